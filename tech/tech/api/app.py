@@ -1,30 +1,157 @@
+import asyncio
+import math
+from contextlib import asynccontextmanager, suppress
 from http import HTTPStatus
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from tech.interfaces.schemas.message_schema import (
     Message,
 )
 
 from tech.api import  products_router
+from tech.api.responses import TimedJSONResponse
+from tech.infra.catalog.catalog_store import catalog_store
+from tech.infra.catalog.catalog_sync import catalog_synchronizer
+from tech.infra.catalog.product_export import product_exporter
+from tech.infra.catalog.shared_catalog import shared_catalog
+from tech.infra.databases.mongo_health import mongo_health_monitor
+from tech.infra.lifecycle.readiness import readiness
+from tech.infra.lifecycle.warmups import run_startup_warmups
+from tech.infra.observability.structured_logging import configure_logging, shutdown_logging
+from tech.infra.resilience.circuit_breaker import (
+    DATABASE_UNAVAILABLE_ERRORS,
+    CircuitOpenError,
+    mongo_circuit_breaker,
+)
+from tech.infra.resilience.request_deadline import DeadlineExceeded
+from tech.interfaces.middlewares.idempotency_middleware import IdempotencyMiddleware
+from tech.interfaces.middlewares.request_deadline_middleware import RequestDeadlineMiddleware
+from tech.interfaces.middlewares.request_context_middleware import RequestContextMiddleware
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Ciclo de vida da aplicação: configura o logging assíncrono, inicia o
+    monitor de saúde do MongoDB e dispara os warmups em segundo plano, para
+    que o liveness responda imediatamente enquanto o readiness aguarda.
+    """
+    configure_logging()
+    mongo_health_monitor.start()
+    shared_catalog.start()
+    warmups_task = asyncio.create_task(run_startup_warmups())
+    yield
+    warmups_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await warmups_task
+    await shared_catalog.stop()
+    await catalog_synchronizer.stop()
+    await mongo_health_monitor.stop()
+    product_exporter.shutdown()
+    readiness.reset()
+    shutdown_logging()
+
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan, default_response_class=TimedJSONResponse)
+# Escritas administrativas que aceitam Idempotency-Key (dentro do contexto de timing)
+app.add_middleware(IdempotencyMiddleware, routes=[
+    ('POST', '/products/'),
+    ('POST', '/products/bulk'),
+    ('POST', '/products/prices/adjust'),
+    ('PUT', '/products/{product_id}'),
+    ('DELETE', '/products/{product_id}'),
+])
+# Prazo por requisição; streams e importações longas ficam sem prazo (0)
+app.add_middleware(RequestDeadlineMiddleware, routes=[
+    ('GET', '/products/events', 0),
+    ('GET', '/products/export', 0),
+    ('POST', '/products/import', 0),
+    ('POST', '/products/bulk', 30),
+    ('POST', '/products/prices/adjust', 30),
+])
+app.add_middleware(RequestContextMiddleware)
 app.include_router(
     products_router.router, prefix='/products', tags=['products']
 )
 
+
+async def database_unavailable_handler(request: Request, exc: Exception) -> JSONResponse:
+    """
+    Modo degradado: o MongoDB está indisponível (ou o circuito aberto) e a
+    operação não pôde ser atendida pelo snapshot do catálogo. Responde 503
+    com Retry-After em vez de segurar a requisição até o timeout do driver.
+    """
+    retry_after = exc.retry_after if isinstance(exc, CircuitOpenError) else mongo_circuit_breaker.retry_after()
+    return JSONResponse(
+        status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+        content={"detail": "Product database unavailable, the catalog is read-only"},
+        headers={"Retry-After": str(max(1, math.ceil(retry_after or mongo_circuit_breaker.open_seconds)))},
+    )
+
+
+for unavailable_error in (CircuitOpenError,) + DATABASE_UNAVAILABLE_ERRORS:
+    app.add_exception_handler(unavailable_error, database_unavailable_handler)
+
+
+async def deadline_exceeded_handler(request: Request, exc: DeadlineExceeded) -> JSONResponse:
+    """
+    O orçamento da requisição acabou durante uma chamada ao MongoDB ou ao
+    Cognito: responde 504, sem contar como falha do banco.
+    """
+    return JSONResponse(status_code=HTTPStatus.GATEWAY_TIMEOUT, content={"detail": str(exc)})
+
+
+app.add_exception_handler(DeadlineExceeded, deadline_exceeded_handler)
+
+
 @app.get('/', status_code=HTTPStatus.OK, response_model=Message)
 def read_root():
     return {'message': 'Tech Challenge FIAP - Kauan Silva!      Products Microservice'}
 
 @app.get("/health")
+@app.get("/health/live")
 async def health_check():
     """
-    Endpoint de verificação de saúde da aplicação.
-    Utilizado pelo Kubernetes para readiness e liveness probes.
+    Liveness probe: indica apenas que o processo está respondendo.
+
+    Não depende do MongoDB, para que uma indisponibilidade do banco não
+    faça o Kubernetes reiniciar pods saudáveis. `/health` é mantido como
+    alias por compatibilidade.
+    """
+    return {"status": "healthy"}
+
+
+def catalog_available() -> bool:
+    """
+    Indica se há um catálogo em memória (ou o snapshot compartilhado) para
+    atender as leituras, com ou sem o MongoDB.
+    """
+    return catalog_store.loaded or (shared_catalog.enabled and shared_catalog.reader() is not None)
+
+
+@app.get("/health/ready")
+async def readiness_check():
+    """
+    Readiness probe: pronto quando todos os warmups de inicialização
+    terminaram e há um catálogo carregado.
+
+    O MongoDB não entra na decisão: com o banco fora do ar (ou o circuito
+    aberto) o pod continua atendendo as leituras pelo snapshot do catálogo,
+    em modo somente leitura. O estado do banco e do circuito vai no corpo
+    apenas como informação.
+
+    Lê apenas estado em memória, atualizado por tarefas em segundo plano;
+    a probe em si não faz nenhuma operação de I/O no banco.
     """
-    try:
-        # Não vamos verificar a conexão com o MongoDB aqui
-        # para evitar que a health check falhe por problemas de banco
-        return {"status": "healthy"}
-    except Exception as e:
-        return {"status": "unhealthy", "error": str(e)}
\ No newline at end of file
+    ready = readiness.is_ready() and catalog_available()
+    return JSONResponse(
+        status_code=HTTPStatus.OK if ready else HTTPStatus.SERVICE_UNAVAILABLE,
+        content={
+            "status": "ready" if ready else "not_ready",
+            "catalog": {"loaded": catalog_store.loaded, "source": catalog_store.source},
+            "mongodb": mongo_health_monitor.status(),
+            "circuit": mongo_circuit_breaker.status(),
+            "warmups": readiness.snapshot(),
+        },
+    )
@@ -0,0 +1,64 @@
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Optional
+
+from fastapi import Request, Response
+
+from tech.infra.catalog.catalog_validators import Validators
+
+
+def validator_headers(validators: Validators) -> Dict[str, str]:
+    """
+    Returns the ETag and Last-Modified headers for a view.
+    """
+    return {
+        'ETag': validators.etag,
+        'Last-Modified': format_datetime(validators.last_modified, usegmt=True),
+    }
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    # If-None-Match usa comparação fraca (RFC 9110, 13.1.2)
+    if header.strip() == '*':
+        return True
+    candidates = [candidate.strip() for candidate in header.split(',')]
+    return etag in (candidate[2:] if candidate.startswith('W/') else candidate for candidate in candidates)
+
+
+def is_not_modified(request: Request, validators: Validators) -> bool:
+    """
+    Evaluates If-None-Match, or If-Modified-Since when it is absent.
+    """
+    if_none_match = request.headers.get('if-none-match')
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, validators.etag)
+    if_modified_since = request.headers.get('if-modified-since')
+    if if_modified_since is not None:
+        try:
+            return validators.last_modified <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def conditional_response(request: Request, response: Response, validators: Optional[Validators]) -> Optional[Response]:
+    """
+    Answers a conditional GET before any data is read or serialized.
+
+    Args:
+        request (Request): The incoming request.
+        response (Response): The endpoint's response, which receives the
+            validator headers when the full body is sent.
+        validators (Optional[Validators]): Validators of the requested view,
+            or None when they cannot be computed from memory.
+
+    Returns:
+        Optional[Response]: A 304 response if the client copy is current,
+            otherwise None and the endpoint proceeds normally.
+    """
+    if validators is None:
+        return None
+    headers = validator_headers(validators)
+    if is_not_modified(request, validators):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
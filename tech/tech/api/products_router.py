@@ -1,17 +1,55 @@
 # tech/api/products_router.py
-from fastapi import APIRouter, Depends, HTTPException
+import os
+from typing import Any, Callable, Hashable, List, Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter, ValidationError
+from tech.api.conditional import conditional_response, is_not_modified, validator_headers
+from tech.api.responses import TimedJSONResponse
+from tech.api.streaming_upload import consume_upload
+from tech.infra.concurrency.single_flight import catalog_read_flight, catalog_read_flight_async
+from tech.infra.catalog.catalog_validators import catalog_validators
+from tech.infra.catalog.columnar_catalog import columnar_index
+from tech.infra.catalog.suggest_index import suggest_index
+from tech.infra.catalog.trigram_index import trigram_index
+from tech.infra.catalog.menu_view import menu_view
+from tech.infra.catalog.category_stats import category_stats_view
+from tech.infra.catalog.product_event_stream import product_event_stream
+from tech.infra.catalog.product_import import IMPORT_FORMATS, ProductImporter, detect_format
+from tech.infra.catalog.product_export import product_exporter
+from tech.infra.catalog.product_view_cache import product_view_cache
 from tech.infra.factories.product_repository_factory import ProductRepositoryFactory
-from tech.interfaces.schemas.product_schema import ProductSchema
+from tech.infra.repositories.mongodb_product_repository import CHANGES_SETTLE_WINDOW, TOMBSTONE_RETENTION
+from tech.interfaces.schemas.product_schema import PriceAdjustmentSchema, ProductSchema
 from tech.use_cases.products.create_product_use_case import CreateProductUseCase
 from tech.use_cases.products.list_products_by_category_use_case import ListProductsByCategoryUseCase
 from tech.use_cases.products.list_all_products_use_case import ListAllProductsUseCase
 from tech.use_cases.products.update_product_use_case import UpdateProductUseCase
 from tech.use_cases.products.delete_product_use_case import DeleteProductUseCase
+from tech.use_cases.products.search_products_use_case import SearchProductsUseCase
+from tech.use_cases.products.suggest_products_use_case import SuggestProductsUseCase
+from tech.use_cases.products.fuzzy_search_products_use_case import FuzzySearchProductsUseCase
+from tech.use_cases.products.get_menu_use_case import GetMenuUseCase
+from tech.use_cases.products.list_product_changes_use_case import ListProductChangesUseCase
+from tech.use_cases.products.stream_product_events_use_case import StreamProductEventsUseCase
+from tech.use_cases.products.get_product_use_case import GetProductUseCase
+from tech.use_cases.products.bulk_upsert_products_use_case import BulkUpsertProductsUseCase
+from tech.use_cases.products.import_products_use_case import ImportProductsUseCase
+from tech.use_cases.products.export_products_use_case import ExportProductsUseCase
+from tech.use_cases.products.adjust_prices_use_case import AdjustPricesUseCase
+from tech.use_cases.products.get_category_stats_use_case import GetCategoryStatsUseCase
 from tech.interfaces.controllers.product_controller import ProductController
 from tech.interfaces.middlewares.admin_auth_middleware import admin_required
 
 router = APIRouter()
 
+PRODUCT_BULK_MAX_ITEMS = int(os.getenv('PRODUCT_BULK_MAX_ITEMS', '1000'))
+# Valida o lote inteiro em uma passada, direto dos bytes do corpo
+product_batch_adapter = TypeAdapter(List[ProductSchema])
+
 
 def get_product_controller() -> ProductController:
     """
@@ -32,17 +70,71 @@ def get_product_controller() -> ProductController:
         list_all_products_use_case=ListAllProductsUseCase(product_repository),
         update_product_use_case=UpdateProductUseCase(product_repository),
         delete_product_use_case=DeleteProductUseCase(product_repository),
+        search_products_use_case=SearchProductsUseCase(product_repository, columnar_index),
+        suggest_products_use_case=SuggestProductsUseCase(product_repository, suggest_index),
+        fuzzy_search_products_use_case=FuzzySearchProductsUseCase(product_repository, trigram_index),
+        get_menu_use_case=GetMenuUseCase(product_repository, menu_view),
+        list_product_changes_use_case=ListProductChangesUseCase(
+            product_repository, settle_window=CHANGES_SETTLE_WINDOW, retention=TOMBSTONE_RETENTION
+        ),
+        stream_product_events_use_case=StreamProductEventsUseCase(product_event_stream),
+        get_product_use_case=GetProductUseCase(product_repository),
+        single_flight=catalog_read_flight,
+        bulk_upsert_products_use_case=BulkUpsertProductsUseCase(product_repository),
+        import_products_use_case=ImportProductsUseCase(ProductImporter(product_repository)),
+        export_products_use_case=ExportProductsUseCase(product_exporter),
+        adjust_prices_use_case=AdjustPricesUseCase(product_repository),
+        get_category_stats_use_case=GetCategoryStatsUseCase(product_repository, category_stats_view),
     )
 
 
+async def coalesced_json(key: Hashable, load: Callable[[], Any], headers: Optional[dict] = None) -> Response:
+    """
+    Runs a blocking read once for all identical concurrent requests.
+
+    The first request for `key` runs `load` in the threadpool and renders the
+    JSON body; requests that arrive while it is in flight await the same
+    result without holding a thread, and get the same bytes (or the same
+    error), along with the read's warnings and timings. The read runs under
+    its own bounded deadline rather than that of the request that started
+    it; each request waits for it within its own. A request that starts during an in-flight read may
+    receive the data that read returns, which can predate a write made
+    meanwhile.
+
+    Args:
+        key (Hashable): Identifies identical reads.
+        load: Returns the JSON-compatible content.
+        headers (Optional[dict]): Headers for this request's response.
+
+    Returns:
+        Response: The shared body as application/json.
+    """
+    async def render():
+        content = await run_in_threadpool(load)
+        return TimedJSONResponse(content=jsonable_encoder(content)).body
+
+    body = await catalog_read_flight_async.do(key, render)
+    return Response(content=body, media_type='application/json', headers=headers)
+
+
 @router.get('/')
-def list_all_products(
+async def list_all_products(
+        request: Request,
+        response: Response,
         controller: ProductController = Depends(get_product_controller)
 ) -> list:
     """
     Retrieves all available products.
 
+    Answers If-None-Match / If-Modified-Since with 304 from the in-memory
+    catalog validators, before reading or serializing any product. The body
+    is rendered from the same catalog version the ETag describes; without an
+    in-memory catalog it comes from the controller, with no validators.
+    Concurrent requests share one read and one serialized body.
+
     Args:
+        request (Request): The incoming request, for conditional headers.
+        response (Response): The response, which receives ETag and Last-Modified.
         controller (ProductController): The ProductController instance.
 
     Returns:
@@ -51,19 +143,302 @@ def list_all_products(
     Raises:
         HTTPException: If no products are found.
     """
-    return controller.list_all_products()
+    view = catalog_validators.view_all()
+    if view is None:
+        return await coalesced_json(('all',), controller.list_all_products)
+    not_modified = conditional_response(request, response, view.validators)
+    if not_modified is not None:
+        return not_modified
+    # Corpo e ETag saem da mesma versão do catálogo
+    return await coalesced_json(
+        ('all', view.version), lambda: [p.dict() for p in view.products], dict(response.headers)
+    )
+
+
+@router.get('/search')
+def search_products(
+        min_price: Optional[float] = Query(None, ge=0),
+        max_price: Optional[float] = Query(None, ge=0),
+        category: Optional[List[str]] = Query(None),
+        q: Optional[str] = Query(None, min_length=1, max_length=100),
+        sort: Literal['id', 'price', 'name'] = 'id',
+        order: Literal['asc', 'desc'] = 'asc',
+        limit: int = Query(50, ge=1, le=500),
+        offset: int = Query(0, ge=0),
+        controller: ProductController = Depends(get_product_controller)
+) -> list:
+    """
+    Searches products in memory by price range, categories and name prefix.
+
+    Declared before `/{category}` so that "search" is not taken as a category.
+
+    Args:
+        min_price (Optional[float]): Minimum price, inclusive.
+        max_price (Optional[float]): Maximum price, inclusive.
+        category (Optional[List[str]]): Categories to include; repeat the parameter for several.
+        q (Optional[str]): Case-insensitive name prefix.
+        sort (str): Field to sort by.
+        order (str): Sort direction.
+        limit (int): Maximum number of products returned.
+        offset (int): Number of matching products to skip.
+        controller (ProductController): The ProductController instance.
+
+    Returns:
+        list: The matching products, possibly empty.
+    """
+    return controller.search_products(
+        min_price=min_price, max_price=max_price, categories=category, name_prefix=q,
+        sort=sort, order=order, limit=limit, offset=offset
+    )
+
+
+@router.get('/suggest')
+def suggest_products(
+        q: str = Query(..., min_length=1, max_length=100),
+        limit: int = Query(10, ge=1, le=50),
+        controller: ProductController = Depends(get_product_controller)
+) -> list:
+    """
+    Suggests products whose name, or a word of it, starts with `q`.
+
+    Matching ignores case and accents and is served from memory.
+
+    Args:
+        q (str): Text typed so far.
+        limit (int): Maximum number of suggestions.
+        controller (ProductController): The ProductController instance.
+
+    Returns:
+        list: Up to `limit` matching products, possibly empty.
+    """
+    return controller.suggest_products(q, limit)
+
+
+@router.get('/fuzzy')
+def fuzzy_search_products(
+        q: str = Query(..., min_length=1, max_length=100),
+        category: Optional[str] = None,
+        limit: int = Query(10, ge=1, le=50),
+        controller: ProductController = Depends(get_product_controller)
+) -> list:
+    """
+    Searches products by name similarity, tolerating typos and accents.
+
+    Args:
+        q (str): Free text to match against product names.
+        category (Optional[str]): Only return products of this category.
+        limit (int): Maximum number of results.
+        controller (ProductController): The ProductController instance.
+
+    Returns:
+        list: Matching products with their similarity, best match first.
+    """
+    return controller.fuzzy_search_products(q, category=category, limit=limit)
+
+
+@router.get('/menu')
+def get_menu(
+        request: Request,
+        response: Response,
+        controller: ProductController = Depends(get_product_controller)
+) -> Response:
+    """
+    Retrieves every category with its products in a single payload.
+
+    The body is served from a materialized view as pre-serialized bytes,
+    with the ETag and Last-Modified computed from those same bytes;
+    conditional requests are answered with 304 like `list_all_products`.
+
+    Args:
+        request (Request): The incoming request, for conditional headers.
+        response (Response): Carries the ETag and Last-Modified headers.
+        controller (ProductController): The ProductController instance.
+
+    Returns:
+        Response: The menu document as JSON, or 304.
+    """
+    menu = controller.get_menu()
+    not_modified = conditional_response(request, response, menu.validators)
+    if not_modified is not None:
+        return not_modified
+    return Response(content=menu.body, media_type='application/json', headers=dict(response.headers))
+
+
+@router.get('/stats')
+def get_category_stats(controller: ProductController = Depends(get_product_controller)) -> dict:
+    """
+    Retrieves the product count and min/avg/max price of each category.
+
+    Computed by a single aggregation pipeline and cached until the next
+    catalog write.
+
+    Args:
+        controller (ProductController): The ProductController instance.
+
+    Returns:
+        dict: Per-category `categories` statistics and the `total` product count.
+    """
+    return controller.get_category_stats()
+
+
+@router.get('/categories')
+def list_categories(controller: ProductController = Depends(get_product_controller)) -> list:
+    """
+    Lists the categories that have products, with their product counts.
+
+    Served from the same cached result as `/stats`.
+
+    Args:
+        controller (ProductController): The ProductController instance.
+
+    Returns:
+        list: The `category` and `count` of each category.
+    """
+    return controller.list_categories()
+
+
+@router.get('/changes')
+def list_product_changes(
+        since: Optional[str] = None,
+        limit: int = Query(500, ge=1, le=1000),
+        controller: ProductController = Depends(get_product_controller)
+) -> dict:
+    """
+    Delta sync feed: products changed, and tombstones of products deleted,
+    since the given token.
+
+    Start without `since` to page through the whole catalog, then keep
+    passing the returned `next` token; repeat immediately while `has_more`.
+
+    Args:
+        since (Optional[str]): Token returned by the previous call.
+        limit (int): Maximum number of changes per page.
+        controller (ProductController): The ProductController instance.
+
+    Returns:
+        dict: `changes`, `next` and `has_more`.
+
+    Raises:
+        HTTPException: 400 for a malformed token, 410 when the token is older
+            than the tombstone retention and a full re-sync is required.
+    """
+    return controller.list_product_changes(since, limit)
+
+
+@router.get('/events')
+async def stream_product_events(
+        request: Request,
+        last_event_id: Optional[str] = None,
+        controller: ProductController = Depends(get_product_controller)
+) -> StreamingResponse:
+    """
+    Server-sent events stream of product creates, updates and deletes.
+
+    Reconnecting clients resume from the `Last-Event-ID` header (sent
+    automatically by EventSource) or the `last_event_id` query parameter.
+    A `reset` event means the missed events are gone and the client should
+    catch up through `/changes`.
+
+    Args:
+        request (Request): The incoming request, for the Last-Event-ID header.
+        last_event_id (Optional[str]): Resume token, when the header cannot be set.
+        controller (ProductController): The ProductController instance.
+
+    Returns:
+        StreamingResponse: A text/event-stream response.
+    """
+    resume_from = request.headers.get('last-event-id') or last_event_id
+    return StreamingResponse(
+        controller.stream_product_events(resume_from),
+        media_type='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
+
+
+@router.get('/export')
+def export_products(
+        requested_format: Literal['ndjson', 'csv'] = Query('ndjson', alias='format'),
+        controller: ProductController = Depends(get_product_controller),
+        _: bool = Depends(admin_required)
+) -> StreamingResponse:
+    """
+    Downloads the whole catalog as gzip-compressed NDJSON or CSV. Admin access only.
+
+    Meant for bulk consumers such as the nightly analytics export: the
+    `product_id` range is scanned in parallel partitions and compressed in
+    a process pool, and the file is streamed while it is produced instead
+    of being buffered like `GET /products/`. Rows are grouped by partition
+    batch, not sorted.
+
+    Args:
+        requested_format (str): ?format=ndjson (default) or csv.
+        controller (ProductController): The ProductController instance.
+
+    Returns:
+        StreamingResponse: An application/gzip attachment.
+    """
+    return StreamingResponse(
+        controller.export_products(requested_format),
+        media_type='application/gzip',
+        headers={
+            'Content-Disposition': f'attachment; filename="products.{requested_format}.gz"',
+            'Cache-Control': 'no-store',
+        },
+    )
+
+
+@router.api_route('/id/{product_id}', methods=['GET', 'HEAD'])
+def get_product(
+        product_id: int,
+        request: Request,
+        controller: ProductController = Depends(get_product_controller)
+) -> Response:
+    """
+    Retrieves a single product by its ID.
+
+    The rendered product is kept in a bounded LRU keyed by ID, so a hit
+    costs one dictionary lookup and no repository call. Responses carry an
+    ETag and Last-Modified, and conditional requests are answered with 304.
+    HEAD returns the same headers without the body.
+
+    Args:
+        product_id (int): The ID of the product.
+        request (Request): The incoming request, for conditional headers.
+        controller (ProductController): The ProductController instance.
+
+    Returns:
+        Response: The product as JSON, or 304.
+
+    Raises:
+        HTTPException: If the product is not found.
+    """
+    rendered = product_view_cache.get(product_id, lambda: controller.get_product(product_id))
+    headers = validator_headers(rendered.validators)
+    if is_not_modified(request, rendered.validators):
+        return Response(status_code=304, headers=headers)
+    if request.method == 'HEAD':
+        headers['Content-Length'] = str(len(rendered.body))
+        return Response(media_type='application/json', headers=headers)
+    return Response(content=rendered.body, media_type='application/json', headers=headers)
 
 
 @router.get('/{category}')
-def list_products_by_category(
+async def list_products_by_category(
         category: str,
+        request: Request,
+        response: Response,
         controller: ProductController = Depends(get_product_controller)
 ) -> list:
     """
     Retrieves a list of products filtered by category.
 
+    Answers conditional requests with 304 and coalesces concurrent reads
+    like `list_all_products`.
+
     Args:
         category (str): The category to filter products by.
+        request (Request): The incoming request, for conditional headers.
+        response (Response): The response, which receives ETag and Last-Modified.
         controller (ProductController): The ProductController instance.
 
     Returns:
@@ -72,7 +447,15 @@ def list_products_by_category(
     Raises:
         HTTPException: If no products are found in the specified category.
     """
-    return controller.list_products_by_category(category)
+    view = catalog_validators.view_category(category)
+    if view is None:
+        return await coalesced_json(('category', category), lambda: controller.list_products_by_category(category))
+    not_modified = conditional_response(request, response, view.validators)
+    if not_modified is not None:
+        return not_modified
+    return await coalesced_json(
+        ('category', category, view.version), lambda: [p.dict() for p in view.products], dict(response.headers)
+    )
 
 
 # Admin-only routes - protected with admin authentication
@@ -95,6 +478,115 @@ def create_product(
     return controller.create_product(product)
 
 
+@router.post('/bulk', openapi_extra={'requestBody': {
+    'required': True,
+    'content': {'application/json': {'schema': {
+        'type': 'array', 'items': {'$ref': '#/components/schemas/ProductSchema'}
+    }}},
+}})
+async def bulk_upsert_products(
+        request: Request,
+        controller: ProductController = Depends(get_product_controller),
+        _: bool = Depends(admin_required)
+) -> dict:
+    """
+    Creates or updates a batch of products in one request. Admin access only.
+
+    Items are matched to existing products by name. The whole batch is
+    validated before anything is written, then stored with a single
+    unordered bulk write; one failing item does not stop the others.
+
+    Args:
+        request (Request): The request, whose body is a JSON array of products.
+        controller (ProductController): The ProductController instance.
+
+    Returns:
+        dict: Per-item `results` and the `created`, `updated` and `failed` totals.
+
+    Raises:
+        HTTPException: 422 if any item is invalid, 413 if the batch is larger
+            than PRODUCT_BULK_MAX_ITEMS.
+    """
+    try:
+        items = product_batch_adapter.validate_json(await request.body())
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=422, detail=e.errors(include_url=False, include_context=False, include_input=False)
+        )
+    if len(items) > PRODUCT_BULK_MAX_ITEMS:
+        raise HTTPException(status_code=413, detail=f"A batch may have at most {PRODUCT_BULK_MAX_ITEMS} products")
+    return await run_in_threadpool(controller.bulk_upsert_products, items)
+
+
+@router.post('/prices/adjust')
+def adjust_prices(
+        adjustment: PriceAdjustmentSchema,
+        controller: ProductController = Depends(get_product_controller),
+        _: bool = Depends(admin_required)
+) -> dict:
+    """
+    Changes the price of a whole category or a set of products. Admin access only.
+
+    Give either `percent` (e.g. 5 for +5%) or `amount` (e.g. -1.5), and
+    either `category` or `product_ids`. Prices are recomputed and rounded
+    to cents by the database in one write, instead of a read and a PUT
+    per product.
+
+    Args:
+        adjustment (PriceAdjustmentSchema): The change and the products it applies to.
+        controller (ProductController): The ProductController instance.
+
+    Returns:
+        dict: The number of updated products and their new state.
+
+    Raises:
+        HTTPException: 400 if the change or its target is not given exactly once.
+    """
+    return controller.adjust_prices(adjustment)
+
+
+@router.post('/import', openapi_extra={'requestBody': {
+    'required': True,
+    'content': {
+        'application/x-ndjson': {'schema': {'type': 'string', 'format': 'binary'}},
+        'text/csv': {'schema': {'type': 'string', 'format': 'binary'}},
+        'application/bson': {'schema': {'type': 'string', 'format': 'binary'}},
+    },
+}})
+async def import_products(
+        request: Request,
+        requested_format: Optional[Literal['ndjson', 'csv', 'bson']] = Query(None, alias='format'),
+        controller: ProductController = Depends(get_product_controller),
+        _: bool = Depends(admin_required)
+) -> dict:
+    """
+    Imports products from an NDJSON, CSV or mongodump BSON upload. Admin access only.
+
+    The raw request body is parsed while it is still arriving and upserted
+    by name in bounded chunks; when the database falls behind, reading the
+    upload pauses, so memory stays flat whatever the size of the file.
+
+    Args:
+        request (Request): The request, whose body is the file itself.
+        requested_format (Optional[str]): ?format=ndjson|csv|bson; defaults to the Content-Type.
+        controller (ProductController): The ProductController instance.
+
+    Returns:
+        dict: Row counters, a sample of row errors and the throughput.
+
+    Raises:
+        HTTPException: 415 if the format is neither given nor implied by the Content-Type.
+    """
+    file_format = requested_format or detect_format(content_type=request.headers.get('content-type'))
+    if file_format is None:
+        raise HTTPException(
+            status_code=415, detail=f"Send one of {', '.join(IMPORT_FORMATS)} via ?format= or the Content-Type"
+        )
+    return await consume_upload(
+        request.stream(), lambda stream: controller.import_products(stream, file_format)
+    )
+
+
 @router.put('/{product_id}')
 def update_product(
         product_id: str,
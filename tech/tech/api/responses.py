@@ -0,0 +1,16 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+from tech.infra.observability.request_context import track
+
+
+class TimedJSONResponse(JSONResponse):
+    """
+    JSONResponse that reports the time spent rendering the body under the
+    'serialize' Server-Timing metric.
+    """
+
+    def render(self, content: Any) -> bytes:
+        with track('serialize'):
+            return super().render(content)
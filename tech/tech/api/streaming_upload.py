@@ -0,0 +1,125 @@
+import asyncio
+import io
+import queue
+from typing import Any, AsyncIterator, Callable
+
+from fastapi.concurrency import run_in_threadpool
+
+# Chunks of the body in flight between the event loop and the consumer thread
+UPLOAD_PIPE_MAX_CHUNKS = 8
+
+
+class BodyPipe(io.RawIOBase):
+    """
+    Blocking, read-only file over request body chunks pushed from the event loop.
+
+    The queue between the two sides is bounded, so a consumer that reads
+    slowly (e.g. waiting on database writes) stops the upload from being read
+    any further and TCP flow control pushes back on the client.
+    """
+
+    def __init__(self, max_chunks: int = UPLOAD_PIPE_MAX_CHUNKS):
+        super().__init__()
+        self._queue: queue.Queue = queue.Queue(maxsize=max_chunks)
+        self._pending = memoryview(b'')
+        self._eof = False
+        self._detached = False
+        self._aborted = False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self._aborted:
+            raise ConnectionAbortedError("The request body ended before it was complete")
+        if not self._pending:
+            if self._eof:
+                return 0
+            chunk = self._queue.get()
+            if self._aborted:
+                raise ConnectionAbortedError("The request body ended before it was complete")
+            if chunk is None:
+                self._eof = True
+                return 0
+            self._pending = memoryview(chunk)
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+    def feed(self, chunk: bytes) -> None:
+        """
+        Hands a chunk to the consumer, blocking while the pipe is full.
+        Chunks are dropped once the consumer has stopped reading.
+        """
+        while not self._detached:
+            try:
+                self._queue.put(chunk, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def abort(self) -> None:
+        """
+        Called when the body cannot be read to the end (e.g. the client
+        disconnected): the consumer's next read raises ConnectionAbortedError
+        instead of waiting for chunks that will never come. Never blocks.
+        """
+        self._aborted = True
+        try:
+            # Acorda o consumidor se ele estiver esperando na fila vazia
+            self._queue.put_nowait(None)
+        except queue.Full:
+            pass
+
+    def detach_consumer(self) -> None:
+        """
+        Called by the consumer when it stops reading, so `feed` never blocks
+        forever on a pipe nobody drains.
+        """
+        self._detached = True
+
+
+async def consume_upload(body: AsyncIterator[bytes], consumer: Callable[[io.BufferedReader], Any]) -> Any:
+    """
+    Runs a blocking `consumer` in the threadpool over a streamed request body.
+
+    Args:
+        body: The request body, e.g. `request.stream()`.
+        consumer: Reads the body as a binary file and returns a result.
+
+    Returns:
+        Whatever `consumer` returns; its exceptions propagate.
+
+    Raises:
+        Exception: Whatever reading `body` raises (e.g. a client disconnect),
+            once the consumer has been stopped.
+    """
+    pipe = BodyPipe()
+
+    def run() -> Any:
+        try:
+            return consumer(io.BufferedReader(pipe, buffer_size=64 * 1024))
+        finally:
+            pipe.detach_consumer()
+
+    task = asyncio.ensure_future(run_in_threadpool(run))
+    completed = False
+    try:
+        async for chunk in body:
+            if task.done():
+                break
+            if chunk:
+                await run_in_threadpool(pipe.feed, chunk)
+        await run_in_threadpool(pipe.feed, None)
+        completed = True
+    finally:
+        if not completed:
+            # Sem o fim do corpo o consumidor esperaria para sempre
+            pipe.abort()
+        if not task.done():
+            await asyncio.wait({task})
+        if not completed and not task.cancelled():
+            # O erro da leitura do corpo é o que se propaga
+            task.exception()
+    return task.result()
@@ -1,3 +1,6 @@
+import math
+
+
 class CPF:
     def __init__(self, value: str):
         if len(value) != 11 or not value.isdigit():
@@ -6,3 +9,105 @@ class CPF:
 
     def __str__(self):
         return self.value
+
+
+class ProductSearchQuery:
+    """
+    Filters and ordering for a product search.
+
+    Prices are compared in cents so that range bounds behave exactly for
+    two-decimal prices.
+    """
+
+    SORT_FIELDS = ('id', 'price', 'name')
+
+    def __init__(self, min_price: float = None, max_price: float = None, categories=None,
+                 name_prefix: str = None, sort: str = 'id', descending: bool = False,
+                 limit: int = 50, offset: int = 0):
+        if sort not in self.SORT_FIELDS:
+            raise ValueError(f"sort must be one of {', '.join(self.SORT_FIELDS)}")
+        if min_price is not None and max_price is not None and min_price > max_price:
+            raise ValueError("min_price must not be greater than max_price")
+        if limit < 0 or offset < 0:
+            raise ValueError("limit and offset must not be negative")
+        self.min_price = min_price
+        self.max_price = max_price
+        self.categories = list(categories) if categories else []
+        self.name_prefix = name_prefix or None
+        self.sort = sort
+        self.descending = descending
+        self.limit = limit
+        self.offset = offset
+
+
+class BulkUpsertResult:
+    """
+    Outcome of one item of a bulk upsert.
+
+    Attributes:
+        index (int): Position of the item in the submitted batch.
+        status (str): 'created', 'updated' or 'error'.
+        product: The stored product, unless the item failed.
+        error (str): Why the item failed, if it did.
+    """
+
+    STATUSES = ('created', 'updated', 'error')
+
+    def __init__(self, index: int, status: str, product=None, error: str = None):
+        if status not in self.STATUSES:
+            raise ValueError(f"status must be one of {', '.join(self.STATUSES)}")
+        self.index = index
+        self.status = status
+        self.product = product
+        self.error = error
+
+
+class PriceAdjustment:
+    """
+    A price change applied to many products at once.
+
+    Exactly one of `percent` and `amount` says how prices change, and
+    exactly one of `category` and `product_ids` says which products change.
+    New prices are rounded to cents, half to even like Python's `round`
+    (10.125 becomes 10.12, 10.375 becomes 10.38), and never go below zero.
+    """
+
+    def __init__(self, percent: float = None, amount: float = None, category: str = None,
+                 product_ids=None):
+        if (percent is None) == (amount is None):
+            raise ValueError("Give exactly one of percent or amount")
+        if (category is None) == (product_ids is None):
+            raise ValueError("Give exactly one of category or product_ids")
+        for value in (percent, amount):
+            if value is not None and not math.isfinite(value):
+                raise ValueError("percent and amount must be finite numbers")
+        if percent is not None and percent <= -100:
+            raise ValueError("percent must be greater than -100")
+        if product_ids is not None and not product_ids:
+            raise ValueError("product_ids must not be empty")
+        self.percent = percent
+        self.amount = amount
+        self.category = category
+        self.product_ids = sorted({int(product_id) for product_id in product_ids}) if product_ids else None
+
+
+class CategoryStats:
+    """
+    Product count and price statistics of one category.
+    """
+
+    def __init__(self, category: str, count: int, min_price: float, avg_price: float, max_price: float):
+        self.category = category
+        self.count = count
+        self.min_price = min_price
+        self.avg_price = avg_price
+        self.max_price = max_price
+
+    def dict(self):
+        return {
+            "category": self.category,
+            "count": self.count,
+            "min_price": self.min_price,
+            "avg_price": self.avg_price,
+            "max_price": self.max_price,
+        }
@@ -0,0 +1,79 @@
+# tech/infra/cache/bloom_filter.py
+import math
+from typing import Iterable
+
+import numpy as np
+
+_MASK = (1 << 64) - 1
+
+
+def _mix(value: int) -> int:
+    # splitmix64: espalha IDs sequenciais por todo o espaço de 64 bits
+    value = (value + 0x9E3779B97F4A7C15) & _MASK
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK
+    return value ^ (value >> 31)
+
+
+def _mix_array(values: np.ndarray) -> np.ndarray:
+    with np.errstate(over='ignore'):
+        values = values + np.uint64(0x9E3779B97F4A7C15)
+        values = (values ^ (values >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        values = (values ^ (values >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        return values ^ (values >> np.uint64(31))
+
+
+class BloomFilter:
+    """
+    Set of integers with no false negatives and a bounded false-positive rate.
+
+    Sized for `capacity` items at `error_rate`; adding more items than that
+    raises the false-positive rate, which `saturated` reports. Positions use
+    double hashing over a 64-bit mix of the key, and bulk loads are
+    vectorized with numpy.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        capacity = max(1, capacity)
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.hashes = max(1, int(round(self.size / capacity * math.log(2))))
+        self.count = 0
+        self._bits = np.zeros((self.size + 7) // 8, dtype=np.uint8)
+
+    def _positions(self, key: int):
+        first = _mix(key & _MASK)
+        second = _mix(first) | 1
+        return [((first + i * second) & _MASK) % self.size for i in range(self.hashes)]
+
+    def add(self, key: int) -> None:
+        for position in self._positions(key):
+            self._bits[position >> 3] |= np.uint8(1 << (position & 7))
+        self.count += 1
+
+    def update(self, keys: Iterable[int]) -> None:
+        """
+        Adds many keys at once.
+        """
+        values = np.fromiter((int(key) & _MASK for key in keys), dtype=np.uint64)
+        if not len(values):
+            return
+        first = _mix_array(values)
+        second = _mix_array(first) | np.uint64(1)
+        size = np.uint64(self.size)
+        with np.errstate(over='ignore'):
+            for i in range(self.hashes):
+                positions = (first + np.uint64(i) * second) % size
+                np.bitwise_or.at(
+                    self._bits, (positions >> np.uint64(3)).astype(np.intp),
+                    (np.uint8(1) << (positions & np.uint64(7)).astype(np.uint8))
+                )
+        self.count += len(values)
+
+    def __contains__(self, key: int) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    @property
+    def saturated(self) -> bool:
+        return self.count > self.capacity
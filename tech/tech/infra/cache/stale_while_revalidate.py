@@ -0,0 +1,221 @@
+# tech/infra/cache/stale_while_revalidate.py
+import collections
+import logging
+import math
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional, Set, Tuple, Type
+
+from pymongo.errors import PyMongoError
+
+from tech.infra.concurrency.single_flight import SingleFlight
+from tech.infra.observability.request_context import add_response_warning
+
+logger = logging.getLogger(__name__)
+
+# RFC 7234, 5.5.2: resposta antiga servida porque a revalidação falhou
+REVALIDATION_FAILED_WARNING = '111 - "Revalidation Failed"'
+
+
+class _Entry:
+    __slots__ = ('value', 'delta', 'expires_at', 'stale_until', 'invalidated', 'failed')
+
+    def __init__(self, value: Any, delta: float, expires_at: float, stale_until: float):
+        self.value = value
+        self.delta = delta
+        self.expires_at = expires_at
+        self.stale_until = stale_until
+        self.invalidated = False
+        self.failed = False
+
+
+class StaleWhileRevalidateCache:
+    """
+    Read-through cache that never makes a request wait for an expired entry
+    while a usable one exists.
+
+    * Fresh entries are served as is. Each read may decide to refresh early,
+      with a probability that grows as expiry approaches and with how long
+      the value took to compute (XFetch, Vattani et al.), so refreshes of a
+      hot key are spread out instead of all landing on the expiry instant.
+    * Entries past their TTL but within `max_stale` are served immediately
+      while a single background task revalidates them.
+    * Missing, invalidated or too-old entries are loaded synchronously;
+      identical concurrent loads are coalesced.
+    * When a load fails with one of `unavailable_errors`, the last good value
+      is served instead and the response gets a `Warning: 111` header; so are
+      stale values whose background revalidation failed.
+
+    None results are not cached. At most `max_entries` entries are kept,
+    least recently used first out, and entries past `max_stale` are dropped,
+    so reads for arbitrary keys (unknown IDs or categories) cannot grow the
+    cache without bound.
+    """
+
+    def __init__(
+            self,
+            ttl: float,
+            max_stale: float,
+            beta: float = 1.0,
+            max_entries: int = 10000,
+            unavailable_errors: Tuple[Type[BaseException], ...] = (PyMongoError,),
+            clock: Callable[[], float] = time.monotonic,
+            random_source: Callable[[], float] = random.random,
+            executor: Optional[ThreadPoolExecutor] = None
+    ):
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self.beta = beta
+        self.max_entries = max_entries
+        self.unavailable_errors = unavailable_errors
+        self.clock = clock
+        self.random_source = random_source
+        self._executor = executor
+        self._lock = threading.Lock()
+        self._entries: 'collections.OrderedDict[Hashable, _Entry]' = collections.OrderedDict()
+        # Só as chaves com leitura em andamento: uma invalidação durante a
+        # leitura incrementa a geração e o resultado não é guardado
+        self._generations: Dict[Hashable, int] = {}
+        self._refreshing: Set[Hashable] = set()
+        self._flight = SingleFlight()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def _should_refresh_early(self, entry: _Entry, now: float) -> bool:
+        # 1 - random() fica em (0, 1], evitando log(0)
+        return now - entry.delta * self.beta * math.log(1.0 - self.random_source()) >= entry.expires_at
+
+    def _load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        with self._lock:
+            generation = self._generations.setdefault(key, 0)
+        try:
+            started_at = self.clock()
+            value = loader()
+            finished_at = self.clock()
+        except BaseException:
+            with self._lock:
+                self._generations.pop(key, None)
+            raise
+        with self._lock:
+            # Uma invalidação durante a leitura torna o resultado suspeito
+            current = self._generations.pop(key, 0)
+            if value is not None and current == generation and self.max_entries > 0:
+                self._entries[key] = _Entry(
+                    value, finished_at - started_at,
+                    finished_at + self.ttl, finished_at + self.ttl + self.max_stale
+                )
+                self._entries.move_to_end(key)
+                self._evict(finished_at)
+        return value
+
+    def _evict(self, now: float) -> None:
+        # Chamado com o lock: descarta as entradas velhas demais no início da
+        # fila e as menos usadas além do limite
+        while self._entries:
+            oldest = next(iter(self._entries.values()))
+            if len(self._entries) <= self.max_entries and now < oldest.stale_until:
+                break
+            self._entries.popitem(last=False)
+
+    def _refresh_in_background(self, key: Hashable, loader: Callable[[], Any]) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh() -> None:
+            try:
+                self._flight.do(key, lambda: self._load(key, loader))
+            except Exception as e:
+                logger.warning("Background revalidation of %s failed: %s", key, e)
+                with self._lock:
+                    entry = self._entries.get(key)
+                    if entry is not None:
+                        entry.failed = True
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='swr-cache')
+        try:
+            self._executor.submit(refresh)
+        except RuntimeError:
+            # Executor encerrado (desligamento do processo)
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def get(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Returns the value for `key`, loading it with `loader` when needed.
+
+        Args:
+            key (Hashable): Identifies the read.
+            loader: Performs the read; called without arguments.
+
+        Returns:
+            The cached, revalidating or freshly loaded value.
+
+        Raises:
+            Whatever `loader` raises when there is no previous value to serve.
+        """
+        if not self.enabled:
+            return loader()
+
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if now < entry.stale_until:
+                    self._entries.move_to_end(key)
+                else:
+                    # Continua como reserva só para esta leitura
+                    del self._entries[key]
+
+        if entry is not None and not entry.invalidated:
+            if now < entry.expires_at:
+                if self._should_refresh_early(entry, now):
+                    self._refresh_in_background(key, loader)
+                return entry.value
+            if now < entry.stale_until:
+                self._refresh_in_background(key, loader)
+                if entry.failed:
+                    add_response_warning(REVALIDATION_FAILED_WARNING)
+                return entry.value
+
+        try:
+            return self._flight.do(key, lambda: self._load(key, loader))
+        except self.unavailable_errors as e:
+            if entry is None:
+                raise
+            logger.warning("Serving the last good value of %s: %s", key, e)
+            add_response_warning(REVALIDATION_FAILED_WARNING)
+            return entry.value
+
+    def invalidate(self, matches: Callable[[Hashable], bool]) -> None:
+        """
+        Stops serving the entries whose key `matches`, so the next read loads
+        them again. Their values are kept as the fallback for a failed load.
+
+        Args:
+            matches: Predicate over cache keys.
+        """
+        with self._lock:
+            for key in self._generations:
+                if matches(key):
+                    self._generations[key] += 1
+            for key, entry in self._entries.items():
+                if matches(key):
+                    entry.invalidated = True
+
+    def clear(self) -> None:
+        """
+        Drops every entry (used in tests).
+        """
+        with self._lock:
+            self._entries.clear()
+            self._generations.clear()
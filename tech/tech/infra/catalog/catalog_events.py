@@ -0,0 +1,100 @@
+# tech/infra/catalog/catalog_events.py
+import logging
+import threading
+from datetime import datetime
+from typing import Callable, List, Optional
+
+from tech.domain.entities.products import Products
+
+logger = logging.getLogger(__name__)
+
+
+class ProductChange:
+    """
+    A single product write, as observed by the repository.
+
+    Attributes:
+        kind (str): ProductChange.UPSERT or ProductChange.DELETE.
+        product_id (int): ID of the affected product.
+        product (Optional[Products]): The stored product for upserts.
+        origin (str): 'local' for writes made by this process.
+        changed_at (Optional[datetime]): When the write happened, if known.
+        action (str): 'create', 'update' or 'delete', for consumers that
+            distinguish creations from updates.
+    """
+
+    UPSERT = 'upsert'
+    DELETE = 'delete'
+
+    def __init__(self, kind: str, product_id: int, product: Optional[Products] = None,
+                 origin: str = 'local', changed_at: Optional[datetime] = None,
+                 action: Optional[str] = None):
+        self.kind = kind
+        self.product_id = int(product_id)
+        self.product = product
+        self.origin = origin
+        self.changed_at = changed_at
+        self.action = action or ('delete' if kind == self.DELETE else 'update')
+
+    @classmethod
+    def upsert(cls, product: Products, origin: str = 'local', action: str = 'update') -> 'ProductChange':
+        return cls(cls.UPSERT, product.id, product, origin, product.updated_at, action)
+
+    @classmethod
+    def delete(cls, product_id: int, origin: str = 'local',
+               changed_at: Optional[datetime] = None) -> 'ProductChange':
+        return cls(cls.DELETE, product_id, None, origin, changed_at)
+
+
+Subscriber = Callable[[List[ProductChange]], None]
+
+
+class CatalogEventBus:
+    """
+    In-process publish/subscribe bus for catalog writes.
+
+    Repository writes publish a batch of changes; in-memory views of the
+    catalog subscribe to stay consistent without re-reading MongoDB. A batch
+    is delivered as a single call so subscribers can invalidate once per
+    write operation, however many products it touched.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers: List[Subscriber] = []
+
+    def subscribe(self, callback: Subscriber) -> None:
+        """
+        Registers a callback that receives every published batch.
+        """
+        with self._lock:
+            if callback not in self._subscribers:
+                self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Subscriber) -> None:
+        """
+        Removes a previously registered callback.
+        """
+        with self._lock:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+    def publish(self, changes: List[ProductChange]) -> None:
+        """
+        Delivers a batch of changes to every subscriber, synchronously.
+
+        A failing subscriber is logged and does not prevent delivery to the
+        others nor fail the write that produced the changes.
+        """
+        if not changes:
+            return
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            try:
+                callback(changes)
+            except Exception:
+                logger.exception("Catalog subscriber %r failed", callback)
+
+
+catalog_events = CatalogEventBus()
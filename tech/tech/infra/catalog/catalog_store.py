@@ -0,0 +1,176 @@
+# tech/infra/catalog/catalog_store.py
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from tech.domain.entities.products import Products
+from tech.infra.catalog.catalog_events import ProductChange, catalog_events
+
+
+def _fingerprint(product: Products) -> tuple:
+    return (product.id, product.name, product.price, product.category, product.updated_at)
+
+
+class CatalogStore:
+    """
+    In-memory copy of the product catalog, shared by the whole process.
+
+    The store is loaded by the startup warm-up (from MongoDB or from a local
+    snapshot file), refreshed by the background reconcile loop, and kept
+    current between refreshes by the writes this process publishes on the
+    catalog event bus.
+
+    `version` increases every time the content changes, so derived views can
+    cheaply tell whether they need rebuilding. `generation` only increases
+    when the content is replaced wholesale (a reload that changed something,
+    or a reset): views that follow the event bus incrementally only need a
+    full rebuild when it moves. Products handed out by the
+    store are shared and must be treated as read-only.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._products: Dict[int, Products] = {}
+        self._loads_in_progress = 0
+        self._changes_during_load: List[ProductChange] = []
+        self.version = 0
+        self.generation = 0
+        self.loaded = False
+        self.source: Optional[str] = None
+        self.loaded_at: Optional[float] = None
+
+    def begin_load(self) -> None:
+        """
+        Marks the start of a full reload.
+
+        Writes published while the reload is reading MongoDB are buffered and
+        re-applied on top of the loaded data, so a slow load cannot roll back
+        a newer write.
+        """
+        with self._lock:
+            self._loads_in_progress += 1
+
+    def replace_all(self, products: Iterable[Products], source: str) -> bool:
+        """
+        Replaces the whole catalog, ending a load started with `begin_load`.
+
+        Args:
+            products: Every product in the catalog.
+            source (str): Where the data came from ('mongodb' or 'snapshot').
+
+        Returns:
+            bool: True if the content changed (and `version` was bumped).
+        """
+        new_products = {int(product.id): product for product in products if product.id is not None}
+        with self._lock:
+            if self._loads_in_progress:
+                self._loads_in_progress -= 1
+            pending = self._changes_during_load
+            if not self._loads_in_progress:
+                self._changes_during_load = []
+            for change in pending:
+                self._apply_change(new_products, change)
+
+            changed = not self.loaded or self._differs(new_products)
+            if changed:
+                self._products = new_products
+                self.version += 1
+                self.generation += 1
+            self.loaded = True
+            self.source = source
+            self.loaded_at = time.time()
+            return changed
+
+    def abort_load(self) -> None:
+        """
+        Ends a load started with `begin_load` that failed.
+
+        Buffered changes were already applied to the current content by
+        `apply`, so they are simply dropped.
+        """
+        with self._lock:
+            if self._loads_in_progress:
+                self._loads_in_progress -= 1
+            if not self._loads_in_progress:
+                self._changes_during_load = []
+
+    def apply(self, changes: List[ProductChange]) -> None:
+        """
+        Applies a batch of writes published on the catalog event bus.
+
+        Before the first load the store has nothing to keep consistent, so
+        changes are ignored unless a load is in progress.
+        """
+        with self._lock:
+            if self._loads_in_progress:
+                self._changes_during_load.extend(changes)
+            if not self.loaded:
+                return
+            for change in changes:
+                self._apply_change(self._products, change)
+            self.version += 1
+
+    @staticmethod
+    def _apply_change(products: Dict[int, Products], change: ProductChange) -> None:
+        if change.kind == ProductChange.DELETE:
+            products.pop(change.product_id, None)
+        elif change.product is not None:
+            products[change.product_id] = change.product
+
+    def _differs(self, new_products: Dict[int, Products]) -> bool:
+        if new_products.keys() != self._products.keys():
+            return True
+        return any(
+            _fingerprint(product) != _fingerprint(self._products[product_id])
+            for product_id, product in new_products.items()
+        )
+
+    def get(self, product_id: int) -> Optional[Products]:
+        """
+        Returns the product with the given ID, or None.
+        """
+        return self._products.get(int(product_id))
+
+    def list_all(self) -> List[Products]:
+        """
+        Returns every product, ordered by ID.
+        """
+        with self._lock:
+            products = list(self._products.values())
+        return sorted(products, key=lambda product: product.id)
+
+    def list_by_category(self, category: str) -> List[Products]:
+        """
+        Returns the products of a category, ordered by ID.
+        """
+        return [product for product in self.list_all() if product.category == category]
+
+    def max_updated_at(self) -> Optional[datetime]:
+        """
+        Returns the most recent `updated_at` in the catalog.
+        """
+        with self._lock:
+            timestamps = [p.updated_at for p in self._products.values() if p.updated_at]
+        return max(timestamps, default=None)
+
+    def __len__(self) -> int:
+        return len(self._products)
+
+    def reset(self) -> None:
+        """
+        Empties the store and marks it as not loaded (used in tests).
+        """
+        with self._lock:
+            self._products = {}
+            self._loads_in_progress = 0
+            self._changes_during_load = []
+            self.version += 1
+            self.generation += 1
+            self.loaded = False
+            self.source = None
+            self.loaded_at = None
+
+
+catalog_store = CatalogStore()
+catalog_events.subscribe(catalog_store.apply)
@@ -0,0 +1,129 @@
+# tech/infra/catalog/catalog_sync.py
+import asyncio
+import logging
+import os
+from typing import Callable, List, Optional
+
+from tech.domain.entities.products import Products
+from tech.infra.catalog.catalog_store import CatalogStore, catalog_store
+from tech.infra.catalog.snapshot_file import read_snapshot, write_snapshot
+from tech.infra.repositories.mongodb_product_repository import MongoDBProductRepository
+
+logger = logging.getLogger(__name__)
+
+CATALOG_SNAPSHOT_PATH = os.getenv('CATALOG_SNAPSHOT_PATH', '/tmp/products-catalog.json.gz')
+CATALOG_WARMUP_TIMEOUT_SECONDS = float(os.getenv('CATALOG_WARMUP_TIMEOUT_SECONDS', '0.5'))
+CATALOG_REFRESH_INTERVAL_SECONDS = float(os.getenv('CATALOG_REFRESH_INTERVAL_SECONDS', '60'))
+
+
+class CatalogSynchronizer:
+    """
+    Loads the catalog into the CatalogStore and keeps it reconciled.
+
+    On start it gives MongoDB a short budget to return the catalog; if that
+    fails it boots from the local snapshot file instead and reconciles with
+    MongoDB in the background. Afterwards it reloads from MongoDB on an
+    interval and rewrites the snapshot whenever the content changed.
+    """
+
+    def __init__(
+            self,
+            store: CatalogStore = catalog_store,
+            repository_factory: Callable[[], MongoDBProductRepository] = MongoDBProductRepository,
+            snapshot_path: str = CATALOG_SNAPSHOT_PATH,
+            warmup_timeout: float = CATALOG_WARMUP_TIMEOUT_SECONDS,
+            refresh_interval: float = CATALOG_REFRESH_INTERVAL_SECONDS
+    ):
+        self.store = store
+        self.repository_factory = repository_factory
+        self.snapshot_path = snapshot_path
+        self.warmup_timeout = warmup_timeout
+        self.refresh_interval = refresh_interval
+        self._task: Optional[asyncio.Task] = None
+
+    def _load_from_mongodb(self) -> List[Products]:
+        return self.repository_factory().list_all_products()
+
+    async def _refresh_from_mongodb(self, timeout: Optional[float] = None) -> None:
+        self.store.begin_load()
+        try:
+            load = asyncio.to_thread(self._load_from_mongodb)
+            products = await (asyncio.wait_for(load, timeout) if timeout else load)
+        except BaseException:
+            self.store.abort_load()
+            raise
+        if self.store.replace_all(products, source='mongodb'):
+            await asyncio.to_thread(self._write_snapshot)
+
+    async def refresh_now(self) -> None:
+        """
+        Reloads the catalog from MongoDB immediately, outside the interval.
+        """
+        await self._refresh_from_mongodb()
+
+    def _write_snapshot(self) -> None:
+        try:
+            write_snapshot(self.store.list_all(), self.snapshot_path)
+        except OSError as e:
+            logger.warning("Could not write catalog snapshot to %s: %s", self.snapshot_path, e)
+
+    async def warm_up(self) -> None:
+        """
+        Startup warmup: loads the catalog from MongoDB or, failing that,
+        from the snapshot file, then starts the background reconcile loop.
+
+        Raises:
+            Exception: If neither MongoDB nor the snapshot could be read, so
+                the warmup runner retries.
+        """
+        try:
+            await self._refresh_from_mongodb(timeout=self.warmup_timeout)
+            logger.info("Catalog warmed from MongoDB", extra={"products": len(self.store)})
+            self.start(reconcile_now=False)
+        except Exception as mongo_error:
+            try:
+                products = await asyncio.to_thread(read_snapshot, self.snapshot_path)
+            except Exception as snapshot_error:
+                raise RuntimeError(
+                    f"MongoDB unavailable ({mongo_error!r}) and no usable snapshot ({snapshot_error!r})"
+                ) from mongo_error
+            self.store.replace_all(products, source='snapshot')
+            logger.info(
+                "Catalog warmed from snapshot, reconciling in background",
+                extra={"products": len(products), "reason": repr(mongo_error)}
+            )
+            self.start(reconcile_now=True)
+
+    async def _run(self, reconcile_now: bool) -> None:
+        if not reconcile_now:
+            await asyncio.sleep(self.refresh_interval)
+        while True:
+            try:
+                await self._refresh_from_mongodb()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Catalog reconcile failed: %s", e)
+            await asyncio.sleep(self.refresh_interval)
+
+    def start(self, reconcile_now: bool = False) -> None:
+        """
+        Starts the background reconcile loop if it is not running yet.
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run(reconcile_now))
+
+    async def stop(self) -> None:
+        """
+        Stops the background reconcile loop.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+catalog_synchronizer = CatalogSynchronizer()
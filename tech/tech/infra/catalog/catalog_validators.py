@@ -0,0 +1,195 @@
+# tech/infra/catalog/catalog_validators.py
+import hashlib
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from tech.domain.entities.products import Products
+from tech.infra.catalog.catalog_store import CatalogStore, catalog_store
+from tech.infra.catalog.shared_catalog import SharedCatalog, shared_catalog
+
+
+class Validators:
+    """
+    HTTP cache validators for one view of the catalog.
+    """
+
+    def __init__(self, etag: str, last_modified: datetime):
+        self.etag = etag
+        self.last_modified = last_modified
+
+
+class CatalogView:
+    """
+    The products of one catalog view together with their validators, taken
+    from the same catalog version, so a body rendered from `products` is
+    exactly what `validators` describe.
+
+    Attributes:
+        validators (Validators): ETag and Last-Modified of the view.
+        products (List[Products]): The view's products, ordered by ID.
+        version (Hashable): The catalog version both were computed from.
+    """
+
+    def __init__(self, validators: Validators, products: List[Products], version: Hashable):
+        self.validators = validators
+        self.products = products
+        self.version = version
+
+
+def _as_utc(value: datetime) -> datetime:
+    # O repositório grava `updated_at` com datetime.utcnow(), sem fuso
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def next_last_modified(etag: str, products: List[Products],
+                       previous: Optional[Tuple[str, datetime]]) -> datetime:
+    """
+    Last-Modified for a representation with `etag` built from `products`.
+
+    It is the newest `updated_at`; when the content changed without moving
+    that (e.g. a delete), it is the time the change was observed instead.
+
+    Args:
+        etag (str): The new representation's ETag.
+        products (List[Products]): The products it was built from.
+        previous (Optional[Tuple[str, datetime]]): The ETag and
+            Last-Modified handed out before, if any.
+
+    Returns:
+        datetime: An aware UTC datetime.
+    """
+    newest = max((_as_utc(p.updated_at) for p in products if p.updated_at), default=None)
+    if previous is None:
+        return newest or datetime.now(timezone.utc)
+    if previous[0] == etag:
+        return previous[1]
+    if newest is not None and newest > previous[1]:
+        return newest
+    return datetime.now(timezone.utc)
+
+
+def _digest(view: str, products: List[Products]) -> str:
+    digest = hashlib.blake2b(view.encode('utf-8'), digest_size=16)
+    for product in products:
+        updated_at = product.updated_at.isoformat() if product.updated_at else ''
+        digest.update(repr((int(product.id), product.name, product.price, product.category, updated_at)).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class CatalogValidators:
+    """
+    Computes ETag and Last-Modified for catalog views from memory.
+
+    The ETag is a strong validator: a hash of the content of the view, so
+    every worker and pod holding the same catalog hands out the same value
+    and a 304 never hides a difference. Last-Modified is the newest
+    `updated_at` of the view; since a delete does not move that, a content
+    change that does not advance it sets Last-Modified to the time it was
+    observed instead.
+
+    Validators are cached per catalog version, so a conditional request
+    costs a dictionary lookup. They follow the in-memory catalog, which
+    trails writes made by other pods by at most one reconcile interval.
+    """
+
+    def __init__(self, store: CatalogStore = catalog_store, shared: SharedCatalog = shared_catalog):
+        self.store = store
+        self.shared = shared
+        self._lock = threading.Lock()
+        self._version: Optional[Hashable] = None
+        self._cache: Dict[str, Optional[CatalogView]] = {}
+        self._history: Dict[str, Tuple[str, datetime]] = {}
+
+    def _source(self):
+        if self.store.loaded:
+            return ('store', self.store.version), self.store.list_all
+        reader = self.shared.reader() if self.shared.enabled else None
+        if reader is not None:
+            return ('shared', reader.identity), reader.list_all
+        return None
+
+    def _compute(self, view: str, products: List[Products]) -> Validators:
+        etag = f'"{_digest(view, products)}"'
+        last_modified = next_last_modified(etag, products, self._history.get(view))
+        self._history[view] = (etag, last_modified)
+        return Validators(etag, last_modified.replace(microsecond=0))
+
+    def _get(self, view: str, select) -> Optional[CatalogView]:
+        source = self._source()
+        if source is None:
+            return None
+        version, load = source
+        with self._lock:
+            if version != self._version:
+                self._version = version
+                self._cache = {}
+            if view not in self._cache:
+                products = select(load())
+                # Sem produtos não há representação (a rota responde 404)
+                self._cache[view] = CatalogView(self._compute(view, products), products, version) if products else None
+            return self._cache[view]
+
+    def view_all(self, view: str = 'list') -> Optional[CatalogView]:
+        """
+        Every product with the validators of `view`, from one catalog version.
+
+        Returns:
+            Optional[CatalogView]: None while no in-memory catalog exists or
+                the catalog is empty.
+        """
+        return self._get(view, lambda products: products)
+
+    def view_category(self, category: str) -> Optional[CatalogView]:
+        """
+        The products of one category with their validators, from one
+        catalog version.
+
+        Returns:
+            Optional[CatalogView]: None while no in-memory catalog exists or
+                the category is empty.
+        """
+        return self._get(
+            f'category:{category}',
+            lambda products: [p for p in products if p.category == category]
+        )
+
+    def for_all(self, view: str = 'list') -> Optional[Validators]:
+        """
+        Validators for a view over the whole catalog.
+
+        Args:
+            view (str): Name of the representation ('list', 'menu'), so that
+                different representations of the same data get different ETags.
+
+        Returns:
+            Optional[Validators]: None while no in-memory catalog exists or
+                the view is empty.
+        """
+        catalog_view = self.view_all(view)
+        return catalog_view.validators if catalog_view is not None else None
+
+    def for_category(self, category: str) -> Optional[Validators]:
+        """
+        Validators for the products of one category.
+
+        Returns:
+            Optional[Validators]: None while no in-memory catalog exists or
+                the category is empty.
+        """
+        catalog_view = self.view_category(category)
+        return catalog_view.validators if catalog_view is not None else None
+
+    def reset(self) -> None:
+        """
+        Drops cached validators (used in tests).
+        """
+        with self._lock:
+            self._version = None
+            self._cache = {}
+            self._history = {}
+
+
+catalog_validators = CatalogValidators()
@@ -0,0 +1,103 @@
+# tech/infra/catalog/category_stats.py
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from tech.domain.entities.products import Products
+from tech.domain.value_objects import CategoryStats
+from tech.infra.catalog.catalog_events import ProductChange, catalog_events
+from tech.infra.catalog.columnar_catalog import CATEGORIES
+from tech.infra.concurrency.single_flight import SingleFlight, catalog_read_flight
+
+# Limite de idade do resultado: escritas de outras instâncias não chegam pelo barramento local
+CATEGORY_STATS_TTL_SECONDS = float(os.getenv('CATEGORY_STATS_TTL_SECONDS', '300'))
+
+
+def order_categories(stats: List[CategoryStats]) -> List[CategoryStats]:
+    """
+    Categories in API order, unknown ones last by name, like the menu.
+    """
+    rank = {category: position for position, category in enumerate(CATEGORIES)}
+    return sorted(stats, key=lambda entry: (rank.get(entry.category, len(rank)), str(entry.category)))
+
+
+def summarize_categories(products: List[Products]) -> List[CategoryStats]:
+    """
+    Computes the same statistics as the aggregation pipeline, in memory.
+
+    Used when the database is unavailable and reads are served from the
+    catalog snapshot.
+    """
+    prices: Dict[str, List[float]] = {}
+    for product in products:
+        prices.setdefault(product.category, []).append(product.price)
+    return [
+        CategoryStats(
+            category=category,
+            count=len(values),
+            min_price=min(values),
+            avg_price=round(sum(values) / len(values), 2),
+            max_price=max(values),
+        )
+        for category, values in prices.items()
+    ]
+
+
+class CategoryStatsView:
+    """
+    Per-category statistics, computed once and kept until the next catalog write.
+
+    Every published write drops the result; concurrent misses share one
+    aggregation. A load that overlaps a write is returned to its callers
+    but not kept, so a result computed before the write is never served
+    after it.
+    """
+
+    def __init__(
+            self,
+            ttl: float = CATEGORY_STATS_TTL_SECONDS,
+            flight: SingleFlight = catalog_read_flight,
+            clock: Callable[[], float] = time.monotonic
+    ):
+        self.ttl = ttl
+        self.flight = flight
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._stats: Optional[List[CategoryStats]] = None
+        self._expires_at = 0.0
+        self._generation = 0
+
+    def get(self, load: Callable[[], List[CategoryStats]]) -> List[CategoryStats]:
+        """
+        Returns the cached statistics, loading them if missing or expired.
+
+        Args:
+            load: Runs the aggregation.
+
+        Returns:
+            List[CategoryStats]: One entry per category, in API order.
+        """
+        with self._lock:
+            if self._stats is not None and self.clock() < self._expires_at:
+                return self._stats
+            generation = self._generation
+
+        stats = self.flight.do(('category_stats', generation), lambda: order_categories(load()))
+        with self._lock:
+            if generation == self._generation:
+                self._stats = stats
+                self._expires_at = self.clock() + self.ttl
+        return stats
+
+    def invalidate(self, changes: Optional[List[ProductChange]] = None) -> None:
+        """
+        Catalog subscriber: drops the statistics.
+        """
+        with self._lock:
+            self._generation += 1
+            self._stats = None
+
+
+category_stats_view = CategoryStatsView()
+catalog_events.subscribe(category_stats_view.invalidate)
@@ -0,0 +1,173 @@
+# tech/infra/catalog/columnar_catalog.py
+import threading
+from typing import Callable, Hashable, List, Optional, get_args
+
+import numpy as np
+
+from tech.domain.entities.products import Products
+from tech.domain.value_objects import ProductSearchQuery
+from tech.infra.catalog.catalog_store import CatalogStore, catalog_store
+from tech.infra.catalog.shared_catalog import SharedCatalog, shared_catalog
+from tech.interfaces.schemas.product_schema import ProductSchema
+
+# Categorias aceitas pela API; recebem sempre os mesmos códigos
+CATEGORIES = get_args(ProductSchema.model_fields['category'].annotation)
+
+# Maior code point Unicode: delimita o fim do intervalo de um prefixo
+_PREFIX_END = '\U0010ffff'
+
+
+def _to_cents(price: float) -> int:
+    return int(round(float(price) * 100))
+
+
+class ColumnarCatalog:
+    """
+    Immutable, column-oriented copy of the catalog for filtering and sorting.
+
+    Each product attribute used by a query is a NumPy column aligned by
+    position (rows are ordered by product_id):
+
+        product_ids     int64
+        price_cents     int64, so range bounds compare exactly
+        category_codes  small ints; the API categories keep fixed codes
+        sorted_names    casefolded names in lexicographic order, with the
+                        permutation back to rows, so a name prefix is two
+                        binary searches
+
+    A query builds a boolean mask with vectorized comparisons, sorts the
+    surviving rows with argsort and only materializes the requested page.
+    """
+
+    def __init__(self, products: List[Products], version: Hashable = None):
+        ordered = sorted((p for p in products if p.id is not None), key=lambda p: int(p.id))
+        count = len(ordered)
+        self.version = version
+
+        self._products = np.empty(count, dtype=object)
+        self._products[:] = ordered
+        self.product_ids = np.fromiter((int(p.id) for p in ordered), dtype=np.int64, count=count)
+        self.price_cents = np.fromiter((_to_cents(p.price) for p in ordered), dtype=np.int64, count=count)
+
+        extra_categories = sorted({p.category for p in ordered} - set(CATEGORIES))
+        self.categories = list(CATEGORIES) + extra_categories
+        self._category_codes = {name: code for code, name in enumerate(self.categories)}
+        self.category_codes = np.fromiter(
+            (self._category_codes[p.category] for p in ordered),
+            dtype=np.min_scalar_type(len(self.categories)), count=count
+        )
+
+        names = np.array([p.name.casefold() for p in ordered], dtype=str)
+        self._name_order = np.argsort(names, kind='stable')
+        self.sorted_names = names[self._name_order]
+        self._name_rank = np.empty(count, dtype=np.intp)
+        self._name_rank[self._name_order] = np.arange(count)
+
+    def __len__(self) -> int:
+        return len(self.product_ids)
+
+    def _mask(self, query: ProductSearchQuery) -> np.ndarray:
+        mask = np.ones(len(self), dtype=bool)
+        if query.min_price is not None:
+            mask &= self.price_cents >= _to_cents(query.min_price)
+        if query.max_price is not None:
+            mask &= self.price_cents <= _to_cents(query.max_price)
+        if query.categories:
+            allowed = np.zeros(len(self.categories), dtype=bool)
+            allowed[[self._category_codes[c] for c in query.categories if c in self._category_codes]] = True
+            mask &= allowed[self.category_codes]
+        if query.name_prefix:
+            prefix = query.name_prefix.casefold()
+            start = np.searchsorted(self.sorted_names, prefix, side='left')
+            end = np.searchsorted(self.sorted_names, prefix + _PREFIX_END, side='right')
+            matches = np.zeros(len(self), dtype=bool)
+            matches[self._name_order[start:end]] = True
+            mask &= matches
+        return mask
+
+    def search(self, query: ProductSearchQuery) -> List[Products]:
+        """
+        Evaluates a query without touching the database.
+
+        Args:
+            query (ProductSearchQuery): Filters, ordering and page.
+
+        Returns:
+            List[Products]: The requested page of matching products.
+        """
+        rows = np.flatnonzero(self._mask(query))
+        if query.sort == 'price':
+            rows = rows[np.argsort(self.price_cents[rows], kind='stable')]
+        elif query.sort == 'name':
+            rows = rows[np.argsort(self._name_rank[rows])]
+        if query.descending:
+            rows = rows[::-1]
+        page = rows[query.offset:query.offset + query.limit]
+        return self._products[page].tolist()
+
+
+class ColumnarCatalogIndex:
+    """
+    Keeps a ColumnarCatalog in step with the in-memory catalog.
+
+    The columns are rebuilt lazily, on the first search after the catalog
+    changed: the CatalogStore version identifies the content when this
+    worker holds the store, the mapped file identity when it only follows
+    the shared snapshot. Without either, searches build a one-off catalog
+    from the repository.
+    """
+
+    def __init__(self, store: CatalogStore = catalog_store, shared: SharedCatalog = shared_catalog):
+        self.store = store
+        self.shared = shared
+        self._catalog: Optional[ColumnarCatalog] = None
+        self._lock = threading.Lock()
+
+    def current(self) -> Optional[ColumnarCatalog]:
+        """
+        Returns the columns for the current catalog, rebuilding if needed.
+
+        Returns:
+            Optional[ColumnarCatalog]: None while no in-memory catalog exists.
+        """
+        if self.store.loaded:
+            version, load = ('store', self.store.version), self.store.list_all
+        else:
+            reader = self.shared.reader() if self.shared.enabled else None
+            if reader is None:
+                return None
+            version, load = ('shared', reader.identity), reader.list_all
+
+        catalog = self._catalog
+        if catalog is not None and catalog.version == version:
+            return catalog
+        with self._lock:
+            if self._catalog is None or self._catalog.version != version:
+                self._catalog = ColumnarCatalog(load(), version=version)
+            return self._catalog
+
+    def search(self, query: ProductSearchQuery, fallback: Callable[[], List[Products]]) -> List[Products]:
+        """
+        Runs a query on the current columns.
+
+        Args:
+            query (ProductSearchQuery): Filters, ordering and page.
+            fallback: Loads every product when no in-memory catalog exists.
+
+        Returns:
+            List[Products]: The requested page of matching products.
+        """
+        catalog = self.current()
+        if catalog is None:
+            catalog = ColumnarCatalog(fallback())
+        return catalog.search(query)
+
+    def reset(self) -> None:
+        """
+        Drops the cached columns (used in tests).
+        """
+        with self._lock:
+            self._catalog = None
+
+
+columnar_index = ColumnarCatalogIndex()
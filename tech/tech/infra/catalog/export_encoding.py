@@ -0,0 +1,53 @@
+# tech/infra/catalog/export_encoding.py
+"""
+Encoding and compression of catalog export chunks.
+
+Kept free of database and framework imports: these functions run inside
+the export process pool, whose workers import only this module.
+"""
+import csv
+import gzip
+import io
+import json
+from datetime import datetime
+from typing import Any, List, Sequence
+
+EXPORT_COLUMNS = ('id', 'name', 'price', 'category', 'created_at', 'updated_at')
+
+
+def _value(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def csv_header() -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(EXPORT_COLUMNS)
+    return buffer.getvalue().encode('utf-8')
+
+
+def encode_rows(rows: Sequence[Sequence[Any]], file_format: str) -> bytes:
+    """
+    Encodes rows ordered like EXPORT_COLUMNS as NDJSON lines or CSV records.
+    """
+    if file_format == 'csv':
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerows([[_value(value) for value in row] for row in rows])
+        return buffer.getvalue().encode('utf-8')
+    lines: List[str] = [
+        json.dumps(dict(zip(EXPORT_COLUMNS, map(_value, row))), ensure_ascii=False) for row in rows
+    ]
+    lines.append('')
+    return '\n'.join(lines).encode('utf-8')
+
+
+def gzip_member(data: bytes, level: int) -> bytes:
+    # Membros gzip concatenados formam um arquivo gzip válido (RFC 1952, 2.2)
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+
+def encode_gzip_chunk(rows: Sequence[Sequence[Any]], file_format: str, level: int) -> bytes:
+    """
+    Encodes a batch of rows and compresses it as one self-contained gzip member.
+    """
+    return gzip_member(encode_rows(rows, file_format), level)
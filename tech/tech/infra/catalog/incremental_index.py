@@ -0,0 +1,92 @@
+# tech/infra/catalog/incremental_index.py
+import threading
+from abc import ABC, abstractmethod
+from typing import Callable, Hashable, List, Optional, Tuple
+
+from tech.domain.entities.products import Products
+from tech.infra.catalog.catalog_events import ProductChange
+from tech.infra.catalog.catalog_store import CatalogStore, catalog_store
+from tech.infra.catalog.shared_catalog import SharedCatalog, shared_catalog
+
+
+class IncrementalCatalogIndex(ABC):
+    """
+    Base class for in-memory indexes that follow the catalog incrementally.
+
+    Subclasses implement `_load` (bulk build), `_insert` and `_remove`. The
+    index is built lazily on first use from the catalog store, or from the
+    shared snapshot on workers that only follow it, or, with neither, from
+    the repository fallback. Afterwards `apply`, subscribed to the catalog
+    event bus, updates only the products in each published batch; a full
+    rebuild happens only when the source is replaced wholesale (its
+    generation moves).
+
+    Subclasses must hold `self._lock` while reading their structures.
+    """
+
+    def __init__(self, store: CatalogStore = catalog_store, shared: SharedCatalog = shared_catalog):
+        self.store = store
+        self.shared = shared
+        self._lock = threading.RLock()
+        self._generation: Optional[Hashable] = None
+
+    @abstractmethod
+    def _load(self, products: List[Products]) -> None:
+        """
+        Replaces the whole index with `products`.
+        """
+
+    @abstractmethod
+    def _insert(self, product: Products) -> None:
+        """
+        Adds one product, called with `self._lock` held.
+        """
+
+    @abstractmethod
+    def _remove(self, product_id: int) -> None:
+        """
+        Removes one product, if indexed, called with `self._lock` held.
+        """
+
+    def _source(self) -> Optional[Tuple[Hashable, Callable[[], List[Products]]]]:
+        if self.store.loaded:
+            return ('store', self.store.generation), self.store.list_all
+        reader = self.shared.reader() if self.shared.enabled else None
+        if reader is not None:
+            return ('shared', reader.identity), reader.list_all
+        return None
+
+    def apply(self, changes: List[ProductChange]) -> None:
+        """
+        Catalog subscriber: updates only the changed products.
+        """
+        with self._lock:
+            if self._generation is None:
+                return
+            for change in changes:
+                self._remove(int(change.product_id))
+                if change.kind == ProductChange.UPSERT and change.product is not None:
+                    self._insert(change.product)
+
+    def _ensure_current(self, fallback: Callable[[], List[Products]]) -> None:
+        source = self._source()
+        if source is None:
+            if self._generation is not None:
+                return
+            generation, load = ('repository',), fallback
+        else:
+            generation, load = source
+            if self._generation == generation:
+                return
+        with self._lock:
+            if self._generation != generation:
+                self._load([product for product in load() if product.id is not None])
+                self._generation = generation
+
+    def reset(self) -> None:
+        """
+        Empties the index (used in tests).
+        """
+        with self._lock:
+            self._load([])
+            self._generation = None
@@ -0,0 +1,110 @@
+# tech/infra/catalog/menu_view.py
+import hashlib
+import json
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from tech.domain.entities.products import Products
+from tech.infra.catalog.catalog_events import catalog_events
+from tech.infra.catalog.catalog_store import CatalogStore, catalog_store
+from tech.infra.catalog.catalog_validators import Validators, next_last_modified
+from tech.infra.catalog.columnar_catalog import CATEGORIES
+from tech.infra.catalog.incremental_index import IncrementalCatalogIndex
+from tech.infra.catalog.shared_catalog import SharedCatalog, shared_catalog
+
+
+def render_menu(products: List[Products]) -> bytes:
+    """
+    Serializes the menu: categories in API order (unknown ones last, by
+    name), each with its products ordered by ID. Empty categories are left
+    out. The encoding matches the API's JSON responses.
+    """
+    grouped: Dict[str, List[Products]] = {}
+    for product in sorted(products, key=lambda p: int(p.id)):
+        grouped.setdefault(product.category, []).append(product)
+    order = [c for c in CATEGORIES if c in grouped] + sorted(set(grouped) - set(CATEGORIES))
+    document = {
+        "categories": [
+            {"category": category, "products": [product.dict() for product in grouped[category]]}
+            for category in order
+        ]
+    }
+    return json.dumps(document, ensure_ascii=False, allow_nan=False, separators=(',', ':')).encode('utf-8')
+
+
+class RenderedMenu:
+    """
+    The menu as JSON bytes, with the HTTP cache validators of those bytes.
+    """
+
+    __slots__ = ('body', 'validators')
+
+    def __init__(self, body: bytes, validators: Validators):
+        self.body = body
+        self.validators = validators
+
+
+class MenuView(IncrementalCatalogIndex):
+    """
+    Materialized menu: the whole catalog grouped by category, held as the
+    final response bytes.
+
+    Any published write, or a wholesale reload of the catalog, invalidates
+    the bytes; the next request renders them once and every request after
+    that is a single attribute read. The ETag (a hash of the bytes) and
+    Last-Modified are computed with the bytes and kept with them, so they
+    always describe the body they are served with.
+    """
+
+    def __init__(self, store: CatalogStore = catalog_store, shared: SharedCatalog = shared_catalog):
+        super().__init__(store, shared)
+        self._previous: Optional[Tuple[str, datetime]] = None
+        self._rendered = self._render([])
+
+    def _render(self, products: List[Products]) -> RenderedMenu:
+        body = render_menu(products)
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        last_modified = next_last_modified(etag, products, self._previous)
+        self._previous = (etag, last_modified)
+        return RenderedMenu(body, Validators(etag, last_modified.replace(microsecond=0)))
+
+    def _load(self, products: List[Products]) -> None:
+        self._rendered = self._render(products)
+
+    def _insert(self, product: Products) -> None:
+        # Qualquer alteração descarta o cardápio renderizado; o próximo
+        # pedido o renderiza de novo a partir do catálogo
+        self._generation = None
+
+    def _remove(self, product_id: int) -> None:
+        self._generation = None
+
+    def snapshot(self, fallback: Callable[[], List[Products]]) -> RenderedMenu:
+        """
+        Returns the menu with its validators, rendering it if it is stale.
+
+        Args:
+            fallback: Loads every product when no in-memory catalog exists.
+
+        Returns:
+            RenderedMenu: The serialized menu document and its ETag and
+                Last-Modified, from the same catalog snapshot.
+        """
+        self._ensure_current(fallback)
+        return self._rendered
+
+    def render(self, fallback: Callable[[], List[Products]]) -> bytes:
+        """
+        Returns the menu as JSON bytes, rendering it if it is stale.
+
+        Args:
+            fallback: Loads every product when no in-memory catalog exists.
+
+        Returns:
+            bytes: The serialized menu document.
+        """
+        return self.snapshot(fallback).body
+
+
+menu_view = MenuView()
+catalog_events.subscribe(menu_view.apply)
@@ -0,0 +1,216 @@
+# tech/infra/catalog/mmap_catalog.py
+"""
+Read-only, memory-mapped catalog snapshot shared by every worker of a pod.
+
+Layout (little-endian):
+
+    header     magic, format, counts and section offsets
+    records    fixed-width product records, sorted by product_id
+    categories one entry per category: name and a slice of the postings
+    postings   uint32 record indexes, grouped by category
+    strings    UTF-8 heap holding product and category names
+
+Because records are fixed-width and sorted, the record section doubles as
+the product_id index: a lookup is a binary search over offsets in the
+mapping. Workers map the file with MAP_SHARED/ACCESS_READ, so the pages
+live once in the page cache no matter how many processes read them, and a
+lookup only decodes the records it returns.
+"""
+import mmap
+import os
+import struct
+import tempfile
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from tech.domain.entities.products import Products
+
+MAGIC = b'PRODCAT\x00'
+FORMAT_VERSION = 1
+
+# magic, format, category_count, record_count, records, categories, postings, strings
+HEADER = struct.Struct('<8sHHIQQQQ')
+# product_id, price, created_at (us), updated_at (us), name offset, name length, category code
+RECORD = struct.Struct('<qdqqIIB3x')
+# name offset, name length, first posting, posting count
+CATEGORY = struct.Struct('<IIII')
+POSTING = struct.Struct('<I')
+PRODUCT_ID = struct.Struct('<q')
+
+_EPOCH = datetime(1970, 1, 1)
+_NO_TIMESTAMP = -(2 ** 63)
+
+
+def _to_micros(value: Optional[datetime]) -> int:
+    if value is None:
+        return _NO_TIMESTAMP
+    if value.tzinfo is not None:
+        value = value.replace(tzinfo=None) - value.utcoffset()
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
+def _from_micros(value: int) -> Optional[datetime]:
+    if value == _NO_TIMESTAMP:
+        return None
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def build_mmap_catalog(products: Iterable[Products]) -> bytes:
+    """
+    Serializes products into the shared snapshot format.
+
+    Args:
+        products: Products to store; products without an ID are skipped.
+
+    Returns:
+        bytes: The complete file content.
+    """
+    ordered = sorted((p for p in products if p.id is not None), key=lambda p: int(p.id))
+
+    strings = bytearray()
+
+    def intern(text: str) -> Tuple[int, int]:
+        encoded = text.encode('utf-8')
+        offset = len(strings)
+        strings.extend(encoded)
+        return offset, len(encoded)
+
+    categories: Dict[str, List[int]] = {}
+    for index, product in enumerate(ordered):
+        categories.setdefault(product.category, []).append(index)
+    category_codes = {name: code for code, name in enumerate(categories)}
+    if len(category_codes) > 255:
+        raise ValueError('The shared catalog supports at most 255 categories')
+
+    records = bytearray()
+    for product in ordered:
+        name_offset, name_length = intern(product.name)
+        records += RECORD.pack(
+            int(product.id), float(product.price),
+            _to_micros(product.created_at), _to_micros(product.updated_at),
+            name_offset, name_length, category_codes[product.category]
+        )
+
+    category_table = bytearray()
+    postings = bytearray()
+    for name, indexes in categories.items():
+        name_offset, name_length = intern(name)
+        category_table += CATEGORY.pack(name_offset, name_length, len(postings) // POSTING.size, len(indexes))
+        for index in indexes:
+            postings += POSTING.pack(index)
+
+    records_offset = HEADER.size
+    categories_offset = records_offset + len(records)
+    postings_offset = categories_offset + len(category_table)
+    strings_offset = postings_offset + len(postings)
+    header = HEADER.pack(
+        MAGIC, FORMAT_VERSION, len(categories), len(ordered),
+        records_offset, categories_offset, postings_offset, strings_offset
+    )
+    return bytes(header + records + category_table + postings + strings)
+
+
+def write_mmap_catalog(products: Iterable[Products], path: str) -> None:
+    """
+    Writes the shared snapshot atomically.
+
+    Readers keep their existing mapping of the previous file (its inode stays
+    alive while mapped) and pick up the new one on their next refresh.
+    """
+    content = build_mmap_catalog(products)
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.catalog-', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as tmp_file:
+            tmp_file.write(content)
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+class MmapCatalog:
+    """
+    Zero-copy reader over a file written by `write_mmap_catalog`.
+    """
+
+    def __init__(self, path: str):
+        with open(path, 'rb') as snapshot:
+            stat = os.fstat(snapshot.fileno())
+            self._buffer = mmap.mmap(snapshot.fileno(), 0, access=mmap.ACCESS_READ)
+        self.identity = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+        (magic, file_format, category_count, self.record_count,
+         self._records, categories_offset, self._postings, self._strings) = HEADER.unpack_from(self._buffer, 0)
+        if magic != MAGIC or file_format != FORMAT_VERSION:
+            self._buffer.close()
+            raise ValueError(f'{path} is not a shared catalog snapshot')
+
+        self._category_names: List[str] = []
+        self._categories: Dict[str, Tuple[int, int]] = {}
+        for code in range(category_count):
+            name_offset, name_length, first, count = CATEGORY.unpack_from(
+                self._buffer, categories_offset + code * CATEGORY.size
+            )
+            name = self._string(name_offset, name_length)
+            self._category_names.append(name)
+            self._categories[name] = (first, count)
+
+    def __len__(self) -> int:
+        return self.record_count
+
+    def _string(self, offset: int, length: int) -> str:
+        start = self._strings + offset
+        return self._buffer[start:start + length].decode('utf-8')
+
+    def _product_id_at(self, index: int) -> int:
+        return PRODUCT_ID.unpack_from(self._buffer, self._records + index * RECORD.size)[0]
+
+    def _product_at(self, index: int) -> Products:
+        product_id, price, created_at, updated_at, name_offset, name_length, code = RECORD.unpack_from(
+            self._buffer, self._records + index * RECORD.size
+        )
+        return Products(
+            id=product_id,
+            name=self._string(name_offset, name_length),
+            price=price,
+            category=self._category_names[code],
+            created_at=_from_micros(created_at),
+            updated_at=_from_micros(updated_at),
+        )
+
+    def get_by_id(self, product_id: int) -> Optional[Products]:
+        """
+        Binary-searches the record section for a product ID.
+        """
+        product_id = int(product_id)
+        low, high = 0, self.record_count
+        while low < high:
+            middle = (low + high) // 2
+            if self._product_id_at(middle) < product_id:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.record_count and self._product_id_at(low) == product_id:
+            return self._product_at(low)
+        return None
+
+    def list_by_category(self, category: str) -> List[Products]:
+        """
+        Decodes the products of one category, ordered by ID.
+        """
+        first, count = self._categories.get(category, (0, 0))
+        return [
+            self._product_at(POSTING.unpack_from(self._buffer, self._postings + (first + i) * POSTING.size)[0])
+            for i in range(count)
+        ]
+
+    def list_all(self) -> List[Products]:
+        """
+        Decodes every product, ordered by ID.
+        """
+        return [self._product_at(index) for index in range(self.record_count)]
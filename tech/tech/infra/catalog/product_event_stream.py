@@ -0,0 +1,312 @@
+# tech/infra/catalog/product_event_stream.py
+"""
+Live product change notifications for server-sent events.
+
+Two sources feed the stream:
+
+* MongoDB change streams, when the deployment is a replica set. Every pod
+  sees every write, and event IDs are change stream resume tokens, so a
+  client can reconnect to any pod and resume exactly where it stopped.
+  Deletes are observed through the tombstones written by the repository,
+  because a delete event on `products` carries only the ObjectId.
+* Otherwise, the in-process catalog event bus. Event IDs are sequence
+  numbers in a bounded replay buffer, valid on the process that issued
+  them.
+
+When a resume point can no longer be honoured (buffer overflowed, oplog
+rolled over, different process), the stream emits a `reset` event and the
+client should catch up through GET /products/changes.
+"""
+import asyncio
+import collections
+import contextlib
+import json
+import logging
+import os
+import threading
+import uuid
+from typing import AsyncIterator, Deque, Dict, List, Optional, Tuple
+
+from pymongo.errors import OperationFailure
+
+from tech.domain.entities.products import Products
+from tech.infra.catalog.catalog_events import ProductChange, catalog_events
+from tech.infra.databases.mongodb import get_async_database
+
+logger = logging.getLogger(__name__)
+
+# 'auto' usa change streams quando o MongoDB é um replica set
+PRODUCT_EVENTS_SOURCE = os.getenv('PRODUCT_EVENTS_SOURCE', 'auto')
+PRODUCT_EVENTS_BUFFER_SIZE = int(os.getenv('PRODUCT_EVENTS_BUFFER_SIZE', '1000'))
+PRODUCT_EVENTS_HEARTBEAT_SECONDS = float(os.getenv('PRODUCT_EVENTS_HEARTBEAT_SECONDS', '15'))
+
+# Códigos do servidor: change streams indisponíveis / histórico perdido
+_CHANGE_STREAMS_UNSUPPORTED = {40573}
+_CHANGE_STREAM_HISTORY_LOST = {136, 280, 286}
+
+
+class ProductEvent:
+    """
+    One notification sent to stream clients.
+
+    Attributes:
+        event_id (str): Resume token of this event.
+        action (str): 'create', 'update', 'delete' or 'reset'.
+        product_id (Optional[int]): The affected product.
+        product (Optional[dict]): The product as returned by the API, for
+            creates and updates.
+    """
+
+    def __init__(self, event_id: Optional[str], action: str, product_id: Optional[int] = None,
+                 product: Optional[dict] = None):
+        self.event_id = event_id
+        self.action = action
+        self.product_id = product_id
+        self.product = product
+
+    @classmethod
+    def reset(cls) -> 'ProductEvent':
+        return cls(None, 'reset')
+
+    def to_sse(self) -> str:
+        """
+        Formats the event in the text/event-stream wire format.
+        """
+        lines = []
+        if self.event_id is not None:
+            lines.append(f'id: {self.event_id}')
+        lines.append(f'event: {self.action}')
+        data = {'action': self.action, 'product_id': self.product_id, 'product': self.product}
+        lines.append(f'data: {json.dumps(data, ensure_ascii=False, separators=(",", ":"))}')
+        return '\n'.join(lines) + '\n\n'
+
+
+class _Subscription:
+    def __init__(self, loop: asyncio.AbstractEventLoop, size: int):
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=size)
+        self.overflowed = False
+
+    def offer(self, event: ProductEvent) -> None:
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+
+class LocalEventBuffer:
+    """
+    Bounded replay buffer of the writes published on the catalog event bus.
+
+    Writes are published from the threads that run the endpoints, so events
+    are handed to each subscriber's event loop with call_soon_threadsafe.
+    """
+
+    def __init__(self, size: int = PRODUCT_EVENTS_BUFFER_SIZE):
+        self.size = size
+        self.boot_id = uuid.uuid4().hex[:8]
+        self._lock = threading.Lock()
+        self._sequence = 0
+        self._events: Deque[Tuple[int, ProductEvent]] = collections.deque(maxlen=size)
+        self._subscriptions: List[_Subscription] = []
+
+    def _event_id(self, sequence: int) -> str:
+        return f'L{self.boot_id}-{sequence}'
+
+    def _parse(self, event_id: str) -> Optional[int]:
+        prefix = f'L{self.boot_id}-'
+        if not event_id.startswith(prefix):
+            return None
+        try:
+            return int(event_id[len(prefix):])
+        except ValueError:
+            return None
+
+    def publish(self, changes: List[ProductChange]) -> None:
+        """
+        Catalog subscriber: records and fans out the local writes.
+        """
+        with self._lock:
+            for change in changes:
+                if change.origin != 'local':
+                    continue
+                self._sequence += 1
+                event = ProductEvent(
+                    self._event_id(self._sequence), change.action, change.product_id,
+                    change.product.dict() if change.product is not None else None
+                )
+                self._events.append((self._sequence, event))
+                for subscription in self._subscriptions:
+                    try:
+                        subscription.loop.call_soon_threadsafe(subscription.offer, event)
+                    except RuntimeError:
+                        # Loop do assinante já encerrado
+                        pass
+
+    def subscribe(self, last_event_id: Optional[str]) -> Tuple[_Subscription, List[ProductEvent]]:
+        """
+        Registers a subscriber and returns the events it missed.
+
+        Args:
+            last_event_id: The last event the client received, if any.
+
+        Returns:
+            The subscription and the events to replay first; a single reset
+            event when the resume point is not in the buffer any more.
+        """
+        subscription = _Subscription(asyncio.get_running_loop(), self.size)
+        with self._lock:
+            replay: List[ProductEvent] = []
+            if last_event_id:
+                sequence = self._parse(last_event_id)
+                oldest = self._events[0][0] if self._events else self._sequence + 1
+                if sequence is None or sequence > self._sequence or sequence < oldest - 1:
+                    replay = [ProductEvent.reset()]
+                else:
+                    replay = [event for number, event in self._events if number > sequence]
+            self._subscriptions.append(subscription)
+        return subscription, replay
+
+    def unsubscribe(self, subscription: _Subscription) -> None:
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+
+    async def events(self, last_event_id: Optional[str]) -> AsyncIterator[ProductEvent]:
+        """
+        Yields missed events, then live ones, until the client goes away.
+        """
+        subscription, replay = self.subscribe(last_event_id)
+        try:
+            for event in replay:
+                yield event
+            while True:
+                event = await subscription.queue.get()
+                yield event
+                if subscription.overflowed and subscription.queue.empty():
+                    # Cliente lento demais: eventos foram descartados
+                    subscription.overflowed = False
+                    yield ProductEvent.reset()
+        finally:
+            self.unsubscribe(subscription)
+
+
+def _change_to_event(change: Dict) -> Optional[ProductEvent]:
+    """
+    Converts a change stream document into a ProductEvent, or None if it
+    carries nothing clients need.
+    """
+    event_id = f"C{change['_id']['_data']}"
+    collection = change.get('ns', {}).get('coll')
+    document = change.get('fullDocument') or {}
+    if collection == 'product_tombstones':
+        if 'product_id' not in document:
+            return None
+        return ProductEvent(event_id, 'delete', int(document['product_id']))
+    if 'product_id' not in document or document['product_id'] is None:
+        return None
+    product = Products(
+        id=document['product_id'],
+        name=document['name'],
+        price=document['price'],
+        category=document['category'],
+        created_at=document.get('created_at'),
+        updated_at=document.get('updated_at')
+    )
+    action = 'create' if change['operationType'] == 'insert' else 'update'
+    return ProductEvent(event_id, action, product.id, product.dict())
+
+
+class ChangeStreamUnavailable(Exception):
+    """
+    Raised when the deployment does not support change streams.
+    """
+
+
+class ProductEventStream:
+    """
+    Chooses the event source and exposes one async iterator per client.
+    """
+
+    def __init__(self, buffer: LocalEventBuffer, source: str = PRODUCT_EVENTS_SOURCE,
+                 database_getter=get_async_database):
+        self.buffer = buffer
+        self.source = source
+        self.database_getter = database_getter
+        self._change_streams_supported: Optional[bool] = None if source == 'auto' else source == 'changestream'
+
+    async def _change_stream_events(self, last_event_id: Optional[str]) -> AsyncIterator[ProductEvent]:
+        resume_after = None
+        if last_event_id and last_event_id.startswith('C'):
+            resume_after = {'_data': last_event_id[1:]}
+        elif last_event_id:
+            yield ProductEvent.reset()
+
+        pipeline = [{'$match': {
+            'ns.coll': {'$in': ['products', 'product_tombstones']},
+            'operationType': {'$in': ['insert', 'update', 'replace']},
+        }}]
+        database = self.database_getter()
+        try:
+            async with database.watch(pipeline, full_document='updateLookup', resume_after=resume_after) as stream:
+                async for change in stream:
+                    event = _change_to_event(change)
+                    if event is not None:
+                        yield event
+        except OperationFailure as e:
+            if e.code in _CHANGE_STREAMS_UNSUPPORTED:
+                raise ChangeStreamUnavailable(str(e)) from e
+            if e.code in _CHANGE_STREAM_HISTORY_LOST and resume_after is not None:
+                logger.info("Change stream resume token expired: %s", e)
+                yield ProductEvent.reset()
+                return
+            raise
+
+    async def events(self, last_event_id: Optional[str] = None) -> AsyncIterator[ProductEvent]:
+        """
+        Yields product events for one client, starting after `last_event_id`.
+        """
+        if self._change_streams_supported is not False:
+            try:
+                async for event in self._change_stream_events(last_event_id):
+                    yield event
+                return
+            except ChangeStreamUnavailable as e:
+                logger.info("Change streams unavailable, using the local event bus: %s", e)
+                self._change_streams_supported = False
+        async for event in self.buffer.events(last_event_id):
+            yield event
+
+    async def sse(self, last_event_id: Optional[str] = None,
+                  heartbeat: float = PRODUCT_EVENTS_HEARTBEAT_SECONDS) -> AsyncIterator[str]:
+        """
+        Yields text/event-stream chunks, with a comment line as heartbeat
+        whenever the stream is idle so proxies keep the connection open.
+        """
+        events = self.events(last_event_id).__aiter__()
+        yield 'retry: 3000\n\n'
+        pending: Optional[asyncio.Future] = None
+        try:
+            while True:
+                if pending is None:
+                    pending = asyncio.ensure_future(events.__anext__())
+                done, _ = await asyncio.wait({pending}, timeout=heartbeat)
+                if not done:
+                    yield ': keep-alive\n\n'
+                    continue
+                task, pending = pending, None
+                try:
+                    event = task.result()
+                except StopAsyncIteration:
+                    return
+                yield event.to_sse()
+        finally:
+            if pending is not None:
+                pending.cancel()
+                with contextlib.suppress(asyncio.CancelledError, StopAsyncIteration):
+                    await pending
+            await events.aclose()
+
+local_event_buffer = LocalEventBuffer()
+catalog_events.subscribe(local_event_buffer.publish)
+product_event_stream = ProductEventStream(local_event_buffer)
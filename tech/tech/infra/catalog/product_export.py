@@ -0,0 +1,228 @@
+# tech/infra/catalog/product_export.py
+"""
+Parallel streaming export of the whole catalog as gzip NDJSON or CSV.
+
+The `product_id` range is split into `partitions` disjoint ranges, each
+scanned by its own cursor on its own thread. Every batch of rows is
+encoded and gzip-compressed in a process pool, so the CPU-bound part
+scales with the number of cores and never runs on the event loop. Each
+compressed batch is a complete gzip member; concatenated, the members
+form one valid gzip file (RFC 1952), written out as soon as it is ready.
+Rows therefore come out grouped by batch, not in global `product_id`
+order. A bounded queue between the scanners and the client keeps memory
+flat when the client reads slower than the database:
+
+    python -m tech.infra.catalog.product_export products.ndjson.gz
+    python -m tech.infra.catalog.product_export products.csv.gz --format csv
+"""
+import argparse
+import asyncio
+import logging
+import math
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import AsyncIterator, Callable, List, Optional, Tuple
+
+from tech.infra.catalog.export_encoding import csv_header, encode_gzip_chunk, gzip_member
+from tech.infra.repositories.mongodb_product_repository import MongoDBProductRepository
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS = ('ndjson', 'csv')
+# Teto dos padrões: `os.cpu_count()` é o número de núcleos do nó, não o
+# limite de CPU do pod, e cada partição custa uma thread e um cursor
+PRODUCT_EXPORT_MAX_DEFAULT_WORKERS = 2
+
+
+def _default_workers() -> int:
+    try:
+        available = len(os.sched_getaffinity(0))
+    except AttributeError:
+        # Plataformas sem sched_getaffinity (ex.: macOS)
+        available = os.cpu_count() or 1
+    return max(1, min(available, PRODUCT_EXPORT_MAX_DEFAULT_WORKERS))
+
+
+PRODUCT_EXPORT_PARTITIONS = int(os.getenv('PRODUCT_EXPORT_PARTITIONS', str(_default_workers())))
+PRODUCT_EXPORT_BATCH_SIZE = int(os.getenv('PRODUCT_EXPORT_BATCH_SIZE', '5000'))
+PRODUCT_EXPORT_MAX_PENDING_CHUNKS = int(os.getenv('PRODUCT_EXPORT_MAX_PENDING_CHUNKS', '8'))
+# 0 comprime nas próprias threads de leitura, sem pool de processos
+PRODUCT_EXPORT_COMPRESSION_WORKERS = int(
+    os.getenv('PRODUCT_EXPORT_COMPRESSION_WORKERS', str(_default_workers()))
+)
+PRODUCT_EXPORT_GZIP_LEVEL = int(os.getenv('PRODUCT_EXPORT_GZIP_LEVEL', '6'))
+
+_PARTITION_DONE = object()
+
+
+def partition_id_range(bounds: Tuple[int, int], partitions: int) -> List[Tuple[int, int]]:
+    """
+    Splits the inclusive range `bounds` into up to `partitions` half-open ranges.
+
+    Returns:
+        List[Tuple[int, int]]: Contiguous (start, stop) ranges covering `bounds`.
+    """
+    lowest, highest = bounds
+    span = highest - lowest + 1
+    count = max(1, min(partitions, span))
+    step = math.ceil(span / count)
+    return [
+        (start, min(start + step, highest + 1))
+        for start in range(lowest, highest + 1, step)
+    ]
+
+
+class ProductExporter:
+    """
+    Streams the catalog out of MongoDB with concurrent range scans.
+    """
+
+    def __init__(
+            self,
+            source_factory: Callable[[], MongoDBProductRepository] = MongoDBProductRepository,
+            partitions: int = PRODUCT_EXPORT_PARTITIONS,
+            batch_size: int = PRODUCT_EXPORT_BATCH_SIZE,
+            max_pending_chunks: int = PRODUCT_EXPORT_MAX_PENDING_CHUNKS,
+            compression_workers: int = PRODUCT_EXPORT_COMPRESSION_WORKERS,
+            compression_level: int = PRODUCT_EXPORT_GZIP_LEVEL
+    ):
+        self.source_factory = source_factory
+        self.partitions = max(1, partitions)
+        self.batch_size = batch_size
+        self.max_pending_chunks = max_pending_chunks
+        self.compression_workers = compression_workers
+        self.compression_level = compression_level
+        self._source: Optional[MongoDBProductRepository] = None
+        self._pool: Optional[Executor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def source(self) -> MongoDBProductRepository:
+        if self._source is None:
+            self._source = self.source_factory()
+        return self._source
+
+    def _compression_pool(self) -> Optional[Executor]:
+        if self.compression_workers <= 0:
+            return None
+        with self._lock:
+            if self._pool is None:
+                # spawn: um fork herdaria as threads do MongoClient do processo pai
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.compression_workers, mp_context=multiprocessing.get_context('spawn')
+                )
+            return self._pool
+
+    def shutdown(self) -> None:
+        """
+        Stops the compression workers, if they were ever started.
+        """
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def stream(self, file_format: str) -> AsyncIterator[bytes]:
+        """
+        Exports every product as a gzip stream.
+
+        Args:
+            file_format (str): 'ndjson' or 'csv'.
+
+        Returns:
+            AsyncIterator[bytes]: Gzip members; their concatenation is the
+                compressed export.
+
+        Raises:
+            ValueError: If the format is not supported.
+        """
+        if file_format not in EXPORT_FORMATS:
+            raise ValueError(f"Unsupported export format: {file_format}")
+        return self._stream(file_format)
+
+    async def _stream(self, file_format: str) -> AsyncIterator[bytes]:
+        started_at = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        if file_format == 'csv':
+            yield gzip_member(csv_header(), self.compression_level)
+
+        source = self.source
+        bounds = await loop.run_in_executor(None, source.product_id_bounds)
+        if bounds is None:
+            return
+        ranges = partition_id_range(bounds, self.partitions)
+        scanners = ThreadPoolExecutor(max_workers=len(ranges), thread_name_prefix='product-export')
+        compressors = self._compression_pool() or scanners
+        output: asyncio.Queue = asyncio.Queue(maxsize=self.max_pending_chunks)
+        exported = 0
+
+        async def scan(start: int, stop: int) -> None:
+            nonlocal exported
+            try:
+                batches = source.scan_product_id_range(start, stop, self.batch_size)
+                while True:
+                    # Cada faixa tem a sua thread: o mesmo cursor nunca avança em paralelo
+                    rows = await loop.run_in_executor(scanners, next, batches, None)
+                    if rows is None:
+                        break
+                    chunk = await loop.run_in_executor(
+                        compressors, encode_gzip_chunk, rows, file_format, self.compression_level
+                    )
+                    exported += len(rows)
+                    await output.put(chunk)
+            except Exception as e:
+                await output.put(e)
+            else:
+                await output.put(_PARTITION_DONE)
+
+        tasks = [asyncio.ensure_future(scan(start, stop)) for start, stop in ranges]
+        try:
+            remaining = len(tasks)
+            while remaining:
+                item = await output.get()
+                if item is _PARTITION_DONE:
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+            logger.info(
+                "Catalog export: %d products in %d partitions, %.2fs",
+                exported, len(ranges), time.perf_counter() - started_at
+            )
+        finally:
+            for task in tasks:
+                task.cancel()
+            scanners.shutdown(wait=False, cancel_futures=True)
+
+
+product_exporter = ProductExporter()
+
+
+async def _export_to_file(path: str, file_format: str) -> None:
+    exporter = ProductExporter()
+    try:
+        with open(path, 'wb') as output:
+            async for chunk in exporter.stream(file_format):
+                output.write(chunk)
+    finally:
+        exporter.shutdown()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description='Exports the catalog as gzip NDJSON or CSV.')
+    parser.add_argument('path', help='Output file, e.g. products.ndjson.gz')
+    parser.add_argument('--format', choices=EXPORT_FORMATS, help='Defaults to the file extension')
+    args = parser.parse_args(argv)
+
+    file_format = args.format or ('csv' if '.csv' in os.path.basename(args.path).lower() else 'ndjson')
+    started_at = time.perf_counter()
+    asyncio.run(_export_to_file(args.path, file_format))
+    print(f'{args.path}: {os.path.getsize(args.path)} bytes in {time.perf_counter() - started_at:.2f}s')
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
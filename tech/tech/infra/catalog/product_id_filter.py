@@ -0,0 +1,188 @@
+# tech/infra/catalog/product_id_filter.py
+import collections
+import logging
+import os
+import threading
+import time
+from typing import Callable, Iterable, List, Optional, Set
+
+from tech.infra.cache.bloom_filter import BloomFilter
+from tech.infra.catalog.catalog_events import ProductChange, catalog_events
+
+logger = logging.getLogger(__name__)
+
+PRODUCT_ID_FILTER_ENABLED = os.getenv('PRODUCT_ID_FILTER_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+PRODUCT_ID_FILTER_ERROR_RATE = float(os.getenv('PRODUCT_ID_FILTER_ERROR_RATE', '0.01'))
+PRODUCT_ID_FILTER_REFRESH_SECONDS = float(os.getenv('PRODUCT_ID_FILTER_REFRESH_SECONDS', '60'))
+PRODUCT_NEGATIVE_CACHE_SIZE = int(os.getenv('PRODUCT_NEGATIVE_CACHE_SIZE', '10000'))
+PRODUCT_NEGATIVE_CACHE_TTL_SECONDS = float(os.getenv('PRODUCT_NEGATIVE_CACHE_TTL_SECONDS', '30'))
+# Folga para criações entre duas reconstruções, sem saturar o filtro
+_HEADROOM = 2
+_MINIMUM_CAPACITY = 1024
+
+
+class ProductIdFilter:
+    """
+    Answers "does this product_id certainly not exist?" without MongoDB.
+
+    Two structures back the answer:
+
+    * a Bloom filter of every existing `product_id`, rebuilt from the ID
+      index and updated by local writes. An ID the filter has never seen is
+      a definite miss only if it is not above the highest ID seen at the
+      last rebuild: new products always get higher IDs, so a product
+      created by another instance since then is never wrongly rejected.
+    * a small LRU negative cache of IDs recently found missing (or deleted
+      here), with a short TTL, for misses the Bloom filter cannot rule out.
+
+    Creations made here drop the ID from the negative cache at once; the
+    filter is rebuilt every `refresh_seconds`, when it saturates, or when
+    local deletions have piled up.
+    """
+
+    def __init__(
+            self,
+            error_rate: float = PRODUCT_ID_FILTER_ERROR_RATE,
+            refresh_seconds: float = PRODUCT_ID_FILTER_REFRESH_SECONDS,
+            negative_cache_size: int = PRODUCT_NEGATIVE_CACHE_SIZE,
+            negative_cache_ttl: float = PRODUCT_NEGATIVE_CACHE_TTL_SECONDS,
+            clock: Callable[[], float] = time.monotonic
+    ):
+        self.error_rate = error_rate
+        self.refresh_seconds = refresh_seconds
+        self.negative_cache_size = negative_cache_size
+        self.negative_cache_ttl = negative_cache_ttl
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._bloom: Optional[BloomFilter] = None
+        self._max_id = 0
+        self._built_at: Optional[float] = None
+        self._deleted_since_build = 0
+        self._rebuilding = False
+        self._added_during_rebuild: Optional[Set[int]] = None
+        self._missing: 'collections.OrderedDict[int, float]' = collections.OrderedDict()
+
+    @property
+    def ready(self) -> bool:
+        return self._bloom is not None
+
+    def definitely_missing(self, product_id: int) -> bool:
+        """
+        True when `product_id` certainly does not exist.
+        """
+        now = self.clock()
+        with self._lock:
+            expires_at = self._missing.get(product_id)
+            if expires_at is not None:
+                if now < expires_at:
+                    self._missing.move_to_end(product_id)
+                    return True
+                del self._missing[product_id]
+            bloom = self._bloom
+            max_id = self._max_id
+        return bloom is not None and product_id <= max_id and product_id not in bloom
+
+    def record_missing(self, product_id: int) -> None:
+        """
+        Remembers an ID that MongoDB just reported as missing.
+        """
+        with self._lock:
+            self._missing[product_id] = self.clock() + self.negative_cache_ttl
+            self._missing.move_to_end(product_id)
+            while len(self._missing) > self.negative_cache_size:
+                self._missing.popitem(last=False)
+
+    def apply(self, changes: List[ProductChange]) -> None:
+        """
+        Catalog subscriber: adds created IDs and remembers deleted ones.
+        """
+        deleted = [change.product_id for change in changes if change.kind == ProductChange.DELETE]
+        with self._lock:
+            for change in changes:
+                if change.kind != ProductChange.UPSERT:
+                    continue
+                self._missing.pop(change.product_id, None)
+                if self._bloom is not None:
+                    self._bloom.add(change.product_id)
+                    self._max_id = max(self._max_id, change.product_id)
+                if self._added_during_rebuild is not None:
+                    self._added_during_rebuild.add(change.product_id)
+            self._deleted_since_build += len(deleted)
+        for product_id in deleted:
+            self.record_missing(product_id)
+
+    def needs_rebuild(self) -> bool:
+        with self._lock:
+            bloom = self._bloom
+            if self._built_at is None:
+                return True
+            if bloom is None:
+                return self.clock() - self._built_at >= self.refresh_seconds
+            return (
+                self.clock() - self._built_at >= self.refresh_seconds
+                or bloom.saturated
+                or self._deleted_since_build > bloom.capacity // (2 * _HEADROOM)
+            )
+
+    def rebuild(self, load_ids: Callable[[], Iterable[int]]) -> None:
+        """
+        Rebuilds the filter from every existing ID and swaps it in.
+
+        IDs created while the load runs are carried over into the new filter.
+
+        Args:
+            load_ids: Reads every `product_id`, e.g. from the ID index.
+        """
+        with self._lock:
+            self._rebuilding = True
+            self._added_during_rebuild = set()
+            # Se a carga falhar, a próxima tentativa espera o intervalo
+            self._built_at = self.clock()
+        try:
+            ids = [int(product_id) for product_id in load_ids()]
+            bloom = BloomFilter(max(_MINIMUM_CAPACITY, len(ids) * _HEADROOM), self.error_rate)
+            bloom.update(ids)
+            with self._lock:
+                late = self._added_during_rebuild or set()
+                for product_id in late:
+                    bloom.add(product_id)
+                self._bloom = bloom
+                self._max_id = max(max(ids, default=0), max(late, default=0))
+                self._built_at = self.clock()
+                self._deleted_since_build = 0
+            logger.info("Product ID filter rebuilt with %d IDs", len(ids))
+        finally:
+            with self._lock:
+                self._rebuilding = False
+                self._added_during_rebuild = None
+
+    def refresh_in_background(self, load_ids: Callable[[], Iterable[int]]) -> None:
+        """
+        Starts a rebuild on a daemon thread if one is due; never blocks.
+        """
+        if not self.needs_rebuild():
+            return
+        with self._lock:
+            if self._rebuilding:
+                return
+            self._rebuilding = True
+
+        def run() -> None:
+            try:
+                self.rebuild(load_ids)
+            except Exception as e:
+                logger.warning("Product ID filter rebuild failed: %s", e)
+
+        threading.Thread(target=run, name='product-id-filter', daemon=True).start()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._bloom = None
+            self._max_id = 0
+            self._built_at = None
+            self._deleted_since_build = 0
+            self._missing.clear()
+
+
+product_id_filter = ProductIdFilter()
+catalog_events.subscribe(product_id_filter.apply)
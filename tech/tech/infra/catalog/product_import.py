@@ -0,0 +1,306 @@
+# tech/infra/catalog/product_import.py
+"""
+Streaming bulk import of products from NDJSON, CSV or mongodump BSON.
+
+Rows are read incrementally, validated against ProductSchema and upserted
+by name in chunks of `chunk_size` through `ProductRepository.bulk_upsert`.
+A single writer thread consumes a queue bounded to `max_pending_chunks`,
+so parsing overlaps with database writes, and a reader that gets ahead
+blocks until the writer catches up. Memory stays constant whatever the
+size of the input:
+
+    python -m tech.infra.catalog.product_import mongodump/products/products.bson
+    python -m tech.infra.catalog.product_import products.csv --chunk-size 2000
+"""
+import argparse
+import csv
+import io
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import bson
+from pydantic import ValidationError
+
+from tech.domain.entities.products import Products
+from tech.infra.repositories.mongodb_product_repository import MongoDBProductRepository
+from tech.interfaces.repositories.product_repository import ProductRepository
+from tech.interfaces.schemas.product_schema import ProductSchema
+
+logger = logging.getLogger(__name__)
+
+IMPORT_FORMATS = ('ndjson', 'csv', 'bson')
+PRODUCT_IMPORT_CHUNK_SIZE = int(os.getenv('PRODUCT_IMPORT_CHUNK_SIZE', '1000'))
+PRODUCT_IMPORT_MAX_PENDING_CHUNKS = int(os.getenv('PRODUCT_IMPORT_MAX_PENDING_CHUNKS', '2'))
+# Quantos erros de linha são guardados no relatório
+MAX_REPORTED_ERRORS = 20
+
+_EXTENSIONS = {'.ndjson': 'ndjson', '.jsonl': 'ndjson', '.csv': 'csv', '.bson': 'bson'}
+_CONTENT_TYPES = {
+    'application/x-ndjson': 'ndjson',
+    'application/jsonl': 'ndjson',
+    'text/csv': 'csv',
+    'application/bson': 'bson',
+}
+
+
+def detect_format(filename: Optional[str] = None, content_type: Optional[str] = None) -> Optional[str]:
+    """
+    Guesses the import format from a file name or a Content-Type.
+
+    Returns:
+        Optional[str]: 'ndjson', 'csv', 'bson', or None if unknown.
+    """
+    if filename:
+        detected = _EXTENSIONS.get(os.path.splitext(filename)[1].lower())
+        if detected:
+            return detected
+    if content_type:
+        return _CONTENT_TYPES.get(content_type.split(';')[0].strip().lower())
+    return None
+
+
+def read_ndjson(stream: IO[bytes]) -> Iterator[Tuple[int, Any]]:
+    """
+    Yields (line number, decoded value) for each non-blank NDJSON line.
+    """
+    for number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield number, json.loads(line)
+        except ValueError as e:
+            yield number, e
+
+
+def read_csv(stream: IO[bytes]) -> Iterator[Tuple[int, Any]]:
+    """
+    Yields (line number, row) for a CSV file with a header row.
+    """
+    text = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+    try:
+        reader = csv.DictReader(text)
+        for row in reader:
+            yield reader.line_num, row
+    finally:
+        text.detach()
+
+
+def read_bson(stream: IO[bytes]) -> Iterator[Tuple[int, Any]]:
+    """
+    Yields (document number, document) from a mongodump `.bson` file.
+    """
+    for number, document in enumerate(bson.decode_file_iter(stream), start=1):
+        yield number, document
+
+
+_READERS: Dict[str, Callable[[IO[bytes]], Iterator[Tuple[int, Any]]]] = {
+    'ndjson': read_ndjson,
+    'csv': read_csv,
+    'bson': read_bson,
+}
+
+
+def _describe(error: ValidationError) -> str:
+    return '; '.join(f"{'.'.join(str(part) for part in item['loc'])}: {item['msg']}" for item in error.errors())
+
+
+def _to_product(record: Any) -> Products:
+    if isinstance(record, Exception):
+        raise ValueError(f"Invalid JSON: {record}")
+    if not isinstance(record, dict):
+        raise ValueError("Expected an object")
+    product = ProductSchema.model_validate(record)
+    product_id = record.get('product_id') or record.get('id') or None
+    return Products(
+        id=int(product_id) if product_id not in (None, '') else None,
+        name=product.name,
+        price=product.price,
+        category=product.category,
+    )
+
+
+class ImportReport:
+    """
+    Counters and throughput of one import.
+    """
+
+    def __init__(self):
+        self.rows_read = 0
+        self.created = 0
+        self.updated = 0
+        self.invalid = 0
+        self.failed = 0
+        self.errors: List[Dict[str, Any]] = []
+        self.started_at = time.perf_counter()
+        self.elapsed_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def add_error(self, row: int, message: str, invalid: bool) -> None:
+        with self._lock:
+            if invalid:
+                self.invalid += 1
+            else:
+                self.failed += 1
+            if len(self.errors) < MAX_REPORTED_ERRORS:
+                self.errors.append({'row': row, 'error': message})
+
+    def add_written(self, created: int, updated: int) -> None:
+        with self._lock:
+            self.created += created
+            self.updated += updated
+
+    def finish(self) -> None:
+        self.elapsed_seconds = time.perf_counter() - self.started_at
+
+    @property
+    def rows_per_second(self) -> float:
+        elapsed = self.elapsed_seconds or (time.perf_counter() - self.started_at)
+        return self.rows_read / elapsed if elapsed > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'rows_read': self.rows_read,
+            'created': self.created,
+            'updated': self.updated,
+            'invalid': self.invalid,
+            'failed': self.failed,
+            'errors': list(self.errors),
+            'elapsed_seconds': round(self.elapsed_seconds, 3),
+            'rows_per_second': round(self.rows_per_second, 1),
+        }
+
+
+class ProductImporter:
+    """
+    Streams products from a file into the repository in bounded chunks.
+    """
+
+    def __init__(
+            self,
+            repository: ProductRepository,
+            chunk_size: int = PRODUCT_IMPORT_CHUNK_SIZE,
+            max_pending_chunks: int = PRODUCT_IMPORT_MAX_PENDING_CHUNKS,
+            progress: Optional[Callable[[ImportReport], None]] = None
+    ):
+        self.repository = repository
+        self.chunk_size = chunk_size
+        self.max_pending_chunks = max_pending_chunks
+        self.progress = progress
+
+    def _write(self, chunk: List[Tuple[int, Products]], report: ImportReport) -> None:
+        # Linhas repetidas no mesmo lote: a última vence, como em lotes separados
+        latest: Dict[str, Tuple[int, Products]] = {}
+        for row, product in chunk:
+            latest.pop(product.name, None)
+            latest[product.name] = (row, product)
+        rows = [row for row, _ in latest.values()]
+        results = self.repository.bulk_upsert([product for _, product in latest.values()])
+
+        created = updated = 0
+        for row, result in zip(rows, results):
+            if result.status == 'created':
+                created += 1
+            elif result.status == 'updated':
+                updated += 1
+            else:
+                report.add_error(row, result.error or 'write failed', invalid=False)
+        # Linhas substituídas por uma posterior do mesmo lote contam como atualizações
+        report.add_written(created, updated + len(chunk) - len(latest))
+        if self.progress is not None:
+            self.progress(report)
+
+    def import_stream(self, stream: IO[bytes], file_format: str) -> ImportReport:
+        """
+        Imports every row of `stream`.
+
+        Args:
+            stream: Binary file-like object, read sequentially.
+            file_format (str): 'ndjson', 'csv' or 'bson'.
+
+        Returns:
+            ImportReport: Counters, a sample of row errors and throughput.
+
+        Raises:
+            ValueError: If the format is not supported.
+            Exception: Whatever a bulk write raised; rows already written
+                stay written.
+        """
+        reader = _READERS.get(file_format)
+        if reader is None:
+            raise ValueError(f"Unsupported import format: {file_format}")
+
+        report = ImportReport()
+        pending: queue.Queue = queue.Queue(maxsize=self.max_pending_chunks)
+        failures: List[BaseException] = []
+
+        def writer() -> None:
+            while True:
+                chunk = pending.get()
+                if chunk is None:
+                    return
+                if failures:
+                    # Continua consumindo para o leitor não ficar bloqueado
+                    continue
+                try:
+                    self._write(chunk, report)
+                except BaseException as e:
+                    failures.append(e)
+
+        thread = threading.Thread(target=writer, name='product-import-writer', daemon=True)
+        thread.start()
+        try:
+            chunk: List[Tuple[int, Products]] = []
+            for row, record in reader(stream):
+                if failures:
+                    break
+                report.rows_read += 1
+                try:
+                    chunk.append((row, _to_product(record)))
+                except ValidationError as e:
+                    report.add_error(row, _describe(e), invalid=True)
+                    continue
+                except (ValueError, TypeError) as e:
+                    report.add_error(row, str(e), invalid=True)
+                    continue
+                if len(chunk) >= self.chunk_size:
+                    pending.put(chunk)
+                    chunk = []
+            if chunk and not failures:
+                pending.put(chunk)
+        finally:
+            pending.put(None)
+            thread.join()
+
+        report.finish()
+        if failures:
+            raise failures[0]
+        return report
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description='Imports products from an NDJSON, CSV or mongodump BSON file.')
+    parser.add_argument('path', help='File to import')
+    parser.add_argument('--format', choices=IMPORT_FORMATS, help='Defaults to the file extension')
+    parser.add_argument('--chunk-size', type=int, default=PRODUCT_IMPORT_CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    file_format = args.format or detect_format(filename=args.path)
+    if file_format is None:
+        parser.error('cannot tell the format from the file name, pass --format')
+
+    def progress(report: ImportReport) -> None:
+        print(f'{report.rows_read} rows, {report.rows_per_second:.0f} rows/s', flush=True)
+
+    importer = ProductImporter(MongoDBProductRepository(), chunk_size=args.chunk_size, progress=progress)
+    with open(args.path, 'rb') as stream:
+        report = importer.import_stream(stream, file_format)
+    print(json.dumps(report.to_dict(), indent=2))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
@@ -0,0 +1,126 @@
+# tech/infra/catalog/product_view_cache.py
+import collections
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List
+
+from tech.infra.catalog.catalog_events import ProductChange, catalog_events
+from tech.infra.catalog.catalog_validators import Validators
+
+PRODUCT_VIEW_CACHE_SIZE = int(os.getenv('PRODUCT_VIEW_CACHE_SIZE', '10000'))
+# Escritas de outros pods aparecem em até este intervalo
+PRODUCT_VIEW_CACHE_TTL_SECONDS = float(os.getenv('PRODUCT_VIEW_CACHE_TTL_SECONDS', '30'))
+
+
+class RenderedProduct:
+    """
+    One product as the final JSON bytes, with its HTTP cache validators.
+    """
+
+    __slots__ = ('body', 'validators', 'expires_at')
+
+    def __init__(self, body: bytes, validators: Validators, expires_at: float):
+        self.body = body
+        self.validators = validators
+        self.expires_at = expires_at
+
+
+def render_product(product: Dict[str, Any]) -> RenderedProduct:
+    """
+    Serializes a product (as returned by `Products.dict`) and derives a
+    strong ETag from the bytes and Last-Modified from `updated_at`, falling
+    back to `created_at`.
+    """
+    body = json.dumps(product, ensure_ascii=False, allow_nan=False, separators=(',', ':')).encode('utf-8')
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    changed_at = product.get('updated_at') or product.get('created_at')
+    if changed_at:
+        last_modified = datetime.fromisoformat(changed_at)
+        # O repositório grava `updated_at` com datetime.utcnow(), sem fuso
+        if last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=timezone.utc)
+    else:
+        last_modified = datetime.now(timezone.utc)
+    return RenderedProduct(body, Validators(etag, last_modified.replace(microsecond=0)), 0.0)
+
+
+class ProductViewCache:
+    """
+    Bounded LRU of rendered single products, keyed by `product_id`.
+
+    A hit is one dictionary lookup and hands out the stored bytes and
+    validators, without touching the repository or serializing anything.
+    Local writes evict the changed IDs through the catalog event bus;
+    writes made by other pods show up once the entry's TTL runs out.
+    """
+
+    def __init__(
+            self,
+            max_entries: int = PRODUCT_VIEW_CACHE_SIZE,
+            ttl: float = PRODUCT_VIEW_CACHE_TTL_SECONDS,
+            clock: Callable[[], float] = time.monotonic
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._entries: 'collections.OrderedDict[int, RenderedProduct]' = collections.OrderedDict()
+        self._generation = 0
+
+    def get(self, product_id: int, load: Callable[[], Dict[str, Any]]) -> RenderedProduct:
+        """
+        Returns the rendered product, loading and rendering it on a miss.
+
+        Args:
+            product_id (int): The product to return.
+            load: Returns the product as a dict; its exceptions (e.g. not
+                found) propagate and nothing is cached.
+
+        Returns:
+            RenderedProduct: The JSON body with its ETag and Last-Modified.
+        """
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(product_id)
+            if entry is not None:
+                if now < entry.expires_at:
+                    self._entries.move_to_end(product_id)
+                    return entry
+                del self._entries[product_id]
+            generation = self._generation
+
+        entry = render_product(load())
+        entry.expires_at = self.clock() + self.ttl
+        with self._lock:
+            # Uma escrita durante a leitura pode ter tornado o valor antigo
+            if generation == self._generation and self.max_entries > 0:
+                self._entries[product_id] = entry
+                self._entries.move_to_end(product_id)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return entry
+
+    def apply(self, changes: List[ProductChange]) -> None:
+        """
+        Catalog subscriber: evicts the changed products.
+        """
+        with self._lock:
+            self._generation += 1
+            for change in changes:
+                self._entries.pop(change.product_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+product_view_cache = ProductViewCache()
+catalog_events.subscribe(product_view_cache.apply)
@@ -0,0 +1,201 @@
+# tech/infra/catalog/shared_catalog.py
+import asyncio
+import fcntl
+import logging
+import os
+import time
+from typing import List, Optional
+
+from tech.infra.catalog.catalog_events import ProductChange, catalog_events
+from tech.infra.catalog.catalog_store import CatalogStore, catalog_store
+from tech.infra.catalog.catalog_sync import CatalogSynchronizer, catalog_synchronizer
+from tech.infra.catalog.mmap_catalog import MmapCatalog, write_mmap_catalog
+
+logger = logging.getLogger(__name__)
+
+# Vazio desabilita o snapshot compartilhado (um worker por pod)
+SHARED_CATALOG_PATH = os.getenv('SHARED_CATALOG_PATH', '')
+SHARED_CATALOG_POLL_SECONDS = float(os.getenv('SHARED_CATALOG_POLL_SECONDS', '1'))
+
+
+class SharedCatalog:
+    """
+    Coordinates the memory-mapped catalog snapshot between the workers of a pod.
+
+    Exactly one worker, the refresher, holds an exclusive lock on
+    `<path>.lock`. It keeps the in-memory CatalogStore (warm-up and reconcile
+    loop) and rewrites the mapped file atomically whenever the store changes.
+    Every other worker skips the store entirely and only maps the file, so
+    the catalog costs no per-worker memory. Followers retry the lock and take
+    over if the refresher dies.
+
+    Writes handled by a follower touch `<path>.dirty`; the refresher notices
+    it on its next poll and reloads from MongoDB, so the shared snapshot
+    catches up within one poll interval.
+    """
+
+    def __init__(
+            self,
+            path: str = SHARED_CATALOG_PATH,
+            store: CatalogStore = catalog_store,
+            synchronizer: CatalogSynchronizer = catalog_synchronizer,
+            poll_interval: float = SHARED_CATALOG_POLL_SECONDS
+    ):
+        self.path = path
+        self.store = store
+        self.synchronizer = synchronizer
+        self.poll_interval = poll_interval
+        self.is_refresher = False
+        self._lock_file = None
+        self._reader: Optional[MmapCatalog] = None
+        self._checked_at = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path)
+
+    @property
+    def _dirty_path(self) -> str:
+        return f'{self.path}.dirty'
+
+    def try_become_refresher(self) -> bool:
+        """
+        Tries to take the refresher lock without blocking.
+
+        Returns:
+            bool: True if this worker is (now) the refresher.
+        """
+        if self.is_refresher:
+            return True
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        lock_file = open(f'{self.path}.lock', 'a')
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        self._lock_file = lock_file
+        self.is_refresher = True
+        catalog_events.unsubscribe(self.mark_dirty)
+        return True
+
+    def release(self) -> None:
+        """
+        Releases the refresher lock, if held.
+        """
+        if self._lock_file is not None:
+            fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
+            self._lock_file.close()
+            self._lock_file = None
+        self.is_refresher = False
+
+    def reader(self) -> Optional[MmapCatalog]:
+        """
+        Returns the current mapping, remapping if the file was replaced.
+
+        The file is stat'ed at most once per poll interval, so hot reads only
+        pay for an attribute lookup.
+
+        Returns:
+            Optional[MmapCatalog]: None while no snapshot has been written.
+        """
+        now = time.monotonic()
+        if self._reader is not None and now - self._checked_at < self.poll_interval:
+            return self._reader
+        self._checked_at = now
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return self._reader
+        identity = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if self._reader is None or self._reader.identity != identity:
+            try:
+                self._reader = MmapCatalog(self.path)
+            except (OSError, ValueError) as e:
+                logger.warning("Could not map shared catalog %s: %s", self.path, e)
+        return self._reader
+
+    def mark_dirty(self, changes: List[ProductChange]) -> None:
+        """
+        Catalog subscriber used by followers: asks the refresher to reload.
+        """
+        with open(self._dirty_path, 'a'):
+            os.utime(self._dirty_path)
+
+    async def wait_until_available(self) -> None:
+        """
+        Follower warmup: waits until the refresher has written a snapshot.
+        """
+        while self.reader() is None:
+            self._checked_at = 0.0
+            await asyncio.sleep(0.05)
+
+    async def warm_up(self) -> None:
+        """
+        Startup warmup for the 'catalog' step when sharing is enabled.
+        """
+        if self.is_refresher:
+            await self.synchronizer.warm_up()
+        else:
+            await self.wait_until_available()
+
+    def _dirty_mtime(self) -> float:
+        try:
+            return os.stat(self._dirty_path).st_mtime
+        except FileNotFoundError:
+            return 0.0
+
+    async def _run(self) -> None:
+        published_version = None
+        seen_dirty = self._dirty_mtime()
+        took_over = False
+        while True:
+            try:
+                if not self.is_refresher and self.try_become_refresher():
+                    logger.info("Taking over as shared catalog refresher")
+                    took_over = True
+                if took_over and not self.store.loaded:
+                    await self.synchronizer.warm_up()
+                if self.is_refresher:
+                    dirty = self._dirty_mtime()
+                    if dirty > seen_dirty:
+                        seen_dirty = dirty
+                        await self.synchronizer.refresh_now()
+                    if self.store.loaded and self.store.version != published_version:
+                        version = self.store.version
+                        await asyncio.to_thread(write_mmap_catalog, self.store.list_all(), self.path)
+                        published_version = version
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Shared catalog refresh failed: %s", e)
+            await asyncio.sleep(self.poll_interval)
+
+    def start(self) -> None:
+        """
+        Elects the refresher and starts the coordination loop.
+        """
+        if not self.enabled:
+            return
+        if not self.try_become_refresher():
+            catalog_events.subscribe(self.mark_dirty)
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Stops the coordination loop and releases the refresher lock.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        catalog_events.unsubscribe(self.mark_dirty)
+        self.release()
+
+
+shared_catalog = SharedCatalog()
@@ -0,0 +1,138 @@
+# tech/infra/catalog/snapshot_file.py
+"""
+Compressed on-disk snapshot of the product catalog.
+
+Pods write the snapshot periodically and read it back on start when MongoDB
+is slow or unreachable. It can also be produced from a mongodump export:
+
+    python -m tech.infra.catalog.snapshot_file \\
+        --from-bson mongodump/products/products.bson \\
+        --output /var/cache/products/catalog.json.gz
+"""
+import argparse
+import gzip
+import json
+import os
+import tempfile
+from datetime import datetime
+from typing import Iterable, List, Optional
+
+import bson
+
+from tech.domain.entities.products import Products
+
+SNAPSHOT_FORMAT = 1
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+def product_to_record(product: Products) -> dict:
+    """
+    Converts a product to the JSON record stored in the snapshot.
+    """
+    return {
+        'product_id': int(product.id),
+        'name': product.name,
+        'price': product.price,
+        'category': product.category,
+        'created_at': product.created_at.isoformat() if product.created_at else None,
+        'updated_at': product.updated_at.isoformat() if product.updated_at else None,
+    }
+
+
+def record_to_product(record: dict) -> Products:
+    """
+    Converts a snapshot record back to a product entity.
+    """
+    return Products(
+        id=record['product_id'],
+        name=record['name'],
+        price=record['price'],
+        category=record['category'],
+        created_at=_parse_datetime(record.get('created_at')),
+        updated_at=_parse_datetime(record.get('updated_at')),
+    )
+
+
+def write_snapshot(products: Iterable[Products], path: str) -> None:
+    """
+    Writes the catalog to `path` atomically.
+
+    The file is written to a temporary sibling and renamed over the target,
+    so readers (including other workers) never see a partial snapshot.
+
+    Args:
+        products: Products to store.
+        path (str): Destination file.
+    """
+    document = {
+        'format': SNAPSHOT_FORMAT,
+        'written_at': datetime.utcnow().isoformat(),
+        'products': [product_to_record(product) for product in products],
+    }
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.catalog-', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=6) as gz:
+            gz.write(json.dumps(document, separators=(',', ':')).encode('utf-8'))
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def read_snapshot(path: str) -> List[Products]:
+    """
+    Reads a snapshot written by `write_snapshot`.
+
+    Raises:
+        FileNotFoundError: If the snapshot does not exist.
+        ValueError: If the file is not a supported snapshot.
+    """
+    with gzip.open(path, 'rb') as gz:
+        document = json.loads(gz.read())
+    if document.get('format') != SNAPSHOT_FORMAT:
+        raise ValueError(f"Unsupported catalog snapshot format: {document.get('format')}")
+    return [record_to_product(record) for record in document['products']]
+
+
+def read_mongodump(path: str) -> List[Products]:
+    """
+    Reads products from a mongodump `.bson` collection file.
+
+    Documents without a `product_id` (legacy rows) are skipped, matching
+    what the repository lists.
+    """
+    products = []
+    with open(path, 'rb') as dump:
+        for document in bson.decode_file_iter(dump):
+            if document.get('product_id') is None:
+                continue
+            products.append(Products(
+                id=document['product_id'],
+                name=document['name'],
+                price=document['price'],
+                category=document['category'],
+                created_at=document.get('created_at'),
+                updated_at=document.get('updated_at'),
+            ))
+    return products
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description='Builds a catalog snapshot from a mongodump file.')
+    parser.add_argument('--from-bson', required=True, help='Path to products.bson')
+    parser.add_argument('--output', required=True, help='Snapshot file to write')
+    args = parser.parse_args(argv)
+
+    products = read_mongodump(args.from_bson)
+    write_snapshot(products, args.output)
+    print(f'{len(products)} products written to {args.output}')
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
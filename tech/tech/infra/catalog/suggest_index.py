@@ -0,0 +1,109 @@
+# tech/infra/catalog/suggest_index.py
+import bisect
+import unicodedata
+from typing import Callable, Dict, List, Tuple
+
+from tech.domain.entities.products import Products
+from tech.infra.catalog.catalog_events import catalog_events
+from tech.infra.catalog.catalog_store import CatalogStore, catalog_store
+from tech.infra.catalog.incremental_index import IncrementalCatalogIndex
+from tech.infra.catalog.shared_catalog import SharedCatalog, shared_catalog
+
+
+def fold(text: str) -> str:
+    """
+    Normalizes text for matching: strips accents, casefolds and collapses
+    whitespace, so "Pão  de Queijo" and "pao de queijo" compare equal.
+    """
+    decomposed = unicodedata.normalize('NFKD', text)
+    stripped = ''.join(char for char in decomposed if not unicodedata.combining(char))
+    return ' '.join(stripped.casefold().split())
+
+
+def _word_starts(folded: str) -> List[str]:
+    """
+    Returns the folded name and every suffix starting at a word, so that
+    "burger" also finds "X-Burger".
+    """
+    keys = [folded]
+    for index in range(1, len(folded)):
+        if not folded[index - 1].isalnum() and folded[index].isalnum():
+            keys.append(folded[index:])
+    return keys
+
+
+class SuggestIndex(IncrementalCatalogIndex):
+    """
+    Accent-insensitive prefix index over product names for type-ahead.
+
+    Keys are kept in a sorted list of (folded key, product_id) tuples, so a
+    lookup is one binary search plus a scan over at most k matches. Writes
+    insert or remove only the keys of the products that changed.
+    """
+
+    def __init__(self, store: CatalogStore = catalog_store, shared: SharedCatalog = shared_catalog):
+        super().__init__(store, shared)
+        self._keys: List[Tuple[str, int]] = []
+        self._products: Dict[int, Products] = {}
+
+    def _load(self, products: List[Products]) -> None:
+        keys = []
+        indexed = {}
+        for product in products:
+            product_id = int(product.id)
+            indexed[product_id] = product
+            keys.extend((key, product_id) for key in _word_starts(fold(product.name)))
+        keys.sort()
+        self._keys = keys
+        self._products = indexed
+
+    def _remove(self, product_id: int) -> None:
+        product = self._products.pop(product_id, None)
+        if product is None:
+            return
+        for key in _word_starts(fold(product.name)):
+            position = bisect.bisect_left(self._keys, (key, product_id))
+            if position < len(self._keys) and self._keys[position] == (key, product_id):
+                del self._keys[position]
+
+    def _insert(self, product: Products) -> None:
+        product_id = int(product.id)
+        self._products[product_id] = product
+        for key in _word_starts(fold(product.name)):
+            bisect.insort(self._keys, (key, product_id))
+
+    def suggest(self, prefix: str, limit: int, fallback: Callable[[], List[Products]]) -> List[Products]:
+        """
+        Returns up to `limit` products whose name, or a word of it, starts
+        with `prefix`, ignoring case and accents.
+
+        Args:
+            prefix (str): What the user typed so far.
+            limit (int): Maximum number of suggestions.
+            fallback: Loads every product when no in-memory catalog exists.
+
+        Returns:
+            List[Products]: Matches ordered by the matched text.
+        """
+        folded = fold(prefix)
+        if not folded:
+            return []
+        self._ensure_current(fallback)
+
+        suggestions: List[Products] = []
+        seen = set()
+        with self._lock:
+            position = bisect.bisect_left(self._keys, (folded,))
+            while position < len(self._keys) and len(suggestions) < limit:
+                key, product_id = self._keys[position]
+                if not key.startswith(folded):
+                    break
+                if product_id not in seen:
+                    seen.add(product_id)
+                    suggestions.append(self._products[product_id])
+                position += 1
+        return suggestions
+
+
+suggest_index = SuggestIndex()
+catalog_events.subscribe(suggest_index.apply)
@@ -0,0 +1,115 @@
+# tech/infra/catalog/trigram_index.py
+from collections import Counter
+from typing import Callable, Dict, FrozenSet, List, Optional, Set, Tuple
+
+from tech.domain.entities.products import Products
+from tech.infra.catalog.catalog_events import catalog_events
+from tech.infra.catalog.catalog_store import CatalogStore, catalog_store
+from tech.infra.catalog.incremental_index import IncrementalCatalogIndex
+from tech.infra.catalog.shared_catalog import SharedCatalog, shared_catalog
+from tech.infra.catalog.suggest_index import fold
+
+# Similaridade mínima padrão, a mesma do pg_trgm
+DEFAULT_SIMILARITY_THRESHOLD = 0.3
+
+
+def trigrams(text: str) -> FrozenSet[str]:
+    """
+    Returns the trigrams of a folded text, pg_trgm style: every word is
+    padded with two spaces in front and one behind, so word starts weigh
+    more than word middles and one-letter typos still share most trigrams.
+    """
+    grams: Set[str] = set()
+    for word in ''.join(char if char.isalnum() else ' ' for char in fold(text)).split():
+        padded = f'  {word} '
+        grams.update(padded[index:index + 3] for index in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+class TrigramIndex(IncrementalCatalogIndex):
+    """
+    Typo-tolerant name search over a trigram inverted index.
+
+    Each trigram maps to the set of product IDs whose folded name contains
+    it. A query only visits the posting lists of its own trigrams, counts
+    how many trigrams each candidate shares and ranks candidates by Jaccard
+    similarity, |shared| / |query ∪ name|. Writes update only the postings of
+    the products that changed.
+    """
+
+    def __init__(self, store: CatalogStore = catalog_store, shared: SharedCatalog = shared_catalog):
+        super().__init__(store, shared)
+        self._postings: Dict[str, Set[int]] = {}
+        self._grams: Dict[int, FrozenSet[str]] = {}
+        self._products: Dict[int, Products] = {}
+
+    def _load(self, products: List[Products]) -> None:
+        self._postings = {}
+        self._grams = {}
+        self._products = {}
+        for product in products:
+            self._insert(product)
+
+    def _insert(self, product: Products) -> None:
+        product_id = int(product.id)
+        grams = trigrams(product.name)
+        self._products[product_id] = product
+        self._grams[product_id] = grams
+        for gram in grams:
+            self._postings.setdefault(gram, set()).add(product_id)
+
+    def _remove(self, product_id: int) -> None:
+        self._products.pop(product_id, None)
+        for gram in self._grams.pop(product_id, ()):
+            posting = self._postings.get(gram)
+            if posting is not None:
+                posting.discard(product_id)
+                if not posting:
+                    del self._postings[gram]
+
+    def search(
+            self,
+            text: str,
+            limit: int,
+            fallback: Callable[[], List[Products]],
+            category: Optional[str] = None,
+            threshold: float = DEFAULT_SIMILARITY_THRESHOLD
+    ) -> List[Tuple[Products, float]]:
+        """
+        Finds the products whose names are most similar to `text`.
+
+        Args:
+            text (str): Free text, possibly misspelled.
+            limit (int): Maximum number of results.
+            fallback: Loads every product when no in-memory catalog exists.
+            category (Optional[str]): Only consider products of this category.
+            threshold (float): Minimum similarity, between 0 and 1.
+
+        Returns:
+            List[Tuple[Products, float]]: Products with their similarity,
+                most similar first.
+        """
+        query = trigrams(text)
+        if not query:
+            return []
+        self._ensure_current(fallback)
+
+        with self._lock:
+            shared = Counter()
+            for gram in query:
+                shared.update(self._postings.get(gram, ()))
+            scored = []
+            for product_id, count in shared.items():
+                product = self._products[product_id]
+                if category is not None and product.category != category:
+                    continue
+                similarity = count / (len(query) + len(self._grams[product_id]) - count)
+                if similarity >= threshold:
+                    scored.append((product, similarity))
+
+        scored.sort(key=lambda item: (-item[1], fold(item[0].name), int(item[0].id)))
+        return scored[:limit]
+
+
+trigram_index = TrigramIndex()
+catalog_events.subscribe(trigram_index.apply)
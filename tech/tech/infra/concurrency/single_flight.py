@@ -0,0 +1,168 @@
+# tech/infra/concurrency/single_flight.py
+import asyncio
+import contextvars
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+from tech.infra.observability.request_context import RequestContext, current_request_context, start_request_context
+from tech.infra.resilience.request_deadline import (
+    REQUEST_DEADLINE_SECONDS, DeadlineExceeded, remaining, start_deadline
+)
+
+T = TypeVar('T')
+
+
+def _detached() -> Tuple[contextvars.Context, RequestContext]:
+    # Contexto sem o prazo e o RequestContext de quem iniciou a chamada, com
+    # um prazo próprio: o padrão de uma requisição, ou o de quem a iniciou se
+    # for maior, para que o MongoDB sempre receba `maxTimeMS`
+    budget = max(REQUEST_DEADLINE_SECONDS, remaining() or 0.0)
+    context = contextvars.Context()
+    trace, _ = context.run(start_request_context)
+    context.run(start_deadline, budget)
+    return context, trace
+
+
+def _wait_budget() -> Optional[float]:
+    budget = remaining()
+    return None if budget is None else max(0.0, budget)
+
+
+def _adopt(trace: Optional[RequestContext]) -> None:
+    # Cada requisição recebe as métricas e avisos da leitura compartilhada
+    context = current_request_context()
+    if context is not None and trace is not None:
+        context.merge(trace)
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.trace: Optional[RequestContext] = None
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent calls made from threads.
+
+    The first caller for a key runs the function; callers that arrive while
+    it is in flight block until it finishes and receive the same result, or
+    the same exception. Nothing is cached: once the call returns, the next
+    caller for the key runs the function again.
+
+    The shared call belongs to no single request: it runs in a fresh
+    context, without the first caller's request context, and its timings
+    and warnings are added to every caller's request. It gets its own
+    deadline of REQUEST_DEADLINE_SECONDS (or the first caller's remaining
+    budget, if longer), so its database calls stay bounded. A waiter stops
+    waiting, with DeadlineExceeded, when its own deadline runs out.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """
+        Runs `fn`, or joins the call already in flight for `key`.
+
+        Args:
+            key (Hashable): Identifies identical calls.
+            fn: The work to run when no call for `key` is in flight.
+
+        Returns:
+            The result of the (possibly shared) call.
+
+        Raises:
+            DeadlineExceeded: If the caller's deadline runs out while it waits
+                for a call started by another caller.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            if not call.done.wait(timeout=_wait_budget()):
+                raise DeadlineExceeded()
+            _adopt(call.trace)
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            context, call.trace = _detached()
+            call.result = context.run(fn)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+            _adopt(call.trace)
+
+
+class AsyncSingleFlight:
+    """
+    Coalesces identical concurrent calls made from coroutines.
+
+    The shared work runs as its own task, and each caller awaits it through
+    `asyncio.shield`, so a caller that goes away (client disconnect) does not
+    cancel the work for the others. Waiters hold no thread while they wait.
+
+    Like `SingleFlight`, the task runs in a fresh context with its own
+    bounded deadline, not the request context of the caller that started
+    it; each caller waits for it within its own deadline and gets its
+    timings and warnings.
+    """
+
+    def __init__(self):
+        self._tasks: Dict[Hashable, Tuple[asyncio.Future, RequestContext]] = {}
+
+    def _forget(self, key: Hashable, task: asyncio.Future) -> None:
+        if key in self._tasks and self._tasks[key][0] is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            # Marca a exceção como consumida mesmo que todos tenham desistido
+            task.exception()
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Awaits `fn()`, or joins the call already in flight for `key`.
+
+        Args:
+            key (Hashable): Identifies identical calls.
+            fn: Returns the awaitable to run when no call for `key` is in flight.
+
+        Returns:
+            The result of the (possibly shared) call.
+
+        Raises:
+            DeadlineExceeded: If the caller's deadline runs out first; the
+                shared call goes on for the other callers.
+        """
+        task, trace = self._tasks.get(key, (None, None))
+        if task is None or task.done():
+            context, trace = _detached()
+            task = context.run(asyncio.ensure_future, fn())
+            self._tasks[key] = task, trace
+            task.add_done_callback(lambda finished: self._forget(key, finished))
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), timeout=_wait_budget())
+        except asyncio.TimeoutError:
+            if task.done():
+                raise
+            # O prazo desta requisição acabou; a chamada segue para as demais
+            raise DeadlineExceeded() from None
+        finally:
+            if task.done():
+                _adopt(trace)
+
+
+catalog_read_flight = SingleFlight()
+catalog_read_flight_async = AsyncSingleFlight()
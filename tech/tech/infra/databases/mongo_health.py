@@ -0,0 +1,96 @@
+# tech/infra/databases/mongo_health.py
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Dict, Optional
+
+from tech.infra.databases.mongodb import async_client
+
+logger = logging.getLogger(__name__)
+
+MONGO_HEALTH_INTERVAL_SECONDS = float(os.getenv('MONGO_HEALTH_INTERVAL_SECONDS', '5'))
+MONGO_HEALTH_TIMEOUT_SECONDS = float(os.getenv('MONGO_HEALTH_TIMEOUT_SECONDS', '2'))
+
+
+class MongoHealthMonitor:
+    """
+    Pings MongoDB on a fixed interval and caches the outcome.
+
+    The readiness probe reads `healthy` and `status()` only; all network I/O
+    happens in the background task started by `start`.
+    """
+
+    def __init__(self, client: Any = None, interval: float = MONGO_HEALTH_INTERVAL_SECONDS,
+                 timeout: float = MONGO_HEALTH_TIMEOUT_SECONDS):
+        self.client = client if client is not None else async_client
+        self.interval = interval
+        self.timeout = timeout
+        self.healthy = False
+        self.last_checked: Optional[float] = None
+        self.latency_ms: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def check(self) -> bool:
+        """
+        Runs one ping and updates the cached result.
+
+        Returns:
+            bool: True if MongoDB answered within the timeout.
+        """
+        started_at = time.perf_counter()
+        try:
+            await asyncio.wait_for(self.client.admin.command('ping'), timeout=self.timeout)
+        except Exception as e:
+            if self.healthy:
+                logger.warning("MongoDB ping failed: %s", e)
+            self.healthy = False
+            self.last_error = str(e) or e.__class__.__name__
+        else:
+            if not self.healthy:
+                logger.info("MongoDB ping succeeded")
+            self.healthy = True
+            self.last_error = None
+            self.latency_ms = (time.perf_counter() - started_at) * 1000
+        finally:
+            self.last_checked = time.time()
+        return self.healthy
+
+    async def _run(self) -> None:
+        while True:
+            await self.check()
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        """
+        Starts the background ping loop on the running event loop.
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Cancels the background ping loop.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Returns the cached result of the last ping.
+        """
+        return {
+            'healthy': self.healthy,
+            'last_checked': self.last_checked,
+            'latency_ms': self.latency_ms,
+            'error': self.last_error,
+        }
+
+
+mongo_health_monitor = MongoHealthMonitor()
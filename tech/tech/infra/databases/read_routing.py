@@ -0,0 +1,104 @@
+# tech/infra/databases/read_routing.py
+import os
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from bson.timestamp import Timestamp
+from pymongo.client_session import ClientSession
+from pymongo.collection import Collection
+from pymongo.read_preferences import SecondaryPreferred
+
+MONGODB_SECONDARY_READS_ENABLED = os.getenv('MONGODB_SECONDARY_READS_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+# O MongoDB exige no mínimo 90 segundos (idleWritePeriodMS + heartbeat)
+MONGODB_MAX_STALENESS_SECONDS = max(90, int(os.getenv('MONGODB_MAX_STALENESS_SECONDS', '90')))
+
+
+class ReadRouting:
+    """
+    Decides where repository queries run, and keeps read-your-writes.
+
+    Bulk reads (whole-catalog and category lists, aggregations, exports)
+    go to secondaries with `secondaryPreferred` and a bounded
+    `maxStalenessSeconds`, so they scale with the number of replicas;
+    point reads and every write stay on the primary.
+
+    Writes run in causally consistent sessions. The operation and cluster
+    times they return are kept, and every later secondary read in this
+    process starts a session advanced to them: the secondary waits until it
+    has replicated those writes before answering, so a write made here is
+    never missing from a list read here afterwards. On a standalone server
+    there is no cluster time, and reads simply go to the primary.
+    """
+
+    def __init__(
+            self,
+            enabled: bool = MONGODB_SECONDARY_READS_ENABLED,
+            max_staleness: int = MONGODB_MAX_STALENESS_SECONDS
+    ):
+        self.enabled = enabled
+        self.read_preference = SecondaryPreferred(max_staleness=max_staleness)
+        self._lock = threading.Lock()
+        self._operation_time: Optional[Timestamp] = None
+        self._cluster_time: Optional[dict] = None
+
+    def for_reads(self, collection: Collection) -> Collection:
+        """
+        Returns `collection` configured for secondary reads.
+        """
+        if not self.enabled:
+            return collection
+        return collection.with_options(read_preference=self.read_preference)
+
+    def _observe(self, session: ClientSession) -> None:
+        operation_time, cluster_time = session.operation_time, session.cluster_time
+        with self._lock:
+            if isinstance(operation_time, Timestamp) and (
+                    self._operation_time is None or operation_time > self._operation_time):
+                self._operation_time = operation_time
+            if isinstance(cluster_time, dict) and (
+                    self._cluster_time is None or cluster_time['clusterTime'] > self._cluster_time['clusterTime']):
+                self._cluster_time = cluster_time
+
+    @contextmanager
+    def write_session(self, collection: Collection) -> Iterator[Optional[ClientSession]]:
+        """
+        Causally consistent session for a write flow.
+
+        Reads made in the same session see its writes, and the session's
+        operation time is recorded for later secondary reads.
+
+        Yields:
+            Optional[ClientSession]: None when read routing is disabled.
+        """
+        if not self.enabled:
+            yield None
+            return
+        with collection.database.client.start_session(causal_consistency=True) as session:
+            try:
+                yield session
+            finally:
+                self._observe(session)
+
+    @contextmanager
+    def read_session(self, collection: Collection) -> Iterator[Optional[ClientSession]]:
+        """
+        Session for a secondary read that must include this process's writes.
+
+        Yields:
+            Optional[ClientSession]: None (an implicit session) while no write
+            has been recorded or read routing is disabled.
+        """
+        with self._lock:
+            operation_time, cluster_time = self._operation_time, self._cluster_time
+        if not self.enabled or operation_time is None:
+            yield None
+            return
+        with collection.database.client.start_session(causal_consistency=True) as session:
+            if cluster_time is not None:
+                session.advance_cluster_time(cluster_time)
+            session.advance_operation_time(operation_time)
+            yield session
+
+
+read_routing = ReadRouting()
@@ -1,6 +1,12 @@
 import os
 from tech.interfaces.repositories.product_repository import ProductRepository
 from tech.infra.repositories.mongodb_product_repository import MongoDBProductRepository
+from tech.infra.repositories.shared_snapshot_product_repository import SharedSnapshotProductRepository
+from tech.infra.repositories.cached_product_repository import CachedProductRepository, product_read_cache
+from tech.infra.repositories.circuit_breaker_product_repository import CircuitBreakerProductRepository
+from tech.infra.repositories.bloom_filter_product_repository import BloomFilterProductRepository
+from tech.infra.catalog.product_id_filter import PRODUCT_ID_FILTER_ENABLED, product_id_filter
+from tech.infra.catalog.shared_catalog import shared_catalog
 
 
 class ProductRepositoryFactory:
@@ -19,4 +25,15 @@ class ProductRepositoryFactory:
         Returns:
             ProductRepository: Implementação concreta do repositório de produtos
         """
-        return MongoDBProductRepository()
\ No newline at end of file
+        mongo_repository = MongoDBProductRepository()
+        repository = mongo_repository
+        if shared_catalog.enabled:
+            repository = SharedSnapshotProductRepository(repository, shared_catalog)
+        repository = CircuitBreakerProductRepository(repository)
+        if product_read_cache.enabled:
+            repository = CachedProductRepository(repository, product_read_cache)
+        if PRODUCT_ID_FILTER_ENABLED:
+            repository = BloomFilterProductRepository(
+                repository, mongo_repository.list_product_ids, product_id_filter
+            )
+        return repository
@@ -0,0 +1,95 @@
+# tech/infra/lifecycle/readiness.py
+import threading
+from typing import Dict, Optional
+
+
+class ReadinessState:
+    """
+    Tracks the startup warmups a pod must finish before taking traffic.
+
+    Warmups are declared with `expect` when the application starts and
+    reported with `mark_done` / `mark_failed` by the background tasks that run
+    them. A warmup can be `defer`red: it keeps being retried but no longer
+    holds the pod back. Reads are plain attribute lookups, so the readiness
+    probe never performs I/O.
+    """
+
+    PENDING = 'pending'
+    DONE = 'done'
+    FAILED = 'failed'
+    DEFERRED = 'deferred'
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._warmups: Dict[str, str] = {}
+        self._errors: Dict[str, str] = {}
+
+    def expect(self, name: str) -> None:
+        """
+        Declares a warmup that must complete before the pod is ready.
+
+        Args:
+            name (str): Warmup identifier, e.g. 'indexes'.
+        """
+        with self._lock:
+            self._warmups.setdefault(name, self.PENDING)
+
+    def mark_done(self, name: str) -> None:
+        """
+        Reports a warmup as completed.
+        """
+        with self._lock:
+            self._warmups[name] = self.DONE
+            self._errors.pop(name, None)
+
+    def mark_failed(self, name: str, error: Exception) -> None:
+        """
+        Reports a failed attempt; the warmup stays required and may be retried.
+
+        Args:
+            name (str): Warmup identifier.
+            error (Exception): Error raised by the last attempt.
+        """
+        with self._lock:
+            if self._warmups.get(name) not in (self.DONE, self.DEFERRED):
+                self._warmups[name] = self.FAILED
+            self._errors[name] = str(error)
+
+    def defer(self, name: str) -> None:
+        """
+        Stops a warmup that has not completed from blocking readiness.
+
+        Args:
+            name (str): Warmup identifier.
+        """
+        with self._lock:
+            if name in self._warmups and self._warmups[name] != self.DONE:
+                self._warmups[name] = self.DEFERRED
+
+    def is_ready(self) -> bool:
+        """
+        Returns True when every expected warmup has completed or was deferred.
+        """
+        with self._lock:
+            return all(state in (self.DONE, self.DEFERRED) for state in self._warmups.values())
+
+    def snapshot(self) -> Dict[str, Dict[str, Optional[str]]]:
+        """
+        Returns the state of every warmup for diagnostics.
+        """
+        with self._lock:
+            return {
+                name: {'state': state, 'error': self._errors.get(name)}
+                for name, state in self._warmups.items()
+            }
+
+    def reset(self) -> None:
+        """
+        Forgets every declared warmup (used on shutdown and in tests).
+        """
+        with self._lock:
+            self._warmups.clear()
+            self._errors.clear()
+
+
+readiness = ReadinessState()
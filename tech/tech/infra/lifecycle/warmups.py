@@ -0,0 +1,103 @@
+# tech/infra/lifecycle/warmups.py
+import asyncio
+import logging
+import os
+from typing import Awaitable, Callable, List, Tuple
+
+from tech.infra.catalog.catalog_store import catalog_store
+from tech.infra.catalog.catalog_sync import catalog_synchronizer
+from tech.infra.catalog.product_id_filter import PRODUCT_ID_FILTER_ENABLED, product_id_filter
+from tech.infra.catalog.shared_catalog import shared_catalog
+from tech.infra.lifecycle.readiness import ReadinessState, readiness
+from tech.infra.repositories.mongodb_product_repository import MongoDBProductRepository
+from tech.infra.resilience.idempotency_store import idempotency_store
+
+logger = logging.getLogger(__name__)
+
+WARMUP_RETRY_MAX_SECONDS = float(os.getenv('WARMUP_RETRY_MAX_SECONDS', '30'))
+# Warmups que só o MongoDB atende; não seguram um pod que subiu do snapshot
+MONGODB_ONLY_WARMUPS = ('indexes', 'product_ids')
+
+Warmup = Callable[[], Awaitable[None]]
+
+
+async def ensure_indexes() -> None:
+    """
+    Creates the MongoDB indexes the repository queries rely on, and the
+    TTL index that expires idempotency keys.
+    """
+    await asyncio.to_thread(MongoDBProductRepository().ensure_indexes)
+    await asyncio.to_thread(idempotency_store.ensure_indexes)
+
+
+async def warm_catalog(state: ReadinessState = readiness) -> None:
+    """
+    Loads the catalog; with a shared snapshot only the refresher worker
+    loads it, the others wait for the mapped file.
+
+    When the catalog did not come from MongoDB (the database was down and
+    the snapshot file was used, or this worker maps the shared snapshot),
+    the pod can serve reads without the database, so the MongoDB-only
+    warmups stop blocking readiness and keep retrying in the background.
+    """
+    if shared_catalog.enabled:
+        await shared_catalog.warm_up()
+    else:
+        await catalog_synchronizer.warm_up()
+    if catalog_store.source != 'mongodb':
+        for name in MONGODB_ONLY_WARMUPS:
+            state.defer(name)
+
+
+async def warm_product_id_filter() -> None:
+    """
+    Builds the product ID filter, so that lookups of unknown IDs skip
+    MongoDB from the first request.
+    """
+    if PRODUCT_ID_FILTER_ENABLED:
+        await asyncio.to_thread(product_id_filter.rebuild, MongoDBProductRepository().list_product_ids)
+
+
+STARTUP_WARMUPS: List[Tuple[str, Warmup]] = [
+    ('indexes', ensure_indexes),
+    ('catalog', warm_catalog),
+    ('product_ids', warm_product_id_filter),
+]
+
+
+async def _run_until_done(name: str, warmup: Warmup, state: ReadinessState) -> None:
+    delay = 0.5
+    while True:
+        try:
+            await warmup()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("Warmup %s failed, retrying in %.1fs: %s", name, delay, e)
+            state.mark_failed(name, e)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, WARMUP_RETRY_MAX_SECONDS)
+        else:
+            logger.info("Warmup %s done", name)
+            state.mark_done(name)
+            return
+
+
+async def run_startup_warmups(
+        warmups: List[Tuple[str, Warmup]] = None,
+        state: ReadinessState = readiness
+) -> None:
+    """
+    Runs every startup warmup concurrently, retrying each until it succeeds.
+
+    All warmups are declared on the readiness state before any of them runs,
+    so the pod reports not-ready until the last one completes.
+
+    Args:
+        warmups: (name, coroutine function) pairs; defaults to STARTUP_WARMUPS.
+        state: Readiness state to report to.
+    """
+    warmups = STARTUP_WARMUPS if warmups is None else warmups
+    for name, _ in warmups:
+        state.expect(name)
+    await asyncio.gather(*(_run_until_done(name, warmup, state) for name, warmup in warmups))
@@ -0,0 +1,31 @@
+# tech/infra/observability/mongo_command_listener.py
+from pymongo import monitoring
+
+from tech.infra.observability.request_context import current_request_context
+
+
+class MongoCommandTimingListener(monitoring.CommandListener):
+    """
+    PyMongo command listener that attributes every round trip to the
+    request being served.
+
+    PyMongo publishes command events synchronously on the thread that ran
+    the operation, so the request context bound to that thread is the one
+    that issued the command. Each command (including cursor `getMore`
+    batches) counts as one round trip.
+    """
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        pass
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        self._record(event.duration_micros)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        self._record(event.duration_micros)
+
+    @staticmethod
+    def _record(duration_micros: int) -> None:
+        context = current_request_context()
+        if context is not None:
+            context.add_db_roundtrip(duration_micros / 1000)
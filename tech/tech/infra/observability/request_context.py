@@ -0,0 +1,159 @@
+# tech/infra/observability/request_context.py
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+class RequestContext:
+    """
+    Accumulates per-request diagnostics while a request is being handled.
+
+    A single instance is shared by the event loop task and every threadpool
+    call spawned for the request (Starlette copies the context into worker
+    threads), so all mutations are guarded by a lock.
+    """
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.timings: Dict[str, float] = {}
+        self.db_roundtrips = 0
+        self.warnings: List[str] = []
+        self._lock = threading.Lock()
+
+    def add_timing(self, name: str, duration_ms: float) -> None:
+        """
+        Adds a duration to the named timing bucket.
+
+        Args:
+            name (str): Metric name as emitted in the Server-Timing header.
+            duration_ms (float): Elapsed time in milliseconds.
+        """
+        with self._lock:
+            self.timings[name] = self.timings.get(name, 0.0) + duration_ms
+
+    def add_db_roundtrip(self, duration_ms: float) -> None:
+        """
+        Records one database round trip and its duration.
+
+        Args:
+            duration_ms (float): Time spent waiting for the database reply.
+        """
+        with self._lock:
+            self.db_roundtrips += 1
+            self.timings['db'] = self.timings.get('db', 0.0) + duration_ms
+
+    def add_warning(self, warning: str) -> None:
+        """
+        Adds a value for the response's Warning header, once.
+
+        Args:
+            warning (str): A Warning header value, e.g. '111 - "Revalidation Failed"'.
+        """
+        with self._lock:
+            if warning not in self.warnings:
+                self.warnings.append(warning)
+
+    def merge(self, other: 'RequestContext') -> None:
+        """
+        Adds the timings, round trips and warnings recorded in `other`.
+
+        Args:
+            other (RequestContext): Diagnostics of work done on this
+                request's behalf, e.g. a read shared with other requests.
+        """
+        with other._lock:
+            timings, db_roundtrips, warnings = dict(other.timings), other.db_roundtrips, list(other.warnings)
+        with self._lock:
+            for name, duration in timings.items():
+                self.timings[name] = self.timings.get(name, 0.0) + duration
+            self.db_roundtrips += db_roundtrips
+            for warning in warnings:
+                if warning not in self.warnings:
+                    self.warnings.append(warning)
+
+    def elapsed_ms(self) -> float:
+        """
+        Returns the time elapsed since the request started, in milliseconds.
+        """
+        return (time.perf_counter() - self.started_at) * 1000
+
+    def server_timing_header(self) -> str:
+        """
+        Formats the accumulated timings as a Server-Timing header value.
+
+        Returns:
+            str: Comma separated metrics, always ending with the total.
+        """
+        with self._lock:
+            entries = [
+                f'{name};dur={duration:.1f}'
+                for name, duration in self.timings.items()
+            ]
+        entries.append(f'total;dur={self.elapsed_ms():.1f}')
+        return ', '.join(entries)
+
+
+_current_context: ContextVar[Optional[RequestContext]] = ContextVar(
+    'request_context', default=None
+)
+
+
+def start_request_context() -> Tuple[RequestContext, Token]:
+    """
+    Creates a new RequestContext and binds it to the current context.
+
+    Returns:
+        Tuple[RequestContext, Token]: The context and the token needed to
+        restore the previous value with `end_request_context`.
+    """
+    context = RequestContext()
+    return context, _current_context.set(context)
+
+
+def end_request_context(token: Token) -> None:
+    """
+    Restores the request context that was active before `start_request_context`.
+    """
+    _current_context.reset(token)
+
+
+def current_request_context() -> Optional[RequestContext]:
+    """
+    Returns the RequestContext bound to the running request, if any.
+    """
+    return _current_context.get()
+
+
+def add_response_warning(warning: str) -> None:
+    """
+    Adds a Warning header to the running request's response.
+
+    Outside of a request this is a no-op.
+    """
+    context = _current_context.get()
+    if context is not None:
+        context.add_warning(warning)
+
+
+@contextmanager
+def track(name: str) -> Iterator[None]:
+    """
+    Measures the wrapped block and adds it to the named timing bucket.
+
+    Outside of a request (CLI, background tasks, tests) this is a no-op.
+
+    Args:
+        name (str): Metric name, e.g. 'auth' or 'serialize'.
+    """
+    context = _current_context.get()
+    if context is None:
+        yield
+        return
+
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        context.add_timing(name, (time.perf_counter() - started_at) * 1000)
@@ -0,0 +1,127 @@
+# tech/infra/observability/structured_logging.py
+import atexit
+import json
+import logging
+import os
+import queue
+import random
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+LOG_DEBUG_SAMPLE_RATE = float(os.getenv('LOG_DEBUG_SAMPLE_RATE', '0.01'))
+
+# Atributos padrão do LogRecord; tudo que não estiver aqui veio de `extra=`
+_RESERVED_ATTRIBUTES = frozenset(vars(logging.makeLogRecord({}))) | {'message', 'asctime'}
+
+_listener: Optional[QueueListener] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats log records as single-line JSON documents.
+
+    Fields passed through `extra=` are emitted as top-level keys, so call
+    sites can log structured data instead of interpolating it into the
+    message.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            'ts': datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RESERVED_ATTRIBUTES and not key.startswith('_'):
+                payload[key] = value
+        if record.exc_info:
+            payload['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str, ensure_ascii=False)
+
+
+class SamplingFilter(logging.Filter):
+    """Lets through only a fraction of DEBUG records.
+
+    Per-request debug lines are useful to spot-check traffic but too
+    expensive to emit for every request; INFO and above always pass.
+    """
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG:
+            return True
+        return self.rate >= 1 or random.random() < self.rate
+
+
+class _LazyQueueHandler(QueueHandler):
+    """QueueHandler that defers message formatting to the listener thread.
+
+    The stock implementation formats the record on the calling thread before
+    enqueueing it; since the queue never leaves the process there is no need
+    to, and the request thread only pays for building the record.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def configure_logging(level: Optional[str] = None, debug_sample_rate: Optional[float] = None) -> None:
+    """
+    Routes the application's loggers through a non-blocking queue.
+
+    Records are put on an in-memory queue by the calling thread and written
+    to stdout as JSON by a background listener, so a slow or unbuffered
+    stdout never stalls a request. Calling it more than once is a no-op.
+
+    Args:
+        level: Minimum level for the `tech` loggers (defaults to LOG_LEVEL).
+        debug_sample_rate: Fraction of DEBUG records kept (defaults to
+            LOG_DEBUG_SAMPLE_RATE).
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    log_queue = queue.SimpleQueue()
+
+    queue_handler = _LazyQueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter(
+        LOG_DEBUG_SAMPLE_RATE if debug_sample_rate is None else debug_sample_rate
+    ))
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(JsonFormatter())
+
+    app_logger = logging.getLogger('tech')
+    app_logger.setLevel((level or LOG_LEVEL).upper())
+    app_logger.addHandler(queue_handler)
+    app_logger.propagate = False
+
+    _listener = QueueListener(log_queue, stream_handler)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging() -> None:
+    """
+    Flushes pending records and stops the background listener.
+    """
+    global _listener
+    if _listener is None:
+        return
+
+    _listener.stop()
+    _listener = None
+
+    app_logger = logging.getLogger('tech')
+    for handler in list(app_logger.handlers):
+        if isinstance(handler, _LazyQueueHandler):
+            app_logger.removeHandler(handler)
+    app_logger.setLevel(logging.NOTSET)
+    app_logger.propagate = True
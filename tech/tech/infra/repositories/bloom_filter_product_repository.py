@@ -0,0 +1,84 @@
+# tech/infra/repositories/bloom_filter_product_repository.py
+from typing import Callable, Iterable, List, Optional
+
+from tech.domain.entities.products import Products
+from tech.domain.value_objects import BulkUpsertResult, CategoryStats, PriceAdjustment
+from tech.infra.catalog.product_id_filter import ProductIdFilter, product_id_filter
+from tech.interfaces.repositories.product_repository import ProductRepository
+
+
+class BloomFilterProductRepository(ProductRepository):
+    """
+    Repositório que responde `get_by_id` para IDs inexistentes sem ir ao MongoDB.
+
+    Antes de delegar, consulta o ProductIdFilter: um ID que certamente não
+    existe (ou que acabou de não ser encontrado) devolve None na hora. O
+    filtro é reconstruído em segundo plano a partir do índice de
+    `product_id`, sem bloquear a requisição que percebeu que ele venceu.
+    """
+
+    def __init__(
+            self,
+            repository: ProductRepository,
+            load_ids: Callable[[], Iterable[int]],
+            id_filter: ProductIdFilter = product_id_filter
+    ):
+        self.repository = repository
+        self.load_ids = load_ids
+        self.id_filter = id_filter
+
+    def add(self, product: Products) -> Products:
+        return self.repository.add(product)
+
+    def get_by_id(self, product_id: int) -> Optional[Products]:
+        try:
+            product_id_int = int(product_id)
+        except (TypeError, ValueError):
+            return None
+        self.id_filter.refresh_in_background(self.load_ids)
+        if self.id_filter.definitely_missing(product_id_int):
+            return None
+        product = self.repository.get_by_id(product_id_int)
+        if product is None:
+            self.id_filter.record_missing(product_id_int)
+        return product
+
+    def get_by_name(self, name: str) -> Optional[Products]:
+        return self.repository.get_by_name(name)
+
+    def list_by_category(self, category: str) -> List[Products]:
+        return self.repository.list_by_category(category)
+
+    def list_all_products(self) -> List[Products]:
+        return self.repository.list_all_products()
+
+    def bulk_upsert(self, products: List[Products]) -> List[BulkUpsertResult]:
+        return self.repository.bulk_upsert(products)
+
+    def adjust_prices(self, adjustment: PriceAdjustment) -> List[Products]:
+        return self.repository.adjust_prices(adjustment)
+
+    def category_stats(self) -> List[CategoryStats]:
+        return self.repository.category_stats()
+
+    def update(self, product: Products) -> Products:
+        return self.repository.update(product)
+
+    def delete(self, product_id) -> bool:
+        return self.repository.delete(product_id)
+
+    def get_by_ids(self, product_ids: List[int]) -> List[Products]:
+        candidates = []
+        for product_id in product_ids:
+            try:
+                product_id_int = int(product_id)
+            except (TypeError, ValueError):
+                continue
+            if not self.id_filter.definitely_missing(product_id_int):
+                candidates.append(product_id_int)
+        if not candidates:
+            return []
+        return self.repository.get_by_ids(candidates)
+
+    def list_changes_since(self, since, until, limit):
+        return self.repository.list_changes_since(since, until, limit)
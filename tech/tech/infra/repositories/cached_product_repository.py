@@ -0,0 +1,100 @@
+# tech/infra/repositories/cached_product_repository.py
+import os
+from typing import Hashable, List, Optional
+
+from pymongo.errors import PyMongoError
+
+from tech.domain.entities.products import Products
+from tech.domain.value_objects import BulkUpsertResult, CategoryStats, PriceAdjustment
+from tech.infra.cache.stale_while_revalidate import StaleWhileRevalidateCache
+from tech.infra.catalog.catalog_events import ProductChange, catalog_events
+from tech.infra.resilience.circuit_breaker import CircuitOpenError
+from tech.interfaces.repositories.product_repository import ProductRepository
+
+# TTL 0 desabilita o cache de leituras
+PRODUCT_CACHE_TTL_SECONDS = float(os.getenv('PRODUCT_CACHE_TTL_SECONDS', '30'))
+# Por quanto tempo após o TTL um valor ainda é servido enquanto é revalidado
+PRODUCT_CACHE_MAX_STALE_SECONDS = float(os.getenv('PRODUCT_CACHE_MAX_STALE_SECONDS', '300'))
+PRODUCT_CACHE_BETA = float(os.getenv('PRODUCT_CACHE_BETA', '1.0'))
+# Limite de entradas: chaves arbitrárias (IDs, categorias) não crescem sem fim
+PRODUCT_CACHE_MAX_ENTRIES = int(os.getenv('PRODUCT_CACHE_MAX_ENTRIES', '2048'))
+
+
+class CachedProductRepository(ProductRepository):
+    """
+    Repositório que atende `list_all_products`, `list_by_category` e
+    `get_by_id` por um cache stale-while-revalidate.
+
+    As escritas são delegadas ao repositório interno; as escritas deste
+    processo invalidam as entradas afetadas pelos eventos do catálogo, e as
+    feitas por outros pods aparecem em até PRODUCT_CACHE_TTL_SECONDS.
+    """
+
+    def __init__(self, repository: ProductRepository, cache: StaleWhileRevalidateCache):
+        self.repository = repository
+        self.cache = cache
+
+    def add(self, product: Products) -> Products:
+        return self.repository.add(product)
+
+    def get_by_id(self, product_id: int) -> Optional[Products]:
+        try:
+            key = ('product', int(product_id))
+        except (TypeError, ValueError):
+            return self.repository.get_by_id(product_id)
+        return self.cache.get(key, lambda: self.repository.get_by_id(product_id))
+
+    def get_by_name(self, name: str) -> Optional[Products]:
+        return self.repository.get_by_name(name)
+
+    def list_by_category(self, category: str) -> List[Products]:
+        return self.cache.get(('category', category), lambda: self.repository.list_by_category(category))
+
+    def list_all_products(self) -> List[Products]:
+        return self.cache.get(('all',), self.repository.list_all_products)
+
+    def bulk_upsert(self, products: List[Products]) -> List[BulkUpsertResult]:
+        return self.repository.bulk_upsert(products)
+
+    def adjust_prices(self, adjustment: PriceAdjustment) -> List[Products]:
+        return self.repository.adjust_prices(adjustment)
+
+    def category_stats(self) -> List[CategoryStats]:
+        return self.repository.category_stats()
+
+    def update(self, product: Products) -> Products:
+        return self.repository.update(product)
+
+    def delete(self, product_id) -> bool:
+        return self.repository.delete(product_id)
+
+    def get_by_ids(self, product_ids: List[int]) -> List[Products]:
+        return self.repository.get_by_ids(product_ids)
+
+    def list_changes_since(self, since, until, limit):
+        return self.repository.list_changes_since(since, until, limit)
+
+
+def invalidate_product_reads(changes: List[ProductChange]) -> None:
+    """
+    Assinante do catálogo: invalida as listas e os produtos alterados.
+
+    Uma alteração pode mover o produto de categoria, e o evento não traz a
+    categoria anterior, então todas as listas são invalidadas.
+    """
+    changed = {int(change.product_id) for change in changes}
+
+    def affected(key: Hashable) -> bool:
+        return key[0] != 'product' or key[1] in changed
+
+    product_read_cache.invalidate(affected)
+
+
+product_read_cache = StaleWhileRevalidateCache(
+    ttl=PRODUCT_CACHE_TTL_SECONDS,
+    max_stale=PRODUCT_CACHE_MAX_STALE_SECONDS,
+    beta=PRODUCT_CACHE_BETA,
+    max_entries=PRODUCT_CACHE_MAX_ENTRIES,
+    unavailable_errors=(PyMongoError, CircuitOpenError),
+)
+catalog_events.subscribe(invalidate_product_reads)
@@ -0,0 +1,111 @@
+# tech/infra/repositories/circuit_breaker_product_repository.py
+import logging
+from typing import Callable, List, Optional, TypeVar
+
+from tech.domain.entities.products import Products
+from tech.domain.value_objects import BulkUpsertResult, CategoryStats, PriceAdjustment
+from tech.infra.catalog.catalog_store import CatalogStore, catalog_store
+from tech.infra.catalog.category_stats import summarize_categories
+from tech.infra.catalog.shared_catalog import SharedCatalog, shared_catalog
+from tech.infra.observability.request_context import add_response_warning
+from tech.infra.resilience.circuit_breaker import (
+    DATABASE_UNAVAILABLE_ERRORS,
+    CircuitBreaker,
+    CircuitOpenError,
+    mongo_circuit_breaker,
+)
+from tech.interfaces.repositories.product_repository import ProductRepository
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# RFC 7234, 5.5.1: resposta servida do snapshot, possivelmente desatualizada
+DEGRADED_READ_WARNING = '110 - "Response is Stale"'
+
+
+class CircuitBreakerProductRepository(ProductRepository):
+    """
+    Repositório que passa todas as chamadas ao MongoDB por um circuit breaker.
+
+    Com o circuito aberto (ou o banco indisponível), o serviço entra em modo
+    somente leitura degradado: as leituras são atendidas pelo último snapshot
+    do catálogo em memória, com um cabeçalho `Warning`, e as escritas falham
+    imediatamente com CircuitOpenError (503 com Retry-After na API).
+    """
+
+    def __init__(
+            self,
+            repository: ProductRepository,
+            breaker: CircuitBreaker = mongo_circuit_breaker,
+            store: CatalogStore = catalog_store,
+            shared: SharedCatalog = shared_catalog
+    ):
+        self.repository = repository
+        self.breaker = breaker
+        self.store = store
+        self.shared = shared
+
+    def _snapshot(self):
+        if self.store.loaded:
+            return self.store
+        return self.shared.reader() if self.shared.enabled else None
+
+    def _read(self, fn: Callable[[], T], degraded: Callable[[object], T]) -> T:
+        try:
+            return self.breaker.call(fn)
+        except (CircuitOpenError,) + DATABASE_UNAVAILABLE_ERRORS as e:
+            snapshot = self._snapshot()
+            if snapshot is None:
+                raise
+            logger.info("Serving read from the catalog snapshot: %s", e)
+            add_response_warning(DEGRADED_READ_WARNING)
+            return degraded(snapshot)
+
+    def add(self, product: Products) -> Products:
+        return self.breaker.call(lambda: self.repository.add(product))
+
+    def get_by_id(self, product_id: int) -> Optional[Products]:
+        def degraded(snapshot) -> Optional[Products]:
+            try:
+                product_id_int = int(product_id)
+            except (TypeError, ValueError):
+                return None
+            if snapshot is self.store:
+                return snapshot.get(product_id_int)
+            return snapshot.get_by_id(product_id_int)
+
+        return self._read(lambda: self.repository.get_by_id(product_id), degraded)
+
+    def get_by_name(self, name: str) -> Optional[Products]:
+        return self.breaker.call(lambda: self.repository.get_by_name(name))
+
+    def list_by_category(self, category: str) -> List[Products]:
+        return self._read(
+            lambda: self.repository.list_by_category(category),
+            lambda snapshot: snapshot.list_by_category(category)
+        )
+
+    def list_all_products(self) -> List[Products]:
+        return self._read(self.repository.list_all_products, lambda snapshot: snapshot.list_all())
+
+    def bulk_upsert(self, products: List[Products]) -> List[BulkUpsertResult]:
+        return self.breaker.call(lambda: self.repository.bulk_upsert(products))
+
+    def adjust_prices(self, adjustment: PriceAdjustment) -> List[Products]:
+        return self.breaker.call(lambda: self.repository.adjust_prices(adjustment))
+
+    def category_stats(self) -> List[CategoryStats]:
+        return self._read(self.repository.category_stats, lambda snapshot: summarize_categories(snapshot.list_all()))
+
+    def update(self, product: Products) -> Products:
+        return self.breaker.call(lambda: self.repository.update(product))
+
+    def delete(self, product_id) -> bool:
+        return self.breaker.call(lambda: self.repository.delete(product_id))
+
+    def get_by_ids(self, product_ids: List[int]) -> List[Products]:
+        return self.breaker.call(lambda: self.repository.get_by_ids(product_ids))
+
+    def list_changes_since(self, since, until, limit):
+        return self.breaker.call(lambda: self.repository.list_changes_since(since, until, limit))
@@ -1,11 +1,32 @@
 # tech/infra/repositories/mongodb_product_repository.py
-from datetime import datetime
-from typing import List, Optional, Dict, Any
+import logging
+import os
+from datetime import datetime, timedelta
+from typing import Iterator, List, Optional, Dict, Any, Tuple
 import random
 
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError, OperationFailure, PyMongoError
+
 from tech.domain.entities.products import Products
+from tech.domain.value_objects import BulkUpsertResult, CategoryStats, PriceAdjustment
 from tech.interfaces.repositories.product_repository import ProductRepository
 from tech.infra.databases.mongodb import get_collection
+from tech.infra.databases.read_routing import ReadRouting, read_routing
+from tech.infra.resilience.request_deadline import bounded_by_deadline
+from tech.infra.catalog.catalog_events import ProductChange, catalog_events
+
+logger = logging.getLogger(__name__)
+
+# Por quanto tempo as exclusões ficam visíveis no feed de alterações
+TOMBSTONE_RETENTION = timedelta(days=float(os.getenv('PRODUCT_TOMBSTONE_RETENTION_DAYS', '30')))
+# Código de erro do MongoDB para violação de índice único
+DUPLICATE_KEY_ERROR = 11000
+# Códigos do MongoDB para um índice que já existe com outras opções
+INDEX_OPTIONS_CONFLICT_ERRORS = (85, 86)
+# Alterações mais recentes que isto ainda não entram no feed: uma escrita
+# concorrente com `updated_at` anterior pode ainda não ter sido confirmada
+CHANGES_SETTLE_WINDOW = timedelta(seconds=float(os.getenv('CHANGES_SETTLE_SECONDS', '2')))
 
 
 class MongoDBProductRepository(ProductRepository):
@@ -15,31 +36,116 @@ class MongoDBProductRepository(ProductRepository):
     Esta implementação mantém IDs inteiros para compatibilidade com o serviço de Orders.
     Em vez de usar os ObjectIDs do MongoDB como IDs primários, usamos um campo 'product_id'
     com valores inteiros.
+
+    Leituras em massa (listas, agregações, exportação) vão para os secundários
+    conforme o ReadRouting; leituras pontuais e escritas ficam no primário, e
+    as escritas usam sessões causalmente consistentes. Dentro de uma
+    requisição, cada operação leva o orçamento restante como `maxTimeMS`.
     """
 
-    def __init__(self):
+    def __init__(self, routing: ReadRouting = read_routing):
         """
         Inicializa o repositório com a coleção de produtos.
+
+        Args:
+            routing: Política de roteamento das leituras.
         """
         self.collection = get_collection('products')
+        self.routing = routing
+        self.reads = routing.for_reads(self.collection)
+        self._tombstones = None
+        self._counters = None
+
+    @property
+    def tombstones(self):
+        """
+        Coleção de lápides: um registro {product_id, deleted_at} por produto
+        excluído, para que o feed de alterações também entregue exclusões.
+        """
+        if self._tombstones is None:
+            self._tombstones = get_collection('product_tombstones')
+        return self._tombstones
+
+    @property
+    def counters(self):
+        """
+        Coleção de contadores, usada para reservar blocos de IDs.
+        """
+        if self._counters is None:
+            self._counters = get_collection('counters')
+        return self._counters
+
+    def ensure_indexes(self) -> None:
+        """
+        Cria os índices usados pelas consultas do repositório.
+
+        A operação é idempotente: índices já existentes não são recriados.
+        `product_id` e `name` são únicos, o que impede IDs repetidos e
+        produtos duplicados por escritas concorrentes. As lápides expiram
+        por TTL após TOMBSTONE_RETENTION.
+        """
+        self._create_unique_index('product_id')
+        self.collection.create_index('category')
+        self._create_unique_index('name')
+        self.collection.create_index([('updated_at', 1), ('product_id', 1)])
+        self.tombstones.create_index('product_id', unique=True)
+        self.tombstones.create_index(
+            'deleted_at', expireAfterSeconds=int(TOMBSTONE_RETENTION.total_seconds())
+        )
+
+    def _create_unique_index(self, field: str) -> None:
+        """
+        Cria um índice único em `field`, substituindo o índice não único
+        criado por versões anteriores.
+
+        Raises:
+            DuplicateKeyError: Se já houver valores repetidos em `field`.
+        """
+        try:
+            self.collection.create_index(field, unique=True)
+        except OperationFailure as e:
+            if e.code not in INDEX_OPTIONS_CONFLICT_ERRORS:
+                raise
+            logger.warning("Recriando o índice de '%s' como único", field)
+            self.collection.drop_index(f'{field}_1')
+            self.collection.create_index(field, unique=True)
 
     def _generate_id(self) -> int:
         """
         Gera um novo ID inteiro que ainda não existe no banco de dados.
 
+        Usa o mesmo contador das importações em lote, então dois produtos
+        criados ao mesmo tempo nunca recebem o mesmo ID.
+
         Returns:
             int: Novo ID único
         """
-        # Encontrar o maior ID atual
-        result = self.collection.find_one(sort=[("product_id", -1)])
+        return self._reserve_ids(1)
+
+    def _reserve_ids(self, count: int) -> int:
+        """
+        Reserva um bloco de `count` IDs consecutivos.
 
-        # Se não houver produtos, começar do ID 1
-        if not result or not result.get("product_id"):
-            return 1
+        O contador nunca fica abaixo do maior `product_id` existente, para
+        conviver com produtos gravados com ID próprio (ex.: de um mongodump).
 
-        # Caso contrário, incrementar o maior ID
-        return result.get("product_id", 0) + 1
+        Args:
+            count: Quantidade de IDs a reservar.
+
+        Returns:
+            int: O primeiro ID do bloco.
+        """
+        latest = self.collection.find_one(sort=[("product_id", -1)], projection={'product_id': 1})
+        current_max = int(latest['product_id']) if latest and latest.get('product_id') else 0
+        counter = self.counters.find_one_and_update(
+            {'_id': 'product_id'},
+            [{'$set': {'seq': {'$add': [{'$max': [{'$ifNull': ['$seq', 0]}, current_max]}, count]}}}],
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        return int(counter['seq']) - count + 1
 
+    @bounded_by_deadline
     def add(self, product: Products) -> Products:
         """
         Adiciona um novo produto ao MongoDB.
@@ -49,6 +155,9 @@ class MongoDBProductRepository(ProductRepository):
 
         Returns:
             Products: Produto adicionado com ID atualizado
+
+        Raises:
+            ValueError: Se já existir um produto com o mesmo ID ou nome.
         """
         # Verificar se já existe o ID
         if product.id:
@@ -70,10 +179,15 @@ class MongoDBProductRepository(ProductRepository):
         }
 
         # Inserir no MongoDB
-        self.collection.insert_one(product_dict)
+        with self.routing.write_session(self.collection) as session:
+            try:
+                self.collection.insert_one(product_dict, session=session)
+            except DuplicateKeyError:
+                # Outra escrita gravou o mesmo nome ou ID depois da verificação
+                raise ValueError("Product already exists")
 
         # Criar uma nova instância do produto com o ID atualizado
-        return Products(
+        created_product = Products(
             id=product_id,  # ID inteiro
             name=product.name,
             price=product.price,
@@ -82,39 +196,267 @@ class MongoDBProductRepository(ProductRepository):
             updated_at=product_dict["updated_at"]
         )
 
-    def get_by_id(self, product_id: int) -> Optional[Products]:
+        # Notificar as visões em memória do catálogo
+        catalog_events.publish([ProductChange.upsert(created_product, action='create')])
+        return created_product
+
+    @bounded_by_deadline
+    def bulk_upsert(self, products: List[Products]) -> List[BulkUpsertResult]:
         """
-        Obtém um produto pelo ID.
+        Cria ou atualiza vários produtos de uma vez, usando o nome como chave.
+
+        Custa um número fixo de round trips por lote: uma consulta dos nomes
+        existentes, a reserva de um bloco de IDs para os novos e um único
+        `bulk_write` não ordenado, em que a falha de um item não impede os
+        demais.
 
         Args:
-            product_id: ID do produto a ser obtido
+            products: Produtos a gravar, com nomes distintos entre si. Um
+                produto novo que já traz ID (ex.: vindo de um mongodump)
+                mantém esse ID.
 
         Returns:
-            Optional[Products]: Produto encontrado ou None
+            List[BulkUpsertResult]: O resultado de cada item, na ordem recebida.
+        """
+        if not products:
+            return []
+
+        with self.routing.write_session(self.collection) as session:
+            return self._bulk_upsert(products, session)
+
+    def _bulk_upsert(self, products: List[Products], session) -> List[BulkUpsertResult]:
+        now = datetime.utcnow()
+        names = [product.name for product in products]
+        existing = {
+            document['name']: document
+            for document in self.collection.find(
+                {'name': {'$in': names}}, {'name': 1, 'product_id': 1, 'created_at': 1}, session=session
+            )
+        }
+        # Produtos novos sem ID recebem IDs de um bloco reservado
+        new_count = sum(1 for product in products if product.name not in existing and not product.id)
+        next_id = self._reserve_ids(new_count) if new_count else 0
+
+        operations = []
+        planned = []
+        for product in products:
+            current = existing.get(product.name)
+            if current is not None:
+                product_id, created_at = int(current['product_id']), current.get('created_at')
+            elif product.id:
+                product_id, created_at = int(product.id), now
+            else:
+                product_id, created_at = next_id, now
+                next_id += 1
+            planned.append((product_id, created_at))
+            operations.append(UpdateOne(
+                {'name': product.name},
+                {
+                    '$set': {'price': product.price, 'category': product.category, 'updated_at': now},
+                    '$setOnInsert': {'product_id': product_id, 'created_at': now},
+                },
+                upsert=True
+            ))
+
+        errors, upserted = self._bulk_write(operations, list(range(len(operations))), session)
+        # Um upsert que perdeu a corrida para outro insert do mesmo nome falha
+        # com chave duplicada; repetido uma vez, ele atualiza o documento
+        duplicates = [index for index, (code, _) in errors.items() if code == DUPLICATE_KEY_ERROR]
+        if duplicates:
+            retry_errors, _ = self._bulk_write([operations[index] for index in duplicates], duplicates, session)
+            for index in duplicates:
+                if index in retry_errors:
+                    errors[index] = retry_errors[index]
+                else:
+                    del errors[index]
+
+        # Nomes inseridos por outra escrita entre a consulta e o bulk_write
+        raced = [
+            products[index].name for index in range(len(products))
+            if index not in errors and index not in upserted and products[index].name not in existing
+        ]
+        if raced:
+            for document in self.collection.find(
+                    {'name': {'$in': raced}}, {'name': 1, 'product_id': 1, 'created_at': 1}, session=session
+            ):
+                existing[document['name']] = document
+                index = names.index(document['name'])
+                planned[index] = (int(document['product_id']), document.get('created_at'))
+
+        results = []
+        changes = []
+        for index, product in enumerate(products):
+            if index in errors:
+                results.append(BulkUpsertResult(index, 'error', error=errors[index][1]))
+                continue
+            product_id, created_at = planned[index]
+            if index in upserted:
+                created_at = now
+            stored = Products(
+                id=product_id,
+                name=product.name,
+                price=product.price,
+                category=product.category,
+                created_at=created_at,
+                updated_at=now
+            )
+            action = 'create' if index in upserted else 'update'
+            results.append(BulkUpsertResult(index, 'created' if action == 'create' else 'updated', stored))
+            changes.append(ProductChange.upsert(stored, action=action))
+
+        if changes:
+            catalog_events.publish(changes)
+        return results
+
+    def _bulk_write(self, operations: List[UpdateOne], indexes: List[int], session):
+        """
+        Executa um `bulk_write` não ordenado.
+
+        Args:
+            operations: As operações a executar.
+            indexes: A posição de cada operação no lote original.
+            session: Sessão da escrita.
+
+        Returns:
+            Os erros por posição, como (código, mensagem), e as posições
+            que inseriram um documento novo.
         """
         try:
-            # Converter para inteiro se for string
-            if isinstance(product_id, str):
-                product_id = int(product_id)
+            result = self.collection.bulk_write(operations, ordered=False, session=session)
+            return {}, {indexes[index] for index in result.upserted_ids}
+        except BulkWriteError as e:
+            errors = {
+                indexes[error['index']]: (error.get('code'), error.get('errmsg', 'write failed'))
+                for error in e.details.get('writeErrors', [])
+            }
+            return errors, {indexes[item['index']] for item in e.details.get('upserted', [])}
 
-            product = self.collection.find_one({'product_id': product_id})
+    @bounded_by_deadline
+    def adjust_prices(self, adjustment: PriceAdjustment) -> List[Products]:
+        """
+        Altera o preço de todos os produtos de uma categoria ou lista de IDs.
 
-            if not product:
-                return None
+        O cálculo e o arredondamento para centavos acontecem no próprio
+        servidor, em um único `update_many` com pipeline: não há leitura
+        prévia nem uma escrita por produto. Os produtos alterados são lidos
+        de volta pelo `updated_at` da operação e publicados em um único lote,
+        de modo que versão do catálogo e caches mudam uma vez só.
 
-            # Mapear para a entidade Products
-            return Products(
-                id=product['product_id'],  # ID inteiro
+        Args:
+            adjustment: A variação (percentual ou absoluta) e os produtos afetados.
+
+        Returns:
+            List[Products]: Os produtos alterados, com os novos preços.
+        """
+        if adjustment.category is not None:
+            query: Dict[str, Any] = {'category': adjustment.category}
+        else:
+            query = {'product_id': {'$in': adjustment.product_ids}}
+
+        if adjustment.percent is not None:
+            changed = {'$multiply': ['$price', 1 + adjustment.percent / 100]}
+        else:
+            changed = {'$add': ['$price', adjustment.amount]}
+
+        now = datetime.utcnow()
+        with self.routing.write_session(self.collection) as session:
+            # `$round` arredonda metade para o par, como o `round` do Python
+            result = self.collection.update_many(query, [{'$set': {
+                'price': {'$max': [0, {'$round': [changed, 2]}]},
+                'updated_at': now,
+            }}], session=session)
+            if not result.modified_count:
+                return []
+            documents = list(self.collection.find(dict(query, updated_at=now), session=session).sort('product_id', 1))
+
+        products = [
+            Products(
+                id=product['product_id'],
                 name=product['name'],
                 price=product['price'],
                 category=product['category'],
                 created_at=product.get('created_at'),
                 updated_at=product.get('updated_at')
             )
-        except Exception as e:
-            print(f"Erro ao obter produto por ID: {str(e)}")
+            for product in documents
+            if product.get('product_id') is not None
+        ]
+        catalog_events.publish([ProductChange.upsert(product) for product in products])
+        return products
+
+    @bounded_by_deadline
+    def category_stats(self) -> List[CategoryStats]:
+        """
+        Calcula, por categoria, a quantidade de produtos e os preços mínimo,
+        médio e máximo em um único pipeline de agregação.
+
+        Returns:
+            List[CategoryStats]: Uma entrada por categoria com produtos, com a
+            média arredondada para centavos.
+        """
+        pipeline = [
+            {'$match': {'product_id': {'$ne': None}}},
+            {'$group': {
+                '_id': '$category',
+                'count': {'$sum': 1},
+                'min_price': {'$min': '$price'},
+                'avg_price': {'$avg': '$price'},
+                'max_price': {'$max': '$price'},
+            }},
+            {'$set': {'avg_price': {'$round': ['$avg_price', 2]}}},
+            {'$sort': {'_id': 1}},
+        ]
+        with self.routing.read_session(self.collection) as session:
+            groups = list(self.reads.aggregate(pipeline, session=session))
+        return [
+            CategoryStats(
+                category=group['_id'],
+                count=group['count'],
+                min_price=group['min_price'],
+                avg_price=group['avg_price'],
+                max_price=group['max_price'],
+            )
+            for group in groups
+        ]
+
+    @bounded_by_deadline
+    def get_by_id(self, product_id: int) -> Optional[Products]:
+        """
+        Obtém um produto pelo ID.
+
+        Args:
+            product_id: ID do produto a ser obtido
+
+        Returns:
+            Optional[Products]: Produto encontrado ou None
+
+        Raises:
+            PyMongoError: Se o MongoDB falhar; o erro não é mascarado como
+                "produto não encontrado".
+        """
+        try:
+            # Converter para inteiro se for string
+            if isinstance(product_id, str):
+                product_id = int(product_id)
+        except ValueError:
+            return None
+
+        product = self.collection.find_one({'product_id': product_id})
+
+        if not product:
             return None
 
+        # Mapear para a entidade Products
+        return Products(
+            id=product['product_id'],  # ID inteiro
+            name=product['name'],
+            price=product['price'],
+            category=product['category'],
+            created_at=product.get('created_at'),
+            updated_at=product.get('updated_at')
+        )
+
+    @bounded_by_deadline
     def get_by_name(self, name: str) -> Optional[Products]:
         """
         Obtém um produto pelo nome.
@@ -140,6 +482,7 @@ class MongoDBProductRepository(ProductRepository):
             updated_at=product.get('updated_at')
         )
 
+    @bounded_by_deadline
     def list_all_products(self) -> List[Products]:
         """
         Lista todos os produtos disponíveis.
@@ -147,7 +490,8 @@ class MongoDBProductRepository(ProductRepository):
         Returns:
             List[Products]: Lista de produtos
         """
-        products = self.collection.find({})
+        with self.routing.read_session(self.collection) as session:
+            products = list(self.reads.find({}, session=session))
 
         result = []
         for product in products:
@@ -173,6 +517,7 @@ class MongoDBProductRepository(ProductRepository):
         """Alias para list_all_products"""
         return self.list_all_products()
 
+    @bounded_by_deadline
     def list_by_category(self, category: str) -> List[Products]:
         """
         Lista produtos por categoria.
@@ -183,7 +528,8 @@ class MongoDBProductRepository(ProductRepository):
         Returns:
             List[Products]: Lista de produtos da categoria
         """
-        products = self.collection.find({'category': category})
+        with self.routing.read_session(self.collection) as session:
+            products = list(self.reads.find({'category': category}, session=session))
 
         result = []
         for product in products:
@@ -204,6 +550,7 @@ class MongoDBProductRepository(ProductRepository):
 
         return result
 
+    @bounded_by_deadline
     def update(self, product: Products) -> Products:
         """
         Atualiza um produto existente.
@@ -213,45 +560,55 @@ class MongoDBProductRepository(ProductRepository):
 
         Returns:
             Products: Produto atualizado
+
+        Raises:
+            ValueError: Se o produto não existir mais ou o novo nome já for
+                de outro produto.
+            PyMongoError: Se o MongoDB falhar.
         """
-        try:
-            # Converter para inteiro se for string
-            product_id = product.id
-            if isinstance(product_id, str):
-                product_id = int(product_id)
+        # Converter para inteiro se for string
+        product_id = product.id
+        if isinstance(product_id, str):
+            product_id = int(product_id)
 
-            # Preparar dados para atualização
-            update_data = {
-                "name": product.name,
-                "price": product.price,
-                "category": product.category,
-                "updated_at": datetime.utcnow()
-            }
+        # Preparar dados para atualização
+        update_data = {
+            "name": product.name,
+            "price": product.price,
+            "category": product.category,
+            "updated_at": datetime.utcnow()
+        }
 
+        with self.routing.write_session(self.collection) as session:
             # Atualizar no MongoDB
-            self.collection.update_one(
-                {'product_id': product_id},
-                {'$set': update_data}
-            )
+            try:
+                self.collection.update_one(
+                    {'product_id': product_id},
+                    {'$set': update_data},
+                    session=session
+                )
+            except DuplicateKeyError:
+                raise ValueError(f"Product with name '{product.name}' already exists")
 
             # Obter o produto atualizado do banco
-            updated_doc = self.collection.find_one({'product_id': product_id})
-
-            # Retornar como entidade
-            return Products(
-                id=updated_doc['product_id'],  # ID inteiro
-                name=updated_doc['name'],
-                price=updated_doc['price'],
-                category=updated_doc['category'],
-                created_at=updated_doc.get('created_at'),
-                updated_at=updated_doc.get('updated_at')
-            )
+            updated_doc = self.collection.find_one({'product_id': product_id}, session=session)
+        if updated_doc is None:
+            raise ValueError(f"Product with ID {product_id} not found")
+
+        # Retornar como entidade
+        updated_product = Products(
+            id=updated_doc['product_id'],  # ID inteiro
+            name=updated_doc['name'],
+            price=updated_doc['price'],
+            category=updated_doc['category'],
+            created_at=updated_doc.get('created_at'),
+            updated_at=updated_doc.get('updated_at')
+        )
 
-        except Exception as e:
-            print(f"Erro ao atualizar produto: {str(e)}")
-            # Em caso de erro, retornar o produto original
-            return product
+        catalog_events.publish([ProductChange.upsert(updated_product)])
+        return updated_product
 
+    @bounded_by_deadline
     def delete(self, product_id: int) -> bool:
         """
         Remove um produto pelo ID.
@@ -266,12 +623,28 @@ class MongoDBProductRepository(ProductRepository):
             if isinstance(product_id, str):
                 product_id = int(product_id)
 
-            result = self.collection.delete_one({'product_id': product_id})
-            return result.deleted_count > 0
+            with self.routing.write_session(self.collection) as session:
+                result = self.collection.delete_one({'product_id': product_id}, session=session)
+                deleted = result.deleted_count > 0
+                if deleted:
+                    deleted_at = datetime.utcnow()
+                    self.tombstones.update_one(
+                        {'product_id': product_id},
+                        {'$set': {'deleted_at': deleted_at}},
+                        upsert=True,
+                        session=session
+                    )
+            if deleted:
+                catalog_events.publish([ProductChange.delete(product_id, changed_at=deleted_at)])
+            return deleted
+        except PyMongoError:
+            # Falha do banco não é "produto não encontrado"
+            raise
         except Exception as e:
-            print(f"Erro ao excluir produto: {str(e)}")
+            logger.warning("Erro ao excluir produto %s: %s", product_id, e)
             return False
 
+    @bounded_by_deadline
     def get_by_ids(self, product_ids: List[int]) -> List[Products]:
         """
         Obtém múltiplos produtos pelos seus IDs.
@@ -287,7 +660,7 @@ class MongoDBProductRepository(ProductRepository):
             try:
                 int_ids.append(int(id_str))
             except Exception as e:
-                print(f"ID inválido ignorado: {id_str}, erro: {str(e)}")
+                logger.debug("ID inválido ignorado: %s (%s)", id_str, e)
 
         if not int_ids:
             return []
@@ -310,4 +683,134 @@ class MongoDBProductRepository(ProductRepository):
                 )
             )
 
-        return result
\ No newline at end of file
+        return result
+
+    @bounded_by_deadline
+    def product_id_bounds(self) -> Optional[Tuple[int, int]]:
+        """
+        Retorna o menor e o maior `product_id`, lidos pelo índice.
+
+        Returns:
+            Optional[Tuple[int, int]]: (mínimo, máximo), ou None se não houver produtos.
+        """
+        query = {'product_id': {'$type': 'number'}}
+        with self.routing.read_session(self.collection) as session:
+            lowest = self.reads.find_one(query, sort=[('product_id', 1)], projection={'product_id': 1},
+                                         session=session)
+            highest = self.reads.find_one(query, sort=[('product_id', -1)], projection={'product_id': 1},
+                                          session=session)
+        if lowest is None or highest is None:
+            return None
+        return int(lowest['product_id']), int(highest['product_id'])
+
+    def list_product_ids(self) -> Iterator[int]:
+        """
+        Percorre todos os `product_id` existentes.
+
+        A consulta é coberta pelo índice de `product_id`: nenhum documento é
+        lido, só as chaves do índice.
+
+        Returns:
+            Iterator[int]: Os IDs, em ordem crescente.
+        """
+        with self.routing.read_session(self.collection) as session:
+            cursor = self.reads.find(
+                {'product_id': {'$type': 'number'}}, {'_id': 0, 'product_id': 1}, session=session
+            ).sort('product_id', 1).hint('product_id_1')
+            with cursor:
+                for product in cursor:
+                    yield int(product['product_id'])
+
+    def scan_product_id_range(self, start: int, stop: int, batch_size: int) -> Iterator[List[Tuple]]:
+        """
+        Percorre os produtos com `start <= product_id < stop` em lotes.
+
+        Cada chamada abre o seu próprio cursor, de modo que faixas disjuntas
+        podem ser lidas em paralelo. Os lotes trazem tuplas simples (e não
+        entidades) para serem enviadas baratas a outros processos.
+
+        Args:
+            start: Início inclusivo da faixa.
+            stop: Fim exclusivo da faixa.
+            batch_size: Número de produtos por lote.
+
+        Returns:
+            Iterator[List[Tuple]]: Lotes de (product_id, name, price, category,
+            created_at, updated_at), em ordem de `product_id`.
+        """
+        with self.routing.read_session(self.collection) as session:
+            cursor = self.reads.find(
+                {'product_id': {'$gte': start, '$lt': stop}},
+                {'_id': 0, 'product_id': 1, 'name': 1, 'price': 1, 'category': 1, 'created_at': 1, 'updated_at': 1},
+                batch_size=batch_size,
+                session=session,
+            ).sort('product_id', 1)
+            with cursor:
+                batch = []
+                for product in cursor:
+                    batch.append((
+                        product['product_id'], product['name'], product['price'], product['category'],
+                        product.get('created_at'), product.get('updated_at'),
+                    ))
+                    if len(batch) >= batch_size:
+                        yield batch
+                        batch = []
+                if batch:
+                    yield batch
+
+    @staticmethod
+    def _after(field: str, since: Optional[Tuple[datetime, int]], until: datetime) -> Dict[str, Any]:
+        if since is None:
+            return {field: {'$lte': until}}
+        timestamp, product_id = since
+        return {'$or': [
+            {field: {'$gt': timestamp, '$lte': until}},
+            {field: timestamp, 'product_id': {'$gt': product_id}},
+        ]}
+
+    @bounded_by_deadline
+    def list_changes_since(
+            self,
+            since: Optional[Tuple[datetime, int]],
+            until: datetime,
+            limit: int
+    ) -> List[ProductChange]:
+        """
+        Lista as alterações de produtos em ordem (momento, product_id).
+
+        Produtos alterados vêm da coleção principal pelo índice
+        (updated_at, product_id); exclusões vêm das lápides. O custo é
+        proporcional ao número de alterações, não ao tamanho do catálogo.
+
+        Args:
+            since: Cursor exclusivo (momento, product_id) da última alteração
+                já entregue, ou None para começar do início.
+            until: Limite superior inclusivo do momento das alterações.
+            limit: Número máximo de alterações a retornar.
+
+        Returns:
+            List[ProductChange]: Até `limit` alterações, com `changed_at`.
+        """
+        changes = []
+        # No primário: um secundário atrasado faria o cursor pular alterações
+        products = self.collection.find(self._after('updated_at', since, until)) \
+            .sort([('updated_at', 1), ('product_id', 1)]).limit(limit)
+        for product in products:
+            if 'product_id' not in product or product['product_id'] is None:
+                continue
+            changes.append(ProductChange.upsert(Products(
+                id=product['product_id'],
+                name=product['name'],
+                price=product['price'],
+                category=product['category'],
+                created_at=product.get('created_at'),
+                updated_at=product.get('updated_at')
+            )))
+
+        tombstones = self.tombstones.find(self._after('deleted_at', since, until)) \
+            .sort([('deleted_at', 1), ('product_id', 1)]).limit(limit)
+        for tombstone in tombstones:
+            changes.append(ProductChange.delete(tombstone['product_id'], changed_at=tombstone['deleted_at']))
+
+        changes.sort(key=lambda change: (change.changed_at, change.product_id))
+        return changes[:limit]
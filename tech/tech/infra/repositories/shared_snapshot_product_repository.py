@@ -0,0 +1,70 @@
+# tech/infra/repositories/shared_snapshot_product_repository.py
+from typing import List, Optional
+
+from tech.domain.entities.products import Products
+from tech.domain.value_objects import BulkUpsertResult, CategoryStats, PriceAdjustment
+from tech.infra.catalog.shared_catalog import SharedCatalog, shared_catalog
+from tech.interfaces.repositories.product_repository import ProductRepository
+
+
+class SharedSnapshotProductRepository(ProductRepository):
+    """
+    Repositório que atende `get_by_id` e `list_by_category` a partir do
+    snapshot do catálogo mapeado em memória e compartilhado entre workers.
+
+    As demais operações, e as leituras enquanto nenhum snapshot foi escrito,
+    são delegadas ao repositório interno. Um ID ausente do snapshot também é
+    consultado no repositório interno, pois pode ter sido criado depois da
+    última publicação.
+    """
+
+    def __init__(self, repository: ProductRepository, catalog: SharedCatalog = shared_catalog):
+        self.repository = repository
+        self.catalog = catalog
+
+    def add(self, product: Products) -> Products:
+        return self.repository.add(product)
+
+    def get_by_id(self, product_id: int) -> Optional[Products]:
+        reader = self.catalog.reader()
+        if reader is not None:
+            try:
+                product = reader.get_by_id(int(product_id))
+            except (TypeError, ValueError):
+                return None
+            if product is not None:
+                return product
+        return self.repository.get_by_id(product_id)
+
+    def get_by_name(self, name: str) -> Optional[Products]:
+        return self.repository.get_by_name(name)
+
+    def list_by_category(self, category: str) -> List[Products]:
+        reader = self.catalog.reader()
+        if reader is None:
+            return self.repository.list_by_category(category)
+        return reader.list_by_category(category)
+
+    def list_all_products(self) -> List[Products]:
+        return self.repository.list_all_products()
+
+    def bulk_upsert(self, products: List[Products]) -> List[BulkUpsertResult]:
+        return self.repository.bulk_upsert(products)
+
+    def adjust_prices(self, adjustment: PriceAdjustment) -> List[Products]:
+        return self.repository.adjust_prices(adjustment)
+
+    def category_stats(self) -> List[CategoryStats]:
+        return self.repository.category_stats()
+
+    def update(self, product: Products) -> Products:
+        return self.repository.update(product)
+
+    def delete(self, product_id) -> bool:
+        return self.repository.delete(product_id)
+
+    def get_by_ids(self, product_ids: List[int]) -> List[Products]:
+        return self.repository.get_by_ids(product_ids)
+
+    def list_changes_since(self, since, until, limit):
+        return self.repository.list_changes_since(since, until, limit)
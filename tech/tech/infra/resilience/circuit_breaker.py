@@ -0,0 +1,189 @@
+# tech/infra/resilience/circuit_breaker.py
+import collections
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Deque, Dict, Tuple, Type, TypeVar
+
+from pymongo.errors import ConnectionFailure, ExecutionTimeout, WTimeoutError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+MONGO_BREAKER_WINDOW_SECONDS = float(os.getenv('MONGO_BREAKER_WINDOW_SECONDS', '10'))
+MONGO_BREAKER_MINIMUM_CALLS = int(os.getenv('MONGO_BREAKER_MINIMUM_CALLS', '10'))
+MONGO_BREAKER_FAILURE_RATE = float(os.getenv('MONGO_BREAKER_FAILURE_RATE', '0.5'))
+MONGO_BREAKER_SLOW_CALL_SECONDS = float(os.getenv('MONGO_BREAKER_SLOW_CALL_SECONDS', '1'))
+MONGO_BREAKER_SLOW_CALL_RATE = float(os.getenv('MONGO_BREAKER_SLOW_CALL_RATE', '0.5'))
+MONGO_BREAKER_OPEN_SECONDS = float(os.getenv('MONGO_BREAKER_OPEN_SECONDS', '5'))
+
+# Erros que indicam banco indisponível; erros de dados não abrem o circuito
+DATABASE_UNAVAILABLE_ERRORS: Tuple[Type[BaseException], ...] = (ConnectionFailure, ExecutionTimeout, WTimeoutError)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of calling the dependency while the circuit is open.
+
+    Attributes:
+        retry_after (float): Seconds until the circuit lets a trial call through.
+    """
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(f"{name} is unavailable, retry in {retry_after:.0f}s")
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Stops calling a dependency that is failing or stalling.
+
+    Outcomes are kept for a sliding time window. Once it holds at least
+    `minimum_calls`, the circuit opens when the share of failed calls or of
+    calls slower than `slow_call_seconds` reaches its threshold. While open,
+    calls fail immediately with CircuitOpenError, so request threads do not
+    queue behind driver timeouts. After `open_seconds` a single trial call is
+    let through (half-open): success closes the circuit, failure reopens it.
+
+    Only `failure_errors` count as failures; other exceptions (invalid data,
+    duplicate keys) propagate without affecting the circuit.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            window_seconds: float = MONGO_BREAKER_WINDOW_SECONDS,
+            minimum_calls: int = MONGO_BREAKER_MINIMUM_CALLS,
+            failure_rate: float = MONGO_BREAKER_FAILURE_RATE,
+            slow_call_seconds: float = MONGO_BREAKER_SLOW_CALL_SECONDS,
+            slow_call_rate: float = MONGO_BREAKER_SLOW_CALL_RATE,
+            open_seconds: float = MONGO_BREAKER_OPEN_SECONDS,
+            failure_errors: Tuple[Type[BaseException], ...] = DATABASE_UNAVAILABLE_ERRORS,
+            clock: Callable[[], float] = time.monotonic
+    ):
+        self.name = name
+        self.window_seconds = window_seconds
+        self.minimum_calls = minimum_calls
+        self.failure_rate = failure_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate = slow_call_rate
+        self.open_seconds = open_seconds
+        self.failure_errors = failure_errors
+        self.clock = clock
+        self.state = CLOSED
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._outcomes: Deque[Tuple[float, bool, bool]] = collections.deque()
+        self._lock = threading.Lock()
+
+    def _retry_after(self, now: float) -> float:
+        return max(0.0, self._opened_at + self.open_seconds - now)
+
+    def _acquire(self) -> bool:
+        """
+        Decides whether a call may proceed; returns True for the half-open trial.
+        """
+        now = self.clock()
+        with self._lock:
+            if self.state == OPEN:
+                if now < self._opened_at + self.open_seconds:
+                    raise CircuitOpenError(self.name, self._retry_after(now))
+                self.state = HALF_OPEN
+            if self.state == HALF_OPEN:
+                if self._trial_in_flight:
+                    raise CircuitOpenError(self.name, self.open_seconds)
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def _open(self, now: float) -> None:
+        if self.state != OPEN:
+            logger.warning("Circuit %s opened", self.name)
+        self.state = OPEN
+        self._opened_at = now
+        self._outcomes.clear()
+
+    def _record(self, trial: bool, failed: bool, duration: float) -> None:
+        now = self.clock()
+        slow = duration >= self.slow_call_seconds
+        with self._lock:
+            if trial:
+                self._trial_in_flight = False
+                if failed or slow:
+                    self._open(now)
+                else:
+                    logger.info("Circuit %s closed", self.name)
+                    self.state = CLOSED
+                return
+            if self.state != CLOSED:
+                return
+            self._outcomes.append((now, failed, slow))
+            while self._outcomes and self._outcomes[0][0] <= now - self.window_seconds:
+                self._outcomes.popleft()
+            calls = len(self._outcomes)
+            if calls < self.minimum_calls:
+                return
+            failures = sum(1 for _, failed_call, _ in self._outcomes if failed_call)
+            slow_calls = sum(1 for _, _, slow_call in self._outcomes if slow_call)
+            if failures / calls >= self.failure_rate or slow_calls / calls >= self.slow_call_rate:
+                self._open(now)
+
+    def call(self, fn: Callable[[], T]) -> T:
+        """
+        Calls `fn` through the circuit.
+
+        Args:
+            fn: The call to the protected dependency.
+
+        Returns:
+            Whatever `fn` returns.
+
+        Raises:
+            CircuitOpenError: If the circuit is open.
+        """
+        trial = self._acquire()
+        started_at = self.clock()
+        try:
+            result = fn()
+        except self.failure_errors:
+            self._record(trial, True, self.clock() - started_at)
+            raise
+        except BaseException:
+            self._record(trial, False, self.clock() - started_at)
+            raise
+        self._record(trial, False, self.clock() - started_at)
+        return result
+
+    def retry_after(self) -> float:
+        """
+        Seconds until the circuit lets a trial call through; 0 when closed.
+        """
+        with self._lock:
+            if self.state == CLOSED:
+                return 0.0
+            return self._retry_after(self.clock()) or self.open_seconds
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Snapshot of the circuit for the readiness probe.
+        """
+        with self._lock:
+            return {'state': self.state, 'recent_calls': len(self._outcomes)}
+
+    def reset(self) -> None:
+        """
+        Closes the circuit and forgets past outcomes (used in tests).
+        """
+        with self._lock:
+            self.state = CLOSED
+            self._trial_in_flight = False
+            self._outcomes.clear()
+
+
+mongo_circuit_breaker = CircuitBreaker('mongodb')
@@ -0,0 +1,193 @@
+# tech/infra/resilience/idempotency_store.py
+import collections
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from pymongo import ReturnDocument
+
+from tech.infra.databases.mongodb import get_collection
+
+IDEMPOTENCY_TTL_SECONDS = float(os.getenv('IDEMPOTENCY_TTL_SECONDS', str(24 * 3600)))
+# Uma chave "em andamento" mais velha que isto é de uma requisição que morreu
+IDEMPOTENCY_PENDING_TIMEOUT_SECONDS = float(os.getenv('IDEMPOTENCY_PENDING_TIMEOUT_SECONDS', '60'))
+IDEMPOTENCY_FRONT_CACHE_SIZE = int(os.getenv('IDEMPOTENCY_FRONT_CACHE_SIZE', '1024'))
+
+PENDING = 'pending'
+DONE = 'done'
+
+
+class IdempotencyRecord:
+    """
+    What is stored under one idempotency key.
+
+    Attributes:
+        fingerprint (str): Hash of the request the key was first used with.
+        state (str): PENDING while the first request runs, DONE once its
+            response is stored.
+        status (int): The stored response status, once DONE.
+        headers (List[Tuple[str, str]]): The stored response headers.
+        body (bytes): The stored response body.
+    """
+
+    def __init__(self, fingerprint: str, state: str, status: int = 0,
+                 headers: Optional[List[Tuple[str, str]]] = None, body: bytes = b''):
+        self.fingerprint = fingerprint
+        self.state = state
+        self.status = status
+        self.headers = headers or []
+        self.body = body
+
+    @classmethod
+    def from_document(cls, document: Dict[str, Any]) -> 'IdempotencyRecord':
+        return cls(
+            fingerprint=document['fingerprint'],
+            state=document['state'],
+            status=document.get('status', 0),
+            headers=[tuple(header) for header in document.get('headers', [])],
+            body=bytes(document.get('body', b'')),
+        )
+
+
+class IdempotencyStore:
+    """
+    Idempotency keys and the responses they produced.
+
+    Records live in a MongoDB collection that expires them by TTL, so every
+    instance sees every key. Completed records are also kept in a small
+    in-process LRU, so a retry landing on the same instance is answered
+    without a round trip; anything else costs a single `find_one_and_update`
+    that both looks the key up and claims it.
+
+    Every claim records an owner token chosen by the caller, and only that
+    owner can complete or release the key. A request whose key was taken
+    over after `pending_timeout` can therefore not overwrite or delete the
+    claim of the request that took it over.
+    """
+
+    def __init__(
+            self,
+            collection_name: str = 'idempotency_keys',
+            ttl: float = IDEMPOTENCY_TTL_SECONDS,
+            pending_timeout: float = IDEMPOTENCY_PENDING_TIMEOUT_SECONDS,
+            front_cache_size: int = IDEMPOTENCY_FRONT_CACHE_SIZE,
+            clock: Callable[[], float] = time.monotonic
+    ):
+        self.collection_name = collection_name
+        self.ttl = ttl
+        self.pending_timeout = pending_timeout
+        self.front_cache_size = front_cache_size
+        self.clock = clock
+        self._collection = None
+        self._lock = threading.Lock()
+        self._front: 'collections.OrderedDict[str, Tuple[float, IdempotencyRecord]]' = collections.OrderedDict()
+
+    @property
+    def collection(self):
+        if self._collection is None:
+            self._collection = get_collection(self.collection_name)
+        return self._collection
+
+    def ensure_indexes(self) -> None:
+        """
+        Expires records `ttl` seconds after the key was first used.
+        """
+        self.collection.create_index('created_at', expireAfterSeconds=int(self.ttl))
+
+    def _remember(self, key: str, record: IdempotencyRecord) -> None:
+        with self._lock:
+            self._front[key] = (self.clock() + self.ttl, record)
+            self._front.move_to_end(key)
+            while len(self._front) > self.front_cache_size:
+                self._front.popitem(last=False)
+
+    def cached(self, key: str) -> Optional[IdempotencyRecord]:
+        """
+        Returns a completed record from the in-process cache, if any.
+        """
+        with self._lock:
+            entry = self._front.get(key)
+            if entry is None:
+                return None
+            expires_at, record = entry
+            if self.clock() >= expires_at:
+                del self._front[key]
+                return None
+            self._front.move_to_end(key)
+            return record
+
+    def claim(self, key: str, fingerprint: str, owner: str) -> Optional[IdempotencyRecord]:
+        """
+        Claims `key` for a new request, or returns what is already stored.
+
+        Args:
+            key (str): The scoped idempotency key.
+            fingerprint (str): Hash of the current request.
+            owner (str): Token unique to the current request, required to
+                complete or release the key.
+
+        Returns:
+            Optional[IdempotencyRecord]: None if the caller now owns the key
+            and must run the request, otherwise the existing record.
+        """
+        cached = self.cached(key)
+        if cached is not None:
+            return cached
+
+        now = datetime.utcnow()
+        document = self.collection.find_one_and_update(
+            {'_id': key},
+            {'$setOnInsert': {'fingerprint': fingerprint, 'owner': owner, 'state': PENDING, 'created_at': now}},
+            upsert=True,
+            return_document=ReturnDocument.BEFORE,
+        )
+        if document is None:
+            return None
+
+        record = IdempotencyRecord.from_document(document)
+        if record.state == DONE:
+            self._remember(key, record)
+        elif document['created_at'] < now - timedelta(seconds=self.pending_timeout):
+            # A requisição dona da chave não terminou: assume a chave
+            taken = self.collection.update_one(
+                {'_id': key, 'state': PENDING, 'created_at': document['created_at']},
+                {'$set': {'fingerprint': fingerprint, 'owner': owner, 'created_at': now}},
+            )
+            if taken.modified_count:
+                return None
+        return record
+
+    def complete(self, key: str, fingerprint: str, owner: str, status: int,
+                 headers: List[Tuple[str, str]], body: bytes) -> None:
+        """
+        Stores the response of the request that owns `key`.
+
+        Nothing is stored if `owner` no longer holds the key.
+        """
+        stored = self.collection.update_one(
+            {'_id': key, 'state': PENDING, 'owner': owner},
+            {'$set': {'state': DONE, 'status': status, 'headers': [list(h) for h in headers], 'body': body}},
+        )
+        if stored.modified_count:
+            self._remember(key, IdempotencyRecord(fingerprint, DONE, status, headers, body))
+
+    def release(self, key: str, owner: str) -> None:
+        """
+        Forgets `key` after a request that should not be replayed (e.g. a
+        5xx), so that a retry runs again.
+
+        Only the claim made by `owner` is deleted; a key taken over by
+        another request is left to it.
+        """
+        with self._lock:
+            self._front.pop(key, None)
+        self.collection.delete_one({'_id': key, 'state': PENDING, 'owner': owner})
+
+    def clear(self) -> None:
+        with self._lock:
+            self._front.clear()
+
+
+idempotency_store = IdempotencyStore()
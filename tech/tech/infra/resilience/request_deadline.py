@@ -0,0 +1,97 @@
+# tech/infra/resilience/request_deadline.py
+import functools
+import os
+import time
+from contextvars import ContextVar, Token
+from typing import Callable, Optional, TypeVar
+
+import pymongo
+from pymongo.errors import PyMongoError
+
+T = TypeVar('T')
+
+# Orçamento padrão de uma requisição, também usado pelas leituras compartilhadas
+REQUEST_DEADLINE_SECONDS = float(os.getenv('REQUEST_DEADLINE_SECONDS', '10'))
+
+_deadline: ContextVar[Optional[float]] = ContextVar('request_deadline', default=None)
+
+
+class DeadlineExceeded(Exception):
+    """
+    Raised when the running request has no time budget left.
+
+    The API answers it with 504. It is not a database failure, so it never
+    counts against the MongoDB circuit breaker.
+    """
+
+    def __init__(self, message: str = "Request deadline exceeded"):
+        super().__init__(message)
+
+
+def start_deadline(budget: float) -> Token:
+    """
+    Gives the current context `budget` seconds from now.
+
+    Starlette copies the context into threadpool calls, so repository and
+    gateway code running for the request sees the same deadline.
+
+    Returns:
+        Token: Restores the previous deadline with `end_deadline`.
+    """
+    return _deadline.set(time.monotonic() + budget)
+
+
+def end_deadline(token: Token) -> None:
+    _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """
+    Seconds left for the running request, or None outside a deadline.
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def check_deadline() -> Optional[float]:
+    """
+    Returns the remaining budget, raising DeadlineExceeded if it is gone.
+    """
+    budget = remaining()
+    if budget is not None and budget <= 0:
+        raise DeadlineExceeded()
+    return budget
+
+
+def bounded_by_deadline(fn: Callable[..., T]) -> Callable[..., T]:
+    """
+    Runs a MongoDB operation within the remaining request budget.
+
+    Inside a deadline the call runs under `pymongo.timeout`, which sends
+    the remaining budget as `maxTimeMS` with every command and bounds
+    server selection and socket waits by it, so the server abandons the
+    work when the client would. A timeout raised once the budget is spent
+    surfaces as DeadlineExceeded; one raised with budget left (MongoDB
+    unreachable) is re-raised as is. Outside a deadline the call is left
+    as is.
+    """
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        budget = check_deadline()
+        if budget is None:
+            return fn(*args, **kwargs)
+        try:
+            with pymongo.timeout(budget):
+                return fn(*args, **kwargs)
+        except PyMongoError as e:
+            # Só é estouro de prazo se o orçamento acabou de fato; um MongoDB
+            # fora do ar segue como erro de conexão para o circuit breaker
+            # registrar a falha e servir o snapshot
+            left = remaining()
+            if e.timeout and left is not None and left <= 0:
+                raise DeadlineExceeded() from e
+            raise
+
+    return wrapper
@@ -1,13 +1,35 @@
 # tech/interfaces/controllers/product_controller.py
 from fastapi import HTTPException
-from typing import List, Dict, Any
+from typing import IO, Callable, Hashable, List, Dict, Any, Optional, AsyncIterator, TypeVar
 
 from tech.use_cases.products.create_product_use_case import CreateProductUseCase
 from tech.use_cases.products.list_products_by_category_use_case import ListProductsByCategoryUseCase
 from tech.use_cases.products.list_all_products_use_case import ListAllProductsUseCase
 from tech.use_cases.products.update_product_use_case import UpdateProductUseCase
 from tech.use_cases.products.delete_product_use_case import DeleteProductUseCase
-from tech.interfaces.schemas.product_schema import ProductSchema
+from tech.use_cases.products.search_products_use_case import SearchProductsUseCase
+from tech.use_cases.products.suggest_products_use_case import SuggestProductsUseCase
+from tech.use_cases.products.fuzzy_search_products_use_case import FuzzySearchProductsUseCase
+from tech.use_cases.products.get_menu_use_case import GetMenuUseCase
+from tech.use_cases.products.list_product_changes_use_case import (
+    ChangesTokenExpired,
+    InvalidChangesToken,
+    ListProductChangesUseCase,
+)
+from tech.use_cases.products.stream_product_events_use_case import StreamProductEventsUseCase
+from tech.use_cases.products.get_product_use_case import GetProductUseCase
+from tech.use_cases.products.bulk_upsert_products_use_case import BulkUpsertProductsUseCase
+from tech.use_cases.products.import_products_use_case import ImportProductsUseCase
+from tech.use_cases.products.export_products_use_case import ExportProductsUseCase
+from tech.use_cases.products.adjust_prices_use_case import AdjustPricesUseCase
+from tech.use_cases.products.get_category_stats_use_case import GetCategoryStatsUseCase
+from tech.domain.value_objects import ProductSearchQuery
+from tech.interfaces.schemas.product_schema import PriceAdjustmentSchema, ProductSchema
+from tech.infra.observability.request_context import track
+from tech.infra.concurrency.single_flight import SingleFlight
+from tech.infra.catalog.menu_view import RenderedMenu
+
+T = TypeVar('T')
 
 class ProductController:
     """
@@ -20,13 +42,45 @@ class ProductController:
             list_products_by_category_use_case: ListProductsByCategoryUseCase,
             list_all_products_use_case: ListAllProductsUseCase,
             update_product_use_case: UpdateProductUseCase,
-            delete_product_use_case: DeleteProductUseCase
+            delete_product_use_case: DeleteProductUseCase,
+            search_products_use_case: Optional[SearchProductsUseCase] = None,
+            suggest_products_use_case: Optional[SuggestProductsUseCase] = None,
+            fuzzy_search_products_use_case: Optional[FuzzySearchProductsUseCase] = None,
+            get_menu_use_case: Optional[GetMenuUseCase] = None,
+            list_product_changes_use_case: Optional[ListProductChangesUseCase] = None,
+            stream_product_events_use_case: Optional[StreamProductEventsUseCase] = None,
+            get_product_use_case: Optional[GetProductUseCase] = None,
+            single_flight: Optional[SingleFlight] = None,
+            bulk_upsert_products_use_case: Optional[BulkUpsertProductsUseCase] = None,
+            import_products_use_case: Optional[ImportProductsUseCase] = None,
+            export_products_use_case: Optional[ExportProductsUseCase] = None,
+            adjust_prices_use_case: Optional[AdjustPricesUseCase] = None,
+            get_category_stats_use_case: Optional[GetCategoryStatsUseCase] = None
     ):
         self.create_product_use_case = create_product_use_case
         self.list_products_by_category_use_case = list_products_by_category_use_case
         self.list_all_products_use_case = list_all_products_use_case
         self.update_product_use_case = update_product_use_case
         self.delete_product_use_case = delete_product_use_case
+        self.search_products_use_case = search_products_use_case
+        self.suggest_products_use_case = suggest_products_use_case
+        self.fuzzy_search_products_use_case = fuzzy_search_products_use_case
+        self.get_menu_use_case = get_menu_use_case
+        self.list_product_changes_use_case = list_product_changes_use_case
+        self.stream_product_events_use_case = stream_product_events_use_case
+        self.get_product_use_case = get_product_use_case
+        self.single_flight = single_flight
+        self.bulk_upsert_products_use_case = bulk_upsert_products_use_case
+        self.import_products_use_case = import_products_use_case
+        self.export_products_use_case = export_products_use_case
+        self.adjust_prices_use_case = adjust_prices_use_case
+        self.get_category_stats_use_case = get_category_stats_use_case
+
+    def _coalesce(self, key: Hashable, fn: Callable[[], T]) -> T:
+        # Leituras idênticas simultâneas compartilham a mesma consulta
+        if self.single_flight is None:
+            return fn()
+        return self.single_flight.do(key, fn)
 
     def create_product(self, product_data: ProductSchema) -> Dict[str, Any]:
         """
@@ -47,6 +101,99 @@ class ProductController:
         except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
 
+    def bulk_upsert_products(self, items: List[ProductSchema]) -> Dict[str, Any]:
+        """
+        Cria ou atualiza um lote de produtos, identificados pelo nome.
+
+        Args:
+            items: O lote já validado, na ordem enviada.
+
+        Returns:
+            O resultado de cada item ('created', 'updated' ou 'error') e os
+            totais do lote.
+        """
+        with track('bulk_write'):
+            results = self.bulk_upsert_products_use_case.execute(items)
+        with track('serialize'):
+            serialized = []
+            totals = {'created': 0, 'updated': 0, 'error': 0}
+            for result in results:
+                totals[result.status] += 1
+                item: Dict[str, Any] = {"index": result.index, "status": result.status}
+                if result.product is not None:
+                    item["product"] = result.product.dict()
+                if result.error is not None:
+                    item["error"] = result.error
+                serialized.append(item)
+            return {
+                "results": serialized,
+                "created": totals['created'],
+                "updated": totals['updated'],
+                "failed": totals['error'],
+            }
+
+    def adjust_prices(self, data: PriceAdjustmentSchema) -> Dict[str, Any]:
+        """
+        Aplica uma variação de preço a uma categoria ou lista de produtos.
+
+        Args:
+            data: A variação (percent ou amount) e o alvo (category ou product_ids).
+
+        Returns:
+            O número de produtos alterados e os produtos com os novos preços.
+
+        Raises:
+            HTTPException: Se a variação ou o alvo não forem informados
+                exatamente uma vez.
+        """
+        try:
+            with track('update_many'):
+                products = self.adjust_prices_use_case.execute(data)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        with track('serialize'):
+            return {"updated": len(products), "products": [product.dict() for product in products]}
+
+    def import_products(self, stream: IO[bytes], file_format: str) -> Dict[str, Any]:
+        """
+        Importa produtos de um arquivo NDJSON, CSV ou BSON, lido em fluxo.
+
+        Args:
+            stream: O arquivo binário, lido sequencialmente.
+            file_format: 'ndjson', 'csv' ou 'bson'.
+
+        Returns:
+            O relatório da importação: contadores, uma amostra dos erros por
+            linha e a vazão em linhas por segundo.
+
+        Raises:
+            HTTPException: Se o formato não for suportado.
+        """
+        try:
+            with track('import'):
+                report = self.import_products_use_case.execute(stream, file_format)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return report.to_dict()
+
+    def export_products(self, file_format: str) -> AsyncIterator[bytes]:
+        """
+        Exporta o catálogo inteiro como NDJSON ou CSV comprimido com gzip.
+
+        Args:
+            file_format: 'ndjson' ou 'csv'.
+
+        Returns:
+            Um iterador assíncrono com os bytes comprimidos da exportação.
+
+        Raises:
+            HTTPException: Se o formato não for suportado.
+        """
+        try:
+            return self.export_products_use_case.execute(file_format)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
     def list_products_by_category(self, category: str) -> List[Dict[str, Any]]:
         """
         Lista produtos por categoria.
@@ -60,10 +207,14 @@ class ProductController:
         Raises:
             HTTPException: Se nenhum produto for encontrado na categoria.
         """
+        return self._coalesce(('category', category), lambda: self._list_products_by_category(category))
+
+    def _list_products_by_category(self, category: str) -> List[Dict[str, Any]]:
         products = self.list_products_by_category_use_case.execute(category)
         if not products:
             raise HTTPException(status_code=404, detail=f"No products found in category: {category}")
-        return [product.dict() for product in products]
+        with track('serialize'):
+            return [product.dict() for product in products]
 
     def list_all_products(self) -> List[Dict[str, Any]]:
         """
@@ -75,10 +226,208 @@ class ProductController:
         Raises:
             HTTPException: Se nenhum produto for encontrado.
         """
+        return self._coalesce(('all',), self._list_all_products)
+
+    def _list_all_products(self) -> List[Dict[str, Any]]:
         products = self.list_all_products_use_case.execute()
         if not products:
             raise HTTPException(status_code=404, detail="No products found")
-        return [product.dict() for product in products]
+        with track('serialize'):
+            return [product.dict() for product in products]
+
+    def get_product(self, product_id: int) -> Dict[str, Any]:
+        """
+        Busca um produto pelo ID.
+
+        Args:
+            product_id: O ID do produto.
+
+        Returns:
+            Os detalhes formatados do produto.
+
+        Raises:
+            HTTPException: Se o produto não for encontrado.
+        """
+        return self._coalesce(('product', str(product_id)), lambda: self._get_product(product_id))
+
+    def _get_product(self, product_id: int) -> Dict[str, Any]:
+        try:
+            product = self.get_product_use_case.execute(product_id)
+        except ValueError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+        with track('serialize'):
+            return product.dict()
+
+    def search_products(
+            self,
+            min_price: Optional[float] = None,
+            max_price: Optional[float] = None,
+            categories: Optional[List[str]] = None,
+            name_prefix: Optional[str] = None,
+            sort: str = 'id',
+            order: str = 'asc',
+            limit: int = 50,
+            offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        Busca produtos por faixa de preço, categorias e prefixo do nome.
+
+        Args:
+            min_price: Preço mínimo (inclusivo).
+            max_price: Preço máximo (inclusivo).
+            categories: Categorias aceitas; vazio aceita todas.
+            name_prefix: Prefixo do nome, sem diferenciar maiúsculas.
+            sort: Campo de ordenação ('id', 'price' ou 'name').
+            order: 'asc' ou 'desc'.
+            limit: Número máximo de produtos retornados.
+            offset: Quantidade de produtos a pular.
+
+        Returns:
+            Uma lista de produtos formatados, possivelmente vazia.
+
+        Raises:
+            HTTPException: Se os parâmetros da busca forem inválidos.
+        """
+        try:
+            query = ProductSearchQuery(
+                min_price=min_price, max_price=max_price, categories=categories,
+                name_prefix=name_prefix, sort=sort, descending=order == 'desc',
+                limit=limit, offset=offset
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        with track('search'):
+            products = self.search_products_use_case.execute(query)
+        with track('serialize'):
+            return [product.dict() for product in products]
+
+    def suggest_products(self, prefix: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Sugere produtos cujo nome começa com o texto digitado.
+
+        Args:
+            prefix: Texto digitado até agora; maiúsculas e acentos são ignorados.
+            limit: Número máximo de sugestões.
+
+        Returns:
+            Uma lista de produtos formatados, possivelmente vazia.
+        """
+        with track('suggest'):
+            products = self.suggest_products_use_case.execute(prefix, limit)
+        with track('serialize'):
+            return [product.dict() for product in products]
+
+    def fuzzy_search_products(
+            self,
+            text: str,
+            category: Optional[str] = None,
+            limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """
+        Busca produtos por similaridade do nome, tolerando erros de digitação.
+
+        Args:
+            text: Texto buscado.
+            category: Categoria opcional para filtrar os resultados.
+            limit: Número máximo de resultados.
+
+        Returns:
+            Uma lista de produtos formatados com o campo `similarity`,
+            do mais parecido para o menos parecido.
+        """
+        with track('fuzzy'):
+            matches = self.fuzzy_search_products_use_case.execute(text, category=category, limit=limit)
+        with track('serialize'):
+            return [
+                {**product.dict(), "similarity": round(similarity, 3)}
+                for product, similarity in matches
+            ]
+
+    def get_menu(self) -> RenderedMenu:
+        """
+        Retorna o cardápio completo, agrupado por categoria.
+
+        Returns:
+            O documento do cardápio já serializado em JSON, com o ETag e o
+            Last-Modified desses mesmos bytes.
+        """
+        with track('menu'):
+            return self.get_menu_use_case.execute()
+
+    def get_category_stats(self) -> Dict[str, Any]:
+        """
+        Retorna, por categoria, a quantidade de produtos e os preços mínimo,
+        médio e máximo.
+
+        Returns:
+            As estatísticas de cada categoria e o total de produtos.
+        """
+        with track('category_stats'):
+            stats = self.get_category_stats_use_case.execute()
+        return {
+            "categories": [entry.dict() for entry in stats],
+            "total": sum(entry.count for entry in stats),
+        }
+
+    def list_categories(self) -> List[Dict[str, Any]]:
+        """
+        Lista as categorias que têm produtos, com a quantidade de cada uma.
+
+        Returns:
+            Uma lista com o nome e a quantidade de produtos de cada categoria.
+        """
+        with track('category_stats'):
+            stats = self.get_category_stats_use_case.execute()
+        return [{"category": entry.category, "count": entry.count} for entry in stats]
+
+    def list_product_changes(self, since: Optional[str], limit: int = 500) -> Dict[str, Any]:
+        """
+        Lista as alterações do catálogo desde um token de sincronização.
+
+        Args:
+            since: Token retornado pela chamada anterior, ou None para
+                sincronizar o catálogo inteiro.
+            limit: Número máximo de alterações na página.
+
+        Returns:
+            As alterações (upserts e exclusões), o próximo token e se há mais
+            alterações disponíveis.
+
+        Raises:
+            HTTPException: 400 se o token for inválido, 410 se ele for mais
+                antigo que a retenção das exclusões.
+        """
+        try:
+            page = self.list_product_changes_use_case.execute(since, limit)
+        except ChangesTokenExpired as e:
+            raise HTTPException(status_code=410, detail=str(e))
+        except InvalidChangesToken as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        with track('serialize'):
+            changes = []
+            for change in page.changes:
+                if change.product is not None:
+                    changes.append({"op": change.kind, "product": change.product.dict()})
+                else:
+                    changes.append({
+                        "op": change.kind,
+                        "product_id": change.product_id,
+                        "deleted_at": change.changed_at.isoformat() if change.changed_at else None,
+                    })
+            return {"changes": changes, "next": page.next_token, "has_more": page.has_more}
+
+    def stream_product_events(self, last_event_id: Optional[str] = None) -> AsyncIterator[str]:
+        """
+        Abre o fluxo de eventos de alteração de produtos (SSE).
+
+        Args:
+            last_event_id: Token do último evento recebido pelo cliente, para
+                reenviar o que ele perdeu.
+
+        Returns:
+            Um iterador assíncrono com os eventos já formatados.
+        """
+        return self.stream_product_events_use_case.execute(last_event_id)
 
     def update_product(self, product_id: str, product_data: ProductSchema) -> Dict[str, Any]:
         """
@@ -4,7 +4,21 @@ import hmac
 import hashlib
 import base64
 import json
-from typing import Dict
+import logging
+import threading
+from typing import Any, Dict
+
+from botocore.config import Config
+from botocore.exceptions import ConnectTimeoutError, ReadTimeoutError
+
+from tech.infra.resilience.request_deadline import DeadlineExceeded, check_deadline
+
+logger = logging.getLogger(__name__)
+
+# Timeouts possíveis dos clientes usados sob um prazo de requisição, em segundos
+DEADLINE_TIMEOUT_STEPS = (0.25, 0.5, 1.0, 2.0, 5.0)
+_deadline_clients: Dict[float, Any] = {}
+_deadline_clients_lock = threading.Lock()
 
 class CognitoGateway:
     """Gateway for interacting with Amazon Cognito services.
@@ -35,6 +49,51 @@ class CognitoGateway:
 
         self.jwks_url = f"https://cognito-idp.{self.region}.amazonaws.com/{self.user_pool_id}/.well-known/jwks.json"
 
+    def _client_for_deadline(self):
+        """Returns a Cognito client whose timeouts fit the request deadline.
+
+        boto3 timeouts are fixed per client, so one client per step of
+        DEADLINE_TIMEOUT_STEPS is created on first use and shared; the
+        largest step that fits the remaining budget is used, without
+        retries. Outside a deadline, or with budget beyond the last step,
+        the default client is used.
+
+        Raises:
+            DeadlineExceeded: If the budget is shorter than the smallest step.
+        """
+        budget = check_deadline()
+        if budget is None or budget >= DEADLINE_TIMEOUT_STEPS[-1]:
+            return self.client
+        fitting = [step for step in DEADLINE_TIMEOUT_STEPS if step <= budget]
+        if not fitting:
+            raise DeadlineExceeded("Not enough time left to call Cognito")
+        step = fitting[-1]
+        with _deadline_clients_lock:
+            client = _deadline_clients.get(step)
+            if client is None:
+                client = boto3.client(
+                    "cognito-idp",
+                    region_name=self.region,
+                    aws_access_key_id=os.environ.get('AWS_ACCESS_KEY_ID', 'SUA_ACCESS_KEY_ID'),
+                    aws_secret_access_key=os.environ.get('AWS_SECRET_ACCESS_KEY', 'SUA_SECRET_ACCESS_KEY'),
+                    config=Config(connect_timeout=step, read_timeout=step, retries={'total_max_attempts': 1})
+                )
+                _deadline_clients[step] = client
+        return client
+
+    def _call(self, operation: str, **kwargs) -> dict:
+        """Calls a Cognito operation within the request deadline.
+
+        Raises:
+            DeadlineExceeded: If the budget runs out before or during the call.
+        """
+        try:
+            return getattr(self._client_for_deadline(), operation)(**kwargs)
+        except (ConnectTimeoutError, ReadTimeoutError) as e:
+            if check_deadline() is not None:
+                raise DeadlineExceeded("Cognito call exceeded the request deadline") from e
+            raise
+
     def authenticate(self, cpf: str, password: str) -> dict:
         """Authenticates a user with CPF and password.
 
@@ -62,25 +121,29 @@ class CognitoGateway:
                 secret_hash = self._get_secret_hash(cpf)
                 auth_params["SECRET_HASH"] = secret_hash
 
-            response = self.client.initiate_auth(
+            response = self._call(
+                "initiate_auth",
                 AuthFlow="USER_PASSWORD_AUTH",
                 AuthParameters=auth_params,
                 ClientId=self.client_id
             )
 
-            print(f"Authentication successful for user: {cpf}")
+            logger.info("Authentication successful")
             return response.get("AuthenticationResult", {})
 
         except self.client.exceptions.NotAuthorizedException as e:
-            print(f"Authentication error - invalid credentials: {str(e)}")
+            logger.info("Authentication error - invalid credentials: %s", e)
             raise ValueError(f"Incorrect credentials: {str(e)}")
 
         except self.client.exceptions.UserNotFoundException as e:
-            print(f"Authentication error - user not found: {str(e)}")
+            logger.info("Authentication error - user not found: %s", e)
             raise ValueError(f"User not found: {str(e)}")
 
+        except DeadlineExceeded:
+            raise
+
         except Exception as e:
-            print(f"Authentication error: {str(e)}")
+            logger.warning("Authentication error: %s", e)
             raise ValueError(f"Authentication failed: {str(e)}")
 
     def _get_secret_hash(self, username: str) -> str:
@@ -136,7 +199,7 @@ class CognitoGateway:
 
             return json.loads(decoded_bytes.decode('utf-8'))
         except Exception as e:
-            print(f"Failed to decode JWT payload: {str(e)}")
+            logger.debug("Failed to decode JWT payload: %s", e)
             raise ValueError(f"Failed to decode JWT: {str(e)}")
 
     def verify_token(self, token: str) -> Dict:
@@ -157,17 +220,13 @@ class CognitoGateway:
             Exception: For unexpected errors during verification.
         """
         try:
-            print(f"Starting token verification: {token[:20]}...")
-
             try:
                 try:
                     decoded_token = self._decode_jwt_manually(token)
                 except Exception as jwt_error:
-                    print(f"JWT decode error: {str(jwt_error)}")
+                    logger.debug("JWT decode error: %s", jwt_error)
                     raise ValueError(f"Invalid JWT format: {str(jwt_error)}")
 
-                print(f"Token decoded: {decoded_token}")
-
                 if "cognito:groups" in decoded_token:
                     groups = decoded_token.get("cognito:groups", [])
                     username = decoded_token.get("cognito:username", decoded_token.get("sub", ""))
@@ -181,8 +240,10 @@ class CognitoGateway:
                         "is_admin": "admin" in groups
                     }
 
-                    print(f"Group information found in token: {groups}")
-                    print(f"User {username} {'is' if user_data['is_admin'] else 'is not'} an admin")
+                    logger.debug(
+                        "Token verified from claims",
+                        extra={"username": username, "is_admin": user_data["is_admin"]}
+                    )
 
                     return user_data
 
@@ -190,15 +251,15 @@ class CognitoGateway:
                 if not username:
                     raise ValueError("Token does not contain user identifier")
 
-                print(f"Username/sub extracted from token: {username}")
             except ValueError as e:
                 raise e
             except Exception as e:
-                print(f"Error decoding token: {str(e)}")
+                logger.debug("Error decoding token: %s", e)
                 raise ValueError(f"Invalid token: {str(e)}")
 
             try:
-                user_response = self.client.admin_get_user(
+                user_response = self._call(
+                    "admin_get_user",
                     UserPoolId=self.user_pool_id,
                     Username=username
                 )
@@ -211,37 +272,42 @@ class CognitoGateway:
                 for attr in user_response.get("UserAttributes", []):
                     user_data["attributes"][attr["Name"]] = attr["Value"]
 
-                print(f"User information obtained: {user_data['username']}")
             except self.client.exceptions.UserNotFoundException:
-                print(f"User not found: {username}")
+                logger.info("User not found", extra={"username": username})
                 raise ValueError(f"User not found: {username}")
+            except DeadlineExceeded:
+                raise
             except Exception as e:
-                print(f"Error getting user information: {str(e)}")
+                logger.warning("Error getting user information: %s", e)
                 raise ValueError(f"Failed to get user information: {str(e)}")
 
             try:
-                groups_response = self.client.admin_list_groups_for_user(
+                groups_response = self._call(
+                    "admin_list_groups_for_user",
                     UserPoolId=self.user_pool_id,
                     Username=username
                 )
 
-                print(f"Groups obtained: {[g.get('GroupName') for g in groups_response.get('Groups', [])]}")
-
                 user_data["is_admin"] = any(
                     group.get("GroupName") == "admin"
                     for group in groups_response.get("Groups", [])
                 )
 
-                print(f"User {username} {'is' if user_data['is_admin'] else 'is not'} an admin")
+                logger.debug(
+                    "Token verified with Cognito",
+                    extra={"username": username, "is_admin": user_data["is_admin"]}
+                )
 
                 return user_data
 
+            except DeadlineExceeded:
+                raise
             except Exception as e:
-                print(f"Error checking admin status: {str(e)}")
+                logger.warning("Error checking admin status: %s", e)
                 raise ValueError(f"Failed to verify admin status: {str(e)}")
 
-        except ValueError as e:
+        except (ValueError, DeadlineExceeded) as e:
             raise e
         except Exception as e:
-            print(f"Unexpected error in token verification: {str(e)}")
+            logger.exception("Unexpected error in token verification")
             raise ValueError(f"Token verification failed: {str(e)}")
\ No newline at end of file
@@ -76,6 +76,39 @@ class ProductGateway(ProductRepository):
         """
         return self.repository.list_all_products()
 
+    def bulk_upsert(self, products: list) -> list:
+        """
+        Creates or updates several products, matched by name, in one write.
+
+        Args:
+            products (list): The product entities to store, with distinct names.
+
+        Returns:
+            list: One BulkUpsertResult per product, in order.
+        """
+        return self.repository.bulk_upsert(products)
+
+    def adjust_prices(self, adjustment) -> list:
+        """
+        Changes the price of every matching product in one write.
+
+        Args:
+            adjustment (PriceAdjustment): The change and the products it applies to.
+
+        Returns:
+            list: The changed product entities.
+        """
+        return self.repository.adjust_prices(adjustment)
+
+    def category_stats(self) -> list:
+        """
+        Computes the product count and min/avg/max price of each category.
+
+        Returns:
+            list: One CategoryStats per category that has products.
+        """
+        return self.repository.category_stats()
+
     def update(self, product: Products) -> Products:
         """
         Updates an existing product's details.
@@ -1,9 +1,14 @@
+import logging
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from tech.use_cases.products.verify_token_use_case import VerifyTokenUseCase
 from tech.interfaces.gateways.cognito_gateway import CognitoGateway
+from tech.infra.observability.request_context import track
+from tech.infra.resilience.request_deadline import DeadlineExceeded
 
 security = HTTPBearer()
+logger = logging.getLogger(__name__)
 
 
 def admin_required(credentials: HTTPAuthorizationCredentials = Depends(security)):
@@ -26,48 +31,47 @@ def admin_required(credentials: HTTPAuthorizationCredentials = Depends(security)
             401 Unauthorized - If authentication fails (invalid/expired token)
             403 Forbidden - If the user is authenticated but not an admin
     """
-    print("Admin authentication middleware invoked")
-
     if not credentials:
-        print("No credentials provided")
+        logger.info("Admin authentication rejected: no credentials provided")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Authentication credentials not provided"
         )
 
     token = credentials.credentials
-    print(f"Token received: {token[:20]}...")
 
-    cognito_gateway = CognitoGateway()
+    with track('auth'):
+        cognito_gateway = CognitoGateway()
     verify_token_use_case = VerifyTokenUseCase(cognito_gateway)
 
     try:
         if not token or not isinstance(token, str):
             raise ValueError("Token must be a non-empty string")
 
-        print("Verifying token...")
-        user_data = verify_token_use_case.execute(token)
-
-        print(f"Token successfully verified: {user_data}")
+        with track('auth'):
+            user_data = verify_token_use_case.execute(token)
 
         if not user_data.get("is_admin", False):
-            print(f"User is not an admin: {user_data.get('username')}")
+            logger.info("Admin authentication forbidden", extra={"username": user_data.get("username")})
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Insufficient permissions. Admin access required."
             )
 
-        print(f"Admin authentication successful for: {user_data.get('username')}")
+        logger.debug("Admin authentication successful", extra={"username": user_data.get("username")})
         return True
 
+    except DeadlineExceeded:
+        # Vira 504, não 401: as credenciais podem estar corretas
+        raise
     except ValueError as e:
-        print(f"Validation error: {str(e)}")
+        logger.info("Admin authentication failed: %s", e)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=f"Invalid authentication credentials: {str(e)}"
         )
     except Exception as e:
-        print(f"Authentication error: {str(e)}")
+        logger.warning("Admin authentication error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=f"Authentication error: {str(e)}"
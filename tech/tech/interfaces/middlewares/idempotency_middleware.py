@@ -0,0 +1,188 @@
+import hashlib
+import json
+import logging
+import os
+import uuid
+from typing import Iterable, List, Optional, Pattern, Tuple
+
+from pymongo.errors import PyMongoError
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers
+from starlette.routing import compile_path
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from tech.infra.observability.request_context import track
+from tech.infra.resilience.circuit_breaker import CircuitOpenError
+from tech.infra.resilience.idempotency_store import DONE, IdempotencyStore, idempotency_store
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_MAX_KEY_LENGTH = 255
+IDEMPOTENCY_MAX_RESPONSE_BYTES = int(os.getenv('IDEMPOTENCY_MAX_RESPONSE_BYTES', str(4 * 1024 * 1024)))
+# Falhas de autenticação e respostas transitórias não são repetidas: o cliente pode corrigi-las
+NOT_REPLAYED_STATUSES = frozenset({401, 403, 408, 409, 429})
+# Cabeçalhos por requisição, recalculados a cada resposta
+VOLATILE_HEADERS = frozenset({b'server-timing', b'x-db-roundtrips', b'date'})
+
+
+class IdempotencyMiddleware:
+    """ASGI middleware that makes retried admin writes safe.
+
+    A request to one of `routes` that carries an `Idempotency-Key` header
+    runs once; a retry with the same key gets the stored response back,
+    with `Idempotent-Replayed: true`, before authentication or any
+    repository call runs again. Keys are scoped to the Authorization header,
+    so a replay needs the credentials of the original request.
+
+    Reusing a key with a different request is answered with 422, and a
+    retry that arrives while the first request is still running with 409.
+    Responses with a 5xx status (or any status in NOT_REPLAYED_STATUSES)
+    are not stored, so the next retry runs the request again.
+
+    If the key store itself is unavailable the request runs without
+    idempotency, as it would without the header.
+    """
+
+    def __init__(
+            self,
+            app: ASGIApp,
+            routes: Iterable[Tuple[str, str]] = (),
+            store: IdempotencyStore = idempotency_store
+    ):
+        self.app = app
+        self.routes: List[Tuple[str, Pattern]] = [
+            (method.upper(), compile_path(path)[0]) for method, path in routes
+        ]
+        self.store = store
+
+    def _applies_to(self, scope: Scope) -> bool:
+        method = scope['method']
+        return any(method == m and pattern.match(scope['path']) for m, pattern in self.routes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http' or not self._applies_to(scope):
+            await self.app(scope, receive, send)
+            return
+        headers = Headers(scope=scope)
+        idempotency_key = headers.get('idempotency-key')
+        if idempotency_key is None:
+            await self.app(scope, receive, send)
+            return
+        if not idempotency_key or len(idempotency_key) > IDEMPOTENCY_MAX_KEY_LENGTH:
+            await _send_error(send, 400, f"Idempotency-Key must have 1 to {IDEMPOTENCY_MAX_KEY_LENGTH} characters")
+            return
+
+        body = await _read_body(receive)
+        key = _digest(headers.get('authorization', ''), idempotency_key)
+        fingerprint = _digest(scope['method'], scope['path'], scope.get('query_string', b'').decode('latin-1'), body)
+        owner = uuid.uuid4().hex
+
+        try:
+            with track('idempotency'):
+                record = self.store.cached(key) or await run_in_threadpool(self.store.claim, key, fingerprint, owner)
+        except (PyMongoError, CircuitOpenError) as e:
+            logger.warning("Idempotency store unavailable, running the request without it: %s", e)
+            await self.app(scope, _replay_body(body, receive), send)
+            return
+
+        if record is not None:
+            if record.fingerprint != fingerprint:
+                await _send_error(send, 422, "Idempotency-Key was already used with a different request")
+            elif record.state != DONE:
+                await _send_error(send, 409, "A request with this Idempotency-Key is still in progress",
+                                  [(b'retry-after', b'1')])
+            else:
+                await _send_stored(send, record.status, record.headers, record.body)
+            return
+
+        await self._run_and_store(scope, _replay_body(body, receive), send, key, fingerprint, owner)
+
+    async def _run_and_store(self, scope: Scope, receive: Receive, send: Send, key: str, fingerprint: str,
+                             owner: str) -> None:
+        status = 500
+        response_headers: List[Tuple[str, str]] = []
+        chunks: List[bytes] = []
+        size = 0
+
+        async def capture(message: Message) -> None:
+            nonlocal status, size
+            if message['type'] == 'http.response.start':
+                status = message['status']
+                response_headers.extend(
+                    (name.decode('latin-1'), value.decode('latin-1'))
+                    for name, value in message.get('headers', [])
+                    if name.lower() not in VOLATILE_HEADERS
+                )
+            elif message['type'] == 'http.response.body':
+                chunk = message.get('body', b'')
+                size += len(chunk)
+                if size <= IDEMPOTENCY_MAX_RESPONSE_BYTES:
+                    chunks.append(chunk)
+            await send(message)
+
+        completed = False
+        try:
+            await self.app(scope, receive, capture)
+            completed = True
+        finally:
+            replayable = (
+                completed and status < 500 and status not in NOT_REPLAYED_STATUSES
+                and size <= IDEMPOTENCY_MAX_RESPONSE_BYTES
+            )
+            try:
+                if replayable:
+                    await run_in_threadpool(self.store.complete, key, fingerprint, owner, status,
+                                            response_headers, b''.join(chunks))
+                else:
+                    await run_in_threadpool(self.store.release, key, owner)
+            except (PyMongoError, CircuitOpenError) as e:
+                logger.warning("Could not record idempotency key: %s", e)
+
+
+def _digest(*parts) -> str:
+    hasher = hashlib.sha256()
+    for part in parts:
+        hasher.update(part if isinstance(part, bytes) else str(part).encode('utf-8'))
+        hasher.update(b'\0')
+    return hasher.hexdigest()
+
+
+async def _read_body(receive: Receive) -> bytes:
+    chunks = []
+    while True:
+        message = await receive()
+        if message['type'] == 'http.request':
+            chunks.append(message.get('body', b''))
+            if not message.get('more_body', False):
+                return b''.join(chunks)
+        elif message['type'] == 'http.disconnect':
+            return b''.join(chunks)
+
+
+def _replay_body(body: bytes, receive: Receive) -> Receive:
+    sent = False
+
+    async def replay() -> Message:
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {'type': 'http.request', 'body': body, 'more_body': False}
+        # Depois do corpo, só a desconexão real do cliente
+        return await receive()
+
+    return replay
+
+
+async def _send_stored(send: Send, status: int, headers: List[Tuple[str, str]], body: bytes) -> None:
+    raw_headers = [(name.encode('latin-1'), value.encode('latin-1')) for name, value in headers]
+    raw_headers.append((b'idempotent-replayed', b'true'))
+    await send({'type': 'http.response.start', 'status': status, 'headers': raw_headers})
+    await send({'type': 'http.response.body', 'body': body})
+
+
+async def _send_error(send: Send, status: int, detail: str,
+                      extra_headers: Optional[List[Tuple[bytes, bytes]]] = None) -> None:
+    body = json.dumps({'detail': detail}).encode('utf-8')
+    headers = [(b'content-type', b'application/json'), (b'content-length', str(len(body)).encode('latin-1'))]
+    await send({'type': 'http.response.start', 'status': status, 'headers': headers + (extra_headers or [])})
+    await send({'type': 'http.response.body', 'body': body})
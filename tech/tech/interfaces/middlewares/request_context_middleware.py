@@ -0,0 +1,47 @@
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from tech.infra.observability.request_context import (
+    end_request_context,
+    start_request_context,
+)
+
+
+class RequestContextMiddleware:
+    """ASGI middleware that binds a RequestContext to every HTTP request.
+
+    Timings recorded during the request (Cognito verification, MongoDB round
+    trips, response serialization) are emitted on the response as a
+    `Server-Timing` header, together with an `X-DB-Roundtrips` count, so
+    clients and load tests can see where latency goes without a tracing
+    backend. Warnings recorded during the request, such as a stale catalog
+    served while MongoDB is unavailable, are emitted as `Warning` headers.
+
+    It is implemented as a pure ASGI middleware rather than with
+    BaseHTTPMiddleware so the context variable set here is inherited by the
+    endpoint and by the threadpool calls it spawns.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        context, token = start_request_context()
+
+        async def send_with_timing(message: Message) -> None:
+            if message['type'] == 'http.response.start':
+                headers = MutableHeaders(scope=message)
+                headers.append('Server-Timing', context.server_timing_header())
+                headers['X-DB-Roundtrips'] = str(context.db_roundtrips)
+                for warning in context.warnings:
+                    headers.append('Warning', warning)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            end_request_context(token)
@@ -0,0 +1,99 @@
+import asyncio
+import json
+import logging
+import os
+from typing import Iterable, List, Optional, Pattern, Tuple
+
+from starlette.datastructures import Headers
+from starlette.routing import compile_path
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from tech.infra.resilience.request_deadline import REQUEST_DEADLINE_SECONDS, end_deadline, start_deadline
+
+logger = logging.getLogger(__name__)
+
+# Limite para o orçamento pedido pelo cliente no cabeçalho
+REQUEST_DEADLINE_MAX_SECONDS = float(os.getenv('REQUEST_DEADLINE_MAX_SECONDS', '30'))
+REQUEST_TIMEOUT_HEADER = 'x-request-timeout'
+
+
+class RequestDeadlineMiddleware:
+    """ASGI middleware that gives every HTTP request a time budget.
+
+    The budget is `default` seconds, or the one configured for the route in
+    `routes` as (method, path template, seconds); 0 exempts a route, e.g.
+    long-lived streams. Clients may ask for a different budget, in seconds,
+    with the `X-Request-Timeout` header, capped at `maximum`.
+
+    The deadline is bound to the request context, where the MongoDB
+    repository sends what is left of it as `maxTimeMS` and the Cognito
+    gateway uses it as its timeouts, so abandoned work stops on the server
+    side too. When the budget runs out before the response starts, the
+    client gets 504 at once; an endpoint that raises DeadlineExceeded is
+    answered with 504 by the application's exception handler.
+    """
+
+    def __init__(
+            self,
+            app: ASGIApp,
+            default: float = REQUEST_DEADLINE_SECONDS,
+            maximum: float = REQUEST_DEADLINE_MAX_SECONDS,
+            routes: Iterable[Tuple[str, str, float]] = ()
+    ):
+        self.app = app
+        self.default = default
+        self.maximum = maximum
+        self.routes: List[Tuple[str, Pattern, float]] = [
+            (method.upper(), compile_path(path)[0], seconds) for method, path, seconds in routes
+        ]
+
+    def _budget(self, scope: Scope) -> Optional[float]:
+        budget = self.default
+        for method, pattern, seconds in self.routes:
+            if scope['method'] == method and pattern.match(scope['path']):
+                budget = seconds
+                break
+        if not budget:
+            return None
+        requested = Headers(scope=scope).get(REQUEST_TIMEOUT_HEADER)
+        if requested is not None:
+            try:
+                budget = float(requested)
+            except ValueError:
+                pass
+        return max(0.0, min(budget, self.maximum))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        budget = self._budget(scope)
+        if budget is None:
+            await self.app(scope, receive, send)
+            return
+
+        started = False
+
+        async def send_tracking(message: Message) -> None:
+            nonlocal started
+            if message['type'] == 'http.response.start':
+                started = True
+            await send(message)
+
+        token = start_deadline(budget)
+        try:
+            await asyncio.wait_for(self.app(scope, receive, send_tracking), timeout=budget)
+        except asyncio.TimeoutError:
+            logger.info("Request deadline of %.2fs exceeded: %s %s", budget, scope['method'], scope['path'])
+            if not started:
+                await _send_timeout(send)
+        finally:
+            end_deadline(token)
+
+
+async def _send_timeout(send: Send) -> None:
+    body = json.dumps({'detail': 'Request deadline exceeded'}).encode('utf-8')
+    await send({'type': 'http.response.start', 'status': 504, 'headers': [
+        (b'content-type', b'application/json'), (b'content-length', str(len(body)).encode('latin-1')),
+    ]})
+    await send({'type': 'http.response.body', 'body': body})
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from tech.domain.entities.products import Products
+from tech.domain.value_objects import BulkUpsertResult, CategoryStats, PriceAdjustment
 
 class ProductRepository(ABC):
     """Interface for the product repository, defining the operations
@@ -54,6 +55,39 @@ class ProductRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def bulk_upsert(self, products: List[Products]) -> List[BulkUpsertResult]:
+        """Creates or updates several products, matched by name, in one write.
+
+        Args:
+            products (List[Products]): The products to store, with distinct names.
+
+        Returns:
+            List[BulkUpsertResult]: The outcome of each product, in order.
+        """
+        pass
+
+    @abstractmethod
+    def adjust_prices(self, adjustment: PriceAdjustment) -> List[Products]:
+        """Changes the price of every matching product in one write.
+
+        Args:
+            adjustment (PriceAdjustment): The change and the products it applies to.
+
+        Returns:
+            List[Products]: The changed products, with their new prices.
+        """
+        pass
+
+    @abstractmethod
+    def category_stats(self) -> List[CategoryStats]:
+        """Computes the product count and min/avg/max price of each category.
+
+        Returns:
+            List[CategoryStats]: One entry per category that has products.
+        """
+        pass
+
     @abstractmethod
     def update(self, product: Products) -> Products:
         """Updates an existing product's information.
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, ConfigDict
-from typing import Literal
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Literal, Optional
 
 class ProductSchema(BaseModel):
     name: str
@@ -7,6 +7,13 @@ class ProductSchema(BaseModel):
     category: Literal['Lanche', 'Acompanhamento', 'Bebida', 'Sobremesa']
 
 
+class PriceAdjustmentSchema(BaseModel):
+    category: Optional[Literal['Lanche', 'Acompanhamento', 'Bebida', 'Sobremesa']] = None
+    product_ids: Optional[List[int]] = None
+    percent: Optional[float] = Field(None, allow_inf_nan=False)
+    amount: Optional[float] = Field(None, allow_inf_nan=False)
+
+
 class ProductPublic(BaseModel):
     id: int
     name: str
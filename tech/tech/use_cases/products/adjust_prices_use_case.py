@@ -0,0 +1,42 @@
+from typing import List
+
+from tech.domain.entities.products import Products
+from tech.domain.value_objects import PriceAdjustment
+from tech.interfaces.repositories.product_repository import ProductRepository
+from tech.interfaces.schemas.product_schema import PriceAdjustmentSchema
+
+
+class AdjustPricesUseCase(object):
+    """
+    Handles changing the price of a category or a set of products at once.
+    """
+
+    def __init__(self, product_repository: ProductRepository):
+        """
+        Initialize the use case with the product repository.
+
+        Args:
+            product_repository (ProductRepository): Repository to interact with product data.
+        """
+        self.product_repository = product_repository
+
+    def execute(self, data: PriceAdjustmentSchema) -> List[Products]:
+        """
+        Apply a percentage or absolute price change in a single write.
+
+        Args:
+            data (PriceAdjustmentSchema): The change and the products it applies to.
+
+        Returns:
+            List[Products]: The changed products, with prices rounded to cents.
+
+        Raises:
+            ValueError: If the change or its target is not given exactly once.
+        """
+        adjustment = PriceAdjustment(
+            percent=data.percent,
+            amount=data.amount,
+            category=data.category,
+            product_ids=data.product_ids,
+        )
+        return self.product_repository.adjust_prices(adjustment)
@@ -0,0 +1,53 @@
+from typing import List
+
+from tech.domain.entities.products import Products
+from tech.domain.value_objects import BulkUpsertResult
+from tech.interfaces.repositories.product_repository import ProductRepository
+from tech.interfaces.schemas.product_schema import ProductSchema
+
+
+class BulkUpsertProductsUseCase(object):
+    """
+    Handles creating or updating a batch of products in one write.
+
+    Products are matched by name: an existing product with the same name is
+    updated, any other item is created with a newly allocated ID.
+    """
+
+    def __init__(self, product_repository: ProductRepository):
+        """
+        Initialize the use case with the product repository.
+
+        Args:
+            product_repository (ProductRepository): Repository to interact with product data.
+        """
+        self.product_repository = product_repository
+
+    def execute(self, items: List[ProductSchema]) -> List[BulkUpsertResult]:
+        """
+        Upsert every item of a validated batch.
+
+        Args:
+            items (List[ProductSchema]): The batch, in submission order.
+
+        Returns:
+            List[BulkUpsertResult]: One result per item, in submission order.
+                A name repeated in the batch fails on its later occurrences.
+        """
+        results: List[BulkUpsertResult] = []
+        positions: List[int] = []
+        products: List[Products] = []
+        seen = set()
+        for index, item in enumerate(items):
+            if item.name in seen:
+                results.append(BulkUpsertResult(index, 'error', error=f"Duplicate name in batch: {item.name}"))
+                continue
+            seen.add(item.name)
+            positions.append(index)
+            products.append(Products(name=item.name, price=item.price, category=item.category))
+
+        for position, result in zip(positions, self.product_repository.bulk_upsert(products)):
+            result.index = position
+            results.append(result)
+        results.sort(key=lambda result: result.index)
+        return results
@@ -0,0 +1,33 @@
+from typing import AsyncIterator
+
+from tech.infra.catalog.product_export import ProductExporter
+
+
+class ExportProductsUseCase(object):
+    """
+    Handles exporting the whole catalog as a compressed stream.
+    """
+
+    def __init__(self, exporter: ProductExporter):
+        """
+        Initialize the use case with the product exporter.
+
+        Args:
+            exporter (ProductExporter): Scans the catalog in parallel partitions.
+        """
+        self.exporter = exporter
+
+    def execute(self, file_format: str) -> AsyncIterator[bytes]:
+        """
+        Open an export of every product.
+
+        Args:
+            file_format (str): 'ndjson' or 'csv'.
+
+        Returns:
+            AsyncIterator[bytes]: The gzip-compressed export, chunk by chunk.
+
+        Raises:
+            ValueError: If the format is not supported.
+        """
+        return self.exporter.stream(file_format)
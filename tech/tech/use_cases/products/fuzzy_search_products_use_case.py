@@ -0,0 +1,33 @@
+from typing import List, Optional, Tuple
+from tech.domain.entities.products import Products
+from tech.interfaces.repositories.product_repository import ProductRepository
+
+class FuzzySearchProductsUseCase(object):
+    """
+    Handles typo-tolerant product search by name similarity.
+    """
+
+    def __init__(self, product_repository: ProductRepository, fuzzy_index):
+        """
+        Initialize the use case with the product repository and similarity index.
+
+        Args:
+            product_repository (ProductRepository): Repository used when the index has no catalog loaded.
+            fuzzy_index: Index exposing `search(text, limit, fallback, category)`.
+        """
+        self.product_repository = product_repository
+        self.fuzzy_index = fuzzy_index
+
+    def execute(self, text: str, category: Optional[str] = None, limit: int = 10) -> List[Tuple[Products, float]]:
+        """
+        Retrieve the products whose names best match the given text.
+
+        Args:
+            text (str): Free text, possibly misspelled.
+            category (Optional[str]): Restrict results to this category.
+            limit (int): Maximum number of results.
+
+        Returns:
+            List[Tuple[Products, float]]: Products and their similarity, best match first.
+        """
+        return self.fuzzy_index.search(text, limit, self.product_repository.list_all_products, category=category)
@@ -0,0 +1,30 @@
+from typing import List
+
+from tech.domain.value_objects import CategoryStats
+from tech.interfaces.repositories.product_repository import ProductRepository
+
+
+class GetCategoryStatsUseCase(object):
+    """
+    Handles retrieving per-category product statistics from a cached aggregation.
+    """
+
+    def __init__(self, product_repository: ProductRepository, stats_view):
+        """
+        Initialize the use case with the product repository and statistics view.
+
+        Args:
+            product_repository (ProductRepository): Repository that runs the aggregation.
+            stats_view: View exposing `get(load)`.
+        """
+        self.product_repository = product_repository
+        self.stats_view = stats_view
+
+    def execute(self) -> List[CategoryStats]:
+        """
+        Retrieve the statistics of every category that has products.
+
+        Returns:
+            List[CategoryStats]: One entry per category, in API order.
+        """
+        return self.stats_view.get(self.product_repository.category_stats)
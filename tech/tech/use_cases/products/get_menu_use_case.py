@@ -0,0 +1,27 @@
+from tech.interfaces.repositories.product_repository import ProductRepository
+
+class GetMenuUseCase(object):
+    """
+    Handles retrieving the full menu, grouped by category, from a materialized view.
+    """
+
+    def __init__(self, product_repository: ProductRepository, menu_view):
+        """
+        Initialize the use case with the product repository and menu view.
+
+        Args:
+            product_repository (ProductRepository): Repository used when the view has no catalog loaded.
+            menu_view: View exposing `snapshot(fallback)`.
+        """
+        self.product_repository = product_repository
+        self.menu_view = menu_view
+
+    def execute(self):
+        """
+        Retrieve the serialized menu.
+
+        Returns:
+            RenderedMenu: The menu document, already encoded as JSON, with
+                the ETag and Last-Modified of those bytes.
+        """
+        return self.menu_view.snapshot(self.product_repository.list_all_products)
@@ -0,0 +1,37 @@
+from typing import IO
+
+from tech.infra.catalog.product_import import ImportReport, ProductImporter
+
+
+class ImportProductsUseCase(object):
+    """
+    Handles importing products from an NDJSON, CSV or BSON stream.
+
+    Rows are upserted by name in bounded chunks, so the stream is never held
+    in memory as a whole.
+    """
+
+    def __init__(self, importer: ProductImporter):
+        """
+        Initialize the use case with the product importer.
+
+        Args:
+            importer (ProductImporter): Streams rows into the product repository.
+        """
+        self.importer = importer
+
+    def execute(self, stream: IO[bytes], file_format: str) -> ImportReport:
+        """
+        Import every row of the stream.
+
+        Args:
+            stream (IO[bytes]): Binary file-like object, read sequentially.
+            file_format (str): 'ndjson', 'csv' or 'bson'.
+
+        Returns:
+            ImportReport: Counters, a sample of row errors and throughput.
+
+        Raises:
+            ValueError: If the format is not supported.
+        """
+        return self.importer.import_stream(stream, file_format)
@@ -0,0 +1,127 @@
+import base64
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional, Tuple
+
+from tech.interfaces.repositories.product_repository import ProductRepository
+
+_EPOCH = datetime(1970, 1, 1)
+_LAST_ID = 2 ** 63 - 1
+
+
+class InvalidChangesToken(ValueError):
+    """
+    Raised when a sync token cannot be decoded.
+    """
+
+
+class ChangesTokenExpired(ValueError):
+    """
+    Raised when a sync token is older than the tombstone retention, so
+    deletes may have been missed and the client must re-sync from scratch.
+    """
+
+
+def encode_token(cursor: Tuple[datetime, int]) -> str:
+    """
+    Encodes a (timestamp, product_id) cursor as an opaque token.
+    """
+    timestamp, product_id = cursor
+    micros = (timestamp - _EPOCH) // timedelta(microseconds=1)
+    return base64.urlsafe_b64encode(f'v1:{micros}:{product_id}'.encode()).decode().rstrip('=')
+
+
+def decode_token(token: str) -> Tuple[datetime, int]:
+    """
+    Decodes a token produced by `encode_token`.
+
+    Raises:
+        InvalidChangesToken: If the token is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4)).decode()
+        version, micros, product_id = raw.split(':')
+        if version != 'v1':
+            raise ValueError(version)
+        return _EPOCH + timedelta(microseconds=int(micros)), int(product_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise InvalidChangesToken("Invalid sync token") from e
+
+
+class ProductChangesPage(object):
+    """
+    One page of the change feed.
+
+    Attributes:
+        changes (list): Upserts and deletes in (timestamp, product_id) order.
+        next_token (str): Token to pass as `since` on the next call.
+        has_more (bool): True if more changes are available right away.
+    """
+
+    def __init__(self, changes: List, next_token: str, has_more: bool):
+        self.changes = changes
+        self.next_token = next_token
+        self.has_more = has_more
+
+
+class ListProductChangesUseCase(object):
+    """
+    Handles the delta sync feed: products changed or deleted since a token.
+    """
+
+    def __init__(
+            self,
+            product_repository: ProductRepository,
+            settle_window: timedelta = timedelta(seconds=2),
+            retention: Optional[timedelta] = None,
+            clock: Callable[[], datetime] = datetime.utcnow
+    ):
+        """
+        Initialize the use case with the product repository.
+
+        Args:
+            product_repository (ProductRepository): Repository exposing `list_changes_since`.
+            settle_window (timedelta): Changes younger than this are held back,
+                so writes still being committed are not skipped.
+            retention (Optional[timedelta]): How long deletes remain visible;
+                older tokens are rejected.
+            clock: Returns the current UTC time (naive, like the stored timestamps).
+        """
+        self.product_repository = product_repository
+        self.settle_window = settle_window
+        self.retention = retention
+        self.clock = clock
+
+    def execute(self, token: Optional[str], limit: int) -> ProductChangesPage:
+        """
+        Retrieve the changes after the given token.
+
+        Args:
+            token (Optional[str]): Token from the previous page, or None to
+                start from the beginning of the catalog.
+            limit (int): Maximum number of changes in the page.
+
+        Returns:
+            ProductChangesPage: The changes and the token to continue from.
+
+        Raises:
+            InvalidChangesToken: If the token is malformed.
+            ChangesTokenExpired: If the token is older than the tombstone retention.
+        """
+        since = decode_token(token) if token else None
+        now = self.clock()
+        if since is not None and self.retention is not None and since[0] < now - self.retention:
+            raise ChangesTokenExpired("Sync token expired, a full re-sync is required")
+
+        until = now - self.settle_window
+        changes = self.product_repository.list_changes_since(since, until, limit + 1)
+        has_more = len(changes) > limit
+        changes = changes[:limit]
+
+        if has_more:
+            cursor = (changes[-1].changed_at, changes[-1].product_id)
+        else:
+            # Tudo até `until` foi entregue
+            cursor = (until, _LAST_ID)
+            if since is not None and since > cursor:
+                cursor = since
+        return ProductChangesPage(changes, encode_token(cursor), has_more)
@@ -0,0 +1,32 @@
+from typing import List
+from tech.domain.entities.products import Products
+from tech.domain.value_objects import ProductSearchQuery
+from tech.interfaces.repositories.product_repository import ProductRepository
+
+class SearchProductsUseCase(object):
+    """
+    Handles filtering and sorting products through an in-memory search index.
+    """
+
+    def __init__(self, product_repository: ProductRepository, search_index):
+        """
+        Initialize the use case with the product repository and search index.
+
+        Args:
+            product_repository (ProductRepository): Repository used when the index has no catalog loaded.
+            search_index: Index exposing `search(query, fallback)`.
+        """
+        self.product_repository = product_repository
+        self.search_index = search_index
+
+    def execute(self, query: ProductSearchQuery) -> List[Products]:
+        """
+        Retrieve the page of products matching a search query.
+
+        Args:
+            query (ProductSearchQuery): Filters, ordering and page.
+
+        Returns:
+            List[Products]: The matching products, in the requested order.
+        """
+        return self.search_index.search(query, self.product_repository.list_all_products)
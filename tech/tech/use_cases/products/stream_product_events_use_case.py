@@ -0,0 +1,28 @@
+from typing import AsyncIterator, Optional
+
+class StreamProductEventsUseCase(object):
+    """
+    Handles streaming product change notifications to a client.
+    """
+
+    def __init__(self, event_stream):
+        """
+        Initialize the use case with the product event stream.
+
+        Args:
+            event_stream: Stream exposing `sse(last_event_id)`.
+        """
+        self.event_stream = event_stream
+
+    def execute(self, last_event_id: Optional[str] = None) -> AsyncIterator[str]:
+        """
+        Open a stream of product events for one client.
+
+        Args:
+            last_event_id (Optional[str]): Resume token of the last event the
+                client received, to replay what it missed.
+
+        Returns:
+            AsyncIterator[str]: Server-sent event chunks.
+        """
+        return self.event_stream.sse(last_event_id)
@@ -0,0 +1,32 @@
+from typing import List
+from tech.domain.entities.products import Products
+from tech.interfaces.repositories.product_repository import ProductRepository
+
+class SuggestProductsUseCase(object):
+    """
+    Handles name autocomplete through an in-memory prefix index.
+    """
+
+    def __init__(self, product_repository: ProductRepository, suggest_index):
+        """
+        Initialize the use case with the product repository and prefix index.
+
+        Args:
+            product_repository (ProductRepository): Repository used when the index has no catalog loaded.
+            suggest_index: Index exposing `suggest(prefix, limit, fallback)`.
+        """
+        self.product_repository = product_repository
+        self.suggest_index = suggest_index
+
+    def execute(self, prefix: str, limit: int) -> List[Products]:
+        """
+        Retrieve the products whose name starts with the typed prefix.
+
+        Args:
+            prefix (str): Text typed so far; case and accents are ignored.
+            limit (int): Maximum number of suggestions.
+
+        Returns:
+            List[Products]: Up to `limit` matching products.
+        """
+        return self.suggest_index.suggest(prefix, limit, self.product_repository.list_all_products)
@@ -1,5 +1,9 @@
+import logging
+
 from tech.interfaces.gateways.cognito_gateway import CognitoGateway
 
+logger = logging.getLogger(__name__)
+
 
 class VerifyTokenUseCase:
     """
@@ -29,10 +33,9 @@ class VerifyTokenUseCase:
             Exception: If token verification fails or user is not found.
         """
         try:
-            print(f"Attempting to verify token: {token[:10]}...")
             user_data = self.cognito_gateway.verify_token(token)
-            print(f"Token verified successfully, user data: {user_data}")
+            logger.debug("Token verified", extra={"username": user_data.get("username")})
             return user_data
         except Exception as e:
-            print(f"Token verification failed: {str(e)}")
+            logger.info("Token verification failed: %s", e)
             raise
\ No newline at end of file
@@ -1,9 +1,13 @@
 import pytest
 from fastapi.testclient import TestClient
 from http import HTTPStatus
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from tech.api.app import app
+from tech.api.products_router import get_product_controller
+from pymongo.errors import ServerSelectionTimeoutError
+
+from tech.infra.resilience.circuit_breaker import CircuitBreaker, CircuitOpenError
 
 
 class TestApp:
@@ -15,3 +19,91 @@ class TestApp:
         response = client.get("/")
         assert response.status_code == HTTPStatus.OK
         assert response.json() == {"message": "Tech Challenge FIAP - Kauan Silva!      Products Microservice"}
+
+    def test_liveness_does_not_depend_on_mongodb(self, client):
+        with patch("tech.api.app.mongo_health_monitor") as mock_monitor:
+            mock_monitor.healthy = False
+
+            for path in ("/health", "/health/live"):
+                response = client.get(path)
+                assert response.status_code == HTTPStatus.OK
+                assert response.json() == {"status": "healthy"}
+
+    def test_readiness_ready(self, client):
+        with patch("tech.api.app.mongo_health_monitor") as mock_monitor, \
+                patch("tech.api.app.readiness") as mock_readiness, \
+                patch("tech.api.app.catalog_store") as mock_store:
+            mock_monitor.healthy = True
+            mock_monitor.status.return_value = {"healthy": True}
+            mock_readiness.is_ready.return_value = True
+            mock_readiness.snapshot.return_value = {"indexes": {"state": "done", "error": None}}
+            mock_store.loaded = True
+            mock_store.source = "mongodb"
+
+            response = client.get("/health/ready")
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()["status"] == "ready"
+
+    def test_readiness_ready_from_snapshot_while_circuit_open(self, client):
+        breaker = CircuitBreaker("mongodb", minimum_calls=1, open_seconds=30)
+        with pytest.raises(ServerSelectionTimeoutError):
+            breaker.call(Mock(side_effect=ServerSelectionTimeoutError("down")))
+        with patch("tech.api.app.mongo_health_monitor") as mock_monitor, \
+                patch("tech.api.app.readiness") as mock_readiness, \
+                patch("tech.api.app.mongo_circuit_breaker", breaker), \
+                patch("tech.api.app.catalog_store") as mock_store:
+            mock_monitor.healthy = False
+            mock_monitor.status.return_value = {"healthy": False, "error": "timeout"}
+            mock_readiness.is_ready.return_value = True
+            mock_readiness.snapshot.return_value = {}
+            mock_store.loaded = True
+            mock_store.source = "snapshot"
+
+            response = client.get("/health/ready")
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()["status"] == "ready"
+        assert response.json()["mongodb"]["error"] == "timeout"
+        assert response.json()["circuit"]["state"] == "open"
+
+    def test_readiness_not_ready_without_a_catalog(self, client):
+        with patch("tech.api.app.mongo_health_monitor") as mock_monitor, \
+                patch("tech.api.app.readiness") as mock_readiness, \
+                patch("tech.api.app.catalog_available", return_value=False):
+            mock_monitor.healthy = True
+            mock_monitor.status.return_value = {"healthy": True}
+            mock_readiness.is_ready.return_value = True
+            mock_readiness.snapshot.return_value = {}
+
+            response = client.get("/health/ready")
+
+        assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+        assert response.json()["status"] == "not_ready"
+
+    def test_readiness_not_ready_until_warmups_finish(self, client):
+        with patch("tech.api.app.mongo_health_monitor") as mock_monitor, \
+                patch("tech.api.app.readiness") as mock_readiness:
+            mock_monitor.healthy = True
+            mock_monitor.status.return_value = {"healthy": True}
+            mock_readiness.is_ready.return_value = False
+            mock_readiness.snapshot.return_value = {"indexes": {"state": "pending", "error": None}}
+
+            response = client.get("/health/ready")
+
+        assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+        assert response.json()["warmups"]["indexes"]["state"] == "pending"
+
+    def test_open_circuit_is_answered_with_503_and_retry_after(self, client):
+        controller = Mock()
+        controller.list_all_products.side_effect = CircuitOpenError("mongodb", 4.2)
+        app.dependency_overrides[get_product_controller] = lambda: controller
+        try:
+            with patch("tech.api.products_router.catalog_validators") as mock_validators:
+                mock_validators.view_all.return_value = None
+                response = client.get("/products/")
+        finally:
+            app.dependency_overrides.clear()
+
+        assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+        assert response.headers["retry-after"] == "5"
@@ -0,0 +1,52 @@
+from datetime import datetime, timezone
+
+from fastapi import FastAPI, Request, Response
+from fastapi.testclient import TestClient
+
+from tech.api.conditional import conditional_response
+from tech.infra.catalog.catalog_validators import Validators
+
+VALIDATORS = Validators('"abc"', datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc))
+
+app = FastAPI()
+
+
+@app.get('/items')
+def items(request: Request, response: Response):
+    not_modified = conditional_response(request, response, VALIDATORS)
+    if not_modified is not None:
+        return not_modified
+    return [1, 2, 3]
+
+
+client = TestClient(app)
+
+
+class TestConditionalResponse:
+    """Unit tests for conditional GET handling."""
+
+    def test_full_response_carries_validators(self):
+        response = client.get('/items')
+
+        assert response.status_code == 200
+        assert response.headers['etag'] == '"abc"'
+        assert response.headers['last-modified'] == 'Tue, 02 Jan 2024 03:04:05 GMT'
+
+    def test_matching_etag_returns_304_without_body(self):
+        response = client.get('/items', headers={'If-None-Match': 'W/"zzz", "abc"'})
+
+        assert response.status_code == 304
+        assert response.content == b''
+        assert response.headers['etag'] == '"abc"'
+
+    def test_stale_etag_wins_over_if_modified_since(self):
+        response = client.get('/items', headers={
+            'If-None-Match': '"old"', 'If-Modified-Since': 'Wed, 03 Jan 2024 00:00:00 GMT'
+        })
+
+        assert response.status_code == 200
+
+    def test_if_modified_since(self):
+        assert client.get('/items', headers={'If-Modified-Since': 'Tue, 02 Jan 2024 03:04:05 GMT'}).status_code == 304
+        assert client.get('/items', headers={'If-Modified-Since': 'Mon, 01 Jan 2024 00:00:00 GMT'}).status_code == 200
+        assert client.get('/items', headers={'If-Modified-Since': 'yesterday'}).status_code == 200
@@ -1,9 +1,13 @@
 # tests/unit/api/test_products_router.py
+import gzip
 import pytest
+from datetime import datetime, timezone
 from unittest.mock import Mock, patch
 from fastapi import HTTPException
 from fastapi.testclient import TestClient
-from tech.api.products_router import router, get_product_controller
+from tech.api.products_router import router, get_product_controller, admin_required
+from tech.infra.catalog.menu_view import RenderedMenu
+from tech.infra.catalog.product_view_cache import ProductViewCache
 from tech.interfaces.controllers.product_controller import ProductController
 from tech.interfaces.schemas.product_schema import ProductSchema
 
@@ -89,3 +93,309 @@ class TestProductsRouter:
             mock_factory.create.assert_called_once()
 
         self.get_controller_patch.start()
+
+    def test_search_route_is_not_taken_as_category(self):
+        """Test that /search reaches the search endpoint with parsed parameters."""
+        self.mock_product_controller.search_products.return_value = [self.product_response]
+        app.dependency_overrides[get_product_controller] = lambda: self.mock_product_controller
+        try:
+            response = client.get("/search?category=Lanche&category=Bebida&q=x&sort=price&order=desc")
+        finally:
+            app.dependency_overrides.clear()
+
+        assert response.status_code == 200
+        assert response.json() == [self.product_response]
+        self.mock_product_controller.search_products.assert_called_once_with(
+            min_price=None, max_price=None, categories=["Lanche", "Bebida"], name_prefix="x",
+            sort="price", order="desc", limit=50, offset=0
+        )
+        self.mock_product_controller.list_products_by_category.assert_not_called()
+
+    def test_search_route_rejects_unknown_sort(self):
+        """Test that an unsupported sort field is rejected before reaching the controller."""
+        app.dependency_overrides[get_product_controller] = lambda: self.mock_product_controller
+        try:
+            response = client.get("/search?sort=stock")
+        finally:
+            app.dependency_overrides.clear()
+
+        assert response.status_code == 422
+
+    def test_suggest_route_requires_query(self):
+        """Test that /suggest reaches the controller and requires q."""
+        self.mock_product_controller.suggest_products.return_value = [self.product_response]
+        app.dependency_overrides[get_product_controller] = lambda: self.mock_product_controller
+        try:
+            response = client.get("/suggest?q=p%C3%A3o&limit=5")
+            missing = client.get("/suggest")
+        finally:
+            app.dependency_overrides.clear()
+
+        assert response.status_code == 200
+        self.mock_product_controller.suggest_products.assert_called_once_with("pão", 5)
+        assert missing.status_code == 422
+
+    def test_menu_route_serves_pre_serialized_bytes(self):
+        """Test that /menu returns the controller bytes as JSON with their own validators."""
+        validators = Mock(etag='"m1"', last_modified=datetime(2024, 1, 1, tzinfo=timezone.utc))
+        self.mock_product_controller.get_menu.return_value = RenderedMenu(b'{"categories":[]}', validators)
+        app.dependency_overrides[get_product_controller] = lambda: self.mock_product_controller
+        try:
+            response = client.get("/menu")
+            not_modified = client.get("/menu", headers={"If-None-Match": '"m1"'})
+        finally:
+            app.dependency_overrides.clear()
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.headers["etag"] == '"m1"'
+        assert response.json() == {"categories": []}
+        assert not_modified.status_code == 304
+        self.mock_product_controller.list_products_by_category.assert_not_called()
+
+    def test_list_returns_304_before_reaching_controller(self):
+        """Test that a matching If-None-Match is answered without calling the controller."""
+        validators = Mock(etag='"v1"', last_modified=datetime(2024, 1, 1, tzinfo=timezone.utc))
+        app.dependency_overrides[get_product_controller] = lambda: self.mock_product_controller
+        try:
+            with patch("tech.api.products_router.catalog_validators") as mock_validators:
+                mock_validators.view_all.return_value = Mock(validators=validators)
+                response = client.get("/", headers={"If-None-Match": '"v1"'})
+        finally:
+            app.dependency_overrides.clear()
+
+        assert response.status_code == 304
+        self.mock_product_controller.list_all_products.assert_not_called()
+
+    def test_list_routes_render_shared_json_body(self):
+        """Test that the coalesced list routes return the controller content as JSON."""
+        self.mock_product_controller.list_all_products.return_value = [self.product_response]
+        self.mock_product_controller.list_products_by_category.return_value = [self.product_response]
+        app.dependency_overrides[get_product_controller] = lambda: self.mock_product_controller
+        try:
+            with patch("tech.api.products_router.catalog_validators") as mock_validators:
+                mock_validators.view_all.return_value = None
+                mock_validators.view_category.return_value = None
+                everything = client.get("/")
+                lanches = client.get("/Lanche")
+        finally:
+            app.dependency_overrides.clear()
+
+        assert everything.status_code == 200
+        assert everything.json() == [self.product_response]
+        assert lanches.json() == [self.product_response]
+        assert "etag" not in everything.headers
+        self.mock_product_controller.list_products_by_category.assert_called_once_with("Lanche")
+
+    def test_list_body_comes_from_the_validated_catalog_version(self):
+        """Test that the list body is rendered from the products its ETag was computed from."""
+        validators = Mock(etag='"v2"', last_modified=datetime(2024, 1, 1, tzinfo=timezone.utc))
+        product = Mock()
+        product.dict.return_value = self.product_response
+        app.dependency_overrides[get_product_controller] = lambda: self.mock_product_controller
+        try:
+            with patch("tech.api.products_router.catalog_validators") as mock_validators:
+                mock_validators.view_all.return_value = Mock(validators=validators, products=[product],
+                                                             version=("store", 2))
+                mock_validators.view_category.return_value = Mock(validators=validators, products=[product],
+                                                                  version=("store", 2))
+                everything = client.get("/")
+                lanches = client.get("/Lanche")
+        finally:
+            app.dependency_overrides.clear()
+
+        assert everything.status_code == 200
+        assert everything.headers["etag"] == '"v2"'
+        assert everything.json() == [self.product_response]
+        assert lanches.json() == [self.product_response]
+        self.mock_product_controller.list_all_products.assert_not_called()
+        self.mock_product_controller.list_products_by_category.assert_not_called()
+
+    def test_product_route_serves_cached_body_with_validators(self):
+        """Test that the single-product route caches per ID and honours HEAD and If-None-Match."""
+        product = {"id": 7, "name": "X-Burger", "price": 20.0, "category": "Lanche",
+                   "created_at": None, "updated_at": "2024-01-01T12:00:00"}
+        self.mock_product_controller.get_product.return_value = product
+        app.dependency_overrides[get_product_controller] = lambda: self.mock_product_controller
+        try:
+            with patch("tech.api.products_router.product_view_cache", ProductViewCache()):
+                first = client.get("/id/7")
+                head = client.head("/id/7")
+                not_modified = client.get("/id/7", headers={"If-None-Match": first.headers["etag"]})
+        finally:
+            app.dependency_overrides.clear()
+
+        assert first.status_code == 200
+        assert first.json() == product
+        assert first.headers["last-modified"] == "Mon, 01 Jan 2024 12:00:00 GMT"
+        assert head.status_code == 200
+        assert head.content == b""
+        assert head.headers["content-length"] == str(len(first.content))
+        assert not_modified.status_code == 304
+        self.mock_product_controller.get_product.assert_called_once_with(7)
+
+    def test_product_route_propagates_not_found(self):
+        """Test that a missing product is a 404 and a non-numeric ID is rejected."""
+        self.mock_product_controller.get_product.side_effect = HTTPException(status_code=404,
+                                                                             detail="Product not found")
+        app.dependency_overrides[get_product_controller] = lambda: self.mock_product_controller
+        try:
+            with patch("tech.api.products_router.product_view_cache", ProductViewCache()):
+                missing = client.get("/id/99")
+                invalid = client.get("/id/abc")
+        finally:
+            app.dependency_overrides.clear()
+
+        assert missing.status_code == 404
+        assert invalid.status_code == 422
+
+    def test_list_route_propagates_controller_404(self):
+        """Test that an HTTPException raised inside the shared read reaches the client."""
+        self.mock_product_controller.list_products_by_category.side_effect = HTTPException(
+            status_code=404, detail="No products found in category: Nada"
+        )
+        app.dependency_overrides[get_product_controller] = lambda: self.mock_product_controller
+        try:
+            with patch("tech.api.products_router.catalog_validators") as mock_validators:
+                mock_validators.view_category.return_value = None
+                response = client.get("/Nada")
+        finally:
+            app.dependency_overrides.clear()
+
+        assert response.status_code == 404
+
+    def test_bulk_route_validates_the_whole_batch_first(self):
+        """Test that an invalid item rejects the batch before anything is written."""
+        app.dependency_overrides[get_product_controller] = lambda: self.mock_product_controller
+        app.dependency_overrides[admin_required] = lambda: True
+        try:
+            response = client.post("/bulk", json=[
+                {"name": "X-Burger", "price": 20.0, "category": "Lanche"},
+                {"name": "Pizza", "price": 30.0, "category": "Pizza"},
+            ])
+        finally:
+            app.dependency_overrides.clear()
+
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"][0] == 1
+        self.mock_product_controller.bulk_upsert_products.assert_not_called()
+
+    def test_bulk_route_returns_per_item_results(self):
+        """Test that a valid batch is handed to the controller as schemas."""
+        self.mock_product_controller.bulk_upsert_products.return_value = {
+            "results": [{"index": 0, "status": "created", "product": self.product_response}],
+            "created": 1, "updated": 0, "failed": 0,
+        }
+        app.dependency_overrides[get_product_controller] = lambda: self.mock_product_controller
+        app.dependency_overrides[admin_required] = lambda: True
+        try:
+            response = client.post("/bulk", json=[self.product_data | {"category": "Lanche"}])
+        finally:
+            app.dependency_overrides.clear()
+
+        assert response.status_code == 200
+        assert response.json()["created"] == 1
+        items = self.mock_product_controller.bulk_upsert_products.call_args.args[0]
+        assert items == [ProductSchema(name="Test Product", price=10.99, category="Lanche")]
+
+    def test_adjust_prices_route_passes_the_adjustment_to_the_controller(self):
+        """Test that /prices/adjust is handed to the controller as a schema."""
+        self.mock_product_controller.adjust_prices.return_value = {"updated": 1, "products": [self.product_response]}
+        app.dependency_overrides[get_product_controller] = lambda: self.mock_product_controller
+        app.dependency_overrides[admin_required] = lambda: True
+        try:
+            response = client.post("/prices/adjust", json={"category": "Bebida", "percent": 5})
+        finally:
+            app.dependency_overrides.clear()
+
+        assert response.status_code == 200
+        assert response.json()["updated"] == 1
+        adjustment = self.mock_product_controller.adjust_prices.call_args.args[0]
+        assert (adjustment.category, adjustment.percent) == ("Bebida", 5)
+
+    def test_stats_and_categories_routes_are_not_taken_as_categories(self):
+        """Test that /stats and /categories reach their own handlers."""
+        self.mock_product_controller.get_category_stats.return_value = {"categories": [], "total": 0}
+        self.mock_product_controller.list_categories.return_value = [{"category": "Lanche", "count": 3}]
+        app.dependency_overrides[get_product_controller] = lambda: self.mock_product_controller
+        try:
+            stats = client.get("/stats")
+            categories = client.get("/categories")
+        finally:
+            app.dependency_overrides.clear()
+
+        assert stats.json() == {"categories": [], "total": 0}
+        assert categories.json() == [{"category": "Lanche", "count": 3}]
+        self.mock_product_controller.list_products_by_category.assert_not_called()
+
+    def test_import_route_streams_the_body_to_the_controller(self):
+        """Test that the uploaded body reaches the controller as a readable stream."""
+        received = {}
+
+        def import_products(stream, file_format):
+            received["body"] = stream.read()
+            received["format"] = file_format
+            return {"rows_read": 2, "created": 2}
+
+        self.mock_product_controller.import_products.side_effect = import_products
+        body = b'{"name": "A", "price": 1, "category": "Lanche"}\n{"name": "B", "price": 2, "category": "Lanche"}\n'
+        app.dependency_overrides[get_product_controller] = lambda: self.mock_product_controller
+        app.dependency_overrides[admin_required] = lambda: True
+        try:
+            response = client.post("/import", content=body, headers={"Content-Type": "application/x-ndjson"})
+        finally:
+            app.dependency_overrides.clear()
+
+        assert response.status_code == 200
+        assert response.json()["created"] == 2
+        assert received == {"body": body, "format": "ndjson"}
+
+    def test_import_route_rejects_an_unknown_format(self):
+        """Test that an upload without a recognizable format gets 415."""
+        app.dependency_overrides[get_product_controller] = lambda: self.mock_product_controller
+        app.dependency_overrides[admin_required] = lambda: True
+        try:
+            response = client.post("/import", content=b"x", headers={"Content-Type": "application/octet-stream"})
+        finally:
+            app.dependency_overrides.clear()
+
+        assert response.status_code == 415
+        self.mock_product_controller.import_products.assert_not_called()
+
+    def test_export_route_streams_a_gzip_attachment(self):
+        """Test that /export streams the controller output as a gzip download."""
+        async def chunks():
+            yield gzip.compress(b'{"id": 1}\n')
+            yield gzip.compress(b'{"id": 2}\n')
+
+        self.mock_product_controller.export_products.return_value = chunks()
+        app.dependency_overrides[get_product_controller] = lambda: self.mock_product_controller
+        app.dependency_overrides[admin_required] = lambda: True
+        try:
+            response = client.get("/export?format=ndjson")
+        finally:
+            app.dependency_overrides.clear()
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/gzip"
+        assert 'products.ndjson.gz' in response.headers["content-disposition"]
+        assert gzip.decompress(response.content) == b'{"id": 1}\n{"id": 2}\n'
+        self.mock_product_controller.export_products.assert_called_once_with("ndjson")
+
+    def test_events_route_streams_sse_and_resumes_from_header(self):
+        """Test that /events streams the controller chunks and forwards Last-Event-ID."""
+        async def chunks():
+            yield "retry: 3000\n\n"
+            yield "id: L1-2\nevent: delete\ndata: {}\n\n"
+
+        self.mock_product_controller.stream_product_events.return_value = chunks()
+        app.dependency_overrides[get_product_controller] = lambda: self.mock_product_controller
+        try:
+            response = client.get("/events", headers={"Last-Event-ID": "L1-1"})
+        finally:
+            app.dependency_overrides.clear()
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert "event: delete" in response.text
+        self.mock_product_controller.stream_product_events.assert_called_once_with("L1-1")
@@ -0,0 +1,44 @@
+import asyncio
+
+import pytest
+
+from tech.api.streaming_upload import consume_upload
+
+
+async def chunks(*parts, error=None):
+    for part in parts:
+        await asyncio.sleep(0)
+        yield part
+    if error is not None:
+        raise error
+
+
+class TestConsumeUpload:
+    """Unit tests for streaming a request body into a blocking consumer."""
+
+    def test_consumer_reads_the_whole_body(self):
+        # Act
+        result = asyncio.run(consume_upload(chunks(b'ab', b'', b'cd'), lambda reader: reader.read()))
+
+        # Assert
+        assert result == b'abcd'
+
+    def test_body_that_fails_halfway_stops_the_consumer(self):
+        # Arrange
+        seen = []
+
+        def consumer(reader):
+            try:
+                return reader.read()
+            except ConnectionAbortedError as e:
+                seen.append(e)
+                raise
+
+        async def scenario():
+            body = chunks(b'ab', error=ConnectionResetError('client went away'))
+            return await asyncio.wait_for(consume_upload(body, consumer), timeout=5)
+
+        # Act / Assert
+        with pytest.raises(ConnectionResetError):
+            asyncio.run(scenario())
+        assert len(seen) == 1
@@ -0,0 +1,52 @@
+from tech.infra.cache.bloom_filter import BloomFilter
+
+
+class TestBloomFilter:
+    """Unit tests for the integer Bloom filter."""
+
+    def test_added_keys_are_always_found(self):
+        # Arrange
+        bloom = BloomFilter(capacity=1000)
+
+        # Act
+        bloom.update(range(1, 501))
+        for key in range(501, 1001):
+            bloom.add(key)
+
+        # Assert
+        assert all(key in bloom for key in range(1, 1001))
+        assert bloom.count == 1000
+        assert not bloom.saturated
+
+    def test_bulk_and_single_adds_set_the_same_bits(self):
+        # Arrange
+        bulk, single = BloomFilter(capacity=100), BloomFilter(capacity=100)
+
+        # Act
+        bulk.update([3, 10, 2 ** 40])
+        for key in (3, 10, 2 ** 40):
+            single.add(key)
+
+        # Assert
+        assert bytes(bulk._bits) == bytes(single._bits)
+
+    def test_false_positive_rate_stays_near_the_target(self):
+        # Arrange
+        bloom = BloomFilter(capacity=10000, error_rate=0.01)
+        bloom.update(range(10000))
+
+        # Act
+        false_positives = sum(1 for key in range(10000, 30000) if key in bloom)
+
+        # Assert
+        assert false_positives / 20000 < 0.02
+
+    def test_reports_saturation_past_capacity(self):
+        # Arrange
+        bloom = BloomFilter(capacity=10)
+
+        # Act
+        bloom.update(range(11))
+
+        # Assert
+        assert bloom.saturated
@@ -0,0 +1,217 @@
+from unittest.mock import MagicMock
+
+import pytest
+from pymongo.errors import ServerSelectionTimeoutError
+
+from tech.infra.cache.stale_while_revalidate import REVALIDATION_FAILED_WARNING, StaleWhileRevalidateCache
+from tech.infra.observability.request_context import end_request_context, start_request_context
+
+
+class ImmediateExecutor:
+    """Runs background refreshes inline so tests stay deterministic."""
+
+    def __init__(self):
+        self.submitted = 0
+
+    def submit(self, fn):
+        self.submitted += 1
+        fn()
+
+
+class TestStaleWhileRevalidateCache:
+    """Unit tests for the stale-while-revalidate read cache."""
+
+    def setup_method(self):
+        self.now = 100.0
+        self.executor = ImmediateExecutor()
+        self.cache = StaleWhileRevalidateCache(
+            ttl=10, max_stale=60, clock=lambda: self.now,
+            random_source=lambda: 0.0, executor=self.executor
+        )
+        self.loader = MagicMock(return_value=['v1'])
+
+    def test_fresh_entry_is_served_without_loading(self):
+        # Act
+        first = self.cache.get('all', self.loader)
+        self.now += 5
+        second = self.cache.get('all', self.loader)
+
+        # Assert
+        assert first == second == ['v1']
+        self.loader.assert_called_once()
+        assert self.executor.submitted == 0
+
+    def test_early_refresh_probability_grows_near_expiry(self):
+        # Arrange
+        self.cache.get('all', self.loader)
+        self.cache.random_source = lambda: 1 - 1e-9  # log(1 - r) ≈ -20.7
+        self.cache._entries['all'].delta = 0.1
+
+        # Act
+        self.now += 1
+        self.cache.get('all', self.loader)
+        self.now += 8
+        self.cache.get('all', self.loader)
+
+        # Assert
+        assert self.executor.submitted == 1
+        assert self.loader.call_count == 2
+
+    def test_stale_entry_is_served_while_revalidating(self):
+        # Arrange
+        self.cache.get('all', self.loader)
+        self.loader.return_value = ['v2']
+
+        # Act
+        self.now += 30
+        stale = self.cache.get('all', self.loader)
+        fresh = self.cache.get('all', self.loader)
+
+        # Assert
+        assert stale == ['v1']
+        assert fresh == ['v2']
+        assert self.executor.submitted == 1
+
+    def test_too_old_entry_is_loaded_synchronously(self):
+        # Arrange
+        self.cache.get('all', self.loader)
+        self.loader.return_value = ['v2']
+
+        # Act
+        self.now += 100
+        result = self.cache.get('all', self.loader)
+
+        # Assert
+        assert result == ['v2']
+        assert self.executor.submitted == 0
+
+    def test_failed_load_serves_last_good_value_with_warning(self):
+        # Arrange
+        self.cache.get('all', self.loader)
+        self.loader.side_effect = ServerSelectionTimeoutError('down')
+        self.now += 100
+
+        # Act
+        context, token = start_request_context()
+        try:
+            result = self.cache.get('all', self.loader)
+        finally:
+            end_request_context(token)
+
+        # Assert
+        assert result == ['v1']
+        assert context.warnings == [REVALIDATION_FAILED_WARNING]
+
+    def test_failed_background_refresh_marks_stale_responses(self):
+        # Arrange
+        self.cache.get('all', self.loader)
+        self.loader.side_effect = ServerSelectionTimeoutError('down')
+        self.now += 30
+        self.cache.get('all', self.loader)
+
+        # Act
+        context, token = start_request_context()
+        try:
+            result = self.cache.get('all', self.loader)
+        finally:
+            end_request_context(token)
+
+        # Assert
+        assert result == ['v1']
+        assert context.warnings == [REVALIDATION_FAILED_WARNING]
+
+    def test_failure_without_previous_value_is_raised(self):
+        # Arrange
+        self.loader.side_effect = ServerSelectionTimeoutError('down')
+
+        # Act / Assert
+        with pytest.raises(ServerSelectionTimeoutError):
+            self.cache.get('all', self.loader)
+
+    def test_invalidated_entry_is_reloaded(self):
+        # Arrange
+        self.cache.get('all', self.loader)
+        self.loader.return_value = ['v2']
+
+        # Act
+        self.cache.invalidate(lambda key: key == 'all')
+        result = self.cache.get('all', self.loader)
+
+        # Assert
+        assert result == ['v2']
+
+    def test_load_overlapping_an_invalidation_is_not_stored(self):
+        # Arrange
+        def load():
+            self.cache.invalidate(lambda key: True)
+            return ['before write']
+
+        # Act
+        first = self.cache.get('all', load)
+        second = self.cache.get('all', self.loader)
+
+        # Assert
+        assert first == ['before write']
+        assert second == ['v1']
+
+    def test_none_is_not_cached(self):
+        # Arrange
+        self.loader.return_value = None
+
+        # Act
+        self.cache.get(('product', 1), self.loader)
+        self.cache.get(('product', 1), self.loader)
+
+        # Assert
+        assert self.loader.call_count == 2
+
+    def test_disabled_cache_always_loads(self):
+        # Arrange
+        cache = StaleWhileRevalidateCache(ttl=0, max_stale=0)
+
+        # Act
+        cache.get('all', self.loader)
+        cache.get('all', self.loader)
+
+        # Assert
+        assert self.loader.call_count == 2
+
+    def test_entries_are_bounded_least_recently_used_first(self):
+        # Arrange
+        cache = StaleWhileRevalidateCache(ttl=10, max_stale=60, max_entries=2, clock=lambda: self.now,
+                                          random_source=lambda: 0.0, executor=self.executor)
+        cache.get(('product', 1), self.loader)
+        cache.get(('product', 2), self.loader)
+
+        # Act
+        cache.get(('product', 1), self.loader)
+        cache.get(('product', 3), self.loader)
+
+        # Assert
+        assert list(cache._entries) == [('product', 1), ('product', 3)]
+
+    def test_misses_and_failures_leave_nothing_behind(self):
+        # Arrange
+        self.loader.return_value = None
+
+        # Act
+        for product_id in range(100):
+            self.cache.get(('product', product_id), self.loader)
+        self.loader.side_effect = ServerSelectionTimeoutError('down')
+        with pytest.raises(ServerSelectionTimeoutError):
+            self.cache.get(('category', 'junk'), self.loader)
+
+        # Assert
+        assert len(self.cache._entries) == 0
+        assert self.cache._generations == {}
+
+    def test_entries_past_max_stale_are_dropped(self):
+        # Arrange
+        self.cache.get(('category', 'Lanche'), self.loader)
+        self.now += 100
+
+        # Act
+        self.cache.get(('category', 'Bebida'), self.loader)
+
+        # Assert
+        assert list(self.cache._entries) == [('category', 'Bebida')]
@@ -0,0 +1,100 @@
+from datetime import datetime
+
+from tech.domain.entities.products import Products
+from tech.infra.catalog.catalog_events import CatalogEventBus, ProductChange
+from tech.infra.catalog.catalog_store import CatalogStore
+
+
+def make_product(product_id, name="Product", price=10.0, category="Lanche"):
+    return Products(id=product_id, name=f"{name} {product_id}", price=price, category=category,
+                    created_at=datetime(2024, 1, 1), updated_at=datetime(2024, 1, product_id))
+
+
+class TestCatalogStore:
+    """Unit tests for the in-memory catalog."""
+
+    def setup_method(self):
+        self.store = CatalogStore()
+
+    def test_ignores_changes_before_first_load(self):
+        self.store.apply([ProductChange.upsert(make_product(1))])
+
+        assert self.store.loaded is False
+        assert len(self.store) == 0
+
+    def test_replace_all_and_reads(self):
+        changed = self.store.replace_all(
+            [make_product(2, category="Bebida"), make_product(1)], source="mongodb"
+        )
+
+        assert changed is True
+        assert self.store.loaded is True
+        assert self.store.source == "mongodb"
+        assert [p.id for p in self.store.list_all()] == [1, 2]
+        assert [p.id for p in self.store.list_by_category("Bebida")] == [2]
+        assert self.store.get(1).name == "Product 1"
+        assert self.store.get("2").id == 2
+        assert self.store.max_updated_at() == datetime(2024, 1, 2)
+
+    def test_reload_with_same_content_keeps_version(self):
+        self.store.replace_all([make_product(1)], source="snapshot")
+        version = self.store.version
+
+        changed = self.store.replace_all([make_product(1)], source="mongodb")
+
+        assert changed is False
+        assert self.store.version == version
+        assert self.store.source == "mongodb"
+
+    def test_apply_bumps_version_once_per_batch(self):
+        self.store.replace_all([make_product(1), make_product(2)], source="mongodb")
+        version = self.store.version
+
+        self.store.apply([ProductChange.delete(1), ProductChange.upsert(make_product(3))])
+
+        assert self.store.version == version + 1
+        assert [p.id for p in self.store.list_all()] == [2, 3]
+
+    def test_writes_during_load_are_not_rolled_back(self):
+        self.store.replace_all([make_product(1)], source="snapshot")
+
+        self.store.begin_load()
+        self.store.apply([ProductChange.upsert(make_product(2))])
+        self.store.replace_all([make_product(1)], source="mongodb")  # leitura anterior à escrita
+
+        assert [p.id for p in self.store.list_all()] == [1, 2]
+
+    def test_writes_during_first_load_are_kept(self):
+        self.store.begin_load()
+        self.store.apply([ProductChange.delete(1)])
+        self.store.replace_all([make_product(1), make_product(2)], source="mongodb")
+
+        assert [p.id for p in self.store.list_all()] == [2]
+
+
+class TestCatalogEventBus:
+    """Unit tests for the catalog publish/subscribe bus."""
+
+    def test_failing_subscriber_does_not_block_others(self):
+        bus = CatalogEventBus()
+        received = []
+
+        def failing(_):
+            raise RuntimeError("boom")
+
+        bus.subscribe(failing)
+        bus.subscribe(received.append)
+
+        bus.publish([ProductChange.delete(1)])
+
+        assert len(received) == 1
+        assert received[0][0].kind == ProductChange.DELETE
+
+    def test_empty_batches_are_not_delivered(self):
+        bus = CatalogEventBus()
+        received = []
+        bus.subscribe(received.append)
+
+        bus.publish([])
+
+        assert received == []
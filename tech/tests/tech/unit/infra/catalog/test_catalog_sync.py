@@ -0,0 +1,73 @@
+import asyncio
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from tech.domain.entities.products import Products
+from tech.infra.catalog.catalog_store import CatalogStore
+from tech.infra.catalog.catalog_sync import CatalogSynchronizer
+from tech.infra.catalog.snapshot_file import read_snapshot, write_snapshot
+
+
+def make_product(product_id):
+    return Products(id=product_id, name=f"Product {product_id}", price=10.0, category="Lanche",
+                    created_at=datetime(2024, 1, 1), updated_at=datetime(2024, 1, 1))
+
+
+class TestCatalogSynchronizer:
+    """Unit tests for the catalog warm-up and reconcile loop."""
+
+    def setup_method(self):
+        self.store = CatalogStore()
+        self.repository = Mock()
+        self.repository.list_all_products.return_value = [make_product(1), make_product(2)]
+
+    def make_synchronizer(self, tmp_path, **kwargs):
+        return CatalogSynchronizer(
+            store=self.store,
+            repository_factory=lambda: self.repository,
+            snapshot_path=str(tmp_path / "catalog.json.gz"),
+            warmup_timeout=0.2,
+            refresh_interval=60,
+            **kwargs
+        )
+
+    def test_warm_up_from_mongodb_writes_snapshot(self, tmp_path):
+        synchronizer = self.make_synchronizer(tmp_path)
+
+        async def scenario():
+            await synchronizer.warm_up()
+            await synchronizer.stop()
+
+        asyncio.run(scenario())
+
+        assert self.store.source == "mongodb"
+        assert len(self.store) == 2
+        assert [p.id for p in read_snapshot(synchronizer.snapshot_path)] == [1, 2]
+
+    def test_warm_up_falls_back_to_snapshot_and_reconciles(self, tmp_path):
+        synchronizer = self.make_synchronizer(tmp_path)
+        write_snapshot([make_product(1)], synchronizer.snapshot_path)
+        self.repository.list_all_products.side_effect = [ConnectionError("down"), [make_product(1), make_product(3)]]
+
+        async def scenario():
+            await synchronizer.warm_up()
+            assert self.store.source == "snapshot"
+            assert [p.id for p in self.store.list_all()] == [1]
+            await asyncio.sleep(0.05)
+            await synchronizer.stop()
+
+        asyncio.run(scenario())
+
+        assert self.store.source == "mongodb"
+        assert [p.id for p in self.store.list_all()] == [1, 3]
+
+    def test_warm_up_fails_without_mongodb_and_snapshot(self, tmp_path):
+        synchronizer = self.make_synchronizer(tmp_path)
+        self.repository.list_all_products.side_effect = ConnectionError("down")
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(synchronizer.warm_up())
+
+        assert self.store.loaded is False
@@ -0,0 +1,76 @@
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+from tech.domain.entities.products import Products
+from tech.infra.catalog.catalog_events import ProductChange
+from tech.infra.catalog.catalog_store import CatalogStore
+from tech.infra.catalog.catalog_validators import CatalogValidators
+
+
+def make_product(product_id, category="Lanche", day=1, price=10.0):
+    return Products(id=product_id, name=f"Produto {product_id}", price=price, category=category,
+                    created_at=datetime(2024, 1, 1), updated_at=datetime(2024, 1, day))
+
+
+class TestCatalogValidators:
+    """Unit tests for catalog ETag and Last-Modified."""
+
+    def setup_method(self):
+        self.store = CatalogStore()
+        self.shared = MagicMock()
+        self.shared.enabled = False
+        self.validators = CatalogValidators(store=self.store, shared=self.shared)
+
+    def test_none_without_in_memory_catalog(self):
+        assert self.validators.for_all() is None
+
+    def test_etag_is_content_based_and_per_view(self):
+        self.store.replace_all([make_product(1), make_product(2, "Bebida", day=3)], source="mongodb")
+        other = CatalogStore()
+        other.replace_all([make_product(2, "Bebida", day=3), make_product(1)], source="snapshot")
+        other_validators = CatalogValidators(store=other, shared=self.shared)
+
+        listing = self.validators.for_all()
+
+        assert listing.etag == other_validators.for_all().etag
+        assert listing.etag != self.validators.for_all("menu").etag
+        assert listing.etag.startswith('"') and listing.etag.endswith('"')
+        assert listing.last_modified == datetime(2024, 1, 3, tzinfo=timezone.utc)
+
+    def test_category_validators_change_only_with_the_category(self):
+        self.store.replace_all([make_product(1), make_product(2, "Bebida")], source="mongodb")
+        lanche = self.validators.for_category("Lanche").etag
+        bebida = self.validators.for_category("Bebida").etag
+
+        self.store.apply([ProductChange.upsert(make_product(2, "Bebida", day=5, price=12.0))])
+
+        assert self.validators.for_category("Lanche").etag == lanche
+        assert self.validators.for_category("Bebida").etag != bebida
+        assert self.validators.for_category("Sobremesa") is None
+
+    def test_delete_moves_last_modified(self):
+        self.store.replace_all([make_product(1, day=2), make_product(2, day=1)], source="mongodb")
+        before = self.validators.for_all()
+
+        self.store.apply([ProductChange.delete(2)])
+        after = self.validators.for_all()
+
+        assert after.etag != before.etag
+        assert after.last_modified > before.last_modified
+
+    def test_view_pairs_products_with_their_validators(self):
+        self.store.replace_all([make_product(2), make_product(1, "Bebida")], source="mongodb")
+        before = self.validators.view_all()
+
+        self.store.apply([ProductChange.upsert(make_product(3, day=4))])
+        after = self.validators.view_all()
+        lanche = self.validators.view_category("Lanche")
+
+        assert [p.id for p in before.products] == [1, 2]
+        assert before.validators.etag == CatalogValidators(store=self.store, shared=self.shared)._compute(
+            "list", before.products).etag
+        assert [p.id for p in after.products] == [1, 2, 3]
+        assert after.version != before.version
+        assert after.validators.etag != before.validators.etag
+        assert [p.id for p in lanche.products] == [2, 3]
+        assert self.validators.view_category("Sobremesa") is None
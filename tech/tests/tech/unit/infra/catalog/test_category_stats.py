@@ -0,0 +1,78 @@
+from unittest.mock import Mock
+
+from tech.domain.entities.products import Products
+from tech.domain.value_objects import CategoryStats
+from tech.infra.catalog.category_stats import CategoryStatsView, summarize_categories
+from tech.infra.concurrency.single_flight import SingleFlight
+
+
+def stats(*categories):
+    return [CategoryStats(category, 1, 1.0, 1.0, 1.0) for category in categories]
+
+
+class TestCategoryStatsView:
+    """Unit tests for the cached category statistics."""
+
+    def setup_method(self):
+        self.now = 0.0
+        self.view = CategoryStatsView(ttl=60, flight=SingleFlight(), clock=lambda: self.now)
+        self.load = Mock(return_value=stats("Bebida", "Lanche"))
+
+    def test_aggregates_once_until_a_write(self):
+        # Act
+        first = self.view.get(self.load)
+        second = self.view.get(self.load)
+
+        # Assert
+        assert first is second
+        assert self.load.call_count == 1
+
+    def test_orders_categories_like_the_api(self):
+        self.load.return_value = stats("Sobremesa", "Combo", "Bebida", "Lanche")
+
+        assert [entry.category for entry in self.view.get(self.load)] == ["Lanche", "Bebida", "Sobremesa", "Combo"]
+
+    def test_write_invalidates_the_result(self):
+        # Arrange
+        self.view.get(self.load)
+
+        # Act
+        self.view.invalidate([])
+        self.view.get(self.load)
+
+        # Assert
+        assert self.load.call_count == 2
+
+    def test_result_expires_after_ttl(self):
+        self.view.get(self.load)
+        self.now = 61
+
+        self.view.get(self.load)
+
+        assert self.load.call_count == 2
+
+    def test_load_overlapping_a_write_is_not_kept(self):
+        # Arrange
+        def load():
+            self.view.invalidate([])
+            return stats("Lanche")
+
+        # Act
+        self.view.get(load)
+        self.view.get(self.load)
+
+        # Assert
+        self.load.assert_called_once()
+
+
+def test_summarize_categories_matches_the_pipeline():
+    products = [
+        Products(id=1, name="A", price=10.0, category="Lanche"),
+        Products(id=2, name="B", price=15.5, category="Lanche"),
+        Products(id=3, name="C", price=6.0, category="Bebida"),
+    ]
+
+    summary = {entry.category: entry.dict() for entry in summarize_categories(products)}
+
+    assert summary["Lanche"] == {"category": "Lanche", "count": 2, "min_price": 10.0, "avg_price": 12.75, "max_price": 15.5}
+    assert summary["Bebida"]["count"] == 1
@@ -0,0 +1,84 @@
+from unittest.mock import MagicMock
+
+from tech.domain.entities.products import Products
+from tech.domain.value_objects import ProductSearchQuery
+from tech.infra.catalog.catalog_store import CatalogStore
+from tech.infra.catalog.columnar_catalog import ColumnarCatalog, ColumnarCatalogIndex
+
+
+def make_products():
+    return [
+        Products(id=1, name="X-Burger", price=20.0, category="Lanche"),
+        Products(id=2, name="Coca-Cola", price=6.5, category="Bebida"),
+        Products(id=3, name="x-salada", price=22.9, category="Lanche"),
+        Products(id=4, name="Batata Frita", price=12.0, category="Acompanhamento"),
+        Products(id=5, name="Sorvete", price=9.99, category="Sobremesa"),
+    ]
+
+
+class TestColumnarCatalog:
+    """Unit tests for the columnar search engine."""
+
+    def setup_method(self):
+        self.catalog = ColumnarCatalog(make_products())
+
+    def ids(self, **kwargs):
+        return [product.id for product in self.catalog.search(ProductSearchQuery(**kwargs))]
+
+    def test_without_filters_returns_everything_by_id(self):
+        assert self.ids() == [1, 2, 3, 4, 5]
+
+    def test_price_range_is_inclusive_in_cents(self):
+        assert self.ids(min_price=9.99, max_price=20) == [1, 4, 5]
+
+    def test_filters_by_several_categories(self):
+        assert self.ids(categories=["Bebida", "Sobremesa", "Desconhecida"]) == [2, 5]
+
+    def test_name_prefix_is_case_insensitive(self):
+        assert self.ids(name_prefix="X-") == [1, 3]
+        assert self.ids(name_prefix="pizza") == []
+
+    def test_sorts_by_price_and_name(self):
+        assert self.ids(sort="price") == [2, 5, 4, 1, 3]
+        assert self.ids(sort="price", descending=True) == [3, 1, 4, 5, 2]
+        assert self.ids(sort="name") == [4, 2, 5, 1, 3]
+
+    def test_combines_filters_and_pages(self):
+        assert self.ids(categories=["Lanche"], sort="price", descending=True, limit=1) == [3]
+        assert self.ids(sort="name", offset=3, limit=5) == [1, 3]
+
+    def test_unknown_categories_get_their_own_code(self):
+        catalog = ColumnarCatalog([Products(id=9, name="Combo", price=30.0, category="Combo")])
+
+        result = catalog.search(ProductSearchQuery(categories=["Combo"]))
+
+        assert [product.id for product in result] == [9]
+
+
+class TestColumnarCatalogIndex:
+    """Unit tests for rebuilding the columns when the catalog changes."""
+
+    def setup_method(self):
+        self.store = CatalogStore()
+        self.shared = MagicMock()
+        self.shared.enabled = False
+        self.index = ColumnarCatalogIndex(store=self.store, shared=self.shared)
+
+    def test_uses_fallback_while_store_is_not_loaded(self):
+        fallback = MagicMock(return_value=make_products())
+
+        result = self.index.search(ProductSearchQuery(categories=["Bebida"]), fallback)
+
+        assert [product.id for product in result] == [2]
+        fallback.assert_called_once()
+
+    def test_rebuilds_only_when_store_version_changes(self):
+        self.store.replace_all(make_products(), source="mongodb")
+
+        first = self.index.current()
+        assert self.index.current() is first
+
+        self.store.replace_all(make_products()[:2], source="mongodb")
+
+        assert self.index.current() is not first
+        assert len(self.index.current()) == 2
@@ -0,0 +1,25 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from tech.infra.catalog.catalog_store import CatalogStore
+from tech.infra.catalog.incremental_index import IncrementalCatalogIndex
+
+
+class TestIncrementalCatalogIndex:
+    """Unit tests for the incremental index base class."""
+
+    def setup_method(self):
+        self.store = CatalogStore()
+        self.shared = MagicMock()
+        self.shared.enabled = False
+
+    def test_incomplete_subclass_cannot_be_instantiated(self):
+        # Arrange
+        class LoadOnly(IncrementalCatalogIndex):
+            def _load(self, products):
+                pass
+
+        # Act / Assert
+        with pytest.raises(TypeError, match="_insert"):
+            LoadOnly(store=self.store, shared=self.shared)
@@ -0,0 +1,66 @@
+import json
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from tech.domain.entities.products import Products
+from tech.infra.catalog.catalog_events import ProductChange
+from tech.infra.catalog.catalog_store import CatalogStore
+from tech.infra.catalog.menu_view import MenuView
+
+
+def make_product(product_id, category, name="Produto"):
+    return Products(id=product_id, name=f"{name} {product_id}", price=10.0, category=category,
+                    created_at=datetime(2024, 1, 1), updated_at=datetime(2024, 1, 1))
+
+
+class TestMenuView:
+    """Unit tests for the materialized menu."""
+
+    def setup_method(self):
+        self.store = CatalogStore()
+        self.store.replace_all([
+            make_product(3, "Bebida"), make_product(1, "Lanche"), make_product(2, "Lanche"),
+            make_product(4, "Combo"),
+        ], source="mongodb")
+        self.shared = MagicMock()
+        self.shared.enabled = False
+        self.view = MenuView(store=self.store, shared=self.shared)
+        self.fallback = MagicMock(return_value=[])
+
+    def menu(self):
+        return json.loads(self.view.render(self.fallback))
+
+    def test_groups_products_by_category_in_api_order(self):
+        menu = self.menu()
+
+        assert [group["category"] for group in menu["categories"]] == ["Lanche", "Bebida", "Combo"]
+        assert [p["id"] for p in menu["categories"][0]["products"]] == [1, 2]
+        assert menu["categories"][1]["products"][0]["name"] == "Produto 3"
+
+    def test_serves_same_bytes_until_a_write(self):
+        first = self.view.render(self.fallback)
+
+        assert self.view.render(self.fallback) is first
+
+        self.store.apply([ProductChange.upsert(make_product(5, "Sobremesa", "Pudim"))])
+        self.view.apply([ProductChange.upsert(make_product(5, "Sobremesa", "Pudim"))])
+
+        menu = self.menu()
+        assert [group["category"] for group in menu["categories"]] == ["Lanche", "Bebida", "Sobremesa", "Combo"]
+
+    def test_keeps_accents_unescaped(self):
+        self.store.replace_all([make_product(1, "Lanche", "Pão")], source="mongodb")
+
+        assert "Pão 1".encode("utf-8") in self.view.render(self.fallback)
+
+    def test_validators_describe_the_bytes_they_are_served_with(self):
+        first = self.view.snapshot(self.fallback)
+
+        self.store.apply([ProductChange.delete(4)])
+        self.view.apply([ProductChange.delete(4)])
+        second = self.view.snapshot(self.fallback)
+
+        assert self.view.snapshot(self.fallback) is second
+        assert first.validators.etag != second.validators.etag
+        assert b"Combo" in first.body and b"Combo" not in second.body
+        assert second.validators.last_modified >= first.validators.last_modified
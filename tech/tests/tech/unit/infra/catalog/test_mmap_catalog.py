@@ -0,0 +1,69 @@
+from datetime import datetime
+
+import pytest
+
+from tech.domain.entities.products import Products
+from tech.infra.catalog.mmap_catalog import MmapCatalog, write_mmap_catalog
+
+
+def make_product(product_id, category="Lanche", name=None):
+    return Products(id=product_id, name=name or f"Produto {product_id}", price=10.0 + product_id,
+                    category=category, created_at=datetime(2024, 1, 1), updated_at=datetime(2024, 1, 2))
+
+
+class TestMmapCatalog:
+    """Unit tests for the memory-mapped catalog snapshot."""
+
+    def test_get_by_id_finds_product(self, tmp_path):
+        path = str(tmp_path / "catalog.bin")
+        write_mmap_catalog([make_product(3), make_product(1), make_product(2, "Bebida")], path)
+
+        catalog = MmapCatalog(path)
+        product = catalog.get_by_id(2)
+
+        assert len(catalog) == 3
+        assert product.id == 2
+        assert product.name == "Produto 2"
+        assert product.price == 12.0
+        assert product.category == "Bebida"
+        assert product.created_at == datetime(2024, 1, 1)
+        assert product.updated_at == datetime(2024, 1, 2)
+
+    def test_get_by_id_returns_none_when_missing(self, tmp_path):
+        path = str(tmp_path / "catalog.bin")
+        write_mmap_catalog([make_product(1), make_product(5)], path)
+
+        catalog = MmapCatalog(path)
+
+        assert catalog.get_by_id(0) is None
+        assert catalog.get_by_id(3) is None
+        assert catalog.get_by_id(6) is None
+
+    def test_list_by_category_and_list_all_are_ordered_by_id(self, tmp_path):
+        path = str(tmp_path / "catalog.bin")
+        write_mmap_catalog([make_product(4), make_product(2, "Bebida"), make_product(1)], path)
+
+        catalog = MmapCatalog(path)
+
+        assert [p.id for p in catalog.list_by_category("Lanche")] == [1, 4]
+        assert catalog.list_by_category("Sobremesa") == []
+        assert [p.id for p in catalog.list_all()] == [1, 2, 4]
+
+    def test_round_trips_unicode_names(self, tmp_path):
+        path = str(tmp_path / "catalog.bin")
+        product = Products(id=7, name="Pão de queijo", price=4.5, category="Acompanhamento",
+                           created_at=datetime(2024, 3, 1, 12, 30, 15, 123456))
+        write_mmap_catalog([product], path)
+
+        restored = MmapCatalog(path).get_by_id(7)
+
+        assert restored.name == "Pão de queijo"
+        assert restored.category == "Acompanhamento"
+        assert restored.created_at == datetime(2024, 3, 1, 12, 30, 15, 123456)
+
+    def test_rejects_files_with_wrong_magic(self, tmp_path):
+        path = tmp_path / "catalog.bin"
+        path.write_bytes(b"\x00" * 128)
+
+        with pytest.raises(ValueError):
+            MmapCatalog(str(path))
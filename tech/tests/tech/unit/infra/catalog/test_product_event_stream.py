@@ -0,0 +1,138 @@
+import asyncio
+import json
+
+from pymongo.errors import OperationFailure
+
+from tech.domain.entities.products import Products
+from tech.infra.catalog.catalog_events import ProductChange
+from tech.infra.catalog.product_event_stream import (
+    LocalEventBuffer,
+    ProductEvent,
+    ProductEventStream,
+    _change_to_event,
+)
+
+
+def make_product(product_id, name="X-Burger"):
+    return Products(id=product_id, name=name, price=20.0, category="Lanche")
+
+
+class FailingChangeStream:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        raise OperationFailure("The $changeStream stage is only supported on replica sets", code=40573)
+
+
+class FakeDatabase:
+    def __init__(self):
+        self.watch_calls = 0
+
+    def watch(self, *args, **kwargs):
+        self.watch_calls += 1
+        return FailingChangeStream()
+
+
+class TestProductEvent:
+    """Unit tests for the SSE wire format."""
+
+    def test_to_sse(self):
+        event = ProductEvent("L1-2", "delete", 7)
+
+        chunk = event.to_sse()
+
+        lines = chunk.split("\n")
+        assert lines[0] == "id: L1-2"
+        assert lines[1] == "event: delete"
+        assert json.loads(lines[2][len("data: "):]) == {"action": "delete", "product_id": 7, "product": None}
+        assert chunk.endswith("\n\n")
+
+    def test_change_stream_documents(self):
+        insert = _change_to_event({
+            "_id": {"_data": "abc"}, "operationType": "insert", "ns": {"coll": "products"},
+            "fullDocument": {"product_id": 3, "name": "Suco", "price": 8.0, "category": "Bebida"},
+        })
+        tombstone = _change_to_event({
+            "_id": {"_data": "def"}, "operationType": "update", "ns": {"coll": "product_tombstones"},
+            "fullDocument": {"product_id": 3},
+        })
+
+        assert (insert.event_id, insert.action, insert.product["name"]) == ("Cabc", "create", "Suco")
+        assert (tombstone.event_id, tombstone.action, tombstone.product_id) == ("Cdef", "delete", 3)
+
+
+class TestLocalEventBuffer:
+    """Unit tests for the in-process replay buffer."""
+
+    def test_live_events_and_resume(self):
+        async def scenario():
+            buffer = LocalEventBuffer(size=10)
+            events = buffer.events(None).__aiter__()
+            first_event = asyncio.ensure_future(events.__anext__())
+            await asyncio.sleep(0)
+
+            buffer.publish([ProductChange.upsert(make_product(1), action="create")])
+            buffer.publish([ProductChange.delete(1)])
+            first = await first_event
+            await events.aclose()
+
+            replay = buffer.events(first.event_id).__aiter__()
+            resumed = await replay.__anext__()
+            await replay.aclose()
+            return first, resumed
+
+        first, resumed = asyncio.run(scenario())
+
+        assert (first.action, first.product_id, first.product["name"]) == ("create", 1, "X-Burger")
+        assert (resumed.action, resumed.product_id) == ("delete", 1)
+
+    def test_unknown_or_evicted_resume_point_sends_reset(self):
+        async def scenario():
+            buffer = LocalEventBuffer(size=2)
+            buffer.publish([ProductChange.upsert(make_product(i)) for i in range(1, 6)])
+            results = []
+            for last_event_id in (f"L{buffer.boot_id}-1", "Lother-3", f"L{buffer.boot_id}-4"):
+                events = buffer.events(last_event_id).__aiter__()
+                results.append(await events.__anext__())
+                await events.aclose()
+            return results
+
+        evicted, foreign, replayed = asyncio.run(scenario())
+
+        assert evicted.action == "reset"
+        assert foreign.action == "reset"
+        assert replayed.product_id == 5
+
+
+class TestProductEventStream:
+    """Unit tests for source selection and the SSE framing."""
+
+    def test_falls_back_to_local_bus_without_replica_set(self):
+        async def scenario():
+            buffer = LocalEventBuffer(size=10)
+            database = FakeDatabase()
+            stream = ProductEventStream(buffer, source="auto", database_getter=lambda: database)
+            chunks = stream.sse(None, heartbeat=0.01).__aiter__()
+            retry = await chunks.__anext__()
+            heartbeat = await chunks.__anext__()
+            buffer.publish([ProductChange.upsert(make_product(2, "Suco"), action="update")])
+            chunk = await chunks.__anext__()
+            while chunk.startswith(":"):
+                chunk = await chunks.__anext__()
+            await chunks.aclose()
+            return retry, heartbeat, chunk, database.watch_calls, stream
+
+        retry, heartbeat, chunk, watch_calls, stream = asyncio.run(scenario())
+
+        assert retry == "retry: 3000\n\n"
+        assert heartbeat == ": keep-alive\n\n"
+        assert "event: update" in chunk and '"name":"Suco"' in chunk
+        assert watch_calls == 1
+        assert stream._change_streams_supported is False
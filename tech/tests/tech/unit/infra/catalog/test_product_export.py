@@ -0,0 +1,114 @@
+import asyncio
+import csv
+import gzip
+import io
+import json
+import threading
+from datetime import datetime
+
+import pytest
+
+from tech.infra.catalog import product_export
+from tech.infra.catalog.product_export import ProductExporter, partition_id_range
+
+
+class FakeSource:
+    """In-memory stand-in for the MongoDB range scans."""
+
+    def __init__(self, ids, fail_at=None):
+        self.ids = sorted(ids)
+        self.fail_at = fail_at
+        self.ranges = []
+        self.threads = set()
+
+    def product_id_bounds(self):
+        return (self.ids[0], self.ids[-1]) if self.ids else None
+
+    def scan_product_id_range(self, start, stop, batch_size):
+        self.ranges.append((start, stop))
+        self.threads.add(threading.get_ident())
+        rows = [
+            (i, f"Produto {i}", float(i), "Lanche", datetime(2024, 1, 1), None)
+            for i in self.ids if start <= i < stop
+        ]
+        for offset in range(0, len(rows), batch_size):
+            if self.fail_at is not None and rows[offset][0] >= self.fail_at:
+                raise RuntimeError("cursor lost")
+            yield rows[offset:offset + batch_size]
+
+
+def export(exporter, file_format):
+    async def collect():
+        return b''.join([chunk async for chunk in exporter.stream(file_format)])
+
+    return gzip.decompress(asyncio.run(collect())).decode('utf-8')
+
+
+class TestProductExporter:
+    """Unit tests for the parallel catalog export."""
+
+    def setup_method(self):
+        self.source = FakeSource(range(1, 101))
+        self.exporter = ProductExporter(
+            source_factory=lambda: self.source, partitions=4, batch_size=10, compression_workers=0
+        )
+
+    @pytest.mark.parametrize("cores, expected", [(1, 1), (2, 2), (64, 2)])
+    def test_default_workers_follow_the_usable_cores_with_a_cap(self, monkeypatch, cores, expected):
+        monkeypatch.setattr(product_export.os, "sched_getaffinity", lambda pid: set(range(cores)), raising=False)
+        monkeypatch.setattr(product_export.os, "cpu_count", lambda: 128)
+
+        assert product_export._default_workers() == expected
+
+    def test_partitions_cover_the_range_without_overlap(self):
+        assert partition_id_range((1, 10), 3) == [(1, 5), (5, 9), (9, 11)]
+        assert partition_id_range((7, 7), 4) == [(7, 8)]
+
+    def test_exports_every_product_as_ndjson_from_all_partitions(self):
+        # Act
+        lines = export(self.exporter, 'ndjson').splitlines()
+
+        # Assert
+        records = [json.loads(line) for line in lines]
+        assert sorted(record["id"] for record in records) == list(range(1, 101))
+        assert records[0]["created_at"] == "2024-01-01T00:00:00"
+        assert sorted(self.source.ranges) == [(1, 26), (26, 51), (51, 76), (76, 101)]
+
+    def test_exports_csv_with_a_single_header(self):
+        # Act
+        rows = list(csv.reader(io.StringIO(export(self.exporter, 'csv'))))
+
+        # Assert
+        assert rows[0] == ["id", "name", "price", "category", "created_at", "updated_at"]
+        assert len(rows) == 101
+        assert rows.count(rows[0]) == 1
+
+    def test_empty_catalog_exports_an_empty_file(self):
+        self.source.ids = []
+
+        assert export(self.exporter, 'ndjson') == ''
+
+    def test_scan_failure_is_raised_to_the_consumer(self):
+        self.source.fail_at = 60
+
+        with pytest.raises(RuntimeError, match="cursor lost"):
+            export(self.exporter, 'ndjson')
+
+    def test_rejects_unknown_format(self):
+        with pytest.raises(ValueError):
+            self.exporter.stream('xml')
+
+    def test_compresses_in_a_process_pool(self):
+        # Arrange
+        exporter = ProductExporter(
+            source_factory=lambda: self.source, partitions=2, batch_size=50, compression_workers=1
+        )
+
+        # Act
+        try:
+            lines = export(exporter, 'ndjson').splitlines()
+        finally:
+            exporter.shutdown()
+
+        # Assert
+        assert len(lines) == 100
@@ -0,0 +1,81 @@
+from tech.infra.catalog.catalog_events import ProductChange
+from tech.infra.catalog.product_id_filter import ProductIdFilter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestProductIdFilter:
+    """Unit tests for the Bloom filter and negative cache of product IDs."""
+
+    def setup_method(self):
+        self.clock = FakeClock()
+        self.filter = ProductIdFilter(refresh_seconds=60, negative_cache_size=2, negative_cache_ttl=30,
+                                      clock=self.clock)
+
+    def test_nothing_is_missing_before_the_first_build(self):
+        # Act / Assert
+        assert not self.filter.ready
+        assert not self.filter.definitely_missing(5)
+        assert self.filter.needs_rebuild()
+
+    def test_unknown_ids_up_to_the_highest_are_missing(self):
+        # Arrange
+        self.filter.rebuild(lambda: [1, 2, 4])
+
+        # Act / Assert
+        assert not self.filter.definitely_missing(2)
+        assert self.filter.definitely_missing(3)
+        # Pode ter sido criado por outra instância depois da reconstrução
+        assert not self.filter.definitely_missing(5)
+
+    def test_local_creation_and_deletion_update_the_filter(self):
+        # Arrange
+        self.filter.rebuild(lambda: [1, 2])
+        self.filter.record_missing(3)
+
+        # Act
+        self.filter.apply([ProductChange.delete(2), ProductChange(ProductChange.UPSERT, 3)])
+
+        # Assert
+        assert self.filter.definitely_missing(2)
+        assert not self.filter.definitely_missing(3)
+
+    def test_negative_cache_entries_expire_and_are_bounded(self):
+        # Arrange
+        self.filter.record_missing(10)
+        self.filter.record_missing(11)
+        self.filter.record_missing(12)
+
+        # Act / Assert
+        assert not self.filter.definitely_missing(10)
+        assert self.filter.definitely_missing(12)
+        self.clock.now += 31
+        assert not self.filter.definitely_missing(12)
+
+    def test_ids_created_during_a_rebuild_are_kept(self):
+        # Arrange
+        def load_ids():
+            self.filter.apply([ProductChange(ProductChange.UPSERT, 9)])
+            return [1]
+
+        # Act
+        self.filter.rebuild(load_ids)
+
+        # Assert
+        assert not self.filter.definitely_missing(9)
+        assert self.filter.definitely_missing(5)
+
+    def test_rebuild_is_due_after_the_refresh_interval(self):
+        # Arrange
+        self.filter.rebuild(lambda: [1])
+
+        # Act / Assert
+        assert not self.filter.needs_rebuild()
+        self.clock.now += 60
+        assert self.filter.needs_rebuild()
@@ -0,0 +1,130 @@
+import io
+import json
+
+import bson
+import pytest
+from unittest.mock import Mock
+
+from tech.domain.value_objects import BulkUpsertResult
+from tech.infra.catalog.product_import import ProductImporter, detect_format
+from tech.interfaces.repositories.product_repository import ProductRepository
+
+
+def created(products):
+    return [BulkUpsertResult(index, 'created', product=product) for index, product in enumerate(products)]
+
+
+class TestProductImporter:
+    """Unit tests for the streaming product importer."""
+
+    def setup_method(self):
+        self.repository = Mock(spec=ProductRepository)
+        self.repository.bulk_upsert.side_effect = created
+        self.importer = ProductImporter(self.repository, chunk_size=2, max_pending_chunks=1)
+
+    def ndjson(self, *records):
+        return io.BytesIO(b''.join(json.dumps(record).encode() + b'\n' for record in records))
+
+    def test_writes_valid_rows_in_bounded_chunks(self):
+        # Arrange
+        stream = self.ndjson(*[{"name": f"P{i}", "price": 1.5, "category": "Lanche"} for i in range(5)])
+
+        # Act
+        report = self.importer.import_stream(stream, 'ndjson')
+
+        # Assert
+        assert [len(call.args[0]) for call in self.repository.bulk_upsert.call_args_list] == [2, 2, 1]
+        assert report.to_dict()["rows_read"] == 5
+        assert report.created == 5
+
+    def test_reports_invalid_rows_without_writing_them(self):
+        # Arrange
+        stream = io.BytesIO(
+            b'{"name": "Ok", "price": 2, "category": "Bebida"}\n'
+            b'not json\n'
+            b'\n'
+            b'{"name": "Bad", "price": 2, "category": "Pizza"}\n'
+        )
+
+        # Act
+        report = self.importer.import_stream(stream, 'ndjson')
+
+        # Assert
+        assert report.created == 1
+        assert report.invalid == 2
+        assert [error["row"] for error in report.errors] == [2, 4]
+        assert "category" in report.errors[1]["error"]
+
+    def test_reads_csv_with_header_and_keeps_ids(self):
+        # Arrange
+        stream = io.BytesIO('﻿product_id,name,price,category\n7,Suco,4.5,Bebida\n,Café,3,Bebida\n'.encode())
+
+        # Act
+        self.importer.import_stream(stream, 'csv')
+
+        # Assert
+        products = self.repository.bulk_upsert.call_args.args[0]
+        assert [(p.id, p.name, p.price) for p in products] == [(7, "Suco", 4.5), (None, "Café", 3.0)]
+        assert not stream.closed
+
+    def test_reads_mongodump_bson(self):
+        # Arrange
+        stream = io.BytesIO(b''.join(bson.encode(
+            {"_id": i, "product_id": i, "name": f"Sobremesa {i}", "price": 20, "category": "Sobremesa"}
+        ) for i in (1, 2, 3)))
+
+        # Act
+        report = self.importer.import_stream(stream, 'bson')
+
+        # Assert
+        assert report.created == 3
+        assert self.repository.bulk_upsert.call_args.args[0][0].id == 3
+
+    def test_last_row_wins_for_a_name_repeated_in_a_chunk(self):
+        # Arrange
+        stream = self.ndjson(
+            {"name": "Suco", "price": 1, "category": "Bebida"},
+            {"name": "Suco", "price": 2, "category": "Bebida"},
+        )
+
+        # Act
+        report = self.importer.import_stream(stream, 'ndjson')
+
+        # Assert
+        assert [p.price for p in self.repository.bulk_upsert.call_args.args[0]] == [2.0]
+        assert (report.created, report.updated) == (1, 1)
+
+    def test_counts_failed_writes(self):
+        # Arrange
+        self.repository.bulk_upsert.side_effect = lambda products: [
+            BulkUpsertResult(0, 'error', error='duplicate key')
+        ]
+        stream = self.ndjson({"name": "X", "price": 1, "category": "Lanche"})
+
+        # Act
+        report = self.importer.import_stream(stream, 'ndjson')
+
+        # Assert
+        assert report.failed == 1
+        assert report.errors == [{"row": 1, "error": "duplicate key"}]
+
+    def test_stops_reading_and_raises_when_a_bulk_write_fails(self):
+        # Arrange
+        self.repository.bulk_upsert.side_effect = RuntimeError("database down")
+        stream = self.ndjson(*[{"name": f"P{i}", "price": 1, "category": "Lanche"} for i in range(50)])
+
+        # Act / Assert
+        with pytest.raises(RuntimeError, match="database down"):
+            self.importer.import_stream(stream, 'ndjson')
+        assert self.repository.bulk_upsert.call_count == 1
+
+    def test_rejects_unknown_format(self):
+        with pytest.raises(ValueError):
+            self.importer.import_stream(io.BytesIO(b''), 'xml')
+
+
+def test_detect_format_from_file_name_or_content_type():
+    assert detect_format(filename="dump/products.BSON") == 'bson'
+    assert detect_format(content_type="text/csv; charset=utf-8") == 'csv'
+    assert detect_format(filename="products.txt", content_type="application/x-ndjson") == 'ndjson'
+    assert detect_format(content_type="application/octet-stream") is None
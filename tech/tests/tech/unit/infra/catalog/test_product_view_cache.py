@@ -0,0 +1,89 @@
+import pytest
+
+from tech.infra.catalog.catalog_events import ProductChange
+from tech.infra.catalog.product_view_cache import ProductViewCache, render_product
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def product(product_id, price=10.0):
+    return {"id": product_id, "name": f"P{product_id}", "price": price, "category": "Lanche",
+            "created_at": "2024-01-01T00:00:00", "updated_at": None}
+
+
+class TestProductViewCache:
+    """Unit tests for the LRU of rendered single products."""
+
+    def setup_method(self):
+        self.clock = FakeClock()
+        self.cache = ProductViewCache(max_entries=2, ttl=30, clock=self.clock)
+        self.loads = []
+
+    def load(self, product_id, price=10.0):
+        def run():
+            self.loads.append(product_id)
+            return product(product_id, price)
+        return run
+
+    def test_hits_skip_the_loader(self):
+        # Act
+        first = self.cache.get(1, self.load(1))
+        second = self.cache.get(1, self.load(1))
+
+        # Assert
+        assert second is first
+        assert self.loads == [1]
+
+    def test_least_recently_used_entry_is_evicted(self):
+        # Arrange
+        self.cache.get(1, self.load(1))
+        self.cache.get(2, self.load(2))
+        self.cache.get(1, self.load(1))
+
+        # Act
+        self.cache.get(3, self.load(3))
+        self.cache.get(1, self.load(1))
+        self.cache.get(2, self.load(2))
+
+        # Assert
+        assert self.loads == [1, 2, 3, 2]
+        assert len(self.cache) == 2
+
+    def test_local_write_and_expiry_reload_the_product(self):
+        # Arrange
+        before = self.cache.get(1, self.load(1))
+
+        # Act
+        self.cache.apply([ProductChange(ProductChange.UPSERT, 1)])
+        after = self.cache.get(1, self.load(1, price=12.0))
+        self.clock.now += 30
+        self.cache.get(1, self.load(1, price=12.0))
+
+        # Assert
+        assert after.validators.etag != before.validators.etag
+        assert self.loads == [1, 1, 1]
+
+    def test_loader_errors_are_not_cached(self):
+        # Arrange
+        def missing():
+            raise LookupError("Product not found")
+
+        # Act / Assert
+        with pytest.raises(LookupError):
+            self.cache.get(5, missing)
+        assert len(self.cache) == 0
+
+    def test_render_uses_created_at_when_never_updated(self):
+        # Act
+        rendered = render_product(product(1))
+
+        # Assert
+        assert rendered.body.startswith(b'{"id":1,')
+        assert rendered.validators.last_modified.year == 2024
+        assert rendered.validators.last_modified.tzinfo is not None
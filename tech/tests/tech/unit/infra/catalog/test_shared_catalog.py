@@ -0,0 +1,53 @@
+import os
+from unittest.mock import MagicMock
+
+from tech.infra.catalog.mmap_catalog import write_mmap_catalog
+from tech.infra.catalog.shared_catalog import SharedCatalog
+from tech.domain.entities.products import Products
+
+
+class TestSharedCatalog:
+    """Unit tests for refresher election and snapshot mapping."""
+
+    def make_catalog(self, path):
+        return SharedCatalog(path=path, store=MagicMock(), synchronizer=MagicMock(), poll_interval=0)
+
+    def test_disabled_without_path(self):
+        assert not SharedCatalog(path='').enabled
+
+    def test_only_one_worker_becomes_refresher(self, tmp_path):
+        path = str(tmp_path / "catalog.bin")
+        first = self.make_catalog(path)
+        second = self.make_catalog(path)
+
+        try:
+            assert first.try_become_refresher()
+            assert not second.try_become_refresher()
+
+            first.release()
+
+            assert second.try_become_refresher()
+        finally:
+            first.release()
+            second.release()
+
+    def test_reader_is_none_until_snapshot_exists_and_remaps_on_replace(self, tmp_path):
+        path = str(tmp_path / "catalog.bin")
+        catalog = self.make_catalog(path)
+
+        assert catalog.reader() is None
+
+        write_mmap_catalog([Products(id=1, name="X-Burger", price=20.0, category="Lanche")], path)
+        assert catalog.reader().get_by_id(1).name == "X-Burger"
+
+        write_mmap_catalog([Products(id=1, name="X-Salada", price=22.0, category="Lanche")], path)
+        assert catalog.reader().get_by_id(1).name == "X-Salada"
+
+    def test_mark_dirty_touches_marker_file(self, tmp_path):
+        path = str(tmp_path / "catalog.bin")
+        catalog = self.make_catalog(path)
+
+        catalog.mark_dirty([])
+
+        assert os.path.exists(f"{path}.dirty")
+        assert catalog._dirty_mtime() > 0
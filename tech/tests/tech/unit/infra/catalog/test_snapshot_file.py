@@ -0,0 +1,50 @@
+import gzip
+import os
+from datetime import datetime
+
+import pytest
+
+from tech.domain.entities.products import Products
+from tech.infra.catalog.snapshot_file import main, read_mongodump, read_snapshot, write_snapshot
+
+DUMP_PATH = os.path.join(os.path.dirname(__file__), "../../../../../mongodump/products/products.bson")
+
+
+class TestSnapshotFile:
+    """Unit tests for the compressed catalog snapshot."""
+
+    def test_round_trip(self, tmp_path):
+        path = str(tmp_path / "catalog.json.gz")
+        product = Products(id=1, name="Hambúrguer", price=25.5, category="Lanche",
+                           created_at=datetime(2024, 1, 1), updated_at=datetime(2024, 1, 2))
+
+        write_snapshot([product], path)
+        restored = read_snapshot(path)
+
+        assert len(restored) == 1
+        assert restored[0].id == 1
+        assert restored[0].name == "Hambúrguer"
+        assert restored[0].price == 25.5
+        assert restored[0].updated_at == datetime(2024, 1, 2)
+        assert os.listdir(tmp_path) == ["catalog.json.gz"]
+
+    def test_rejects_unknown_format(self, tmp_path):
+        path = tmp_path / "catalog.json.gz"
+        path.write_bytes(gzip.compress(b'{"format": 99, "products": []}'))
+
+        with pytest.raises(ValueError):
+            read_snapshot(str(path))
+
+    def test_read_mongodump_skips_rows_without_product_id(self):
+        products = read_mongodump(DUMP_PATH)
+
+        assert products
+        assert all(isinstance(product.id, int) for product in products)
+
+    def test_cli_builds_snapshot_from_mongodump(self, tmp_path, capsys):
+        output = str(tmp_path / "catalog.json.gz")
+
+        main(["--from-bson", DUMP_PATH, "--output", output])
+
+        assert len(read_snapshot(output)) == len(read_mongodump(DUMP_PATH))
+        assert "products written" in capsys.readouterr().out
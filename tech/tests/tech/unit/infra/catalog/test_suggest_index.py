@@ -0,0 +1,84 @@
+from unittest.mock import MagicMock
+
+from tech.domain.entities.products import Products
+from tech.infra.catalog.catalog_events import ProductChange
+from tech.infra.catalog.catalog_store import CatalogStore
+from tech.infra.catalog.suggest_index import SuggestIndex, fold
+
+
+def make_products():
+    return [
+        Products(id=1, name="Pão de Queijo", price=6.0, category="Acompanhamento"),
+        Products(id=2, name="X-Burger", price=20.0, category="Lanche"),
+        Products(id=3, name="Pastel de Carne", price=8.0, category="Lanche"),
+        Products(id=4, name="Açaí", price=15.0, category="Sobremesa"),
+    ]
+
+
+class TestFold:
+    """Unit tests for accent and case folding."""
+
+    def test_strips_accents_case_and_extra_spaces(self):
+        assert fold("  Pão  de QUEIJO ") == "pao de queijo"
+        assert fold("Açaí") == "acai"
+
+
+class TestSuggestIndex:
+    """Unit tests for the name autocomplete index."""
+
+    def setup_method(self):
+        self.store = CatalogStore()
+        self.store.replace_all(make_products(), source="mongodb")
+        self.shared = MagicMock()
+        self.shared.enabled = False
+        self.index = SuggestIndex(store=self.store, shared=self.shared)
+        self.fallback = MagicMock(return_value=[])
+
+    def ids(self, prefix, limit=10):
+        return [product.id for product in self.index.suggest(prefix, limit, self.fallback)]
+
+    def test_matches_ignoring_accents_and_case(self):
+        assert self.ids("pao") == [1]
+        assert self.ids("AÇA") == [4]
+        assert self.ids("pa") == [1, 3]
+
+    def test_matches_word_starts(self):
+        assert self.ids("burg") == [2]
+        assert self.ids("queijo") == [1]
+        assert self.ids("urger") == []
+
+    def test_limits_results_and_ignores_blank_prefix(self):
+        assert self.ids("pa", limit=1) == [1]
+        assert self.ids("   ") == []
+
+    def test_follows_catalog_events_incrementally(self):
+        self.ids("x")
+
+        self.index.apply([
+            ProductChange.upsert(Products(id=2, name="X-Salada", price=22.0, category="Lanche")),
+            ProductChange.upsert(Products(id=5, name="Pão na Chapa", price=5.0, category="Lanche")),
+            ProductChange.delete(3),
+        ])
+
+        assert self.ids("burg") == []
+        assert self.ids("x-sal") == [2]
+        assert self.ids("pao") == [1, 5]
+        assert self.ids("pastel") == []
+
+    def test_rebuilds_after_catalog_reload(self):
+        self.ids("x")
+
+        self.store.replace_all(make_products()[:1], source="mongodb")
+
+        assert self.ids("x") == []
+        assert self.ids("pao") == [1]
+
+    def test_uses_fallback_without_in_memory_catalog(self):
+        index = SuggestIndex(store=CatalogStore(), shared=self.shared)
+        fallback = MagicMock(return_value=make_products())
+
+        index.suggest("pa", 10, fallback)
+        result = index.suggest("x", 10, fallback)
+
+        assert [product.id for product in result] == [2]
+        fallback.assert_called_once()
@@ -0,0 +1,66 @@
+from unittest.mock import MagicMock
+
+from tech.domain.entities.products import Products
+from tech.infra.catalog.catalog_events import ProductChange
+from tech.infra.catalog.catalog_store import CatalogStore
+from tech.infra.catalog.trigram_index import TrigramIndex, trigrams
+
+
+def make_products():
+    return [
+        Products(id=1, name="Hambúrguer Artesanal", price=30.0, category="Lanche"),
+        Products(id=2, name="Hambúrguer Vegano", price=28.0, category="Lanche"),
+        Products(id=3, name="Suco de Laranja", price=8.0, category="Bebida"),
+        Products(id=4, name="Milkshake de Morango", price=15.0, category="Sobremesa"),
+    ]
+
+
+class TestTrigrams:
+    """Unit tests for trigram extraction."""
+
+    def test_pads_words_and_folds_accents(self):
+        assert trigrams("Pão") == {"  p", " pa", "pao", "ao "}
+        assert trigrams("!!") == frozenset()
+
+
+class TestTrigramIndex:
+    """Unit tests for the fuzzy name index."""
+
+    def setup_method(self):
+        self.store = CatalogStore()
+        self.store.replace_all(make_products(), source="mongodb")
+        self.shared = MagicMock()
+        self.shared.enabled = False
+        self.index = TrigramIndex(store=self.store, shared=self.shared)
+        self.fallback = MagicMock(return_value=[])
+
+    def ids(self, text, **kwargs):
+        return [product.id for product, _ in self.index.search(text, 10, self.fallback, **kwargs)]
+
+    def test_tolerates_typos_and_missing_accents(self):
+        assert self.ids("hamburguer vegano")[0] == 2
+        assert self.ids("hamburger artesanal")[0] == 1
+        assert self.ids("suko laranja") == [3]
+
+    def test_ranks_by_similarity(self):
+        results = self.index.search("hamburguer", 10, self.fallback)
+
+        assert {product.id for product, _ in results} == {1, 2}
+        assert all(0 < similarity <= 1 for _, similarity in results)
+        assert results[0][1] >= results[1][1]
+
+    def test_filters_by_category_and_threshold(self):
+        assert self.ids("hamburguer", category="Bebida") == []
+        assert self.ids("pizza calabresa") == []
+
+    def test_follows_catalog_events_incrementally(self):
+        self.ids("suco")
+
+        self.index.apply([
+            ProductChange.upsert(Products(id=3, name="Refrigerante", price=7.0, category="Bebida")),
+            ProductChange.delete(4),
+        ])
+
+        assert self.ids("suco laranja") == []
+        assert self.ids("refrigerente") == [3]
+        assert self.ids("milkshake morango") == []
@@ -0,0 +1,262 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from tech.infra.concurrency.single_flight import AsyncSingleFlight, SingleFlight
+from tech.infra.observability.request_context import (
+    add_response_warning, current_request_context, end_request_context, start_request_context
+)
+from tech.infra.resilience.request_deadline import (
+    REQUEST_DEADLINE_SECONDS, DeadlineExceeded, end_deadline, remaining, start_deadline
+)
+
+
+class TestSingleFlight:
+    """Unit tests for coalescing identical calls across threads."""
+
+    def setup_method(self):
+        self.flight = SingleFlight()
+
+    def run_concurrently(self, callers, fn, key='products'):
+        results = [None] * callers
+        errors = [None] * callers
+
+        def worker(position):
+            try:
+                results[position] = self.flight.do(key, fn)
+            except Exception as e:
+                errors[position] = e
+
+        threads = [threading.Thread(target=worker, args=(position,)) for position in range(callers)]
+        for thread in threads:
+            thread.start()
+        return threads, results, errors
+
+    def test_concurrent_callers_share_one_call(self):
+        # Arrange
+        started, release = threading.Event(), threading.Event()
+        calls = []
+
+        def load():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return ['shared']
+
+        threads, results, errors = self.run_concurrently(8, load)
+
+        # Act
+        started.wait(5)
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        # Assert
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+        assert errors == [None] * 8
+
+    def test_waiters_receive_the_leaders_exception(self):
+        # Arrange
+        started, release = threading.Event(), threading.Event()
+
+        def load():
+            started.set()
+            release.wait(5)
+            raise LookupError('down')
+
+        threads, results, errors = self.run_concurrently(4, load)
+
+        # Act
+        started.wait(5)
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        # Assert
+        assert all(isinstance(error, LookupError) for error in errors)
+        assert results == [None] * 4
+
+    def test_sequential_calls_are_not_cached(self):
+        # Act
+        first = self.flight.do('key', lambda: 1)
+        second = self.flight.do('key', lambda: 2)
+
+        # Assert
+        assert (first, second) == (1, 2)
+        assert self.flight._calls == {}
+
+    def test_different_keys_do_not_share(self):
+        # Act / Assert
+        assert self.flight.do('a', lambda: 'a') == 'a'
+        assert self.flight.do('b', lambda: 'b') == 'b'
+
+    def test_shared_call_runs_under_its_own_deadline_outside_the_leaders_context(self):
+        # Arrange
+        seen = {}
+
+        def load():
+            seen['budget'] = remaining()
+            seen['context'] = current_request_context()
+            add_response_warning('110 - "Response is Stale"')
+            return 'shared'
+
+        context, context_token = start_request_context()
+        deadline_token = start_deadline(5)
+
+        # Act
+        try:
+            result = self.flight.do('key', load)
+        finally:
+            end_deadline(deadline_token)
+            end_request_context(context_token)
+
+        # Assert
+        assert result == 'shared'
+        assert 5 < seen['budget'] <= REQUEST_DEADLINE_SECONDS
+        assert seen['context'] is not context
+        assert context.warnings == ['110 - "Response is Stale"']
+
+    def test_shared_call_started_outside_a_request_is_still_bounded(self):
+        # Act
+        budget = self.flight.do('key', remaining)
+
+        # Assert
+        assert 0 < budget <= REQUEST_DEADLINE_SECONDS
+
+    def test_shared_call_keeps_a_longer_budget_of_its_leader(self):
+        # Arrange
+        deadline_token = start_deadline(REQUEST_DEADLINE_SECONDS + 20)
+
+        # Act
+        try:
+            budget = self.flight.do('key', remaining)
+        finally:
+            end_deadline(deadline_token)
+
+        # Assert
+        assert budget > REQUEST_DEADLINE_SECONDS + 10
+
+    def test_waiter_gives_up_when_its_own_deadline_runs_out(self):
+        # Arrange
+        started, release = threading.Event(), threading.Event()
+
+        def load():
+            started.set()
+            release.wait(5)
+            return 'shared'
+
+        threads, results, errors = self.run_concurrently(1, load)
+        started.wait(5)
+        deadline_token = start_deadline(0.05)
+
+        # Act
+        try:
+            with pytest.raises(DeadlineExceeded):
+                self.flight.do('products', load)
+        finally:
+            end_deadline(deadline_token)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        # Assert
+        assert results == ['shared']
+        assert errors == [None]
+
+
+class TestAsyncSingleFlight:
+    """Unit tests for coalescing identical calls across coroutines."""
+
+    def test_concurrent_awaits_share_one_call(self):
+        # Arrange
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def load():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return b'[]'
+
+        async def scenario():
+            return await asyncio.gather(*(flight.do('products', load) for _ in range(10)))
+
+        # Act
+        results = asyncio.run(scenario())
+
+        # Assert
+        assert len(calls) == 1
+        assert results == [b'[]'] * 10
+        assert flight._tasks == {}
+
+    def test_exception_reaches_every_waiter(self):
+        # Arrange
+        flight = AsyncSingleFlight()
+
+        async def load():
+            await asyncio.sleep(0.01)
+            raise LookupError('down')
+
+        async def scenario():
+            return await asyncio.gather(*(flight.do('products', load) for _ in range(3)), return_exceptions=True)
+
+        # Act
+        results = asyncio.run(scenario())
+
+        # Assert
+        assert all(isinstance(result, LookupError) for result in results)
+
+    def test_cancelled_waiter_does_not_cancel_the_shared_call(self):
+        # Arrange
+        flight = AsyncSingleFlight()
+
+        async def load():
+            await asyncio.sleep(0.02)
+            return 'done'
+
+        async def scenario():
+            first = asyncio.ensure_future(flight.do('products', load))
+            second = asyncio.ensure_future(flight.do('products', load))
+            await asyncio.sleep(0)
+            first.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await first
+            return await second
+
+        # Act / Assert
+        assert asyncio.run(scenario()) == 'done'
+
+    def test_waiters_with_different_budgets_each_keep_their_own(self):
+        # Arrange
+        flight = AsyncSingleFlight()
+        seen = []
+
+        async def load():
+            seen.append(remaining())
+            add_response_warning('111 - "Revalidation Failed"')
+            await asyncio.sleep(0.1)
+            return 'done'
+
+        async def waiter(budget):
+            context, context_token = start_request_context()
+            deadline_token = start_deadline(budget)
+            try:
+                return await flight.do('products', load), context.warnings
+            finally:
+                end_deadline(deadline_token)
+                end_request_context(context_token)
+
+        async def scenario():
+            return await asyncio.gather(waiter(0.02), waiter(5), return_exceptions=True)
+
+        # Act
+        short, long = asyncio.run(scenario())
+
+        # Assert
+        assert isinstance(short, DeadlineExceeded)
+        assert long == ('done', ['111 - "Revalidation Failed"'])
+        assert 0.02 < seen[0] <= REQUEST_DEADLINE_SECONDS
@@ -0,0 +1,50 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from tech.infra.databases.mongo_health import MongoHealthMonitor
+
+
+class TestMongoHealthMonitor:
+    """Unit tests for the cached MongoDB ping."""
+
+    def setup_method(self):
+        self.client = MagicMock()
+        self.client.admin.command = AsyncMock(return_value={"ok": 1})
+        self.monitor = MongoHealthMonitor(client=self.client, interval=0.01, timeout=0.05)
+
+    def test_starts_unhealthy(self):
+        assert self.monitor.healthy is False
+        assert self.monitor.status()["last_checked"] is None
+
+    def test_check_success(self):
+        assert asyncio.run(self.monitor.check()) is True
+
+        self.client.admin.command.assert_awaited_once_with("ping")
+        assert self.monitor.status()["healthy"] is True
+        assert self.monitor.latency_ms is not None
+
+    def test_check_failure_keeps_error(self):
+        self.client.admin.command.side_effect = ConnectionError("connection refused")
+
+        assert asyncio.run(self.monitor.check()) is False
+        assert self.monitor.status()["error"] == "connection refused"
+
+    def test_check_timeout(self):
+        async def slow_ping(_):
+            await asyncio.sleep(1)
+
+        self.client.admin.command = slow_ping
+
+        assert asyncio.run(self.monitor.check()) is False
+        assert self.monitor.last_error == "TimeoutError"
+
+    def test_background_loop_updates_cached_state(self):
+        async def scenario():
+            self.monitor.start()
+            await asyncio.sleep(0.05)
+            await self.monitor.stop()
+
+        asyncio.run(scenario())
+
+        assert self.monitor.healthy is True
+        assert self.client.admin.command.await_count >= 2
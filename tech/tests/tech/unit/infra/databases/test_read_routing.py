@@ -0,0 +1,65 @@
+from unittest.mock import MagicMock
+
+from bson.timestamp import Timestamp
+from pymongo.read_preferences import SecondaryPreferred
+
+from tech.infra.databases.read_routing import ReadRouting
+
+
+class TestReadRouting:
+    """Unit tests for secondary reads and causally consistent write sessions."""
+
+    def setup_method(self):
+        self.collection = MagicMock()
+        self.session = self.collection.database.client.start_session.return_value.__enter__.return_value
+        self.routing = ReadRouting(enabled=True, max_staleness=120)
+
+    def test_reads_use_secondary_preferred_with_bounded_staleness(self):
+        # Act
+        self.routing.for_reads(self.collection)
+
+        # Assert
+        preference = self.collection.with_options.call_args.kwargs["read_preference"]
+        assert isinstance(preference, SecondaryPreferred)
+        assert preference.max_staleness == 120
+
+    def test_reads_use_implicit_sessions_until_a_write_is_seen(self):
+        # Act
+        with self.routing.read_session(self.collection) as session:
+            pass
+
+        # Assert
+        assert session is None
+        self.collection.database.client.start_session.assert_not_called()
+
+    def test_reads_after_a_write_wait_for_its_operation_time(self):
+        # Arrange
+        self.session.operation_time = Timestamp(100, 1)
+        self.session.cluster_time = {"clusterTime": Timestamp(100, 2)}
+        with self.routing.write_session(self.collection) as session:
+            assert session is self.session
+        self.session.operation_time = Timestamp(50, 1)
+        with self.routing.write_session(self.collection):
+            pass
+
+        # Act
+        with self.routing.read_session(self.collection) as session:
+            pass
+
+        # Assert
+        self.collection.database.client.start_session.assert_called_with(causal_consistency=True)
+        session.advance_operation_time.assert_called_once_with(Timestamp(100, 1))
+        session.advance_cluster_time.assert_called_once_with({"clusterTime": Timestamp(100, 2)})
+
+    def test_disabled_routing_keeps_everything_on_the_collection(self):
+        # Arrange
+        routing = ReadRouting(enabled=False)
+
+        # Act
+        reads = routing.for_reads(self.collection)
+        with routing.write_session(self.collection) as session:
+            pass
+
+        # Assert
+        assert reads is self.collection
+        assert session is None
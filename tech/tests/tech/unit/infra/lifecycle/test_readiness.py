@@ -0,0 +1,113 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from tech.infra.lifecycle.readiness import ReadinessState
+from tech.infra.lifecycle.warmups import run_startup_warmups, warm_catalog
+
+
+class TestReadinessState:
+    """Unit tests for startup warmup tracking."""
+
+    def test_ready_only_after_all_warmups_done(self):
+        state = ReadinessState()
+        state.expect("indexes")
+        state.expect("catalog")
+
+        assert state.is_ready() is False
+
+        state.mark_done("indexes")
+        assert state.is_ready() is False
+
+        state.mark_done("catalog")
+        assert state.is_ready() is True
+
+    def test_failed_warmup_keeps_pod_not_ready(self):
+        state = ReadinessState()
+        state.expect("indexes")
+
+        state.mark_failed("indexes", RuntimeError("boom"))
+
+        assert state.is_ready() is False
+        assert state.snapshot() == {"indexes": {"state": "failed", "error": "boom"}}
+
+    def test_deferred_warmup_no_longer_blocks_readiness(self):
+        state = ReadinessState()
+        state.expect("indexes")
+        state.mark_failed("indexes", RuntimeError("mongo down"))
+
+        state.defer("indexes")
+        state.mark_failed("indexes", RuntimeError("still down"))
+
+        assert state.is_ready() is True
+        assert state.snapshot() == {"indexes": {"state": "deferred", "error": "still down"}}
+
+        state.mark_done("indexes")
+        assert state.snapshot()["indexes"]["state"] == "done"
+
+
+class TestRunStartupWarmups:
+    """Unit tests for the warmup runner."""
+
+    def test_retries_failed_warmup_until_success(self):
+        state = ReadinessState()
+        attempts = []
+
+        async def flaky():
+            attempts.append(1)
+            if len(attempts) < 2:
+                raise RuntimeError("mongo down")
+
+        with patch("tech.infra.lifecycle.warmups.asyncio.sleep", return_value=None):
+            asyncio.run(run_startup_warmups([("indexes", flaky)], state))
+
+        assert len(attempts) == 2
+        assert state.is_ready() is True
+
+    def test_all_warmups_declared_before_running(self):
+        state = ReadinessState()
+        seen = []
+
+        async def first():
+            seen.append(state.snapshot())
+
+        async def second():
+            pass
+
+        asyncio.run(run_startup_warmups([("first", first), ("second", second)], state))
+
+        assert set(seen[0]) == {"first", "second"}
+        assert state.is_ready() is True
+
+    def test_snapshot_boot_is_ready_without_mongodb_warmups(self):
+        state = ReadinessState()
+        for name in ("indexes", "catalog", "product_ids"):
+            state.expect(name)
+        state.mark_failed("indexes", RuntimeError("mongo down"))
+
+        with patch("tech.infra.lifecycle.warmups.shared_catalog") as mock_shared, \
+                patch("tech.infra.lifecycle.warmups.catalog_synchronizer") as mock_sync, \
+                patch("tech.infra.lifecycle.warmups.catalog_store") as mock_store:
+            mock_shared.enabled = False
+            mock_sync.warm_up = AsyncMock()
+            mock_store.source = "snapshot"
+            asyncio.run(warm_catalog(state))
+        state.mark_done("catalog")
+
+        assert state.is_ready() is True
+        assert state.snapshot()["product_ids"]["state"] == "deferred"
+
+    def test_mongodb_boot_still_waits_for_every_warmup(self):
+        state = ReadinessState()
+        for name in ("indexes", "catalog"):
+            state.expect(name)
+
+        with patch("tech.infra.lifecycle.warmups.shared_catalog") as mock_shared, \
+                patch("tech.infra.lifecycle.warmups.catalog_synchronizer") as mock_sync, \
+                patch("tech.infra.lifecycle.warmups.catalog_store") as mock_store:
+            mock_shared.enabled = False
+            mock_sync.warm_up = AsyncMock()
+            mock_store.source = "mongodb"
+            asyncio.run(warm_catalog(state))
+        state.mark_done("catalog")
+
+        assert state.is_ready() is False
@@ -0,0 +1,84 @@
+from unittest.mock import Mock
+
+from tech.infra.observability.mongo_command_listener import MongoCommandTimingListener
+from tech.infra.observability.request_context import (
+    add_response_warning,
+    current_request_context,
+    end_request_context,
+    start_request_context,
+    track,
+)
+
+
+class TestRequestContext:
+    """Unit tests for the per-request timing accumulator."""
+
+    def test_track_outside_request_is_noop(self):
+        """Test that tracking without a bound context does nothing."""
+        assert current_request_context() is None
+
+        with track('auth'):
+            pass
+
+        assert current_request_context() is None
+
+    def test_track_accumulates_named_timings(self):
+        """Test that repeated blocks are summed into the same metric."""
+        context, token = start_request_context()
+        try:
+            with track('serialize'):
+                pass
+            with track('serialize'):
+                pass
+        finally:
+            end_request_context(token)
+
+        assert list(context.timings) == ['serialize']
+        assert context.timings['serialize'] >= 0
+        assert current_request_context() is None
+
+    def test_response_warnings_are_recorded_once(self):
+        """Test that warnings are deduplicated and ignored outside a request."""
+        add_response_warning('111 - "Revalidation Failed"')
+        context, token = start_request_context()
+        try:
+            add_response_warning('111 - "Revalidation Failed"')
+            add_response_warning('111 - "Revalidation Failed"')
+        finally:
+            end_request_context(token)
+
+        assert context.warnings == ['111 - "Revalidation Failed"']
+
+    def test_server_timing_header_format(self):
+        """Test the Server-Timing header lists every metric and the total."""
+        context, token = start_request_context()
+        end_request_context(token)
+        context.add_timing('auth', 12.34)
+        context.add_db_roundtrip(2.0)
+        context.add_db_roundtrip(3.0)
+
+        header = context.server_timing_header()
+
+        assert header.startswith('auth;dur=12.3, db;dur=5.0, total;dur=')
+        assert context.db_roundtrips == 2
+
+    def test_mongo_listener_records_roundtrips(self):
+        """Test that command events are attributed to the current request."""
+        listener = MongoCommandTimingListener()
+        context, token = start_request_context()
+        try:
+            listener.succeeded(Mock(duration_micros=1500))
+            listener.failed(Mock(duration_micros=500))
+        finally:
+            end_request_context(token)
+
+        assert context.db_roundtrips == 2
+        assert context.timings['db'] == 2.0
+
+    def test_mongo_listener_ignores_commands_outside_requests(self):
+        """Test that background commands are not attributed to any request."""
+        listener = MongoCommandTimingListener()
+
+        listener.succeeded(Mock(duration_micros=1500))
+
+        assert current_request_context() is None
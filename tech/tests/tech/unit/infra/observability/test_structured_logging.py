@@ -0,0 +1,62 @@
+import io
+import json
+import logging
+from unittest.mock import patch
+
+from tech.infra.observability import structured_logging
+from tech.infra.observability.structured_logging import (
+    JsonFormatter,
+    SamplingFilter,
+    configure_logging,
+    shutdown_logging,
+)
+
+
+class TestStructuredLogging:
+    """Unit tests for the queue-based JSON logging setup."""
+
+    def test_json_formatter_includes_extra_fields(self):
+        """Test that `extra=` fields become top-level JSON keys."""
+        record = logging.makeLogRecord({
+            "name": "tech.test",
+            "levelno": logging.INFO,
+            "levelname": "INFO",
+            "msg": "product %s updated",
+            "args": (7,),
+            "product_id": 7,
+        })
+
+        payload = json.loads(JsonFormatter().format(record))
+
+        assert payload["message"] == "product 7 updated"
+        assert payload["level"] == "INFO"
+        assert payload["logger"] == "tech.test"
+        assert payload["product_id"] == 7
+
+    def test_sampling_filter_only_samples_debug(self):
+        """Test that INFO and above always pass while DEBUG is sampled."""
+        sampling_filter = SamplingFilter(0.0)
+
+        info = logging.makeLogRecord({"levelno": logging.INFO})
+        debug = logging.makeLogRecord({"levelno": logging.DEBUG})
+
+        assert sampling_filter.filter(info) is True
+        assert sampling_filter.filter(debug) is False
+        assert SamplingFilter(1.0).filter(debug) is True
+
+    def test_configure_logging_writes_through_queue(self):
+        """Test that records are written as JSON by the background listener."""
+        stream = io.StringIO()
+        with patch.object(structured_logging.sys, "stdout", stream):
+            configure_logging(level="DEBUG", debug_sample_rate=1.0)
+            configure_logging()  # segunda chamada não duplica handlers
+            try:
+                logging.getLogger("tech.test").info("hello %s", "world", extra={"request": 1})
+            finally:
+                shutdown_logging()
+
+        lines = stream.getvalue().splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])["message"] == "hello world"
+        assert json.loads(lines[0])["request"] == 1
+        assert logging.getLogger("tech").propagate is True
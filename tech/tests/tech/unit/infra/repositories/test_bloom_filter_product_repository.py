@@ -0,0 +1,71 @@
+from unittest.mock import MagicMock
+
+from tech.domain.entities.products import Products
+from tech.infra.catalog.product_id_filter import ProductIdFilter
+from tech.infra.repositories.bloom_filter_product_repository import BloomFilterProductRepository
+
+
+class TestBloomFilterProductRepository:
+    """Unit tests for lookups of unknown product IDs that skip MongoDB."""
+
+    def setup_method(self):
+        self.inner = MagicMock()
+        self.id_filter = ProductIdFilter(refresh_seconds=60)
+        self.id_filter.rebuild(lambda: [1, 2, 5])
+        self.load_ids = MagicMock(return_value=[1, 2, 5])
+        self.repository = BloomFilterProductRepository(self.inner, self.load_ids, self.id_filter)
+        self.product = Products(id=1, name="X-Burger", price=20.0, category="Lanche")
+
+    def test_known_id_is_read_from_the_inner_repository(self):
+        # Arrange
+        self.inner.get_by_id.return_value = self.product
+
+        # Act
+        result = self.repository.get_by_id("1")
+
+        # Assert
+        assert result is self.product
+        self.inner.get_by_id.assert_called_once_with(1)
+        self.load_ids.assert_not_called()
+
+    def test_unknown_and_invalid_ids_skip_the_inner_repository(self):
+        # Act
+        missing = self.repository.get_by_id(3)
+        invalid = self.repository.get_by_id("abc")
+
+        # Assert
+        assert missing is None and invalid is None
+        self.inner.get_by_id.assert_not_called()
+
+    def test_a_miss_is_remembered(self):
+        # Arrange
+        self.inner.get_by_id.return_value = None
+
+        # Act
+        self.repository.get_by_id(99)
+        self.repository.get_by_id(99)
+
+        # Assert
+        self.inner.get_by_id.assert_called_once_with(99)
+
+    def test_get_by_ids_only_asks_for_possible_ids(self):
+        # Arrange
+        self.inner.get_by_ids.return_value = [self.product]
+
+        # Act
+        result = self.repository.get_by_ids([1, 3, "x"])
+
+        # Assert
+        assert result == [self.product]
+        self.inner.get_by_ids.assert_called_once_with([1])
+
+    def test_writes_are_delegated(self):
+        # Act
+        self.repository.add(self.product)
+        self.repository.update(self.product)
+        self.repository.delete(1)
+
+        # Assert
+        self.inner.add.assert_called_once_with(self.product)
+        self.inner.update.assert_called_once_with(self.product)
+        self.inner.delete.assert_called_once_with(1)
@@ -0,0 +1,76 @@
+from unittest.mock import MagicMock
+
+from tech.domain.entities.products import Products
+from tech.infra.cache.stale_while_revalidate import StaleWhileRevalidateCache
+from tech.infra.catalog.catalog_events import ProductChange
+from tech.infra.repositories import cached_product_repository
+from tech.infra.repositories.cached_product_repository import CachedProductRepository, invalidate_product_reads
+
+
+class TestCachedProductRepository:
+    """Unit tests for reads served through the stale-while-revalidate cache."""
+
+    def setup_method(self):
+        self.inner = MagicMock()
+        self.cache = StaleWhileRevalidateCache(ttl=30, max_stale=300)
+        self.repository = CachedProductRepository(self.inner, self.cache)
+        self.product = Products(id=1, name="X-Burger", price=20.0, category="Lanche")
+
+    def test_reads_are_cached_per_key(self):
+        # Arrange
+        self.inner.list_all_products.return_value = [self.product]
+        self.inner.list_by_category.return_value = [self.product]
+        self.inner.get_by_id.return_value = self.product
+
+        # Act
+        for _ in range(2):
+            self.repository.list_all_products()
+            self.repository.list_by_category("Lanche")
+            self.repository.get_by_id("1")
+
+        # Assert
+        self.inner.list_all_products.assert_called_once()
+        self.inner.list_by_category.assert_called_once_with("Lanche")
+        self.inner.get_by_id.assert_called_once_with("1")
+
+    def test_non_numeric_id_bypasses_the_cache(self):
+        # Arrange
+        self.inner.get_by_id.return_value = None
+
+        # Act
+        result = self.repository.get_by_id("abc")
+
+        # Assert
+        assert result is None
+        self.inner.get_by_id.assert_called_once_with("abc")
+
+    def test_writes_are_delegated(self):
+        # Act
+        self.repository.add(self.product)
+        self.repository.update(self.product)
+        self.repository.delete(1)
+
+        # Assert
+        self.inner.add.assert_called_once_with(self.product)
+        self.inner.update.assert_called_once_with(self.product)
+        self.inner.delete.assert_called_once_with(1)
+
+    def test_catalog_change_invalidates_lists_and_the_changed_product(self, monkeypatch):
+        # Arrange
+        monkeypatch.setattr(cached_product_repository, 'product_read_cache', self.cache)
+        other = Products(id=2, name="Coca", price=6.0, category="Bebida")
+        self.inner.list_all_products.return_value = [self.product, other]
+        self.inner.get_by_id.side_effect = lambda product_id: {1: self.product, 2: other}[int(product_id)]
+        self.repository.list_all_products()
+        self.repository.get_by_id(1)
+        self.repository.get_by_id(2)
+
+        # Act
+        invalidate_product_reads([ProductChange.upsert(self.product)])
+        self.repository.list_all_products()
+        self.repository.get_by_id(1)
+        self.repository.get_by_id(2)
+
+        # Assert
+        assert self.inner.list_all_products.call_count == 2
+        assert [call.args[0] for call in self.inner.get_by_id.call_args_list] == [1, 2, 1]
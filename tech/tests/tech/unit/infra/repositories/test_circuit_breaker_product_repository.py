@@ -0,0 +1,105 @@
+from unittest.mock import MagicMock
+
+import pytest
+from pymongo.errors import ServerSelectionTimeoutError
+
+from tech.domain.entities.products import Products
+from tech.infra.catalog.catalog_store import CatalogStore
+from tech.infra.observability.request_context import end_request_context, start_request_context
+from tech.infra.repositories.circuit_breaker_product_repository import (
+    DEGRADED_READ_WARNING,
+    CircuitBreakerProductRepository,
+)
+from tech.infra.resilience.circuit_breaker import CircuitBreaker, CircuitOpenError
+from tech.infra.resilience.request_deadline import bounded_by_deadline, end_deadline, start_deadline
+
+
+class TestCircuitBreakerProductRepository:
+    """Unit tests for the degraded read-only mode."""
+
+    def setup_method(self):
+        self.inner = MagicMock()
+        self.breaker = CircuitBreaker('mongodb', minimum_calls=1, open_seconds=30)
+        self.product = Products(id=1, name="X-Burger", price=20.0, category="Lanche")
+        self.store = CatalogStore()
+        self.shared = MagicMock()
+        self.shared.enabled = False
+        self.repository = CircuitBreakerProductRepository(self.inner, self.breaker, self.store, self.shared)
+
+    def open_circuit(self):
+        self.inner.list_all_products.side_effect = ServerSelectionTimeoutError('down')
+        with pytest.raises(ServerSelectionTimeoutError):
+            self.repository.list_all_products()
+        self.inner.list_all_products.side_effect = None
+
+    def test_reads_pass_through_while_closed(self):
+        # Arrange
+        self.inner.list_by_category.return_value = [self.product]
+
+        # Act
+        result = self.repository.list_by_category("Lanche")
+
+        # Assert
+        assert result == [self.product]
+
+    def test_open_circuit_serves_reads_from_the_snapshot(self):
+        # Arrange
+        self.open_circuit()
+        self.store.replace_all([self.product], source="snapshot")
+
+        # Act
+        context, token = start_request_context()
+        try:
+            everything = self.repository.list_all_products()
+            lanches = self.repository.list_by_category("Lanche")
+            found = self.repository.get_by_id("1")
+        finally:
+            end_request_context(token)
+
+        # Assert
+        assert everything == [self.product]
+        assert lanches == [self.product]
+        assert found == self.product
+        assert context.warnings == [DEGRADED_READ_WARNING]
+        self.inner.list_by_category.assert_not_called()
+
+    def test_open_circuit_without_snapshot_fails_fast(self):
+        # Arrange
+        self.open_circuit()
+
+        # Act / Assert
+        with pytest.raises(CircuitOpenError):
+            self.repository.get_by_id(1)
+        self.inner.get_by_id.assert_not_called()
+
+    def test_writes_fail_fast_while_open(self):
+        # Arrange
+        self.open_circuit()
+        self.store.replace_all([self.product], source="snapshot")
+
+        # Act / Assert
+        with pytest.raises(CircuitOpenError) as exc_info:
+            self.repository.update(self.product)
+        assert exc_info.value.retry_after > 0
+        self.inner.update.assert_not_called()
+
+    def test_mongo_down_inside_a_deadline_serves_the_snapshot(self):
+        # Arrange
+        self.store.replace_all([self.product], source="snapshot")
+        self.inner.list_by_category = bounded_by_deadline(
+            MagicMock(side_effect=ServerSelectionTimeoutError('down'))
+        )
+        deadline = start_deadline(5)
+        context, token = start_request_context()
+
+        # Act
+        try:
+            lanches = self.repository.list_by_category("Lanche")
+        finally:
+            end_request_context(token)
+            end_deadline(deadline)
+
+        # Assert
+        assert lanches == [self.product]
+        assert context.warnings == [DEGRADED_READ_WARNING]
+        assert self.breaker.state == 'open'
@@ -2,7 +2,10 @@
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
+from pymongo.errors import BulkWriteError, DuplicateKeyError, OperationFailure, ServerSelectionTimeoutError
 from tech.domain.entities.products import Products
+from tech.domain.value_objects import PriceAdjustment
+from tech.infra.databases.read_routing import ReadRouting
 from tech.infra.repositories.mongodb_product_repository import MongoDBProductRepository
 
 
@@ -19,8 +22,8 @@ class TestMongoDBProductRepository:
         self.mock_get_collection = self.get_collection_patch.start()
         self.mock_get_collection.return_value = self.mock_collection
 
-        # Create the repository instance
-        self.repository = MongoDBProductRepository()
+        # Create the repository instance, with every query on the mocked collection
+        self.repository = MongoDBProductRepository(routing=ReadRouting(enabled=False))
 
         # Verify get_collection was called with correct collection name
         self.mock_get_collection.assert_called_once_with('products')
@@ -51,6 +54,7 @@ class TestMongoDBProductRepository:
         """Test ID generation when no products exist."""
         # Arrange
         self.mock_collection.find_one.return_value = None
+        self.mock_collection.find_one_and_update.return_value = {"seq": 1}
 
         # Act
         result = self.repository._generate_id()
@@ -60,22 +64,27 @@ class TestMongoDBProductRepository:
         self.mock_collection.find_one.assert_called_once()
 
     def test_generate_id_with_existing_products(self):
-        """Test ID generation when products exist."""
+        """Test that ID generation reserves one ID from the shared counter."""
         # Arrange
         highest_id_product = {"product_id": 5}
         self.mock_collection.find_one.return_value = highest_id_product
+        self.mock_collection.find_one_and_update.return_value = {"seq": 6}
 
         # Act
         result = self.repository._generate_id()
 
         # Assert
         assert result == 6
-        self.mock_collection.find_one.assert_called_once()
+        query, pipeline = self.mock_collection.find_one_and_update.call_args.args
+        assert query == {"_id": "product_id"}
+        assert pipeline[0]["$set"]["seq"]["$add"][1] == 1
+        assert pipeline[0]["$set"]["seq"]["$add"][0]["$max"][1] == 5
 
     def test_add_new_product(self):
         """Test adding a new product."""
         # Arrange
         self.mock_collection.find_one.return_value = None  # No existing product with same ID
+        self.mock_collection.find_one_and_update.return_value = {"seq": 1}
         self.mock_collection.insert_one.return_value = Mock()
 
         # Act
@@ -100,6 +109,19 @@ class TestMongoDBProductRepository:
         assert result.price == 10.99
         assert result.category == "test_category"
 
+    def test_add_reports_a_concurrent_duplicate_as_value_error(self):
+        """Test that a name taken by a concurrent insert is reported as an existing product."""
+        # Arrange
+        self.mock_collection.find_one.return_value = None
+        self.mock_collection.find_one_and_update.return_value = {"seq": 1}
+        self.mock_collection.insert_one.side_effect = DuplicateKeyError("E11000 duplicate key error")
+
+        # Act / Assert
+        with patch("tech.infra.repositories.mongodb_product_repository.catalog_events") as mock_events:
+            with pytest.raises(ValueError, match="already exists"):
+                self.repository.add(self.test_product)
+        mock_events.publish.assert_not_called()
+
     def test_get_by_id_found(self):
         """Test retrieving a product by ID when found."""
         # Arrange
@@ -160,17 +182,24 @@ class TestMongoDBProductRepository:
         self.mock_collection.find_one.assert_called_once_with({"product_id": expected_int_id})
         assert result.id == expected_int_id
 
-    def test_get_by_id_exception_handling(self):
-        """Test exception handling in get_by_id."""
+    def test_get_by_id_propagates_database_errors(self):
+        """Test that a database failure is not reported as a missing product."""
         # Arrange
         product_id = 1
-        self.mock_collection.find_one.side_effect = Exception("Database error")
+        self.mock_collection.find_one.side_effect = ServerSelectionTimeoutError("Database error")
+
+        # Act / Assert
+        with pytest.raises(ServerSelectionTimeoutError):
+            self.repository.get_by_id(product_id)
 
+    def test_get_by_id_with_invalid_id(self):
+        """Test that a non-numeric ID is simply not found."""
         # Act
-        result = self.repository.get_by_id(product_id)
+        result = self.repository.get_by_id("abc")
 
         # Assert
         assert result is None
+        self.mock_collection.find_one.assert_not_called()
 
     def test_get_by_name_found(self):
         """Test retrieving a product by name when found."""
@@ -233,7 +262,7 @@ class TestMongoDBProductRepository:
         result = self.repository.list_all_products()
 
         # Assert
-        self.mock_collection.find.assert_called_once_with({})
+        self.mock_collection.find.assert_called_once_with({}, session=None)
         assert len(result) == 2
         assert all(isinstance(p, Products) for p in result)
         assert result[0].id == 1
@@ -252,7 +281,7 @@ class TestMongoDBProductRepository:
         result = self.repository.list_all_products()
 
         # Assert
-        self.mock_collection.find.assert_called_once_with({})
+        self.mock_collection.find.assert_called_once_with({}, session=None)
         assert len(result) == 0
         assert isinstance(result, list)
 
@@ -332,7 +361,7 @@ class TestMongoDBProductRepository:
         result = self.repository.list_by_category(category)
 
         # Assert
-        self.mock_collection.find.assert_called_once_with({"category": category})
+        self.mock_collection.find.assert_called_once_with({"category": category}, session=None)
         assert len(result) == 2
         assert all(p.category == category for p in result)
 
@@ -348,7 +377,7 @@ class TestMongoDBProductRepository:
         result = self.repository.list_by_category(category)
 
         # Assert
-        self.mock_collection.find.assert_called_once_with({"category": category})
+        self.mock_collection.find.assert_called_once_with({"category": category}, session=None)
         assert len(result) == 0
 
     def test_update_product(self):
@@ -428,8 +457,8 @@ class TestMongoDBProductRepository:
         call_args = self.mock_collection.update_one.call_args
         assert call_args[0][0] == {"product_id": expected_int_id}
 
-    def test_update_product_exception_handling(self):
-        """Test exception handling in update."""
+    def test_update_product_propagates_database_errors(self):
+        """Test that a failed update is not reported as a successful one."""
         # Arrange
         product_id = 1
         updated_product = Products(
@@ -440,13 +469,11 @@ class TestMongoDBProductRepository:
         )
 
         # Mock an exception during update
-        self.mock_collection.update_one.side_effect = Exception("Database error")
+        self.mock_collection.update_one.side_effect = ServerSelectionTimeoutError("Database error")
 
-        # Act
-        result = self.repository.update(updated_product)
-
-        # Assert
-        assert result == updated_product  # Returns original product on error
+        # Act / Assert
+        with pytest.raises(ServerSelectionTimeoutError):
+            self.repository.update(updated_product)
 
     def test_delete_product(self):
         """Test deleting a product successfully."""
@@ -458,7 +485,7 @@ class TestMongoDBProductRepository:
         result = self.repository.delete(product_id)
 
         # Assert
-        self.mock_collection.delete_one.assert_called_once_with({"product_id": product_id})
+        self.mock_collection.delete_one.assert_called_once_with({"product_id": product_id}, session=None)
         assert result is True
 
     def test_delete_product_with_string_id(self):
@@ -472,7 +499,7 @@ class TestMongoDBProductRepository:
         result = self.repository.delete(product_id)
 
         # Assert
-        self.mock_collection.delete_one.assert_called_once_with({"product_id": expected_int_id})
+        self.mock_collection.delete_one.assert_called_once_with({"product_id": expected_int_id}, session=None)
         assert result is True
 
     def test_delete_product_not_found(self):
@@ -485,7 +512,7 @@ class TestMongoDBProductRepository:
         result = self.repository.delete(product_id)
 
         # Assert
-        self.mock_collection.delete_one.assert_called_once_with({"product_id": product_id})
+        self.mock_collection.delete_one.assert_called_once_with({"product_id": product_id}, session=None)
         assert result is False
 
     def test_delete_product_exception_handling(self):
@@ -561,4 +588,285 @@ class TestMongoDBProductRepository:
         assert call_args[0][0] == {"product_id": {"$in": [1, 3]}}
 
         assert len(result) == 2
-        assert [p.id for p in result] == [1, 3]
\ No newline at end of file
+        assert [p.id for p in result] == [1, 3]
+    def test_ensure_indexes(self):
+        """Test that the query indexes are created."""
+        # Act
+        self.repository.ensure_indexes()
+
+        # Assert
+        created = [call.args[0] for call in self.mock_collection.create_index.call_args_list]
+        assert created == [
+            "product_id", "category", "name", [("updated_at", 1), ("product_id", 1)],
+            "product_id", "deleted_at"
+        ]
+        unique = [call.args[0] for call in self.mock_collection.create_index.call_args_list
+                  if call.kwargs.get("unique")]
+        assert unique == ["product_id", "name", "product_id"]
+        self.mock_get_collection.assert_called_with('product_tombstones')
+        assert self.mock_collection.create_index.call_args.kwargs["expireAfterSeconds"] > 0
+
+    def test_ensure_indexes_replaces_a_non_unique_index(self):
+        """Test that an index left by earlier versions is rebuilt as unique."""
+        # Arrange
+        conflict = OperationFailure("Index already exists with different options", code=86)
+        self.mock_collection.create_index.side_effect = [conflict, None, None, None, None, None, None]
+
+        # Act
+        self.repository.ensure_indexes()
+
+        # Assert
+        self.mock_collection.drop_index.assert_called_once_with("product_id_1")
+        assert self.mock_collection.create_index.call_args_list[1].args[0] == "product_id"
+        assert self.mock_collection.create_index.call_args_list[1].kwargs == {"unique": True}
+
+    @patch('tech.infra.repositories.mongodb_product_repository.catalog_events')
+    def test_writes_publish_catalog_changes(self, mock_events):
+        """Test that add and delete notify the in-memory catalog views."""
+        # Arrange
+        self.mock_collection.find_one.return_value = None
+        self.mock_collection.find_one_and_update.return_value = {"seq": 1}
+        self.mock_collection.delete_one.return_value = Mock(deleted_count=1)
+
+        # Act
+        created = self.repository.add(self.test_product)
+        self.repository.delete(created.id)
+
+        # Assert
+        published = [call.args[0][0] for call in mock_events.publish.call_args_list]
+        assert [(change.kind, change.product_id) for change in published] == [
+            ("upsert", created.id), ("delete", created.id)
+        ]
+
+    @patch('tech.infra.repositories.mongodb_product_repository.catalog_events')
+    def test_failed_delete_publishes_nothing(self, mock_events):
+        """Test that nothing is published when no document was removed."""
+        # Arrange
+        self.mock_collection.delete_one.return_value = Mock(deleted_count=0)
+
+        # Act
+        self.repository.delete(1)
+
+        # Assert
+        mock_events.publish.assert_not_called()
+
+    def test_delete_leaves_tombstone(self):
+        """Test that a successful delete records a tombstone for the change feed."""
+        # Arrange
+        self.mock_collection.delete_one.return_value = Mock(deleted_count=1)
+
+        # Act
+        self.repository.delete(7)
+
+        # Assert
+        self.mock_get_collection.assert_called_with('product_tombstones')
+        query, update = self.mock_collection.update_one.call_args.args
+        assert query == {"product_id": 7}
+        assert isinstance(update["$set"]["deleted_at"], datetime)
+        assert self.mock_collection.update_one.call_args.kwargs == {"upsert": True, "session": None}
+
+    def test_list_changes_since_merges_upserts_and_tombstones(self):
+        """Test that the change feed merges both sources in (timestamp, id) order."""
+        # Arrange
+        products_cursor = MagicMock()
+        products_cursor.sort.return_value.limit.return_value = [
+            {"product_id": 2, "name": "B", "price": 2.0, "category": "Lanche", "updated_at": datetime(2024, 1, 3)},
+            {"product_id": 1, "name": "A", "price": 1.0, "category": "Lanche", "updated_at": datetime(2024, 1, 5)},
+        ]
+        tombstones_cursor = MagicMock()
+        tombstones_cursor.sort.return_value.limit.return_value = [
+            {"product_id": 9, "deleted_at": datetime(2024, 1, 4)},
+        ]
+        self.mock_collection.find.side_effect = [products_cursor, tombstones_cursor]
+        since = (datetime(2024, 1, 2), 5)
+
+        # Act
+        changes = self.repository.list_changes_since(since, datetime(2024, 2, 1), limit=2)
+
+        # Assert
+        assert [(c.kind, c.product_id) for c in changes] == [("upsert", 2), ("delete", 9)]
+        products_query = self.mock_collection.find.call_args_list[0].args[0]
+        assert products_query == {"$or": [
+            {"updated_at": {"$gt": datetime(2024, 1, 2), "$lte": datetime(2024, 2, 1)}},
+            {"updated_at": datetime(2024, 1, 2), "product_id": {"$gt": 5}},
+        ]}
+        products_cursor.sort.return_value.limit.assert_called_once_with(2)
+
+    def test_bulk_upsert_allocates_a_block_and_writes_once(self):
+        """Test that a batch costs one lookup, one ID reservation and one bulk_write."""
+        # Arrange
+        created_at = datetime(2024, 1, 1)
+        self.mock_collection.find.return_value = [
+            {"name": "Coca", "product_id": 4, "created_at": created_at},
+        ]
+        self.mock_collection.find_one.return_value = {"product_id": 9}
+        self.mock_collection.find_one_and_update.return_value = {"seq": 11}
+        self.mock_collection.bulk_write.return_value = Mock(upserted_ids={0: "a", 2: "b"})
+        batch = [
+            Products(name="X-Burger", price=20.0, category="Lanche"),
+            Products(name="Coca", price=6.0, category="Bebida"),
+            Products(name="Batata", price=9.0, category="Acompanhamento"),
+        ]
+
+        # Act
+        with patch("tech.infra.repositories.mongodb_product_repository.catalog_events") as mock_events:
+            results = self.repository.bulk_upsert(batch)
+
+        # Assert
+        assert [(r.status, r.product.id) for r in results] == [("created", 10), ("updated", 4), ("created", 11)]
+        assert results[1].product.created_at == created_at
+        operations = self.mock_collection.bulk_write.call_args.args[0]
+        assert self.mock_collection.bulk_write.call_args.kwargs == {"ordered": False, "session": None}
+        assert [op._filter for op in operations] == [{"name": "X-Burger"}, {"name": "Coca"}, {"name": "Batata"}]
+        assert operations[0]._doc["$setOnInsert"]["product_id"] == 10
+        mock_events.publish.assert_called_once()
+        assert [c.action for c in mock_events.publish.call_args.args[0]] == ["create", "update", "create"]
+
+    def test_bulk_upsert_reports_failed_items(self):
+        """Test that write errors fail only their own items."""
+        # Arrange
+        self.mock_collection.find.return_value = []
+        self.mock_collection.find_one.return_value = None
+        self.mock_collection.find_one_and_update.return_value = {"seq": 2}
+        self.mock_collection.bulk_write.side_effect = BulkWriteError({
+            "writeErrors": [{"index": 1, "errmsg": "document too large"}],
+            "upserted": [{"index": 0, "_id": "a"}],
+        })
+        batch = [
+            Products(name="A", price=1.0, category="Lanche"),
+            Products(name="B", price=2.0, category="Lanche"),
+        ]
+
+        # Act
+        with patch("tech.infra.repositories.mongodb_product_repository.catalog_events"):
+            results = self.repository.bulk_upsert(batch)
+
+        # Assert
+        assert [r.status for r in results] == ["created", "error"]
+        assert results[1].error == "document too large"
+
+    def test_bulk_upsert_retries_items_that_lost_an_insert_race(self):
+        """Test that a duplicate key on the unique name index is retried as an update."""
+        # Arrange
+        created_at = datetime(2024, 1, 1)
+        self.mock_collection.find.side_effect = [
+            [],
+            [{"name": "B", "product_id": 7, "created_at": created_at}],
+        ]
+        self.mock_collection.find_one.return_value = None
+        self.mock_collection.find_one_and_update.return_value = {"seq": 2}
+        self.mock_collection.bulk_write.side_effect = [
+            BulkWriteError({
+                "writeErrors": [{"index": 1, "code": 11000, "errmsg": "E11000 duplicate key error"}],
+                "upserted": [{"index": 0, "_id": "a"}],
+            }),
+            Mock(upserted_ids={}),
+        ]
+        batch = [
+            Products(name="A", price=1.0, category="Lanche"),
+            Products(name="B", price=2.0, category="Lanche"),
+        ]
+
+        # Act
+        with patch("tech.infra.repositories.mongodb_product_repository.catalog_events"):
+            results = self.repository.bulk_upsert(batch)
+
+        # Assert
+        assert [(r.status, r.product.id) for r in results] == [("created", 1), ("updated", 7)]
+        assert results[1].product.created_at == created_at
+        retried = self.mock_collection.bulk_write.call_args_list[1].args[0]
+        assert [op._filter for op in retried] == [{"name": "B"}]
+
+    def test_scan_product_id_range_yields_row_batches(self):
+        """Test that a range scan filters by product_id and batches plain tuples."""
+        # Arrange
+        documents = [
+            {'product_id': i, 'name': f'P{i}', 'price': 1.0, 'category': 'Lanche'} for i in (3, 4, 5)
+        ]
+        cursor = MagicMock()
+        cursor.__enter__.return_value = cursor
+        cursor.__iter__.return_value = iter(documents)
+        self.mock_collection.find.return_value.sort.return_value = cursor
+
+        # Act
+        batches = list(self.repository.scan_product_id_range(3, 6, batch_size=2))
+
+        # Assert
+        assert self.mock_collection.find.call_args.args[0] == {'product_id': {'$gte': 3, '$lt': 6}}
+        assert [len(batch) for batch in batches] == [2, 1]
+        assert batches[1][0] == (5, 'P5', 1.0, 'Lanche', None, None)
+        cursor.__exit__.assert_called_once()
+
+    def test_list_product_ids_reads_only_the_id_index(self):
+        """Test that listing IDs is a covered query hinted to the product_id index."""
+        # Arrange
+        cursor = MagicMock()
+        cursor.__enter__.return_value = cursor
+        cursor.__iter__.return_value = iter([{'product_id': 1}, {'product_id': 7}])
+        self.mock_collection.find.return_value.sort.return_value.hint.return_value = cursor
+
+        # Act
+        ids = list(self.repository.list_product_ids())
+
+        # Assert
+        assert ids == [1, 7]
+        assert self.mock_collection.find.call_args.args[1] == {'_id': 0, 'product_id': 1}
+        self.mock_collection.find.return_value.sort.return_value.hint.assert_called_once_with('product_id_1')
+
+    def test_adjust_prices_uses_one_update_many_and_publishes_once(self):
+        """Test that a category price change is computed and rounded by the server."""
+        # Arrange
+        self.mock_collection.update_many.return_value = Mock(modified_count=2)
+        self.mock_collection.find.return_value.sort.return_value = [
+            {"product_id": 1, "name": "Coca", "price": 6.3, "category": "Bebida"},
+            {"product_id": 2, "name": "Suco", "price": 8.4, "category": "Bebida"},
+        ]
+
+        # Act
+        with patch("tech.infra.repositories.mongodb_product_repository.catalog_events") as mock_events:
+            products = self.repository.adjust_prices(PriceAdjustment(percent=5, category="Bebida"))
+
+        # Assert
+        query, pipeline = self.mock_collection.update_many.call_args.args
+        assert query == {"category": "Bebida"}
+        assert pipeline[0]["$set"]["price"] == {"$max": [0, {"$round": [{"$multiply": ["$price", 1.05]}, 2]}]}
+        now = pipeline[0]["$set"]["updated_at"]
+        assert self.mock_collection.find.call_args.args[0] == {"category": "Bebida", "updated_at": now}
+        assert [p.price for p in products] == [6.3, 8.4]
+        mock_events.publish.assert_called_once()
+        assert len(mock_events.publish.call_args.args[0]) == 2
+
+    def test_adjust_prices_by_ids_with_an_amount(self):
+        """Test that an absolute change targets the given IDs and skips the read-back when nothing changed."""
+        # Arrange
+        self.mock_collection.update_many.return_value = Mock(modified_count=0)
+
+        # Act
+        with patch("tech.infra.repositories.mongodb_product_repository.catalog_events") as mock_events:
+            products = self.repository.adjust_prices(PriceAdjustment(amount=-1.5, product_ids=[2, 1]))
+
+        # Assert
+        query, pipeline = self.mock_collection.update_many.call_args.args
+        assert query == {"product_id": {"$in": [1, 2]}}
+        assert pipeline[0]["$set"]["price"]["$max"][1]["$round"][0] == {"$add": ["$price", -1.5]}
+        assert products == []
+        self.mock_collection.find.assert_not_called()
+        mock_events.publish.assert_not_called()
+
+    def test_category_stats_runs_one_group_by_pipeline(self):
+        """Test that statistics come from a single aggregation grouped by category."""
+        # Arrange
+        self.mock_collection.aggregate.return_value = [
+            {"_id": "Bebida", "count": 2, "min_price": 5.0, "avg_price": 6.25, "max_price": 7.5},
+        ]
+
+        # Act
+        stats = self.repository.category_stats()
+
+        # Assert
+        self.mock_collection.aggregate.assert_called_once()
+        pipeline = self.mock_collection.aggregate.call_args.args[0]
+        assert pipeline[1]["$group"]["_id"] == "$category"
+        assert [entry.dict() for entry in stats] == [
+            {"category": "Bebida", "count": 2, "min_price": 5.0, "avg_price": 6.25, "max_price": 7.5}
+        ]
@@ -0,0 +1,63 @@
+from unittest.mock import MagicMock
+
+from tech.domain.entities.products import Products
+from tech.infra.repositories.shared_snapshot_product_repository import SharedSnapshotProductRepository
+
+
+class TestSharedSnapshotProductRepository:
+    """Unit tests for reads served from the shared catalog snapshot."""
+
+    def setup_method(self):
+        self.inner = MagicMock()
+        self.catalog = MagicMock()
+        self.reader = MagicMock()
+        self.catalog.reader.return_value = self.reader
+        self.repository = SharedSnapshotProductRepository(self.inner, self.catalog)
+        self.product = Products(id=1, name="X-Burger", price=20.0, category="Lanche")
+
+    def test_get_by_id_served_from_snapshot(self):
+        # Arrange
+        self.reader.get_by_id.return_value = self.product
+
+        # Act
+        result = self.repository.get_by_id("1")
+
+        # Assert
+        assert result is self.product
+        self.reader.get_by_id.assert_called_once_with(1)
+        self.inner.get_by_id.assert_not_called()
+
+    def test_get_by_id_falls_back_on_snapshot_miss(self):
+        # Arrange
+        self.reader.get_by_id.return_value = None
+        self.inner.get_by_id.return_value = self.product
+
+        # Act
+        result = self.repository.get_by_id(1)
+
+        # Assert
+        assert result is self.product
+        self.inner.get_by_id.assert_called_once_with(1)
+
+    def test_list_by_category_falls_back_without_snapshot(self):
+        # Arrange
+        self.catalog.reader.return_value = None
+        self.inner.list_by_category.return_value = [self.product]
+
+        # Act
+        result = self.repository.list_by_category("Lanche")
+
+        # Assert
+        assert result == [self.product]
+        self.inner.list_by_category.assert_called_once_with("Lanche")
+
+    def test_writes_are_delegated(self):
+        # Act
+        self.repository.add(self.product)
+        self.repository.update(self.product)
+        self.repository.delete(1)
+
+        # Assert
+        self.inner.add.assert_called_once_with(self.product)
+        self.inner.update.assert_called_once_with(self.product)
+        self.inner.delete.assert_called_once_with(1)
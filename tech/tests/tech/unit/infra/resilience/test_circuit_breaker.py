@@ -0,0 +1,124 @@
+import pytest
+from pymongo.errors import DuplicateKeyError, ServerSelectionTimeoutError
+
+from tech.infra.resilience.circuit_breaker import CLOSED, OPEN, CircuitBreaker, CircuitOpenError
+
+
+class TestCircuitBreaker:
+    """Unit tests for the MongoDB circuit breaker."""
+
+    def setup_method(self):
+        self.now = 0.0
+        self.breaker = CircuitBreaker(
+            'mongodb', window_seconds=10, minimum_calls=4, failure_rate=0.5,
+            slow_call_seconds=1, slow_call_rate=0.5, open_seconds=5, clock=lambda: self.now
+        )
+
+    def fail(self):
+        raise ServerSelectionTimeoutError('down')
+
+    def record_failures(self, count):
+        for _ in range(count):
+            with pytest.raises(ServerSelectionTimeoutError):
+                self.breaker.call(self.fail)
+
+    def test_opens_on_failure_rate(self):
+        # Arrange
+        self.breaker.call(lambda: 'ok')
+        self.breaker.call(lambda: 'ok')
+
+        # Act
+        self.record_failures(2)
+
+        # Assert
+        assert self.breaker.state == OPEN
+        with pytest.raises(CircuitOpenError) as exc_info:
+            self.breaker.call(lambda: 'ok')
+        assert exc_info.value.retry_after == 5
+
+    def test_stays_closed_below_minimum_calls(self):
+        # Act
+        self.record_failures(3)
+
+        # Assert
+        assert self.breaker.state == CLOSED
+
+    def test_opens_on_slow_calls(self):
+        # Arrange
+        def slow():
+            self.now += 2
+            return 'ok'
+
+        # Act
+        for _ in range(4):
+            self.breaker.call(slow)
+
+        # Assert
+        assert self.breaker.state == OPEN
+
+    def test_data_errors_do_not_count_as_failures(self):
+        # Arrange
+        def duplicate():
+            raise DuplicateKeyError('dup')
+
+        # Act
+        for _ in range(4):
+            with pytest.raises(DuplicateKeyError):
+                self.breaker.call(duplicate)
+
+        # Assert
+        assert self.breaker.state == CLOSED
+
+    def test_old_outcomes_leave_the_window(self):
+        # Arrange
+        self.record_failures(3)
+        self.now += 11
+
+        # Act
+        self.breaker.call(lambda: 'ok')
+
+        # Assert
+        assert self.breaker.state == CLOSED
+
+    def test_half_open_trial_success_closes(self):
+        # Arrange
+        self.record_failures(4)
+        self.now += 5
+
+        # Act
+        result = self.breaker.call(lambda: 'ok')
+
+        # Assert
+        assert result == 'ok'
+        assert self.breaker.state == CLOSED
+
+    def test_half_open_trial_failure_reopens(self):
+        # Arrange
+        self.record_failures(4)
+        self.now += 5
+
+        # Act
+        self.record_failures(1)
+
+        # Assert
+        assert self.breaker.state == OPEN
+        assert self.breaker.retry_after() == 5
+
+    def test_only_one_trial_while_half_open(self):
+        # Arrange
+        self.record_failures(4)
+        self.now += 5
+        rejected = []
+
+        def trial():
+            with pytest.raises(CircuitOpenError):
+                self.breaker.call(lambda: 'ok')
+            rejected.append(True)
+            return 'ok'
+
+        # Act
+        self.breaker.call(trial)
+
+        # Assert
+        assert rejected == [True]
+        assert self.breaker.state == CLOSED
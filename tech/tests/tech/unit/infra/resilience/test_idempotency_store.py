@@ -0,0 +1,103 @@
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+from tech.infra.resilience.idempotency_store import DONE, PENDING, IdempotencyStore
+
+
+class TestIdempotencyStore:
+    """Unit tests for the MongoDB-backed idempotency store."""
+
+    def setup_method(self):
+        self.now = 0.0
+        self.store = IdempotencyStore(ttl=3600, pending_timeout=60, front_cache_size=2, clock=lambda: self.now)
+        self.collection = Mock()
+        self.store._collection = self.collection
+
+    def test_first_claim_owns_the_key_in_one_round_trip(self):
+        # Arrange
+        self.collection.find_one_and_update.return_value = None
+
+        # Act
+        record = self.store.claim('k', 'f1', 'o1')
+
+        # Assert
+        assert record is None
+        query, update = self.collection.find_one_and_update.call_args.args
+        assert query == {'_id': 'k'}
+        assert update['$setOnInsert']['state'] == PENDING
+        assert update['$setOnInsert']['owner'] == 'o1'
+        assert self.collection.find_one_and_update.call_args.kwargs['upsert'] is True
+
+    def test_completed_response_is_served_from_the_front_cache(self):
+        # Arrange
+        self.collection.update_one.return_value = Mock(modified_count=1)
+
+        # Act
+        self.store.complete('k', 'f1', 'o1', 201, [('content-type', 'application/json')], b'{}')
+        record = self.store.claim('k', 'f1', 'o1')
+
+        # Assert
+        assert (record.state, record.status, record.body) == (DONE, 201, b'{}')
+        self.collection.find_one_and_update.assert_not_called()
+
+    def test_front_cache_is_bounded_and_expires(self):
+        self.collection.update_one.return_value = Mock(modified_count=1)
+        for key in ('a', 'b', 'c'):
+            self.store.complete(key, 'f', 'o', 200, [], b'')
+
+        assert self.store.cached('a') is None
+        assert self.store.cached('c') is not None
+        self.now = 3601
+        assert self.store.cached('c') is None
+
+    def test_stored_response_from_another_instance_is_returned(self):
+        # Arrange
+        self.collection.find_one_and_update.return_value = {
+            '_id': 'k', 'fingerprint': 'f1', 'state': DONE, 'status': 200,
+            'headers': [['content-type', 'application/json']], 'body': b'[]', 'created_at': datetime.utcnow(),
+        }
+
+        # Act
+        record = self.store.claim('k', 'f1', 'o1')
+
+        # Assert
+        assert record.headers == [('content-type', 'application/json')]
+        assert self.store.cached('k') is record
+
+    def test_abandoned_pending_key_is_taken_over(self):
+        # Arrange
+        started = datetime.utcnow() - timedelta(minutes=5)
+        self.collection.find_one_and_update.return_value = {
+            '_id': 'k', 'fingerprint': 'f1', 'state': PENDING, 'created_at': started,
+        }
+        self.collection.update_one.return_value = Mock(modified_count=1)
+
+        # Act
+        record = self.store.claim('k', 'f1', 'o1')
+
+        # Assert
+        assert record is None
+        assert self.collection.update_one.call_args.args[0] == {'_id': 'k', 'state': PENDING, 'created_at': started}
+
+    def test_release_deletes_only_the_owners_pending_key(self):
+        self.store.release('k', 'o1')
+
+        self.collection.delete_one.assert_called_once_with({'_id': 'k', 'state': PENDING, 'owner': 'o1'})
+
+    def test_taken_over_key_is_not_completed_by_its_former_owner(self):
+        # Arrange
+        started = datetime.utcnow() - timedelta(minutes=5)
+        self.collection.find_one_and_update.return_value = {
+            '_id': 'k', 'fingerprint': 'f1', 'owner': 'o1', 'state': PENDING, 'created_at': started,
+        }
+        self.collection.update_one.side_effect = [Mock(modified_count=1), Mock(modified_count=0)]
+        self.store.claim('k', 'f1', 'o2')
+
+        # Act
+        self.store.complete('k', 'f1', 'o1', 201, [], b'{}')
+
+        # Assert
+        takeover, completion = self.collection.update_one.call_args_list
+        assert takeover.args[1]['$set']['owner'] == 'o2'
+        assert completion.args[0] == {'_id': 'k', 'state': PENDING, 'owner': 'o1'}
+        assert self.store.cached('k') is None
@@ -0,0 +1,79 @@
+import time
+
+import pytest
+from pymongo.errors import ExecutionTimeout, OperationFailure, ServerSelectionTimeoutError
+
+from tech.infra.resilience import request_deadline
+from tech.infra.resilience.request_deadline import (
+    DeadlineExceeded,
+    bounded_by_deadline,
+    end_deadline,
+    remaining,
+    start_deadline,
+)
+
+
+@bounded_by_deadline
+def mongo_operation(error=None):
+    if error is not None:
+        raise error
+    return remaining()
+
+
+class TestRequestDeadline:
+    """Unit tests for deadline-bounded MongoDB operations."""
+
+    def test_no_deadline_outside_a_request(self):
+        # Act / Assert
+        assert remaining() is None
+        assert mongo_operation() is None
+
+    def test_operation_runs_within_the_remaining_budget(self):
+        # Arrange
+        token = start_deadline(5)
+        try:
+            # Act
+            left = mongo_operation()
+        finally:
+            end_deadline(token)
+
+        # Assert
+        assert 0 < left <= 5
+
+    def test_expired_budget_skips_the_operation(self):
+        # Arrange
+        token = start_deadline(0)
+        try:
+            # Act / Assert
+            with pytest.raises(DeadlineExceeded):
+                mongo_operation(OperationFailure("must not run"))
+        finally:
+            end_deadline(token)
+
+    def test_timeout_after_the_budget_is_spent_becomes_deadline_exceeded(self, monkeypatch):
+        # Arrange
+        token = start_deadline(5)
+        later = time.monotonic() + 10
+
+        def spend_budget_then_time_out():
+            monkeypatch.setattr(request_deadline.time, 'monotonic', lambda: later)
+            raise ExecutionTimeout("operation exceeded time limit", 50)
+
+        try:
+            # Act / Assert
+            with pytest.raises(DeadlineExceeded):
+                bounded_by_deadline(spend_budget_then_time_out)()
+        finally:
+            end_deadline(token)
+
+    def test_timeouts_with_budget_left_and_other_errors_propagate(self):
+        # Arrange
+        token = start_deadline(5)
+        try:
+            # Act / Assert
+            with pytest.raises(ServerSelectionTimeoutError):
+                mongo_operation(ServerSelectionTimeoutError("mongodb down"))
+            with pytest.raises(OperationFailure):
+                mongo_operation(OperationFailure("duplicate key", 11000))
+        finally:
+            end_deadline(token)
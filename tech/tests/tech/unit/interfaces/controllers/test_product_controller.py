@@ -1,5 +1,8 @@
 # tests/unit/interfaces/controllers/test_product_controller.py
 import pytest
+from datetime import datetime
+import threading
+import time
 from unittest.mock import Mock, patch
 from fastapi import HTTPException
 from tech.interfaces.controllers.product_controller import ProductController
@@ -10,6 +13,16 @@ from tech.use_cases.products.update_product_use_case import UpdateProductUseCase
 from tech.use_cases.products.delete_product_use_case import DeleteProductUseCase
 from tech.interfaces.schemas.product_schema import ProductSchema
 from tech.domain.entities.products import Products
+from tech.domain.value_objects import BulkUpsertResult
+from tech.infra.catalog.catalog_events import ProductChange
+from pymongo import _csot
+from tech.infra.concurrency.single_flight import SingleFlight
+from tech.infra.resilience.request_deadline import REQUEST_DEADLINE_SECONDS, bounded_by_deadline
+from tech.use_cases.products.list_product_changes_use_case import (
+    ChangesTokenExpired,
+    InvalidChangesToken,
+    ProductChangesPage,
+)
 
 
 class TestProductController:
@@ -146,6 +159,113 @@ class TestProductController:
         assert "No products found" in exc_info.value.detail
         self.list_all_products_use_case.execute.assert_called_once()
 
+    def test_coalesced_repository_call_runs_with_a_mongodb_time_limit(self):
+        # Arrange
+        seen = []
+
+        @bounded_by_deadline
+        def execute():
+            seen.append(_csot.get_timeout())
+            return [self.mock_product]
+
+        self.list_all_products_use_case.execute.side_effect = execute
+        self.controller.single_flight = SingleFlight()
+
+        # Act
+        self.controller.list_all_products()
+
+        # Assert
+        assert seen[0] is not None and 0 < seen[0] <= REQUEST_DEADLINE_SECONDS
+
+    def test_concurrent_list_all_products_share_one_query(self):
+        # Arrange
+        release = threading.Event()
+        self.controller.single_flight = SingleFlight()
+
+        def execute():
+            release.wait(5)
+            return [self.mock_product]
+
+        self.list_all_products_use_case.execute.side_effect = execute
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(self.controller.list_all_products()))
+                   for _ in range(5)]
+
+        # Act
+        for thread in threads:
+            thread.start()
+        while not self.controller.single_flight._calls:
+            pass
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        # Assert
+        self.list_all_products_use_case.execute.assert_called_once()
+        assert len(results) == 5
+        assert all(result is results[0] for result in results)
+
+    def test_get_product_success(self):
+        # Arrange
+        self.controller.get_product_use_case = Mock()
+        self.controller.get_product_use_case.execute.return_value = self.mock_product
+        self.controller.single_flight = SingleFlight()
+
+        # Act
+        result = self.controller.get_product(1)
+
+        # Assert
+        self.controller.get_product_use_case.execute.assert_called_once_with(1)
+        assert result == self.mock_product.dict.return_value
+
+    def test_get_product_not_found(self):
+        # Arrange
+        self.controller.get_product_use_case = Mock()
+        self.controller.get_product_use_case.execute.side_effect = ValueError("Product not found")
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            self.controller.get_product(99)
+        assert exc_info.value.status_code == 404
+
+    def test_bulk_upsert_products_serializes_results_and_totals(self):
+        # Arrange
+        self.controller.bulk_upsert_products_use_case = Mock()
+        self.controller.bulk_upsert_products_use_case.execute.return_value = [
+            BulkUpsertResult(0, 'created', self.mock_product),
+            BulkUpsertResult(1, 'error', error="Duplicate name in batch: Test Product"),
+        ]
+
+        # Act
+        result = self.controller.bulk_upsert_products([])
+
+        # Assert
+        assert result["results"][0] == {"index": 0, "status": "created", "product": self.mock_product.dict.return_value}
+        assert result["results"][1]["error"].startswith("Duplicate name")
+        assert (result["created"], result["updated"], result["failed"]) == (1, 0, 1)
+
+    def test_adjust_prices_maps_invalid_adjustment_to_400(self):
+        # Arrange
+        self.controller.adjust_prices_use_case = Mock()
+        self.controller.adjust_prices_use_case.execute.side_effect = ValueError("Give exactly one of percent or amount")
+
+        # Act / Assert
+        with pytest.raises(HTTPException) as exc_info:
+            self.controller.adjust_prices(Mock())
+        assert exc_info.value.status_code == 400
+
+    def test_adjust_prices_returns_count_and_products(self):
+        # Arrange
+        self.controller.adjust_prices_use_case = Mock()
+        self.controller.adjust_prices_use_case.execute.return_value = [self.mock_product]
+
+        # Act
+        result = self.controller.adjust_prices(Mock())
+
+        # Assert
+        assert result == {"updated": 1, "products": [self.mock_product.dict.return_value]}
+
     def test_update_product_success(self):
         # Arrange
         updated_mock_product = Mock(spec=Products)
@@ -218,4 +338,111 @@ class TestProductController:
         # Verify
         assert exc_info.value.status_code == 404
         assert exc_info.value.detail == error_message
-        self.delete_product_use_case.execute.assert_called_once_with("1")
\ No newline at end of file
+        self.delete_product_use_case.execute.assert_called_once_with("1")
+    def test_search_products_builds_query(self):
+        # Arrange
+        search_products_use_case = Mock()
+        search_products_use_case.execute.return_value = [self.mock_product]
+        self.controller.search_products_use_case = search_products_use_case
+
+        # Act
+        result = self.controller.search_products(
+            min_price=5, categories=["Lanche"], name_prefix="te", sort="price", order="desc", limit=10
+        )
+
+        # Assert
+        assert result == [self.mock_product.dict.return_value]
+        query = search_products_use_case.execute.call_args.args[0]
+        assert query.min_price == 5
+        assert query.categories == ["Lanche"]
+        assert query.name_prefix == "te"
+        assert query.sort == "price"
+        assert query.descending is True
+        assert query.limit == 10
+
+    def test_search_products_invalid_range(self):
+        # Arrange
+        self.controller.search_products_use_case = Mock()
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            self.controller.search_products(min_price=20, max_price=10)
+
+        # Verify
+        assert exc_info.value.status_code == 400
+        self.controller.search_products_use_case.execute.assert_not_called()
+
+    def test_suggest_products(self):
+        # Arrange
+        suggest_products_use_case = Mock()
+        suggest_products_use_case.execute.return_value = [self.mock_product]
+        self.controller.suggest_products_use_case = suggest_products_use_case
+
+        # Act
+        result = self.controller.suggest_products("te", 5)
+
+        # Assert
+        assert result == [self.mock_product.dict.return_value]
+        suggest_products_use_case.execute.assert_called_once_with("te", 5)
+
+    def test_fuzzy_search_products_includes_similarity(self):
+        # Arrange
+        fuzzy_search_products_use_case = Mock()
+        fuzzy_search_products_use_case.execute.return_value = [(self.mock_product, 0.66666)]
+        self.controller.fuzzy_search_products_use_case = fuzzy_search_products_use_case
+
+        # Act
+        result = self.controller.fuzzy_search_products("tset", category="Lanche", limit=3)
+
+        # Assert
+        assert result == [{**self.mock_product.dict.return_value, "similarity": 0.667}]
+        fuzzy_search_products_use_case.execute.assert_called_once_with("tset", category="Lanche", limit=3)
+
+    def test_get_menu(self):
+        # Arrange
+        self.controller.get_menu_use_case = Mock()
+        self.controller.get_menu_use_case.execute.return_value = b'{"categories":[]}'
+
+        # Act
+        result = self.controller.get_menu()
+
+        # Assert
+        assert result == b'{"categories":[]}'
+
+    def test_list_product_changes(self):
+        # Arrange
+        self.mock_product.updated_at = datetime(2024, 1, 1)
+        self.controller.list_product_changes_use_case = Mock()
+        self.controller.list_product_changes_use_case.execute.return_value = ProductChangesPage(
+            [ProductChange.upsert(self.mock_product), ProductChange.delete(2, changed_at=datetime(2024, 1, 1))],
+            "token", False
+        )
+
+        # Act
+        result = self.controller.list_product_changes("previous", 10)
+
+        # Assert
+        assert result == {
+            "changes": [
+                {"op": "upsert", "product": self.mock_product.dict.return_value},
+                {"op": "delete", "product_id": 2, "deleted_at": "2024-01-01T00:00:00"},
+            ],
+            "next": "token",
+            "has_more": False,
+        }
+
+    def test_list_product_changes_token_errors(self):
+        # Arrange
+        self.controller.list_product_changes_use_case = Mock()
+
+        # Act & Assert
+        self.controller.list_product_changes_use_case.execute.side_effect = InvalidChangesToken("bad")
+        with pytest.raises(HTTPException) as invalid:
+            self.controller.list_product_changes("x")
+        self.controller.list_product_changes_use_case.execute.side_effect = ChangesTokenExpired("old")
+        with pytest.raises(HTTPException) as expired:
+            self.controller.list_product_changes("x")
+
+        # Verify
+        assert invalid.value.status_code == 400
+        assert expired.value.status_code == 410
@@ -5,6 +5,10 @@ import json
 import hmac
 import hashlib
 
+from botocore.exceptions import ReadTimeoutError
+
+from tech.infra.resilience.request_deadline import DeadlineExceeded, end_deadline, start_deadline
+from tech.interfaces.gateways import cognito_gateway as cognito_gateway_module
 from tech.interfaces.gateways.cognito_gateway import CognitoGateway
 
 
@@ -255,4 +259,35 @@ class TestCognitoGateway:
         with pytest.raises(ValueError) as excinfo:
             cognito_gateway.verify_token(test_jwt)
 
-        assert "Token does not contain user identifier" in str(excinfo.value)
\ No newline at end of file
+        assert "Token does not contain user identifier" in str(excinfo.value)
+
+    def test_short_deadline_uses_a_bounded_client(self, cognito_gateway, monkeypatch):
+        # Arrange
+        monkeypatch.setattr(cognito_gateway_module, '_deadline_clients', {})
+        bounded = MagicMock()
+        bounded.initiate_auth.return_value = {"AuthenticationResult": {"AccessToken": "token"}}
+        token = start_deadline(0.7)
+        try:
+            with patch('boto3.client', return_value=bounded) as mock_client:
+                # Act
+                result = cognito_gateway.authenticate("123456789", "password")
+        finally:
+            end_deadline(token)
+
+        # Assert
+        assert result == {"AccessToken": "token"}
+        config = mock_client.call_args.kwargs["config"]
+        assert config.read_timeout == 0.5
+        cognito_gateway.client.initiate_auth.assert_not_called()
+
+    def test_timeout_under_a_deadline_is_not_an_authentication_failure(self, cognito_gateway):
+        # Arrange
+        cognito_gateway.client.admin_get_user.side_effect = ReadTimeoutError(endpoint_url="https://cognito")
+        claims = base64.urlsafe_b64encode(json.dumps({"sub": "user"}).encode()).decode().rstrip("=")
+        token = start_deadline(10)
+        try:
+            # Act / Assert
+            with pytest.raises(DeadlineExceeded):
+                cognito_gateway.verify_token(f"header.{claims}.signature")
+        finally:
+            end_deadline(token)
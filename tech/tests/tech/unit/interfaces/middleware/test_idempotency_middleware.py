@@ -0,0 +1,160 @@
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from pymongo.errors import ServerSelectionTimeoutError
+
+from tech.infra.resilience.idempotency_store import DONE, PENDING, IdempotencyRecord
+from tech.interfaces.middlewares.idempotency_middleware import IdempotencyMiddleware
+
+
+class InMemoryIdempotencyStore:
+    """Stand-in for the MongoDB-backed store with the same claim semantics."""
+
+    def __init__(self):
+        self.records = {}
+        self.owners = {}
+        self.fail = False
+
+    def cached(self, key):
+        record = self.records.get(key)
+        return record if record is not None and record.state == DONE else None
+
+    def claim(self, key, fingerprint, owner):
+        if self.fail:
+            raise ServerSelectionTimeoutError("mongodb down")
+        if key in self.records:
+            return self.records[key]
+        self.records[key] = IdempotencyRecord(fingerprint, PENDING)
+        self.owners[key] = owner
+        return None
+
+    def complete(self, key, fingerprint, owner, status, headers, body):
+        if self.owners.get(key) == owner:
+            self.records[key] = IdempotencyRecord(fingerprint, DONE, status, headers, body)
+
+    def release(self, key, owner):
+        if self.owners.get(key) == owner:
+            self.records.pop(key, None)
+
+
+store = InMemoryIdempotencyStore()
+calls = []
+
+app = FastAPI()
+app.add_middleware(IdempotencyMiddleware, store=store, routes=[
+    ('POST', '/products/'),
+    ('DELETE', '/products/{product_id}'),
+])
+
+
+@app.post('/products/', status_code=201)
+async def create(payload: dict):
+    calls.append(payload)
+    if payload.get('fail'):
+        raise HTTPException(status_code=503, detail="unavailable")
+    return {'id': len(calls), **payload}
+
+
+@app.delete('/products/{product_id}')
+def delete(product_id: str):
+    calls.append(product_id)
+    return {'deleted': product_id}
+
+
+@app.post('/products/other')
+def other():
+    calls.append('other')
+    return {}
+
+
+client = TestClient(app)
+
+
+class TestIdempotencyMiddleware:
+    """Unit tests for Idempotency-Key handling on admin writes."""
+
+    def setup_method(self):
+        store.records.clear()
+        store.owners.clear()
+        store.fail = False
+        calls.clear()
+
+    def post(self, payload, key='key-1', token='Bearer a'):
+        return client.post('/products/', json=payload, headers={'Idempotency-Key': key, 'Authorization': token})
+
+    def test_retry_replays_the_stored_response_without_running_again(self):
+        # Act
+        first = self.post({'name': 'X-Burger'})
+        retry = self.post({'name': 'X-Burger'})
+
+        # Assert
+        assert (first.status_code, retry.status_code) == (201, 201)
+        assert retry.json() == first.json() == {'id': 1, 'name': 'X-Burger'}
+        assert retry.headers['idempotent-replayed'] == 'true'
+        assert 'idempotent-replayed' not in first.headers
+        assert len(calls) == 1
+
+    def test_reusing_a_key_for_another_request_is_rejected(self):
+        self.post({'name': 'X-Burger'})
+
+        response = self.post({'name': 'Coca'})
+
+        assert response.status_code == 422
+        assert len(calls) == 1
+
+    def test_keys_are_scoped_to_the_credentials(self):
+        self.post({'name': 'X-Burger'}, token='Bearer a')
+
+        response = self.post({'name': 'X-Burger'}, token='Bearer b')
+
+        assert 'idempotent-replayed' not in response.headers
+        assert len(calls) == 2
+
+    def test_request_still_running_gets_409(self):
+        # Arrange
+        first = self.post({'name': 'X-Burger'}, key='k')
+        key = next(iter(store.records))
+        store.records[key] = IdempotencyRecord(store.records[key].fingerprint, PENDING)
+
+        # Act
+        response = self.post({'name': 'X-Burger'}, key='k')
+
+        # Assert
+        assert first.status_code == 201
+        assert response.status_code == 409
+        assert response.headers['retry-after'] == '1'
+
+    def test_server_errors_are_not_stored(self):
+        first = self.post({'fail': True})
+        retry = self.post({'fail': True})
+
+        assert (first.status_code, retry.status_code) == (503, 503)
+        assert len(calls) == 2
+        assert store.records == {}
+
+    def test_other_routes_and_requests_without_key_are_untouched(self):
+        client.post('/products/other', headers={'Idempotency-Key': 'k'})
+        client.post('/products/', json={'name': 'A'})
+
+        assert store.records == {}
+        assert len(calls) == 2
+
+    def test_path_parameters_are_matched(self):
+        client.delete('/products/7', headers={'Idempotency-Key': 'd'})
+        retry = client.delete('/products/7', headers={'Idempotency-Key': 'd'})
+
+        assert retry.json() == {'deleted': '7'}
+        assert calls == ['7']
+
+    def test_runs_without_idempotency_when_the_store_is_down(self):
+        store.fail = True
+
+        response = self.post({'name': 'X-Burger'})
+
+        assert response.status_code == 201
+        assert len(calls) == 1
+
+    def test_rejects_an_oversized_key(self):
+        response = self.post({'name': 'X-Burger'}, key='k' * 256)
+
+        assert response.status_code == 400
+        assert calls == []
@@ -0,0 +1,50 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from tech.api.responses import TimedJSONResponse
+from tech.infra.observability.request_context import current_request_context, track
+from tech.interfaces.middlewares.request_context_middleware import RequestContextMiddleware
+
+app = FastAPI(default_response_class=TimedJSONResponse)
+app.add_middleware(RequestContextMiddleware)
+
+
+@app.get('/timed')
+def timed_endpoint():
+    with track('auth'):
+        pass
+    current_request_context().add_db_roundtrip(1.5)
+    return {'ok': True}
+
+
+@app.get('/plain')
+async def plain_endpoint():
+    return {'ok': True}
+
+
+client = TestClient(app)
+
+
+class TestRequestContextMiddleware:
+    """Unit tests for the Server-Timing middleware."""
+
+    def test_emits_server_timing_from_threadpool_endpoint(self):
+        """Test that timings recorded in a sync endpoint reach the header."""
+        response = client.get('/timed')
+
+        assert response.status_code == 200
+        server_timing = response.headers['Server-Timing']
+        assert 'auth;dur=' in server_timing
+        assert 'db;dur=1.5' in server_timing
+        assert 'serialize;dur=' in server_timing
+        assert 'total;dur=' in server_timing
+        assert response.headers['X-DB-Roundtrips'] == '1'
+
+    def test_requests_do_not_share_context(self):
+        """Test that each request starts with a fresh context."""
+        client.get('/timed')
+
+        response = client.get('/plain')
+
+        assert response.headers['X-DB-Roundtrips'] == '0'
+        assert 'auth' not in response.headers['Server-Timing']
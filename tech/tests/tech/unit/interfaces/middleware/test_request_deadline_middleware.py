@@ -0,0 +1,86 @@
+import asyncio
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from tech.infra.resilience.request_deadline import DeadlineExceeded, check_deadline, remaining
+from tech.interfaces.middlewares.request_deadline_middleware import RequestDeadlineMiddleware
+
+app = FastAPI()
+app.add_middleware(RequestDeadlineMiddleware, default=1, maximum=2, routes=[
+    ('GET', '/stream', 0),
+    ('GET', '/slow', 0.05),
+])
+
+
+@app.exception_handler(DeadlineExceeded)
+async def deadline_exceeded(request, exc):
+    return JSONResponse(status_code=504, content={"detail": str(exc)})
+
+
+@app.get('/budget')
+def budget_endpoint():
+    return {'remaining': remaining()}
+
+
+@app.get('/slow')
+async def slow_endpoint():
+    await asyncio.sleep(1)
+    return {'ok': True}
+
+
+@app.get('/stream')
+async def stream_endpoint():
+    return {'remaining': remaining()}
+
+
+@app.get('/expired')
+def expired_endpoint():
+    check_deadline()
+    return {'ok': True}
+
+
+client = TestClient(app)
+
+
+class TestRequestDeadlineMiddleware:
+    """Unit tests for the per-request deadline."""
+
+    def test_deadline_reaches_threadpool_endpoints(self):
+        # Act
+        response = client.get('/budget')
+
+        # Assert
+        assert 0 < response.json()['remaining'] <= 1
+
+    def test_client_header_overrides_the_budget_up_to_the_maximum(self):
+        # Act
+        shorter = client.get('/budget', headers={'X-Request-Timeout': '0.5'})
+        longer = client.get('/budget', headers={'X-Request-Timeout': '60'})
+
+        # Assert
+        assert shorter.json()['remaining'] <= 0.5
+        assert 1 < longer.json()['remaining'] <= 2
+
+    def test_slow_request_gets_504_when_the_budget_runs_out(self):
+        # Act
+        response = client.get('/slow')
+
+        # Assert
+        assert response.status_code == 504
+        assert response.json() == {'detail': 'Request deadline exceeded'}
+
+    def test_exempt_route_has_no_deadline(self):
+        # Act
+        response = client.get('/stream', headers={'X-Request-Timeout': '0.5'})
+
+        # Assert
+        assert response.json() == {'remaining': None}
+
+    def test_deadline_exceeded_inside_the_endpoint_is_a_504(self):
+        # Act
+        response = client.get('/expired', headers={'X-Request-Timeout': '0'})
+
+        # Assert
+        assert response.status_code == 504
@@ -0,0 +1,57 @@
+import pytest
+from unittest.mock import Mock
+from pydantic import ValidationError
+
+from tech.domain.entities.products import Products
+from tech.interfaces.repositories.product_repository import ProductRepository
+from tech.interfaces.schemas.product_schema import PriceAdjustmentSchema
+from tech.use_cases.products.adjust_prices_use_case import AdjustPricesUseCase
+
+
+class TestAdjustPricesUseCase:
+    """Unit tests for the AdjustPricesUseCase."""
+
+    def setup_method(self):
+        self.product_repository = Mock(spec=ProductRepository)
+        self.use_case = AdjustPricesUseCase(self.product_repository)
+
+    def test_adjusts_a_category_in_one_repository_call(self):
+        # Arrange
+        changed = [Products(id=1, name="Coca", price=6.3, category="Bebida")]
+        self.product_repository.adjust_prices.return_value = changed
+
+        # Act
+        result = self.use_case.execute(PriceAdjustmentSchema(category="Bebida", percent=5))
+
+        # Assert
+        assert result == changed
+        adjustment = self.product_repository.adjust_prices.call_args.args[0]
+        assert (adjustment.category, adjustment.percent, adjustment.amount) == ("Bebida", 5, None)
+
+    @pytest.mark.parametrize("field", ["percent", "amount"])
+    @pytest.mark.parametrize("value", ["NaN", "Infinity", "-Infinity"])
+    def test_schema_rejects_non_finite_values(self, field, value):
+        with pytest.raises(ValidationError):
+            PriceAdjustmentSchema(category="Bebida", **{field: float(value)})
+
+    def test_deduplicates_product_ids(self):
+        self.product_repository.adjust_prices.return_value = []
+
+        self.use_case.execute(PriceAdjustmentSchema(product_ids=[3, 1, 3], amount=-1.5))
+
+        assert self.product_repository.adjust_prices.call_args.args[0].product_ids == [1, 3]
+
+    @pytest.mark.parametrize("data", [
+        PriceAdjustmentSchema(category="Bebida"),
+        PriceAdjustmentSchema(category="Bebida", percent=5, amount=1),
+        PriceAdjustmentSchema(percent=5),
+        PriceAdjustmentSchema(category="Bebida", product_ids=[1], percent=5),
+        PriceAdjustmentSchema(product_ids=[], percent=5),
+        PriceAdjustmentSchema(category="Bebida", percent=-100),
+        PriceAdjustmentSchema.model_construct(category="Bebida", percent=float("nan")),
+        PriceAdjustmentSchema.model_construct(category="Bebida", amount=float("inf")),
+    ])
+    def test_rejects_ambiguous_or_invalid_adjustments(self, data):
+        with pytest.raises(ValueError):
+            self.use_case.execute(data)
+        self.product_repository.adjust_prices.assert_not_called()
@@ -0,0 +1,55 @@
+from unittest.mock import Mock
+
+from tech.domain.entities.products import Products
+from tech.domain.value_objects import BulkUpsertResult
+from tech.interfaces.repositories.product_repository import ProductRepository
+from tech.interfaces.schemas.product_schema import ProductSchema
+from tech.use_cases.products.bulk_upsert_products_use_case import BulkUpsertProductsUseCase
+
+
+class TestBulkUpsertProductsUseCase:
+    """Unit tests for the BulkUpsertProductsUseCase."""
+
+    def setup_method(self):
+        self.product_repository = Mock(spec=ProductRepository)
+        self.use_case = BulkUpsertProductsUseCase(self.product_repository)
+
+    def test_upserts_the_batch_in_one_repository_call(self):
+        # Arrange
+        items = [
+            ProductSchema(name="X-Burger", price=20.0, category="Lanche"),
+            ProductSchema(name="Coca", price=6.0, category="Bebida"),
+        ]
+        stored = [Products(id=1, name="X-Burger", price=20.0, category="Lanche"),
+                  Products(id=2, name="Coca", price=6.0, category="Bebida")]
+        self.product_repository.bulk_upsert.return_value = [
+            BulkUpsertResult(0, 'created', stored[0]), BulkUpsertResult(1, 'updated', stored[1])
+        ]
+
+        # Act
+        results = self.use_case.execute(items)
+
+        # Assert
+        self.product_repository.bulk_upsert.assert_called_once()
+        assert [p.name for p in self.product_repository.bulk_upsert.call_args.args[0]] == ["X-Burger", "Coca"]
+        assert [(r.index, r.status) for r in results] == [(0, 'created'), (1, 'updated')]
+
+    def test_repeated_names_fail_without_reaching_the_repository(self):
+        # Arrange
+        items = [
+            ProductSchema(name="Coca", price=6.0, category="Bebida"),
+            ProductSchema(name="Coca", price=7.0, category="Bebida"),
+            ProductSchema(name="Suco", price=8.0, category="Bebida"),
+        ]
+        self.product_repository.bulk_upsert.return_value = [
+            BulkUpsertResult(0, 'created', Products(id=1, name="Coca", price=6.0, category="Bebida")),
+            BulkUpsertResult(1, 'created', Products(id=2, name="Suco", price=8.0, category="Bebida")),
+        ]
+
+        # Act
+        results = self.use_case.execute(items)
+
+        # Assert
+        assert [(r.index, r.status) for r in results] == [(0, 'created'), (1, 'error'), (2, 'created')]
+        assert "Duplicate name" in results[1].error
+        assert len(self.product_repository.bulk_upsert.call_args.args[0]) == 2
@@ -0,0 +1,29 @@
+from unittest.mock import Mock
+
+from tech.interfaces.repositories.product_repository import ProductRepository
+from tech.use_cases.products.fuzzy_search_products_use_case import FuzzySearchProductsUseCase
+
+
+class TestFuzzySearchProductsUseCase:
+    """Unit tests for the FuzzySearchProductsUseCase."""
+
+    def setup_method(self):
+        """Set up test dependencies."""
+        self.product_repository = Mock(spec=ProductRepository)
+        self.product_repository.list_all_products = Mock()
+        self.fuzzy_index = Mock()
+        self.use_case = FuzzySearchProductsUseCase(self.product_repository, self.fuzzy_index)
+
+    def test_search_delegates_to_index_with_repository_fallback(self):
+        """Test that the text is matched in the index with the repository as fallback."""
+        # Arrange
+        self.fuzzy_index.search.return_value = [("product", 0.8)]
+
+        # Act
+        result = self.use_case.execute("hamburguer", category="Lanche", limit=3)
+
+        # Assert
+        self.fuzzy_index.search.assert_called_once_with(
+            "hamburguer", 3, self.product_repository.list_all_products, category="Lanche"
+        )
+        assert result == [("product", 0.8)]
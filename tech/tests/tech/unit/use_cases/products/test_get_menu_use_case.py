@@ -0,0 +1,27 @@
+from unittest.mock import Mock
+
+from tech.interfaces.repositories.product_repository import ProductRepository
+from tech.use_cases.products.get_menu_use_case import GetMenuUseCase
+
+
+class TestGetMenuUseCase:
+    """Unit tests for the GetMenuUseCase."""
+
+    def setup_method(self):
+        """Set up test dependencies."""
+        self.product_repository = Mock(spec=ProductRepository)
+        self.product_repository.list_all_products = Mock()
+        self.menu_view = Mock()
+        self.use_case = GetMenuUseCase(self.product_repository, self.menu_view)
+
+    def test_get_menu_renders_view_with_repository_fallback(self):
+        """Test that the menu comes from the view with the repository as fallback."""
+        # Arrange
+        self.menu_view.snapshot.return_value = Mock(body=b'{"categories":[]}')
+
+        # Act
+        result = self.use_case.execute()
+
+        # Assert
+        self.menu_view.snapshot.assert_called_once_with(self.product_repository.list_all_products)
+        assert result.body == b'{"categories":[]}'
@@ -0,0 +1,74 @@
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+from tech.domain.entities.products import Products
+from tech.infra.catalog.catalog_events import ProductChange
+from tech.use_cases.products.list_product_changes_use_case import (
+    ChangesTokenExpired,
+    InvalidChangesToken,
+    ListProductChangesUseCase,
+    decode_token,
+    encode_token,
+)
+
+NOW = datetime(2024, 6, 1, 12, 0, 0)
+
+
+class TestListProductChangesUseCase:
+    """Unit tests for the ListProductChangesUseCase."""
+
+    def setup_method(self):
+        """Set up test dependencies."""
+        self.product_repository = Mock()
+        self.use_case = ListProductChangesUseCase(
+            self.product_repository, settle_window=timedelta(seconds=2),
+            retention=timedelta(days=30), clock=lambda: NOW
+        )
+
+    def make_upsert(self, product_id, minute):
+        return ProductChange.upsert(Products(id=product_id, name="P", price=1.0, category="Lanche",
+                                             updated_at=datetime(2024, 6, 1, 11, minute)))
+
+    def test_token_round_trip(self):
+        """Test that tokens encode the cursor exactly."""
+        cursor = (datetime(2024, 6, 1, 11, 30, 0, 123000), 42)
+
+        assert decode_token(encode_token(cursor)) == cursor
+
+    def test_first_page_with_more_changes(self):
+        """Test that a full page continues from its last change."""
+        # Arrange
+        changes = [self.make_upsert(1, 1), self.make_upsert(2, 2), self.make_upsert(3, 3)]
+        self.product_repository.list_changes_since.return_value = changes
+
+        # Act
+        page = self.use_case.execute(None, limit=2)
+
+        # Assert
+        self.product_repository.list_changes_since.assert_called_once_with(None, NOW - timedelta(seconds=2), 3)
+        assert page.has_more is True
+        assert [c.product_id for c in page.changes] == [1, 2]
+        assert decode_token(page.next_token) == (datetime(2024, 6, 1, 11, 2), 2)
+
+    def test_last_page_continues_from_settle_bound(self):
+        """Test that a partial page moves the cursor up to the settle bound."""
+        # Arrange
+        since = encode_token((datetime(2024, 6, 1, 11, 0), 7))
+        self.product_repository.list_changes_since.return_value = [ProductChange.delete(9, changed_at=NOW)]
+
+        # Act
+        page = self.use_case.execute(since, limit=10)
+
+        # Assert
+        assert self.product_repository.list_changes_since.call_args.args[0] == (datetime(2024, 6, 1, 11, 0), 7)
+        assert page.has_more is False
+        assert decode_token(page.next_token)[0] == NOW - timedelta(seconds=2)
+
+    def test_rejects_malformed_and_expired_tokens(self):
+        """Test token validation errors."""
+        with pytest.raises(InvalidChangesToken):
+            self.use_case.execute("not-a-token", limit=10)
+
+        with pytest.raises(ChangesTokenExpired):
+            self.use_case.execute(encode_token((NOW - timedelta(days=31), 1)), limit=10)
@@ -0,0 +1,29 @@
+from unittest.mock import Mock
+
+from tech.domain.value_objects import ProductSearchQuery
+from tech.interfaces.repositories.product_repository import ProductRepository
+from tech.use_cases.products.search_products_use_case import SearchProductsUseCase
+
+
+class TestSearchProductsUseCase:
+    """Unit tests for the SearchProductsUseCase."""
+
+    def setup_method(self):
+        """Set up test dependencies."""
+        self.product_repository = Mock(spec=ProductRepository)
+        self.product_repository.list_all_products = Mock()
+        self.search_index = Mock()
+        self.use_case = SearchProductsUseCase(self.product_repository, self.search_index)
+
+    def test_search_delegates_to_index_with_repository_fallback(self):
+        """Test that the query runs on the index with the repository as fallback."""
+        # Arrange
+        query = ProductSearchQuery(categories=["Lanche"])
+        self.search_index.search.return_value = ["product"]
+
+        # Act
+        result = self.use_case.execute(query)
+
+        # Assert
+        self.search_index.search.assert_called_once_with(query, self.product_repository.list_all_products)
+        assert result == ["product"]
@@ -0,0 +1,27 @@
+from unittest.mock import Mock
+
+from tech.interfaces.repositories.product_repository import ProductRepository
+from tech.use_cases.products.suggest_products_use_case import SuggestProductsUseCase
+
+
+class TestSuggestProductsUseCase:
+    """Unit tests for the SuggestProductsUseCase."""
+
+    def setup_method(self):
+        """Set up test dependencies."""
+        self.product_repository = Mock(spec=ProductRepository)
+        self.product_repository.list_all_products = Mock()
+        self.suggest_index = Mock()
+        self.use_case = SuggestProductsUseCase(self.product_repository, self.suggest_index)
+
+    def test_suggest_delegates_to_index_with_repository_fallback(self):
+        """Test that the prefix is looked up in the index with the repository as fallback."""
+        # Arrange
+        self.suggest_index.suggest.return_value = ["product"]
+
+        # Act
+        result = self.use_case.execute("pa", 5)
+
+        # Assert
+        self.suggest_index.suggest.assert_called_once_with("pa", 5, self.product_repository.list_all_products)
+        assert result == ["product"]